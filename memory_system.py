@@ -1,9 +1,12 @@
 # file: memory_system.py
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
 from pydantic import BaseModel, Field, ValidationError
 from datetime import datetime
+import asyncio
+import copy
+import logging
 import uuid
 import redis
 import json
@@ -24,9 +27,17 @@ from src.memory.engines.distillation_engine import DistillationEngine
 # Import data models
 from src.memory.models import Fact, Episode, KnowledgeDocument, ContextBlock, SearchWeights
 
+# Import cross-tier result fusion
+from src.memory.ranking import CandidateSet, Ranker, get_ranker
+from src.memory.result_cache import LRUTTLCache
+from src.memory.generations import SessionGenerations
+from src.memory.context_assembler import ContextAssembler
+
 # Import the facade for the persistent knowledge layer
 from knowledge_store_manager import KnowledgeStoreManager
 
+logger = logging.getLogger(__name__)
+
 # --- Data Schemas for Operating Memory (Data Contracts) ---
 
 class PersonalMemoryState(BaseModel):
@@ -44,6 +55,19 @@ class SharedWorkspaceState(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     last_updated: datetime = Field(default_factory=datetime.utcnow)
 
+class MemoryQueryResults(list):
+    """
+    Ranked results of a cross-tier query plus per-call metadata.
+    
+    Behaves like the plain result list; `metadata` records which tiers
+    missed their deadline ('skipped_tiers') or raised ('failed_tiers'),
+    and whether the results are therefore partial.
+    """
+    
+    def __init__(self, results: Optional[List[Dict[str, Any]]] = None, metadata: Optional[Dict[str, Any]] = None):
+        super().__init__(results or [])
+        self.metadata: Dict[str, Any] = metadata or {}
+
 # --- Abstract Interface for the COMPLETE Memory System ---
 
 class HybridMemorySystem(ABC):
@@ -107,7 +131,9 @@ class HybridMemorySystem(ABC):
         session_id: str,
         query: str,
         limit: int = 10,
-        weights: Optional[SearchWeights] = None
+        weights: Optional[SearchWeights] = None,
+        deadline: Optional[float] = None,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
         """Hybrid semantic search across L2, L3, and L4 tiers."""
         pass
@@ -118,7 +144,11 @@ class HybridMemorySystem(ABC):
         session_id: str,
         min_ciar: float = 0.6,
         max_turns: int = 20,
-        max_facts: int = 10
+        max_facts: int = 10,
+        deadline: Optional[float] = None,
+        use_cache: bool = True,
+        token_budget: Optional[int] = None,
+        query: Optional[str] = None
     ) -> ContextBlock:
         """Assemble context block for prompt injection."""
         pass
@@ -132,8 +162,23 @@ class UnifiedMemorySystem(HybridMemorySystem):
     
     Integrates all four memory tiers (L1-L4) with lifecycle engines for automated
     information flow and promotion.
+    
+    Cross-tier reads fan out to the tiers concurrently. Each tier gets its own
+    timeout budget, capped by the overall deadline of the call, and tiers that
+    miss it are reported as skipped instead of delaying the result.
+    
+    Complete cross-tier read results are cached per session. Every tier write
+    bumps a generation counter for the session (or globally, for L4), and the
+    counters of the tiers a read depends on are part of its cache key: an
+    unchanged memory answers repeated reads from the cache, and any write is
+    visible on the next read.
     """
     
+    # Overall latency budget (seconds) for one cross-tier read
+    DEFAULT_QUERY_DEADLINE = 1.5
+    DEFAULT_CACHE_MAX_ENTRIES = 1000
+    DEFAULT_CACHE_TTL_SECONDS = 300.0
+    
     def __init__(
         self,
         redis_client: redis.StrictRedis,
@@ -144,7 +189,15 @@ class UnifiedMemorySystem(HybridMemorySystem):
         l4_tier: Optional[SemanticMemoryTier] = None,
         promotion_engine: Optional[PromotionEngine] = None,
         consolidation_engine: Optional[ConsolidationEngine] = None,
-        distillation_engine: Optional[DistillationEngine] = None
+        distillation_engine: Optional[DistillationEngine] = None,
+        query_deadline: float = DEFAULT_QUERY_DEADLINE,
+        tier_deadlines: Optional[Dict[str, float]] = None,
+        ranker: Optional[Union[str, Ranker]] = None,
+        embedding_provider: Optional[Any] = None,
+        generations: Optional[SessionGenerations] = None,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        tokenizer: Optional[Any] = None
     ):
         """
         Initializes the memory system with clients for all layers.
@@ -159,6 +212,23 @@ class UnifiedMemorySystem(HybridMemorySystem):
             promotion_engine: L1→L2 promotion engine - optional
             consolidation_engine: L2→L3 consolidation engine - optional
             distillation_engine: L3→L4 distillation engine - optional
+            query_deadline: Overall deadline in seconds for query_memory() and
+                get_context_block()
+            tier_deadlines: Optional per-tier budgets in seconds keyed by tier
+                name ('L1'-'L4'); each is capped by the overall deadline
+            ranker: Cross-tier ranker instance or name ('relevance', 'rrf',
+                'minmax'); defaults to relevance-weighted fusion
+            embedding_provider: Optional provider exposing get_embedding();
+                L3 is searched by vector similarity to the query, so
+                query_memory() only reads L3 when this is set
+            generations: Tier generation tracker used to invalidate cached
+                reads (default: one shared through redis_client, so writes
+                in any process invalidate cached reads in all of them)
+            cache_max_entries: Maximum cached read results (LRU eviction)
+            cache_ttl_seconds: Upper bound on the age of a cached result
+            tokenizer: Token counter for budgeted context blocks (object with
+                count_tokens() or encode(), or a callable); defaults to the
+                chars-per-token heuristic
         """
         # --- Operating Memory Client ---
         self.redis_client = redis_client
@@ -182,6 +252,34 @@ class UnifiedMemorySystem(HybridMemorySystem):
         self.promotion_engine = promotion_engine
         self.consolidation_engine = consolidation_engine
         self.distillation_engine = distillation_engine
+        
+        # --- Cross-Tier Read Deadlines ---
+        self.query_deadline = query_deadline
+        self.tier_deadlines = dict(tier_deadlines or {})
+        
+        # --- Cross-Tier Ranking ---
+        self.ranker = get_ranker(ranker)
+        self.embedding_provider = embedding_provider
+        
+        # --- Session-Scoped Read Cache ---
+        # Shared through the Operating Memory Redis by default, so writes
+        # made by any process invalidate every process's cached reads
+        self.generations = generations or SessionGenerations(self.redis_client)
+        for tier in (self.l1_tier, self.l2_tier, self.l3_tier, self.l4_tier):
+            if tier is not None:
+                tier.attach_generations(self.generations)
+        self._read_cache = LRUTTLCache(max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+        self._cache_bypasses = 0
+        
+        # --- Token-Budgeted Context Assembly ---
+        self.context_assembler = ContextAssembler(
+            l1_tier=self.l1_tier,
+            l2_tier=self.l2_tier,
+            l3_tier=self.l3_tier,
+            l4_tier=self.l4_tier,
+            tokenizer=tokenizer,
+            generations=self.generations
+        )
 
     # --- Private Key Helpers for Redis ---
     def _get_personal_key(self, agent_id: str) -> str: return f"personal_state:{agent_id}"
@@ -318,158 +416,292 @@ class UnifiedMemorySystem(HybridMemorySystem):
     
     # --- Cross-Tier Query Implementation ---
     
+    def _tier_budget(self, tier: str, deadline: float) -> float:
+        """Timeout for one tier: its own budget, capped by the call deadline."""
+        return min(self.tier_deadlines.get(tier, deadline), deadline)
+    
+    async def _fan_out(
+        self,
+        calls: Dict[str, Callable[[], Awaitable[Any]]],
+        deadline: float
+    ) -> Tuple[Dict[str, Any], List[str], Dict[str, str]]:
+        """
+        Run tier reads concurrently, each bounded by its own budget.
+        
+        Args:
+            calls: Zero-argument coroutine factories keyed by tier name
+            deadline: Overall deadline in seconds
+            
+        Returns:
+            Tuple of (results by tier, tiers that missed their budget,
+            error message by tier for tiers that raised)
+        """
+        async def call(tier: str) -> Any:
+            # The factory runs inside the task, so a tier that raises before
+            # returning its awaitable fails alone instead of the whole read
+            return await asyncio.wait_for(calls[tier](), timeout=self._tier_budget(tier, deadline))
+        
+        tiers = list(calls)
+        outcomes = await asyncio.gather(*(call(tier) for tier in tiers), return_exceptions=True)
+        
+        results: Dict[str, Any] = {}
+        skipped: List[str] = []
+        failed: Dict[str, str] = {}
+        for tier, outcome in zip(tiers, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(f"{tier} query skipped: exceeded {self._tier_budget(tier, deadline):.3f}s budget")
+                skipped.append(tier)
+            elif isinstance(outcome, Exception):
+                logger.warning(f"{tier} query failed: {outcome}")
+                failed[tier] = str(outcome)
+            else:
+                results[tier] = outcome
+        return results, skipped, failed
+    
+    async def _read_cache_key(self, session_id: str, tiers: List[str], *params: Any) -> Optional[Tuple]:
+        """
+        Build the cache key of a read from its parameters and tier generations.
+        
+        Returns:
+            Cache key, or None when generations cannot be read (the caller
+            then bypasses the cache instead of risking a stale result)
+        """
+        try:
+            generation = await self.generations.snapshot(session_id, tiers)
+        except Exception as e:
+            logger.warning(f"Read cache bypassed, generations unavailable: {e}")
+            self._cache_bypasses += 1
+            return None
+        return (session_id, *params, tuple(tiers), generation)
+    
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Return read cache statistics.
+        
+        Returns:
+            LRU cache stats (entries, hits, misses, hit_rate, evictions, ...)
+            plus bypasses and generation bumps
+        """
+        stats = self._read_cache.stats()
+        stats['bypasses'] = self._cache_bypasses
+        stats['generation_bumps'] = self.generations.bumps
+        stats['generation_errors'] = self.generations.errors
+        stats['shared_generations'] = self.generations.shared
+        return stats
+    
+    async def _query_l2(self, session_id: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        """L2: Working Memory (Facts) by full-text relevance (ts_rank)."""
+        l2_facts = await self.l2_tier.search_facts(
+            query=query,
+            session_id=session_id,
+            limit=limit
+        )
+        return [
+            {
+                'content': fact.content,
+                'relevance': fact.metadata.get('search_score'),
+                'prior': fact.ciar_score,
+                'metadata': {
+                    'fact_id': fact.fact_id,
+                    'fact_type': fact.fact_type,
+                    'ciar_score': fact.ciar_score,
+                    'extracted_at': fact.extracted_at.isoformat()
+                }
+            }
+            for fact in l2_facts
+        ]
+    
+    async def _query_l3(self, session_id: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        """L3: Episodic Memory (Episodes) by vector similarity to the query."""
+        query_embedding = await self.embedding_provider.get_embedding(text=query)
+        l3_episodes = await self.l3_tier.search_similar(
+            query_embedding=query_embedding,
+            limit=limit,
+            filters={'session_id': session_id}
+        )
+        return [
+            {
+                'content': episode.summary,
+                'relevance': episode.metadata.get('similarity_score'),
+                'prior': episode.importance_score,
+                'metadata': {
+                    'episode_id': episode.episode_id,
+                    'fact_count': episode.fact_count,
+                    'source_fact_ids': episode.source_fact_ids,
+                    'importance_score': episode.importance_score,
+                    'topics': episode.topics,
+                    'consolidated_at': episode.consolidated_at.isoformat()
+                }
+            }
+            for episode in l3_episodes
+        ]
+    
+    async def _query_l4(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """L4: Semantic Memory (Knowledge Documents) by text match."""
+        l4_docs = await self.l4_tier.search(
+            query_text=query,
+            limit=limit
+        )
+        return [
+            {
+                'content': doc.content,
+                'relevance': doc.metadata.get('search_score'),
+                'prior': doc.confidence_score,
+                'metadata': {
+                    'knowledge_id': doc.knowledge_id,
+                    'title': doc.title,
+                    'knowledge_type': doc.knowledge_type,
+                    'confidence_score': doc.confidence_score,
+                    'tags': doc.tags,
+                    'distilled_at': doc.distilled_at.isoformat()
+                }
+            }
+            for doc in l4_docs
+        ]
+    
+    async def _recent_turns(self, session_id: str, max_turns: int) -> List[Dict[str, Any]]:
+        """L1: the newest `max_turns` turns, oldest first."""
+        turns = await self.l1_tier.retrieve(session_id) or []
+        return list(reversed(turns[:max_turns]))
+    
     async def query_memory(
         self,
         session_id: str,
         query: str,
         limit: int = 10,
-        weights: Optional[SearchWeights] = None
-    ) -> List[Dict[str, Any]]:
+        weights: Optional[SearchWeights] = None,
+        deadline: Optional[float] = None,
+        use_cache: bool = True
+    ) -> MemoryQueryResults:
         """
         Hybrid semantic search across L2, L3, and L4 tiers.
         
-        Merges results from multiple tiers using configurable weights
-        with min-max normalization for comparable scoring.
+        Queries the tiers concurrently by relevance to the query (L2 ts_rank,
+        L3 vector similarity, L4 text match) and fuses the candidates with
+        the configured ranker, merging results that repeat information
+        across tiers. A tier that misses its budget is skipped, so a slow
+        backend costs at most the deadline rather than adding to it. L3 is
+        only queried when an embedding provider is configured.
+        
+        Complete results are cached by (session, normalized query, weights,
+        limit) until a queried tier is written to; partial results are
+        never cached.
         
         Args:
             session_id: Session context for search
             query: Search query string
             limit: Maximum results to return
             weights: Search weighting config (default: 0.3/0.5/0.2 for L2/L3/L4)
+            deadline: Overall deadline in seconds (default: query_deadline)
+            use_cache: Set False to bypass the read cache for this call
             
         Returns:
-            List of ranked results with unified schema:
+            MemoryQueryResults (a list) of ranked results with unified schema:
             [
                 {
                     'content': str,
                     'tier': str (L2/L3/L4),
-                    'score': float (0.0-1.0),
+                    'score': float (ranker-specific, higher is better),
                     'metadata': dict
                 }
             ]
+            Its `metadata` lists 'skipped_tiers' and 'failed_tiers', sets
+            'partial' when any queried tier is missing from the results and
+            'cache_hit' when the results were served from the read cache.
         """
         if weights is None:
             weights = SearchWeights()  # Use defaults
+        deadline = self.query_deadline if deadline is None else deadline
         
-        all_results = []
+        tier_weights = {'L2': weights.l2_weight, 'L3': weights.l3_weight, 'L4': weights.l4_weight}
         
-        # L2: Working Memory (Facts)
+        calls: Dict[str, Callable[[], Awaitable[List[Dict[str, Any]]]]] = {}
         if self.l2_tier and weights.l2_weight > 0:
-            try:
-                l2_facts = await self.l2_tier.retrieve(
-                    session_id=session_id,
-                    query=query,
-                    limit=limit
-                )
-                # Normalize CIAR scores to 0-1 range
-                if l2_facts:
-                    l2_scores = [f.ciar_score for f in l2_facts]
-                    min_score, max_score = min(l2_scores), max(l2_scores)
-                    score_range = max_score - min_score if max_score > min_score else 1.0
-                    
-                    for fact in l2_facts:
-                        normalized_score = (fact.ciar_score - min_score) / score_range if score_range > 0 else 0.5
-                        weighted_score = normalized_score * weights.l2_weight
-                        all_results.append({
-                            'content': fact.content,
-                            'tier': 'L2',
-                            'score': weighted_score,
-                            'metadata': {
-                                'fact_id': fact.fact_id,
-                                'fact_type': fact.fact_type,
-                                'ciar_score': fact.ciar_score,
-                                'extracted_at': fact.extracted_at.isoformat()
-                            }
-                        })
-            except Exception as e:
-                print(f"L2 query failed: {e}")
-        
-        # L3: Episodic Memory (Episodes)
-        if self.l3_tier and weights.l3_weight > 0:
-            try:
-                l3_episodes = await self.l3_tier.retrieve(
-                    session_id=session_id,
-                    query=query,
-                    limit=limit
-                )
-                # Normalize importance scores
-                if l3_episodes:
-                    l3_scores = [e.importance_score for e in l3_episodes]
-                    min_score, max_score = min(l3_scores), max(l3_scores)
-                    score_range = max_score - min_score if max_score > min_score else 1.0
-                    
-                    for episode in l3_episodes:
-                        normalized_score = (episode.importance_score - min_score) / score_range if score_range > 0 else 0.5
-                        weighted_score = normalized_score * weights.l3_weight
-                        all_results.append({
-                            'content': episode.summary,
-                            'tier': 'L3',
-                            'score': weighted_score,
-                            'metadata': {
-                                'episode_id': episode.episode_id,
-                                'fact_count': episode.fact_count,
-                                'importance_score': episode.importance_score,
-                                'topics': episode.topics,
-                                'consolidated_at': episode.consolidated_at.isoformat()
-                            }
-                        })
-            except Exception as e:
-                print(f"L3 query failed: {e}")
-        
-        # L4: Semantic Memory (Knowledge Documents)
+            calls['L2'] = lambda: self._query_l2(session_id, query, limit)
+        # Without an embedder L3 has no query relevance to rank by
+        if self.l3_tier and self.embedding_provider is not None and weights.l3_weight > 0:
+            calls['L3'] = lambda: self._query_l3(session_id, query, limit)
         if self.l4_tier and weights.l4_weight > 0:
-            try:
-                l4_docs = await self.l4_tier.retrieve(
-                    query=query,
-                    limit=limit
-                )
-                # Normalize confidence scores
-                if l4_docs:
-                    l4_scores = [d.confidence_score for d in l4_docs]
-                    min_score, max_score = min(l4_scores), max(l4_scores)
-                    score_range = max_score - min_score if max_score > min_score else 1.0
-                    
-                    for doc in l4_docs:
-                        normalized_score = (doc.confidence_score - min_score) / score_range if score_range > 0 else 0.5
-                        weighted_score = normalized_score * weights.l4_weight
-                        all_results.append({
-                            'content': doc.content,
-                            'tier': 'L4',
-                            'score': weighted_score,
-                            'metadata': {
-                                'knowledge_id': doc.knowledge_id,
-                                'title': doc.title,
-                                'knowledge_type': doc.knowledge_type,
-                                'confidence_score': doc.confidence_score,
-                                'tags': doc.tags,
-                                'distilled_at': doc.distilled_at.isoformat()
-                            }
-                        })
-            except Exception as e:
-                print(f"L4 query failed: {e}")
-        
-        # Sort by weighted score and limit results
-        all_results.sort(key=lambda x: x['score'], reverse=True)
-        return all_results[:limit]
+            calls['L4'] = lambda: self._query_l4(query, limit)
+        
+        # Generations are read before the tiers: a write racing the read
+        # changes them, so its result is never served under the new state
+        cache_key = None
+        if use_cache:
+            cache_key = await self._read_cache_key(
+                session_id,
+                list(calls),
+                'query',
+                self._normalize_query(query),
+                tuple(tier_weights.values()),
+                limit
+            )
+            cached = self._read_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                results, metadata = copy.deepcopy(cached)
+                metadata['cache_hit'] = True
+                return MemoryQueryResults(results, metadata=metadata)
+        
+        tier_results, skipped, failed = await self._fan_out(calls, deadline)
+        
+        # Fuse in tier order so equal scores keep the L2, L3, L4 ordering
+        candidates = CandidateSet.from_tiers(
+            {tier: tier_results[tier] for tier in calls if tier in tier_results}
+        )
+        ranked = self.ranker.rank(candidates, tier_weights, limit)
+        metadata = {
+            'ranker': self.ranker.name,
+            'candidate_count': len(candidates),
+            'queried_tiers': list(calls),
+            'skipped_tiers': skipped,
+            'failed_tiers': failed,
+            'partial': bool(skipped or failed),
+            'deadline': deadline,
+            'cache_hit': False
+        }
+        if cache_key and not metadata['partial']:
+            self._read_cache.set(cache_key, copy.deepcopy((ranked, metadata)))
+        return MemoryQueryResults(ranked, metadata=metadata)
     
     async def get_context_block(
         self,
         session_id: str,
         min_ciar: float = 0.6,
         max_turns: int = 20,
-        max_facts: int = 10
+        max_facts: int = 10,
+        deadline: Optional[float] = None,
+        use_cache: bool = True,
+        token_budget: Optional[int] = None,
+        query: Optional[str] = None
     ) -> ContextBlock:
         """
         Assemble context block for prompt injection.
         
-        Retrieves recent L1 turns and high-CIAR L2 facts, optionally
-        including L3 episode summaries and L4 knowledge snippets.
+        Retrieves recent L1 turns and high-CIAR L2 facts concurrently,
+        optionally including L3 episode summaries and L4 knowledge snippets.
+        Tiers that miss their budget are left out and listed in
+        `skipped_tiers`. Complete blocks are cached until L1 or L2 is written
+        to for the session.
+        
+        With a `token_budget`, the block is assembled by the ContextAssembler
+        instead: tiers are read in priority order (L1, L2, L3, then L4 when a
+        query is given) only until the budget is spent, and the rendered
+        prompt is kept per session and extended as new turns and facts
+        arrive.
         
         Args:
             session_id: Session to retrieve context for
             min_ciar: Minimum CIAR score for L2 facts
             max_turns: Maximum L1 turns to include
             max_facts: Maximum L2 facts to include
+            deadline: Overall deadline in seconds (default: query_deadline)
+            use_cache: Set False to bypass the read cache for this call
+            token_budget: Optional token budget for the rendered prompt
+            query: Optional query used to pick L4 knowledge (budgeted mode)
             
         Returns:
             ContextBlock ready for prompt injection
@@ -477,39 +709,62 @@ class UnifiedMemorySystem(HybridMemorySystem):
         Raises:
             RuntimeError: If required tiers not configured
         """
+        deadline = self.query_deadline if deadline is None else deadline
+        if token_budget is not None:
+            return await self.context_assembler.assemble(
+                session_id,
+                token_budget,
+                min_ciar=min_ciar,
+                max_turns=max_turns,
+                max_facts=max_facts,
+                query=query,
+                deadline=deadline,
+                use_cache=use_cache
+            )
+        
         context = ContextBlock(
             session_id=session_id,
             min_ciar_threshold=min_ciar
         )
         
-        # Retrieve L1 recent turns
+        calls: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        # L1 recent turns
         if self.l1_tier:
-            try:
-                turns = await self.l1_tier.retrieve(
-                    session_id=session_id,
-                    limit=max_turns
-                )
-                context.recent_turns = turns
-                context.turn_count = len(turns)
-            except Exception as e:
-                print(f"L1 retrieval failed: {e}")
-        
-        # Retrieve L2 high-CIAR facts
+            calls['L1'] = lambda: self._recent_turns(session_id, max_turns)
+        # L2 high-CIAR facts
         if self.l2_tier:
-            try:
-                facts = await self.l2_tier.retrieve(
-                    session_id=session_id,
-                    min_ciar_score=min_ciar,
-                    limit=max_facts
-                )
-                context.significant_facts = facts
-                context.fact_count = len(facts)
-            except Exception as e:
-                print(f"L2 retrieval failed: {e}")
+            calls['L2'] = lambda: self.l2_tier.query_by_session(
+                session_id,
+                min_ciar_score=min_ciar,
+                limit=max_facts
+            )
+        
+        cache_key = None
+        if use_cache:
+            cache_key = await self._read_cache_key(
+                session_id, list(calls), 'context', min_ciar, max_turns, max_facts
+            )
+            cached = self._read_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return cached.model_copy(deep=True, update={'cache_hit': True})
+        
+        tier_results, skipped, failed = await self._fan_out(calls, deadline)
+        
+        if 'L1' in tier_results:
+            turns = tier_results['L1']
+            context.recent_turns = turns
+            context.turn_count = len(turns)
+        if 'L2' in tier_results:
+            facts = tier_results['L2']
+            context.significant_facts = facts
+            context.fact_count = len(facts)
+        context.skipped_tiers = skipped + list(failed)
         
         # Estimate token count
         context.estimate_token_count()
         
+        if cache_key and not context.skipped_tiers:
+            self._read_cache.set(cache_key, context.model_copy(deep=True))
         return context
 
 
@@ -0,0 +1,28 @@
+// L3 Episodic Memory: native temporal properties
+// Migration: Convert ISO-8601 string timestamps on Episode nodes and MENTIONS
+// relationships to native DateTime values so range indexes (e.g. on
+// Episode.factValidFrom) serve bi-temporal comparisons.
+// Strings without an offset are interpreted as UTC.
+// Idempotent: only rows whose factValidFrom is still a string are touched.
+// Batched writes require an implicit transaction (`:auto` in cypher-shell).
+
+:auto MATCH (e:Episode)
+WHERE e.factValidFrom = toString(e.factValidFrom)
+CALL {
+    WITH e
+    SET e.timeWindowStart = datetime(e.timeWindowStart),
+        e.timeWindowEnd = datetime(e.timeWindowEnd),
+        e.factValidFrom = datetime(e.factValidFrom),
+        e.factValidTo = datetime(e.factValidTo),
+        e.sourceObservationTimestamp = datetime(e.sourceObservationTimestamp),
+        e.consolidatedAt = datetime(e.consolidatedAt)
+} IN TRANSACTIONS OF 1000 ROWS;
+
+:auto MATCH (:Episode)-[r:MENTIONS]->(:Entity)
+WHERE r.factValidFrom = toString(r.factValidFrom)
+CALL {
+    WITH r
+    SET r.factValidFrom = datetime(r.factValidFrom),
+        r.factValidTo = datetime(r.factValidTo),
+        r.sourceObservationTimestamp = datetime(r.sourceObservationTimestamp)
+} IN TRANSACTIONS OF 1000 ROWS;
@@ -0,0 +1,14 @@
+-- L2 Working Memory CIAR Re-scoring Support
+-- Migration: Index for the chunked, in-database CIAR re-scoring job
+--
+-- WorkingMemoryTier.rescore_decay() recomputes age_decay, recency_boost and
+-- ciar_score with one set-based UPDATE per chunk of facts, paging through
+-- the table by fact_id. A generated or expression-indexed "effective CIAR"
+-- column is not possible: decay depends on NOW(), which is not immutable.
+
+-- Keyset paging of re-scoring chunks (WHERE fact_id > $1 ORDER BY fact_id)
+CREATE INDEX IF NOT EXISTS idx_working_memory_fact_id
+ON working_memory(fact_id);
+
+-- Add comment for documentation
+COMMENT ON COLUMN working_memory.ciar_score IS 'CIAR score; age decay and recency are refreshed in bulk by the L2 re-scoring job (WorkingMemoryTier.rescore_decay)';
@@ -0,0 +1,25 @@
+-- L2 Working Memory Consolidation Tracking
+-- Migration: Record which facts have been consolidated into L3 episodes
+--
+-- ConsolidationEngine marks facts once their episode is stored in L3, so the
+-- pressure valve and the wake-up sweep only read the unconsolidated backlog
+-- instead of re-reading whole time windows. Workers claim facts (claimed_at)
+-- before building an episode, so concurrent consolidation runs never pick up
+-- the same facts; a claim older than the tier's claim timeout is treated as
+-- abandoned and can be claimed again.
+
+ALTER TABLE working_memory
+ADD COLUMN IF NOT EXISTS consolidated_at TIMESTAMP,
+ADD COLUMN IF NOT EXISTS episode_id VARCHAR(255),
+ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP;
+
+-- Backlog count and keyset paging (ORDER BY extracted_at, fact_id); only
+-- unconsolidated rows are indexed, so the index stays as small as the backlog
+CREATE INDEX IF NOT EXISTS idx_working_memory_unconsolidated
+ON working_memory(extracted_at, fact_id)
+WHERE consolidated_at IS NULL;
+
+-- Add comments for documentation
+COMMENT ON COLUMN working_memory.consolidated_at IS 'When the fact was consolidated into an L3 episode (NULL = pending)';
+COMMENT ON COLUMN working_memory.episode_id IS 'L3 episode the fact was consolidated into';
+COMMENT ON COLUMN working_memory.claimed_at IS 'When a consolidation run claimed the fact (NULL = unclaimed)';
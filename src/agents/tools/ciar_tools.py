@@ -27,7 +27,7 @@ else:
         ToolRuntime = Any
 
 from src.agents.runtime import MASToolRuntime
-from src.memory.ciar_scorer import CIARScorer
+from src.memory.ciar_scorer import get_ciar_scorer
 
 
 # ============================================================================
@@ -120,7 +120,7 @@ async def ciar_calculate(
         await mas_runtime.stream_status(f"Calculating CIAR score for: {content[:50]}...")
         
         # Initialize scorer
-        scorer = CIARScorer()
+        scorer = get_ciar_scorer()
         
         # Build fact dict with current timestamp offset by days_old
         from datetime import timedelta, timezone
@@ -188,17 +188,19 @@ async def ciar_filter(
         mas_runtime = MASToolRuntime(runtime)
         await mas_runtime.stream_status(f"Filtering {len(facts)} facts by CIAR threshold {min_threshold}...")
         
-        scorer = CIARScorer()
+        scorer = get_ciar_scorer()
         
-        # Process each fact
-        results = []
+        # Ensure created_at is datetime
         for fact in facts:
-            # Ensure created_at is datetime
             if 'created_at' in fact and isinstance(fact['created_at'], str):
                 fact['created_at'] = datetime.fromisoformat(fact['created_at'].replace('Z', '+00:00'))
-            
-            score = scorer.calculate(fact)
-            
+        
+        # Score all facts in one vectorized pass
+        scores = scorer.calculate_batch(facts)
+        
+        results = []
+        for fact, score in zip(facts, scores):
+            score = float(score)
             if score >= min_threshold:
                 result_fact = fact.copy()
                 if return_scores:
@@ -241,7 +243,7 @@ async def ciar_explain(
         await mas_runtime.stream_status(f"Explaining CIAR score for: {content[:50]}...")
         
         # Initialize scorer
-        scorer = CIARScorer()
+        scorer = get_ciar_scorer()
         
         # Build fact dict
         from datetime import timedelta, timezone
@@ -33,7 +33,7 @@ else:
         ToolRuntime = Any
 
 from src.agents.runtime import MASToolRuntime
-from src.memory.graph_templates import get_template, validate_and_execute_template
+from src.memory.graph_templates import render_template
 
 
 # ============================================================================
@@ -223,8 +223,8 @@ async def l3_query_graph(
         
         await mas_runtime.stream_status(f"Executing Neo4j template: {template_name}")
         
-        # Validate template and parameters
-        is_valid, error_msg, cypher_query = validate_and_execute_template(
+        # Validate and render template and parameters once
+        is_valid, error_msg, rendered = render_template(
             name=template_name,
             params=parameters
         )
@@ -237,20 +237,15 @@ async def l3_query_graph(
         if not l3_tier:
             return "Error: L3 Episodic Memory tier not initialized"
         
-        # Get template for parameter merging
-        template = get_template(template_name)
-        merged_params = template.merge_params(parameters)
-        
-        # Execute query
-        results = await l3_tier.query_graph(
-            cypher_query=cypher_query,
-            parameters=merged_params
-        )
+        # Execute the pre-built variant (cached for read-only templates)
+        results = await l3_tier.query_template(template_name, parameters, rendered=rendered)
         
         # Format response
         response = {
             'template': template_name,
-            'parameters': merged_params,
+            # Values actually executed: defaults applied, structural
+            # params clamped to their bounds
+            'parameters': {**rendered.parameters, **rendered.structural_values},
             'session_id': session_id,
             'results_count': len(results),
             'results': results
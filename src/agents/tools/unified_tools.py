@@ -72,6 +72,11 @@ class GetContextBlockInput(BaseModel):
         default="structured",
         description="Output format: 'structured' (dict) or 'text' (formatted string)"
     )
+    token_budget: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Optional token budget; context is filled by priority until it is spent"
+    )
 
 
 class MemoryStoreInput(BaseModel):
@@ -162,6 +167,11 @@ async def memory_query(
         formatted_results = [f"# Memory Search Results ({len(results)} found)\n"]
         formatted_results.append(f"Query: {query}\n")
         
+        # Tiers that missed their deadline are left out of the ranking
+        skipped_tiers = getattr(results, 'metadata', {}).get('skipped_tiers')
+        if skipped_tiers:
+            formatted_results.append(f"Partial results: skipped {', '.join(skipped_tiers)} (deadline)\n")
+        
         for i, result in enumerate(results, 1):
             tier = result['tier']
             score = result['score']
@@ -196,6 +206,7 @@ async def get_context_block(
     max_turns: int = 20,
     max_facts: int = 10,
     format: str = "structured",
+    token_budget: Optional[int] = None,
     runtime: ToolRuntime = None
 ) -> str:
     """
@@ -214,6 +225,7 @@ async def get_context_block(
         max_turns: Maximum recent turns to include
         max_facts: Maximum facts to include
         format: Output format ('structured' or 'text')
+        token_budget: Optional token budget for the assembled context
     
     Returns:
         Context block in requested format
@@ -233,12 +245,14 @@ async def get_context_block(
             session_id=session_id,
             min_ciar=min_ciar,
             max_turns=max_turns,
-            max_facts=max_facts
+            max_facts=max_facts,
+            token_budget=token_budget
         )
         
         if format == "text":
             # Return formatted text for prompt injection
-            return context.to_prompt_string(include_metadata=True)
+            # A budgeted block is returned exactly as rendered within budget
+            return context.to_prompt_string(include_metadata=token_budget is None)
         else:
             # Return structured summary
             summary = [
@@ -13,19 +13,140 @@ Components:
 - Age Decay (AD): Time-based decay factor (0.1-1.0)
 - Recency Boost (RB): Access-based reinforcement (1.0-1.3)
 
+`calculate` scores one fact; `calculate_batch` scores many facts (or
+columnar NumPy input) with vectorized exp/log and a single regex pass for
+the certainty heuristics, producing the same scores.
+
+Configuration is loaded into an immutable `CIARConfig`. `get_ciar_scorer()`
+returns one process-wide scorer per config file that picks up edits to the
+file (checked by mtime, at most once per reload interval, whenever the
+scorer is used) or an explicit `reload_ciar_config()` by swapping in a new
+config object.
+
 Author: MAS Memory Layer Team
 Date: November 2025
 """
 
+import logging
 import math
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Union
+import numpy as np
 import yaml
 from pathlib import Path
 
 from src.memory.models import Fact
 
 
+# Certainty heuristics in priority order: (config key, default, phrases).
+# A fact takes the first group with any phrase in its lowercased content.
+CERTAINTY_PHRASES = (
+    ('explicit_statement', 0.9, ('i prefer', 'i want', 'i need', 'always', 'never')),
+    ('implied_preference', 0.8, ('usually', 'often', 'typically', 'generally')),
+    ('speculation', 0.4, ('might', 'maybe', 'possibly', 'could')),
+    ('observation', 0.6, ('observed', 'noticed', 'seen')),
+)
+
+# One zero-width lookahead per position finds every (overlapping) phrase
+# occurrence; the named group tells which heuristic matched. The leading
+# first-character class lets the scan skip positions no phrase starts at.
+_CERTAINTY_PATTERN = re.compile('(?=[' + re.escape(''.join(sorted({
+    phrase[0] for _, _, phrases in CERTAINTY_PHRASES for phrase in phrases
+}))) + '])(?=' + '|'.join(
+    f"(?P<g{index}>{'|'.join(re.escape(phrase) for phrase in phrases)})"
+    for index, (_, _, phrases) in enumerate(CERTAINTY_PHRASES)
+) + ')')
+
+# Joins contents for the single regex pass; no phrase can span it
+_CONTENT_SEPARATOR = '\x00'
+
+FactInput = Union[Dict[str, Any], Fact]
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "ciar_config.yaml"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CIARConfig:
+    """
+    Immutable snapshot of the `ciar` section of ciar_config.yaml.
+    
+    Scorers replace the whole snapshot on reload, so a reader always sees
+    one consistent configuration.
+    """
+    threshold: float
+    age_decay_lambda: float
+    max_age_days: float
+    min_age_score: float
+    recency_boost_factor: float
+    max_recency_boost: float
+    default_certainty: float
+    certainty_heuristics: Mapping[str, float]
+    impact_weights: Mapping[str, float]
+    raw: Mapping[str, Any]
+    path: Optional[Path] = None
+    mtime_ns: Optional[int] = None
+    
+    @classmethod
+    def from_dict(
+        cls,
+        config: Dict[str, Any],
+        path: Optional[Path] = None,
+        mtime_ns: Optional[int] = None
+    ) -> 'CIARConfig':
+        """
+        Build a config from the parsed `ciar` section.
+        
+        Raises:
+            KeyError: If a required setting is missing
+        """
+        return cls(
+            threshold=config['threshold'],
+            age_decay_lambda=config['age_decay']['lambda'],
+            max_age_days=config['age_decay']['max_age_days'],
+            min_age_score=config['age_decay']['min_score'],
+            recency_boost_factor=config['recency']['boost_factor'],
+            max_recency_boost=config['recency']['max_boost'],
+            default_certainty=config['certainty']['default'],
+            certainty_heuristics=MappingProxyType(dict(config['certainty'])),
+            impact_weights=MappingProxyType(dict(config['impact_weights'])),
+            raw=MappingProxyType(config),
+            path=path,
+            mtime_ns=mtime_ns
+        )
+    
+    @classmethod
+    def load(cls, config_path: Optional[Union[str, Path]] = None) -> 'CIARConfig':
+        """
+        Read and parse a config file.
+        
+        Args:
+            config_path: Path to ciar_config.yaml, defaults to config/ciar_config.yaml
+        
+        Raises:
+            OSError: If the file cannot be read
+            KeyError: If a required setting is missing
+        """
+        path = Path(config_path) if config_path is not None else DEFAULT_CONFIG_PATH
+        # Stat before reading: an edit landing in between is picked up on
+        # the next mtime check rather than missed
+        mtime_ns = os.stat(path).st_mtime_ns
+        with open(path, 'r') as f:
+            config = yaml.safe_load(f)
+        return cls.from_dict(config['ciar'], path=path, mtime_ns=mtime_ns)
+
+
+def _config_property(name: str) -> property:
+    return property(lambda self: getattr(self._config, name), doc=f"Current config `{name}`.")
+
+
 class CIARScorer:
     """
     Calculate CIAR scores for facts to determine promotion eligibility.
@@ -50,39 +171,117 @@ class CIARScorer:
         CIAR Score: 0.756
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    # Minimum seconds between mtime checks of the config file
+    DEFAULT_RELOAD_INTERVAL = 1.0
+    
+    # Settings are read from the current config snapshot
+    age_decay_lambda = _config_property('age_decay_lambda')
+    max_age_days = _config_property('max_age_days')
+    min_age_score = _config_property('min_age_score')
+    recency_boost_factor = _config_property('recency_boost_factor')
+    max_recency_boost = _config_property('max_recency_boost')
+    default_certainty = _config_property('default_certainty')
+    certainty_heuristics = _config_property('certainty_heuristics')
+    impact_weights = _config_property('impact_weights')
+    
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        config: Optional[CIARConfig] = None,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL
+    ):
         """
         Initialize the CIAR scorer with configuration.
         
+        Prefer `get_ciar_scorer()` over constructing scorers directly: it
+        shares one instance (and one parsed config) per process.
+        
         Args:
             config_path: Path to ciar_config.yaml, defaults to config/ciar_config.yaml
+            config: Already loaded config (skips reading config_path)
+            reload_interval: Minimum seconds between mtime checks in
+                reload_if_changed()
         """
-        if config_path is None:
-            config_path = Path(__file__).parent.parent.parent / "config" / "ciar_config.yaml"
-        else:
-            config_path = Path(config_path)
+        self._config = config if config is not None else CIARConfig.load(config_path)
+        self.reload_interval = reload_interval
+        self._next_check = time.monotonic() + reload_interval
+        self._reload_lock = threading.Lock()
+        self.reloads = 0
+        self.reload_errors = 0
+    
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """The `ciar` section of the current config."""
+        return self.config_snapshot.raw
+    
+    @property
+    def config_snapshot(self) -> CIARConfig:
+        """The current immutable config (checked for file changes first)."""
+        self.reload_if_changed()
+        return self._config
+    
+    @property
+    def threshold(self) -> float:
+        """Current config `threshold` (checked for file changes first)."""
+        return self.config_snapshot.threshold
+    
+    def reload(self, config: Optional[CIARConfig] = None) -> CIARConfig:
+        """
+        Swap in a new config.
         
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        The swap is a single reference assignment: concurrent scoring calls
+        see either the old or the new config, never a mix.
+        
+        Args:
+            config: New config; re-reads the current config file when omitted
         
-        self.config = config['ciar']
-        self.threshold = self.config['threshold']
+        Returns:
+            The config now in use
+        
+        Raises:
+            OSError, KeyError, yaml.YAMLError: If the file cannot be loaded
+                (the current config stays in use)
+        """
+        with self._reload_lock:
+            if config is None:
+                config = CIARConfig.load(self._config.path)
+            self._config = config
+            self.reloads += 1
+        logger.info(f"CIAR config reloaded from {config.path} (threshold={config.threshold})")
+        return config
+    
+    def reload_if_changed(self, force_check: bool = False) -> bool:
+        """
+        Reload the config if its file changed since it was loaded.
         
-        # Age decay parameters
-        self.age_decay_lambda = self.config['age_decay']['lambda']
-        self.max_age_days = self.config['age_decay']['max_age_days']
-        self.min_age_score = self.config['age_decay']['min_score']
+        The file is stat'ed at most once per reload_interval. A file that
+        fails to load is logged and the current config kept.
         
-        # Recency boost parameters
-        self.recency_boost_factor = self.config['recency']['boost_factor']
-        self.max_recency_boost = self.config['recency']['max_boost']
+        Scoring entry points (calculate, calculate_components,
+        calculate_batch), `threshold` and `config_snapshot` call this, so
+        long-lived holders of a scorer pick up edits without calling
+        `get_ciar_scorer()` again.
         
-        # Certainty parameters
-        self.default_certainty = self.config['certainty']['default']
-        self.certainty_heuristics = self.config['certainty']
+        Args:
+            force_check: Check the mtime now regardless of reload_interval
         
-        # Impact weights
-        self.impact_weights = self.config['impact_weights']
+        Returns:
+            True if a new config was swapped in
+        """
+        path = self._config.path
+        now = time.monotonic()
+        if path is None or (not force_check and now < self._next_check):
+            return False
+        self._next_check = now + self.reload_interval
+        try:
+            if os.stat(path).st_mtime_ns == self._config.mtime_ns:
+                return False
+            self.reload()
+            return True
+        except Exception as e:
+            self.reload_errors += 1
+            logger.warning(f"Keeping current CIAR config, reload of {path} failed: {e}")
+            return False
     
     def calculate(self, fact: Union[Dict[str, Any], Fact]) -> float:
         """
@@ -102,6 +301,8 @@ class CIARScorer:
             >>> score = scorer.calculate(fact)
             >>> assert 0.0 <= score <= 1.5
         """
+        self.reload_if_changed()
+        
         # Convert Fact model to dict if needed, preserving whether impact was explicitly set
         if isinstance(fact, Fact):
             fact_dict = fact.model_dump()
@@ -147,14 +348,9 @@ class CIARScorer:
         content = fact.get('content', '').lower()
         
         # Check for certainty indicators in content
-        if any(phrase in content for phrase in ['i prefer', 'i want', 'i need', 'always', 'never']):
-            return self.certainty_heuristics.get('explicit_statement', 0.9)
-        elif any(phrase in content for phrase in ['usually', 'often', 'typically', 'generally']):
-            return self.certainty_heuristics.get('implied_preference', 0.8)
-        elif any(phrase in content for phrase in ['might', 'maybe', 'possibly', 'could']):
-            return self.certainty_heuristics.get('speculation', 0.4)
-        elif any(phrase in content for phrase in ['observed', 'noticed', 'seen']):
-            return self.certainty_heuristics.get('observation', 0.6)
+        for key, default, phrases in CERTAINTY_PHRASES:
+            if any(phrase in content for phrase in phrases):
+                return self.certainty_heuristics.get(key, default)
         
         # Default certainty
         return self.default_certainty
@@ -273,6 +469,216 @@ class CIARScorer:
         
         return 1.0 + boost
     
+    def calculate_batch(
+        self,
+        facts: Union[Sequence[FactInput], Mapping[str, Any]],
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """
+        Calculate CIAR scores for many facts at once.
+        
+        Produces the same scores as `calculate` for each fact, with the
+        components computed as NumPy array operations.
+        
+        Args:
+            facts: List of fact dicts / Fact models, or columnar input as a
+                mapping of arrays (see calculate_components_batch)
+            now: Reference time for age decay (default: current UTC time)
+        
+        Returns:
+            np.ndarray: (n,) CIAR scores
+        
+        Example:
+            >>> scores = scorer.calculate_batch(facts)
+            >>> promotable = [f for f, s in zip(facts, scores) if s >= scorer.threshold]
+        """
+        return self.calculate_components_batch(facts, now)['final_score']
+    
+    def calculate_components_batch(
+        self,
+        facts: Union[Sequence[FactInput], Mapping[str, Any]],
+        now: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate all CIAR components for many facts at once.
+        
+        Columnar input is a mapping of equal-length arrays; every key is
+        optional except that the length must be inferable:
+            - certainty: explicit certainty (NaN = use content heuristics)
+            - content: fact contents, used where certainty is NaN
+            - impact: explicit impact (NaN = use fact_type weight)
+            - fact_type: fact types, used where impact is NaN
+            - age_seconds: fact age in seconds (NaN = no decay)
+            - access_count: access counts
+            - is_important: importance flags
+        
+        Args:
+            facts: List of fact dicts / Fact models, or columnar input
+            now: Reference time for age decay (default: current UTC time)
+        
+        Returns:
+            dict: (n,) arrays keyed like calculate_components()
+        """
+        self.reload_if_changed()
+        
+        if isinstance(facts, Mapping):
+            columns = dict(facts)
+        else:
+            columns = self._columns_from_facts(facts, now)
+        
+        n = self._column_length(columns)
+        certainty = self._column(columns, 'certainty', n, np.nan)
+        access_count = self._column(columns, 'access_count', n, 0.0)
+        
+        # Certainty: explicit (clamped), else content heuristics
+        heuristic = np.isnan(certainty)
+        certainty = np.clip(certainty, 0.0, 1.0)
+        if heuristic.any():
+            contents = columns.get('content')
+            if contents is None:
+                certainty[heuristic] = self.default_certainty
+            else:
+                missing = np.flatnonzero(heuristic)
+                certainty[missing] = self._heuristic_certainty([contents[i] for i in missing])
+        
+        # Impact: explicit (clamped), else fact-type weight with boosts
+        impact = self._column(columns, 'impact', n, np.nan)
+        weighted = np.isnan(impact)
+        impact = np.clip(impact, 0.0, 1.0)
+        if weighted.any():
+            fact_types = columns.get('fact_type')
+            missing = np.flatnonzero(weighted)
+            type_impact = np.array([
+                self.impact_weights.get((fact_types[i] or 'mention').lower(), 0.5)
+                if fact_types is not None else self.impact_weights.get('mention', 0.5)
+                for i in missing
+            ], dtype=np.float64)
+            important = self._column(columns, 'is_important', n, 0.0)[missing] > 0
+            type_impact = np.where(access_count[missing] > 10, np.minimum(1.0, type_impact * 1.1), type_impact)
+            type_impact = np.where(important, np.minimum(1.0, type_impact * 1.2), type_impact)
+            impact[missing] = type_impact
+        
+        # Age decay: exp(-lambda * days), days clamped to [0, max_age_days]
+        age_seconds = self._column(columns, 'age_seconds', n, np.nan)
+        age_days = np.clip(np.nan_to_num(age_seconds, nan=0.0) / 86400.0, 0.0, self.max_age_days)
+        age_decay = np.maximum(self.min_age_score, np.exp(-self.age_decay_lambda * age_days))
+        age_decay[np.isnan(age_seconds)] = 1.0
+        
+        # Recency boost: 1 + min(boost_factor * log(1 + count), max_boost)
+        accessed = access_count > 0
+        boost = self.recency_boost_factor * np.log1p(np.where(accessed, access_count, 0.0))
+        recency_boost = np.where(accessed, 1.0 + np.minimum(boost, self.max_recency_boost), 1.0)
+        
+        base_score = certainty * impact
+        temporal_score = age_decay * recency_boost
+        return {
+            'certainty': certainty,
+            'impact': impact,
+            'age_decay': age_decay,
+            'recency_boost': recency_boost,
+            'base_score': base_score,
+            'temporal_score': temporal_score,
+            'final_score': base_score * temporal_score
+        }
+    
+    def _heuristic_certainty(self, contents: Sequence[str]) -> np.ndarray:
+        """
+        Certainty heuristics for many contents in one regex pass.
+        
+        Contents are lowercased individually (so offsets stay exact), joined
+        and scanned once; each match is mapped back to its fact by offset.
+        """
+        values = np.array(
+            [self.certainty_heuristics.get(key, default) for key, default, _ in CERTAINTY_PHRASES]
+            + [self.default_certainty],
+            dtype=np.float64
+        )
+        lowered = [(content or '').lower() for content in contents]
+        text = _CONTENT_SEPARATOR.join(lowered)
+        
+        starts: List[int] = []
+        groups: List[int] = []
+        for match in _CERTAINTY_PATTERN.finditer(text):
+            starts.append(match.start())
+            groups.append(int(match.lastgroup[1:]))
+        
+        # Best (lowest) heuristic group per content; default when none
+        best = np.full(len(lowered), len(CERTAINTY_PHRASES), dtype=np.intp)
+        if starts:
+            lengths = np.fromiter(map(len, lowered), dtype=np.intp, count=len(lowered))
+            offsets = np.cumsum(lengths + 1) - lengths - 1
+            owner = np.searchsorted(offsets, np.asarray(starts), side='right') - 1
+            np.minimum.at(best, owner, np.asarray(groups, dtype=np.intp))
+        return values[best]
+    
+    @staticmethod
+    def _columns_from_facts(facts: Sequence[FactInput], now: Optional[datetime]) -> Dict[str, Any]:
+        """Extract scoring columns from fact dicts/models without model_dump()."""
+        rows = [
+            # Fact models carry no created_at or is_important (as in calculate())
+            {
+                'certainty': fact.certainty,
+                'impact': fact.impact if 'impact' in fact.model_fields_set else None,
+                'fact_type': fact.fact_type,
+                'access_count': fact.access_count,
+            } if isinstance(fact, Fact) else fact
+            for fact in facts
+        ]
+        
+        certainty = np.array([row.get('certainty') for row in rows], dtype=np.float64)
+        impacts = [row.get('impact') for row in rows]
+        try:
+            impact = np.array(impacts, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Unusable explicit values fall back to the fact-type weight
+            impact = np.array([CIARScorer._as_float(value) for value in impacts], dtype=np.float64)
+        
+        reference = (now or datetime.now(timezone.utc)).timestamp()
+        return {
+            'certainty': certainty,
+            'content': [row.get('content', '') for row in rows],
+            'impact': impact,
+            'fact_type': [row.get('fact_type', 'mention') for row in rows],
+            'age_seconds': reference - np.array(
+                [CIARScorer._timestamp(row.get('created_at')) for row in rows], dtype=np.float64
+            ),
+            'access_count': np.array([row.get('access_count', 0) or 0 for row in rows], dtype=np.float64),
+            'is_important': np.array([bool(row.get('is_important', False)) for row in rows], dtype=np.float64),
+        }
+    
+    @staticmethod
+    def _as_float(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+    
+    @staticmethod
+    def _timestamp(created_at: Any) -> float:
+        """POSIX timestamp of created_at (naive = UTC), NaN when missing."""
+        if created_at is None:
+            return math.nan
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at.timestamp()
+    
+    @staticmethod
+    def _column_length(columns: Mapping[str, Any]) -> int:
+        for value in columns.values():
+            if value is not None:
+                return len(value)
+        return 0
+    
+    @staticmethod
+    def _column(columns: Mapping[str, Any], name: str, n: int, default: float) -> np.ndarray:
+        """Float64 copy of a column, or a filled array if it is absent."""
+        value = columns.get(name)
+        if value is None:
+            return np.full(n, default, dtype=np.float64)
+        return np.array(value, dtype=np.float64)
+    
     def exceeds_threshold(self, fact: Union[Dict[str, Any], Fact]) -> bool:
         """
         Check if a fact's CIAR score exceeds the promotion threshold.
@@ -303,6 +709,8 @@ class CIARScorer:
                 - temporal_score: age_decay × recency_boost
                 - final_score: base_score × temporal_score
         """
+        self.reload_if_changed()
+        
         # Convert Fact model to dict if needed, preserving whether impact was explicitly set
         if isinstance(fact, Fact):
             fact_dict = fact.model_dump()
@@ -330,3 +738,45 @@ class CIARScorer:
             'temporal_score': temporal_score,
             'final_score': final_score
         }
+
+
+_scorers: Dict[Path, CIARScorer] = {}
+_scorers_lock = threading.Lock()
+
+
+def get_ciar_scorer(config_path: Optional[Union[str, Path]] = None) -> CIARScorer:
+    """
+    Return the process-wide scorer for a config file.
+    
+    The config is parsed once per process; later calls only check (at most
+    once per reload interval) whether the file changed and reload it if so.
+    
+    Args:
+        config_path: Path to ciar_config.yaml, defaults to config/ciar_config.yaml
+    
+    Returns:
+        Shared CIARScorer
+    """
+    path = Path(config_path).resolve() if config_path is not None else DEFAULT_CONFIG_PATH.resolve()
+    scorer = _scorers.get(path)
+    if scorer is None:
+        with _scorers_lock:
+            scorer = _scorers.get(path)
+            if scorer is None:
+                scorer = _scorers[path] = CIARScorer(config_path=str(path))
+                return scorer
+    scorer.reload_if_changed()
+    return scorer
+
+
+def reload_ciar_config(config_path: Optional[Union[str, Path]] = None) -> CIARConfig:
+    """
+    Explicitly reload the shared scorer's config (e.g. from a signal handler).
+    
+    Args:
+        config_path: Path to ciar_config.yaml, defaults to config/ciar_config.yaml
+    
+    Returns:
+        The config now in use
+    """
+    return get_ciar_scorer(config_path).reload()
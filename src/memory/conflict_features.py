@@ -0,0 +1,124 @@
+"""
+Precomputed conflict-detection features for knowledge documents.
+
+Contradiction checks used to lowercase and rescan both texts for every pair
+of candidate recommendations. Instead, each document's polarity is computed
+once (when it is stored or loaded) as a small bitmask, and query-time
+detection groups candidates by topic key and derives contradictory pairs
+from the polarity arrays with NumPy.
+
+Polarity bits:
+- POLARITY_NEGATIVE: text contains negative/prohibitive language
+- POLARITY_POSITIVE: text contains positive/prescriptive language
+"""
+
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+import re
+
+import numpy as np
+
+POLARITY_NEGATIVE = 1
+POLARITY_POSITIVE = 2
+
+NEGATIVE_WORDS = ("not", "don't", "avoid", "never", "shouldn't", "cannot")
+POSITIVE_WORDS = ("should", "must", "recommend", "always", "can", "enable")
+
+# Substring semantics match the original keyword scan (e.g. "cannot" is both)
+_NEGATIVE_PATTERN = re.compile("|".join(re.escape(w) for w in NEGATIVE_WORDS), re.IGNORECASE)
+_POSITIVE_PATTERN = re.compile("|".join(re.escape(w) for w in POSITIVE_WORDS), re.IGNORECASE)
+
+
+def compute_polarity(text: str) -> int:
+    """
+    Compute the polarity bitmask for a text.
+
+    Args:
+        text: Document content
+
+    Returns:
+        Bitwise OR of POLARITY_NEGATIVE and POLARITY_POSITIVE
+    """
+    polarity = 0
+    if _NEGATIVE_PATTERN.search(text):
+        polarity |= POLARITY_NEGATIVE
+    if _POSITIVE_PATTERN.search(text):
+        polarity |= POLARITY_POSITIVE
+    return polarity
+
+
+def is_contradictory(polarity1: int, polarity2: int) -> bool:
+    """True if one side is negative and the other positive."""
+    return bool(
+        (polarity1 & POLARITY_NEGATIVE and polarity2 & POLARITY_POSITIVE)
+        or (polarity1 & POLARITY_POSITIVE and polarity2 & POLARITY_NEGATIVE)
+    )
+
+
+def group_by_topic(keys: Sequence[Hashable]) -> List[np.ndarray]:
+    """
+    Group positions by topic key.
+
+    Args:
+        keys: Topic key per document, in candidate order
+
+    Returns:
+        Index arrays (ascending) for every group with at least two members
+    """
+    groups: Dict[Hashable, List[int]] = {}
+    for position, key in enumerate(keys):
+        groups.setdefault(key, []).append(position)
+    return [np.asarray(members, dtype=np.intp) for members in groups.values() if len(members) > 1]
+
+
+def contradictory_pairs(polarities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all contradictory pairs within one topic group.
+
+    Args:
+        polarities: (n,) integer polarity bitmasks
+
+    Returns:
+        Tuple of (i, j) index arrays with i < j, in row-major order
+    """
+    polarities = np.asarray(polarities)
+    negative = (polarities & POLARITY_NEGATIVE) != 0
+    positive = (polarities & POLARITY_POSITIVE) != 0
+    if not (negative.any() and positive.any()):
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    conflict = np.outer(negative, positive) | np.outer(positive, negative)
+    return np.nonzero(np.triu(conflict, k=1))
+
+
+def topic_key(document: Any, fields: Sequence[str]) -> Tuple[Any, ...]:
+    """
+    Build the topic key for a document from attributes or metadata.
+
+    Args:
+        document: KnowledgeDocument (or any object with a metadata dict)
+        fields: Field names, looked up as attributes first, then in metadata
+
+    Returns:
+        Tuple of field values (None where absent)
+    """
+    metadata = getattr(document, "metadata", None) or {}
+    values = []
+    for field in fields:
+        value = getattr(document, field, None)
+        if value is None:
+            value = metadata.get(field)
+        if isinstance(value, list):
+            value = tuple(value)
+        values.append(value or None)
+    return tuple(values)
+
+
+__all__ = [
+    "POLARITY_NEGATIVE",
+    "POLARITY_POSITIVE",
+    "compute_polarity",
+    "is_contradictory",
+    "group_by_topic",
+    "contradictory_pairs",
+    "topic_key",
+]
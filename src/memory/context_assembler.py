@@ -0,0 +1,478 @@
+"""
+Token-budgeted, incremental context assembly for prompt injection.
+
+ContextAssembler fills a token budget from the memory tiers in priority
+order (L1 recent turns, L2 significant facts, L3 episode summaries, L4
+knowledge snippets). Each tier is asked only for about as many items as
+the remaining budget can hold, and tiers below the point where the budget
+runs out are not read at all.
+
+Per session the assembler keeps the rendered prompt line and token count
+of every item it has seen, plus the rendered text of each section. A new
+turn or fact therefore costs one render and one tokenizer call, and
+unchanged sections are reused as-is. With a generation tracker (see
+src/memory/generations.py), a session whose tiers were not written to
+since the last assembly is served without any backend read.
+
+Token counting is pluggable: anything exposing `count_tokens(text)` or
+`encode(text)` (e.g. a tiktoken encoding), or a plain callable. Without a
+tokenizer, or if it fails, the chars-per-token heuristic is used.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+import asyncio
+import logging
+import math
+
+from src.memory.generations import SessionGenerations
+from src.memory.models import ContextBlock
+from src.memory.result_cache import LRUTTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class Tokenizer(Protocol):
+    """Counts tokens in a piece of text."""
+
+    def count_tokens(self, text: str) -> int:
+        ...
+
+
+class CharsPerTokenTokenizer:
+    """Heuristic tokenizer: one token per `chars_per_token` characters."""
+
+    def __init__(self, chars_per_token: float = 4.0):
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        self.chars_per_token = chars_per_token
+
+    def count_tokens(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+
+class _EncodingTokenizer:
+    """Adapts tokenizers exposing `encode(text)` (tiktoken, HF tokenizers)."""
+
+    def __init__(self, encoding: Any):
+        self.encoding = encoding
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode(text))
+
+
+class _CallableTokenizer:
+    def __init__(self, func: Callable[[str], int]):
+        self.func = func
+
+    def count_tokens(self, text: str) -> int:
+        return int(self.func(text))
+
+
+def resolve_tokenizer(tokenizer: Optional[Any] = None) -> Tokenizer:
+    """
+    Resolve a tokenizer.
+
+    Args:
+        tokenizer: Object with `count_tokens(text)`, object with
+            `encode(text)`, callable returning a token count, or None for
+            the chars-per-token heuristic
+
+    Returns:
+        Tokenizer instance
+
+    Raises:
+        TypeError: If the object cannot count tokens
+    """
+    if tokenizer is None:
+        return CharsPerTokenTokenizer()
+    if isinstance(tokenizer, Tokenizer):
+        return tokenizer
+    if callable(getattr(tokenizer, "encode", None)):
+        return _EncodingTokenizer(tokenizer)
+    if callable(tokenizer):
+        return _CallableTokenizer(tokenizer)
+    raise TypeError(f"Cannot count tokens with {type(tokenizer).__name__}")
+
+
+# Section headers, in prompt (and priority) order
+SECTION_HEADERS = {
+    "L1": "## Recent Conversation",
+    "L2": "\n## Key Facts (Working Memory)",
+    "L3": "\n## Related Episodes (Episodic Memory)",
+    "L4": "\n## Relevant Knowledge (Semantic Memory)",
+}
+
+
+@dataclass
+class _Item:
+    line: str
+    tokens: int
+    value: Any
+
+
+@dataclass
+class _SessionState:
+    """Rendered items and sections of one session's last assembly."""
+    items: Dict[str, _Item] = field(default_factory=dict)
+    sections: Dict[str, Tuple[Tuple[str, ...], str]] = field(default_factory=dict)
+    signature: Optional[Tuple] = None
+    block: Optional[ContextBlock] = None
+
+
+class ContextAssembler:
+    """
+    Assemble ContextBlocks that fit a token budget.
+
+    Usage Example:
+        ```python
+        assembler = ContextAssembler(l1_tier=l1, l2_tier=l2, tokenizer=encoding)
+        block = await assembler.assemble(session_id, token_budget=2000)
+        prompt = block.to_prompt_string()
+        ```
+    """
+
+    PRIORITY = ("L1", "L2", "L3", "L4")
+    DEFAULT_ITEM_TOKENS = 40  # Initial guess used to size tier reads
+    DEFAULT_MAX_ITEMS = {"L2": 50, "L3": 10, "L4": 10}
+    DEFAULT_MAX_SESSIONS = 1000
+    DEFAULT_SESSION_TTL_SECONDS = 3600.0
+
+    def __init__(
+        self,
+        l1_tier: Optional[Any] = None,
+        l2_tier: Optional[Any] = None,
+        l3_tier: Optional[Any] = None,
+        l4_tier: Optional[Any] = None,
+        tokenizer: Optional[Any] = None,
+        chars_per_token: float = 4.0,
+        generations: Optional[SessionGenerations] = None,
+        tier_shares: Optional[Dict[str, float]] = None,
+        max_items: Optional[Dict[str, int]] = None,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        session_ttl_seconds: float = DEFAULT_SESSION_TTL_SECONDS
+    ):
+        """
+        Initialize the assembler.
+
+        Args:
+            l1_tier: Active Context tier (recent turns)
+            l2_tier: Working Memory tier (facts)
+            l3_tier: Episodic Memory tier (episode summaries)
+            l4_tier: Semantic Memory tier (knowledge, needs a query)
+            tokenizer: Token counter (see resolve_tokenizer); defaults to
+                the chars-per-token heuristic
+            chars_per_token: Heuristic ratio used without a tokenizer, or
+                when the tokenizer fails
+            generations: Tier generation tracker; when set, assemblies of
+                unchanged sessions are served without backend reads
+            tier_shares: Optional cap per tier as a fraction of the budget
+                (e.g. {'L1': 0.5} leaves at least half for other tiers)
+            max_items: Maximum items read per tier (L2-L4)
+            max_sessions: Sessions whose rendered state is kept (LRU)
+            session_ttl_seconds: Idle time before a session's state expires
+        """
+        self.tiers = {"L1": l1_tier, "L2": l2_tier, "L3": l3_tier, "L4": l4_tier}
+        self.fallback_tokenizer = CharsPerTokenTokenizer(chars_per_token)
+        self.tokenizer = resolve_tokenizer(tokenizer) if tokenizer is not None else self.fallback_tokenizer
+        self.generations = generations
+        self.tier_shares = dict(tier_shares or {})
+        self.max_items = {**self.DEFAULT_MAX_ITEMS, **(max_items or {})}
+        self._sessions = LRUTTLCache(max_entries=max_sessions, ttl_seconds=session_ttl_seconds)
+        self.tier_reads = 0
+        self.tokenized_items = 0
+        self.reused_items = 0
+        self.tokenizer_errors = 0
+        self._header_tokens = {tier: self.count_tokens(header) for tier, header in SECTION_HEADERS.items()}
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the configured tokenizer, falling back to the heuristic."""
+        try:
+            return self.tokenizer.count_tokens(text)
+        except Exception as e:
+            self.tokenizer_errors += 1
+            logger.warning(f"Tokenizer failed, using chars-per-token heuristic: {e}")
+            return self.fallback_tokenizer.count_tokens(text)
+
+    async def assemble(
+        self,
+        session_id: str,
+        token_budget: int,
+        min_ciar: float = 0.6,
+        max_turns: Optional[int] = None,
+        max_facts: Optional[int] = None,
+        query: Optional[str] = None,
+        deadline: Optional[float] = None,
+        use_cache: bool = True
+    ) -> ContextBlock:
+        """
+        Assemble a context block within a token budget.
+
+        Args:
+            session_id: Session to assemble context for
+            token_budget: Maximum tokens of the rendered prompt
+            min_ciar: Minimum CIAR score for L2 facts
+            max_turns: Optional cap on L1 turns
+            max_facts: Optional cap on L2 facts
+            query: Query for L4 knowledge search (L4 is skipped without one)
+            deadline: Optional overall deadline in seconds for tier reads;
+                tiers that miss it are listed in `skipped_tiers`
+            use_cache: Set False to re-read all tiers even if unchanged
+
+        Returns:
+            ContextBlock whose `to_prompt_string()` is the rendered prompt
+            and whose `estimated_tokens` is its token count
+
+        Raises:
+            ValueError: If token_budget is negative
+        """
+        if token_budget < 0:
+            raise ValueError("token_budget must be non-negative")
+
+        state = self._sessions.get(session_id)
+        if state is None:
+            state = _SessionState()
+            self._sessions.set(session_id, state)
+
+        signature = None
+        if self.generations is not None:
+            tiers = [tier for tier in self.PRIORITY if self.tiers[tier] is not None]
+            try:
+                generation = await self.generations.snapshot(session_id, tiers)
+                signature = (token_budget, min_ciar, max_turns, max_facts, query, generation)
+            except Exception as e:
+                logger.warning(f"Generations unavailable, re-reading tiers: {e}")
+        if use_cache and signature is not None and signature == state.signature and state.block is not None:
+            return state.block.model_copy(deep=True, update={"cache_hit": True})
+
+        loop = asyncio.get_running_loop()
+        stop_at = loop.time() + deadline if deadline is not None else None
+        limits = {"L1": max_turns, "L2": max_facts}
+        remaining = token_budget
+        selected: Dict[str, List[str]] = {}
+        fetched: Dict[str, _Item] = {}
+        skipped: List[str] = []
+
+        for tier in self.PRIORITY:
+            if remaining <= 0:
+                break  # Budget spent: lower-priority tiers are not read
+            if self.tiers[tier] is None or (tier == "L4" and not query):
+                continue
+            tier_budget = remaining
+            if tier in self.tier_shares:
+                tier_budget = min(tier_budget, int(token_budget * self.tier_shares[tier]))
+            if tier_budget <= self._header_tokens[tier]:
+                continue
+
+            timeout = None if stop_at is None else max(stop_at - loop.time(), 0.0)
+            try:
+                keys, spent = await asyncio.wait_for(
+                    self._fill_tier(
+                        tier, state, fetched, session_id, tier_budget,
+                        limits.get(tier), min_ciar, query
+                    ),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"{tier} skipped in context assembly: deadline exceeded")
+                skipped.append(tier)
+                continue
+            except Exception as e:
+                logger.warning(f"{tier} skipped in context assembly: {e}")
+                skipped.append(tier)
+                continue
+            if keys:
+                selected[tier] = keys
+                remaining -= spent
+
+        # Keep rendered items that were read this time; drop the rest
+        state.items = fetched
+        block = self._build_block(session_id, state, selected, min_ciar, token_budget)
+        block.skipped_tiers = skipped
+        state.sections = {tier: state.sections[tier] for tier in selected}
+        if signature is not None and not skipped:
+            state.signature = signature
+            state.block = block.model_copy(deep=True)
+        else:
+            state.signature = None
+            state.block = None
+        return block
+
+    async def _fill_tier(
+        self,
+        tier: str,
+        state: _SessionState,
+        fetched: Dict[str, _Item],
+        session_id: str,
+        tier_budget: int,
+        limit: Optional[int],
+        min_ciar: float,
+        query: Optional[str]
+    ) -> Tuple[List[str], int]:
+        """
+        Read a tier in priority order until its share of the budget is spent.
+
+        Reads are sized from the average item size seen so far and grown
+        only while everything read still fits.
+
+        Returns:
+            Tuple of (selected item keys in priority order, tokens spent
+            including the section header)
+        """
+        max_items = self.max_items.get(tier)
+        if limit is not None:
+            max_items = limit if max_items is None else min(limit, max_items)
+        spent = self._header_tokens[tier]
+        keys: List[str] = []
+
+        # L1 returns its whole (bounded) turn window in one read
+        read_size = None
+        if tier != "L1":
+            read_size = self._estimate_items(state, tier_budget - spent, max_items)
+
+        while True:
+            values = await self._read_tier(tier, session_id, read_size, min_ciar, query)
+            self.tier_reads += 1
+            if tier == "L1" and max_items is not None:
+                values = values[:max_items]
+
+            keys, spent = [], self._header_tokens[tier]
+            budget_hit = False
+            for key, value in values:
+                item = self._render(tier, key, value, state, fetched)
+                if spent + item.tokens > tier_budget:
+                    budget_hit = True
+                    break
+                keys.append(key)
+                spent += item.tokens
+
+            exhausted = read_size is None or len(values) < read_size
+            if budget_hit or exhausted or (max_items is not None and read_size >= max_items):
+                return keys, spent
+            grown = read_size * 2
+            read_size = grown if max_items is None else min(grown, max_items)
+
+    def _estimate_items(self, state: _SessionState, tokens: int, max_items: Optional[int]) -> int:
+        """Number of items expected to fill `tokens`, plus one to detect overflow."""
+        if state.items:
+            average = sum(item.tokens for item in state.items.values()) / len(state.items)
+        else:
+            average = self.DEFAULT_ITEM_TOKENS
+        estimate = max(int(tokens / max(average, 1.0)) + 1, 1)
+        return estimate if max_items is None else min(estimate, max_items)
+
+    async def _read_tier(
+        self,
+        tier: str,
+        session_id: str,
+        limit: Optional[int],
+        min_ciar: float,
+        query: Optional[str]
+    ) -> List[Tuple[str, Any]]:
+        """Read (key, value) pairs from a tier, best first."""
+        if tier == "L1":
+            # Newest first: the most recent turns win the budget
+            turns = await self.tiers["L1"].retrieve(session_id) or []
+            return [
+                (f"turn:{turn.get('turn_id') or turn.get('timestamp') or index}", turn)
+                for index, turn in enumerate(turns)
+            ]
+        if tier == "L2":
+            facts = await self.tiers["L2"].query_by_session(
+                session_id, min_ciar_score=min_ciar, limit=limit
+            )
+            return [(f"fact:{fact.fact_id}", fact) for fact in facts]
+        if tier == "L3":
+            episodes = await self.tiers["L3"].query(filters={"session_id": session_id}, limit=limit)
+            return [(f"episode:{episode.episode_id}", episode) for episode in episodes]
+        documents = await self.tiers["L4"].search(query_text=query, limit=limit)
+        return [(f"knowledge:{doc.knowledge_id}", doc) for doc in documents]
+
+    def _render(
+        self,
+        tier: str,
+        key: str,
+        value: Any,
+        state: _SessionState,
+        fetched: Dict[str, _Item]
+    ) -> _Item:
+        """Render and count an item, reusing the previous render if unchanged."""
+        item = fetched.get(key) or state.items.get(key)
+        if tier == "L1":
+            line = f"[{value.get('role', 'unknown').upper()}]: {value.get('content', '')}"
+        elif tier == "L2":
+            line = f"- {value.content}"
+        elif tier == "L3":
+            line = f"- {value.summary}"
+        else:
+            line = f"- {value.content}"
+        if item is not None and item.line == line:
+            self.reused_items += 1
+            item.value = value
+        else:
+            # The newline joining the line to the section counts too
+            item = _Item(line=line, tokens=self.count_tokens("\n" + line), value=value)
+            self.tokenized_items += 1
+        fetched[key] = item
+        return item
+
+    def _section_text(self, tier: str, keys: List[str], state: _SessionState) -> str:
+        """Rendered section text, rebuilt only when its items changed."""
+        key_tuple = tuple(keys)
+        cached = state.sections.get(tier)
+        if cached is not None and cached[0] == key_tuple:
+            return cached[1]
+        lines = [state.items[key].line for key in keys]
+        if tier == "L1":
+            lines.reverse()  # Chronological order in the prompt
+        text = "\n".join([SECTION_HEADERS[tier], *lines])
+        state.sections[tier] = (key_tuple, text)
+        return text
+
+    def _build_block(
+        self,
+        session_id: str,
+        state: _SessionState,
+        selected: Dict[str, List[str]],
+        min_ciar: float,
+        token_budget: int
+    ) -> ContextBlock:
+        items = state.items
+        turns = [items[key].value for key in reversed(selected.get("L1", []))]
+        facts = [items[key].value for key in selected.get("L2", [])]
+        sections = [self._section_text(tier, selected[tier], state) for tier in self.PRIORITY if tier in selected]
+        tokens = sum(self._header_tokens[tier] + sum(items[key].tokens for key in selected[tier]) for tier in selected)
+
+        block = ContextBlock(
+            session_id=session_id,
+            recent_turns=turns,
+            turn_count=len(turns),
+            significant_facts=facts,
+            fact_count=len(facts),
+            min_ciar_threshold=min_ciar,
+            estimated_tokens=tokens,
+            token_budget=token_budget,
+            episode_summaries=[items[key].value.summary for key in selected.get("L3", [])],
+            knowledge_snippets=[items[key].value.content for key in selected.get("L4", [])],
+        )
+        block.set_rendered_prompt("\n".join(sections))
+        return block
+
+    def forget(self, session_id: str) -> None:
+        """Drop a session's cached rendering state."""
+        self._sessions.delete(session_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return session cache, tier read and tokenizer statistics."""
+        stats = self._sessions.stats()
+        stats.update({
+            "tier_reads": self.tier_reads,
+            "tokenized_items": self.tokenized_items,
+            "reused_items": self.reused_items,
+            "tokenizer_errors": self.tokenizer_errors,
+        })
+        return stats
+
+
+__all__ = ["CharsPerTokenTokenizer", "ContextAssembler", "Tokenizer", "resolve_tokenizer"]
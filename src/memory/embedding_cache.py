@@ -0,0 +1,194 @@
+"""
+Embedding caches for query-time similarity scoring.
+
+Document embeddings are computed once when content is written (e.g. when a
+KnowledgeDocument is stored in L4) and kept here as L2-normalized float32
+rows. Query-time consumers then gather a candidate matrix and compute cosine
+similarity with a single matrix-vector product instead of re-embedding
+documents on every request.
+
+Caches are process-local; the vectors themselves are persisted with the
+L4 documents, so other processes load them from search results
+(SemanticMemoryTier.cache_missing_embeddings) without calling the embedding
+provider. Query vectors go in a separate instance so bursts of distinct
+queries cannot evict document embeddings.
+
+Key Features:
+- Bounded LRU (OrderedDict, O(1) get/put/evict)
+- Vectors normalized on insert, so cosine similarity == dot product
+- Batch gather (`get_matrix`) for vectorized NumPy scoring
+- Process-wide document cache via `get_shared_embedding_cache()`
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import hashlib
+import logging
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU cache of L2-normalized embedding vectors.
+
+    Keys are caller-defined identifiers (knowledge IDs, or `content_key()`
+    hashes for free text such as queries). Keep one kind of vector per
+    instance: sharing one LRU lets the more frequent kind evict the other.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            max_entries: Maximum vectors kept before least-recently-used eviction
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def content_key(text: str, namespace: str = "text") -> str:
+        """Build a stable cache key for free text (e.g. a query string)."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:24]
+        return f"{namespace}:{digest}"
+
+    @staticmethod
+    def normalize(vector: Sequence[float]) -> np.ndarray:
+        """Return a float32 unit vector (zero vectors are returned unchanged)."""
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(array))
+        if norm > 0.0:
+            array = array / norm
+        return array
+
+    def put(self, key: str, vector: Sequence[float]) -> None:
+        """Store (or replace) the normalized embedding for a key."""
+        normalized = self.normalize(vector)
+        with self._lock:
+            self._vectors[key] = normalized
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the normalized embedding for a key, or None."""
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is None:
+                self._misses += 1
+                return None
+            self._vectors.move_to_end(key)
+            self._hits += 1
+            return vector
+
+    def get_matrix(
+        self,
+        keys: Sequence[str],
+        dimension: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gather cached embeddings for many keys into one matrix.
+
+        Args:
+            keys: Keys to look up, in caller order
+            dimension: Only include vectors of this size (skips stale models)
+
+        Returns:
+            Tuple of (matrix, positions) where matrix has one row per cached
+            key and positions holds the index of each row's key in `keys`.
+        """
+        rows: List[np.ndarray] = []
+        positions: List[int] = []
+        for position, key in enumerate(keys):
+            vector = self.get(key)
+            if vector is None:
+                continue
+            if dimension is not None and vector.shape[0] != dimension:
+                continue
+            rows.append(vector)
+            positions.append(position)
+
+        if not rows:
+            return np.empty((0, dimension or 0), dtype=np.float32), np.empty(0, dtype=np.intp)
+
+        width = rows[0].shape[0]
+        if any(row.shape[0] != width for row in rows):
+            # Mixed dimensions (model change); keep rows matching the first
+            kept = [(row, pos) for row, pos in zip(rows, positions) if row.shape[0] == width]
+            rows = [row for row, _ in kept]
+            positions = [pos for _, pos in kept]
+
+        return np.vstack(rows), np.asarray(positions, dtype=np.intp)
+
+    def invalidate(self, key: str) -> None:
+        """Drop the embedding for a key if present."""
+        with self._lock:
+            self._vectors.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached embeddings and reset counters."""
+        with self._lock:
+            self._vectors.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._vectors
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit-rate statistics."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._vectors),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+
+def cosine_scores(matrix: np.ndarray, query_vector: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of each normalized row in `matrix` against a query.
+
+    Args:
+        matrix: (n, d) matrix of L2-normalized rows
+        query_vector: (d,) query vector (normalized here)
+
+    Returns:
+        (n,) array of similarities in [-1, 1]
+    """
+    if matrix.size == 0:
+        return np.empty(0, dtype=np.float32)
+    return matrix @ EmbeddingCache.normalize(query_vector)
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide document embedding cache, creating it on first use."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = EmbeddingCache()
+    return _shared_cache
+
+
+__all__ = ["EmbeddingCache", "cosine_scores", "get_shared_embedding_cache"]
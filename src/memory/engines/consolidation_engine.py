@@ -16,18 +16,22 @@ References:
 
 import logging
 import hashlib
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta, timezone
+import time
+from typing import Dict, Any, List, Optional, Tuple, Union
+from datetime import datetime, timezone
 from uuid import uuid4
 import asyncio
 
+import numpy as np
+
 from src.memory.engines.base_engine import BaseEngine
 from src.memory.tiers.working_memory_tier import WorkingMemoryTier
 from src.memory.tiers.episodic_memory_tier import EpisodicMemoryTier
 from src.memory.models import Episode, Fact
+from src.memory.fact_batch import FactBatch
 from src.utils.llm_client import LLMClient
 from src.utils.providers import BaseProvider
-from src.memory.lifecycle_stream import LifecycleStreamConsumer
+from src.memory.lifecycle_stream import LifecycleStreamConsumer, LifecycleStreamProducer
 
 logger = logging.getLogger(__name__)
 
@@ -37,18 +41,25 @@ class ConsolidationEngine(BaseEngine):
     Consolidates facts from L2 into episodes in L3.
     
     Flow:
-    1. Retrieve facts from WorkingMemoryTier (L2) since last consolidation.
-    2. Cluster facts by time windows (default: 24 hours).
+    1. Retrieve facts from WorkingMemoryTier (L2) not yet consolidated,
+       in one columnar read (FactBatch).
+    2. Cluster facts by time windows (default: 24 hours), then group each
+       window by topic_segment_id (facts without one form a single group),
+       with bounded cluster sizes (see _cluster_facts).
     3. Generate episode summary and narrative using LLM.
     4. Generate embedding for episode content.
     5. Store episode in EpisodicMemoryTier (L3) with dual indexing.
+    6. Mark the episode's facts consolidated in L2.
     """
 
     DEFAULT_TIME_WINDOW_HOURS = 24
     DEFAULT_EMBEDDING_MODEL = "gemini-embedding-001"
     DEFAULT_SUMMARY_MODEL = "gemini-2.5-flash"
     DEFAULT_PRESSURE_VALVE_THRESHOLD = 50  # Trigger batch consolidation at 50 facts
-    DEFAULT_BATCH_SIZE = 100  # Max facts to process in one sweep
+    DEFAULT_BATCH_SIZE = 100  # Facts per backlog page in a sweep
+    DEFAULT_FETCH_LIMIT = 500  # Max facts read from L2 per session
+    DEFAULT_MIN_CLUSTER_SIZE = 3  # Smaller topic groups are pooled
+    DEFAULT_MAX_CLUSTER_SIZE = 25  # Bounds the facts in one summary prompt
 
     def __init__(
         self,
@@ -57,7 +68,8 @@ class ConsolidationEngine(BaseEngine):
         llm_provider: Optional[LLMClient] = None,
         stream_consumer: Optional[LifecycleStreamConsumer] = None,
         config: Optional[Dict[str, Any]] = None,
-        gemini_provider: Optional[BaseProvider] = None
+        gemini_provider: Optional[BaseProvider] = None,
+        stream_producer: Optional[LifecycleStreamProducer] = None
     ):
         super().__init__()
         self.l2 = l2_tier
@@ -72,6 +84,7 @@ class ConsolidationEngine(BaseEngine):
         else:
             raise ValueError("llm_provider or gemini_provider must be provided")
         self.stream_consumer = stream_consumer
+        self.stream_producer = stream_producer
         self.config = config or {}
         self.time_window_hours = self.config.get(
             'time_window_hours', self.DEFAULT_TIME_WINDOW_HOURS
@@ -88,6 +101,15 @@ class ConsolidationEngine(BaseEngine):
         self.batch_size = self.config.get(
             'batch_size', self.DEFAULT_BATCH_SIZE
         )
+        self.fetch_limit = self.config.get(
+            'fetch_limit', self.DEFAULT_FETCH_LIMIT
+        )
+        self.min_cluster_size = self.config.get(
+            'min_cluster_size', self.DEFAULT_MIN_CLUSTER_SIZE
+        )
+        self.max_cluster_size = self.config.get(
+            'max_cluster_size', self.DEFAULT_MAX_CLUSTER_SIZE
+        )
         self._running = False
         self._buffer: List[Fact] = []
 
@@ -140,46 +162,59 @@ class ConsolidationEngine(BaseEngine):
         system was offline. Provides eventual consistency for facts that
         couldn't be consolidated in real-time.
         
+        The backlog is claimed in keyset-paged batches of batch_size,
+        oldest first, so a sweep running alongside process_session (or a
+        second sweep from the pressure valve) never consolidates the same
+        facts. Facts are marked consolidated as their episodes are stored,
+        so an interrupted sweep resumes where it stopped; facts whose
+        episode failed are released for the next sweep.
+        
         Returns:
             Stats: sessions_processed, facts_consolidated, episodes_created
         """
         stats = {
             "sessions_processed": 0,
+            "facts_found": 0,
             "facts_consolidated": 0,
             "episodes_created": 0,
             "errors": 0
         }
         
         try:
-            # Query L2 for all unconsolidated facts
-            # (Requires L2 tier to track consolidation status)
-            unconsolidated = await self._get_unconsolidated_facts()
+            after_fact_id = None
+            while True:
+                unconsolidated = await self._get_unconsolidated_facts(after_fact_id)
+                if not unconsolidated:
+                    break
+                stats["facts_found"] += len(unconsolidated)
+                
+                # Group facts by session
+                sessions: Dict[str, List[int]] = {}
+                for index, session_id in enumerate(unconsolidated.session_ids):
+                    sessions.setdefault(session_id, []).append(index)
+                
+                # Process each session
+                for session_id, indices in sessions.items():
+                    try:
+                        result = await self._consolidate_facts(
+                            session_id, unconsolidated.take(indices)
+                        )
+                        stats["sessions_processed"] += 1
+                        stats["facts_consolidated"] += result.get("facts_consolidated", 0)
+                        stats["episodes_created"] += result.get("episodes_created", 0)
+                        stats["errors"] += result.get("errors", 0)
+                    except Exception as e:
+                        logger.error(f"Wake-Up Sweep error for session {session_id}: {e}")
+                        stats["errors"] += 1
+                
+                if len(unconsolidated) < self.batch_size:
+                    break
+                after_fact_id = unconsolidated.fact_ids[-1]
             
-            if not unconsolidated:
+            if not stats["facts_found"]:
                 logger.info("Wake-Up Sweep: No unconsolidated facts found")
                 return stats
             
-            logger.info(f"Wake-Up Sweep: Found {len(unconsolidated)} unconsolidated facts")
-            
-            # Group facts by session
-            sessions = {}
-            for fact in unconsolidated:
-                session_id = fact.session_id
-                if session_id not in sessions:
-                    sessions[session_id] = []
-                sessions[session_id].append(fact)
-            
-            # Process each session
-            for session_id, facts in sessions.items():
-                try:
-                    result = await self._consolidate_facts(session_id, facts)
-                    stats["sessions_processed"] += 1
-                    stats["facts_consolidated"] += len(facts)
-                    stats["episodes_created"] += result.get("episodes_created", 0)
-                except Exception as e:
-                    logger.error(f"Wake-Up Sweep error for session {session_id}: {e}")
-                    stats["errors"] += 1
-            
             logger.info(f"Wake-Up Sweep completed: {stats}")
             return stats
         
@@ -237,60 +272,74 @@ class ConsolidationEngine(BaseEngine):
         except Exception as e:
             logger.error(f"Batch consolidation failed: {e}")
     
-    async def _get_unconsolidated_facts(self) -> List[Fact]:
+    async def _get_unconsolidated_facts(self, after_fact_id: Optional[str] = None) -> FactBatch:
         """
-        Query L2 for all facts where consolidated=False.
+        Claim one page of facts not yet consolidated from L2.
         
         Returns up to batch_size facts, ordered by extraction time.
         """
-        # This requires WorkingMemoryTier to track consolidation status
-        # For now, return empty list (will be implemented in WorkingMemoryTier)
-        # TODO: Add query_unconsolidated() method to WorkingMemoryTier
-        logger.warning("_get_unconsolidated_facts not yet implemented in L2 tier")
-        return []
+        return await self.l2.claim_unconsolidated(
+            limit=self.batch_size,
+            after_fact_id=after_fact_id
+        )
     
     async def _get_unconsolidated_count(self) -> int:
         """
         Get count of unconsolidated facts in L2.
         
-        Used for pressure valve threshold check.
+        Used for pressure valve threshold check, so counting stops at the
+        threshold.
         """
-        # This requires WorkingMemoryTier to track consolidation status
-        # For now, return 0 (will be implemented in WorkingMemoryTier)
-        # TODO: Add count_unconsolidated() method to WorkingMemoryTier
-        return 0
+        try:
+            return await self.l2.count_unconsolidated(limit=self.pressure_valve_threshold)
+        except Exception as e:
+            logger.warning(f"Unconsolidated fact count failed: {e}")
+            return 0
     
     async def _consolidate_facts(
         self, 
         session_id: str, 
-        facts: List[Fact]
+        facts: Union[List[Fact], FactBatch],
+        claimed: bool = True
     ) -> Dict[str, Any]:
         """
         Consolidate a list of facts into episodes.
         
         Args:
             session_id: Session ID
-            facts: List of facts to consolidate
+            facts: Facts to consolidate
+            claimed: Whether the facts were claimed in L2; claims on facts
+                whose episode failed are released for a later run
             
+        Each cluster becomes one L3 episode; once the episode is stored,
+        the cluster's facts are marked consolidated in L2.
+        
         Returns:
-            Stats: episodes_created, errors
+            Stats: episodes_created, facts_consolidated, clusters,
+            clustering_ms, errors
         """
-        stats = {"episodes_created": 0, "errors": 0}
+        stats = {"episodes_created": 0, "facts_consolidated": 0, "errors": 0}
         
-        # Cluster facts by time windows
-        clusters = self._cluster_facts_by_time(facts)
+        # Cluster facts by time windows and topic
+        try:
+            clusters = self._timed_clusters(facts, stats)
+        except Exception:
+            if claimed:
+                fact_ids = facts.fact_ids if isinstance(facts, FactBatch) else [f.fact_id for f in facts]
+                await self._release_claims(fact_ids)
+            raise
         
         # Create episodes from clusters
         for cluster in clusters:
             try:
-                episode = await self._create_episode_from_facts(session_id, cluster)
+                episode = await self._create_episode_from_facts(session_id, cluster.to_facts())
                 embedding = await self._generate_embedding(episode)
                 
                 await self.l3.store({
                     'episode': episode,
                     'embedding': embedding,
-                    'entities': [],
-                    'relationships': []
+                    'entities': [],  # Could extract from facts
+                    'relationships': []  # Could extract from facts
                 })
                 
                 stats["episodes_created"] += 1
@@ -298,9 +347,31 @@ class ConsolidationEngine(BaseEngine):
             except Exception as e:
                 logger.error(f"Error consolidating fact cluster: {e}")
                 stats["errors"] += 1
+                if claimed:
+                    await self._release_claims(cluster.fact_ids)
+                continue
+            
+            try:
+                stats["facts_consolidated"] += await self.l2.mark_consolidated(
+                    cluster.fact_ids, episode.episode_id
+                )
+            except Exception as e:
+                # The episode exists; the facts stay claimed until the claim
+                # times out, then may be consolidated again
+                logger.error(f"Error marking facts consolidated into {episode.episode_id}: {e}")
+                stats["errors"] += 1
         
+        await self._publish_consolidation_event(session_id, stats["episodes_created"])
         return stats
 
+    async def _release_claims(self, fact_ids: List[str]) -> None:
+        """Release claimed facts so a later run can consolidate them."""
+        try:
+            await self.l2.release_claims(fact_ids)
+        except Exception as e:
+            # Unreleased claims expire after the tier's claim timeout
+            logger.warning(f"Failed to release {len(fact_ids)} L2 fact claims: {e}")
+
     async def process(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Execute consolidation cycle for a session.
@@ -323,7 +394,10 @@ class ConsolidationEngine(BaseEngine):
         stats = {
             "session_id": session_id,
             "facts_retrieved": 0,
+            "clusters": 0,
+            "clustering_ms": 0.0,
             "episodes_created": 0,
+            "facts_consolidated": 0,
             "errors": 0
         }
 
@@ -331,44 +405,16 @@ class ConsolidationEngine(BaseEngine):
             # Ensure downstream tier is initialized so collections/constraints exist
             await self.l3.initialize()
 
-            # 1. Determine time range (from last episode or beginning)
-            start_time = await self._get_last_consolidation_time(session_id)
-            end_time = datetime.now(timezone.utc)
-            
-            # 2. Retrieve facts from L2 in time range
-            facts = await self._get_facts_in_range(session_id, start_time, end_time)
+            # 1. Claim unconsolidated facts from L2
+            facts, claimed = await self._get_session_facts(session_id)
             stats["facts_retrieved"] = len(facts)
             
             if not facts:
                 return stats
             
-            # 3. Cluster facts by time windows
-            clusters = self._cluster_facts_by_time(facts)
-            
-            # 4. Create episodes from clusters
-            for cluster in clusters:
-                try:
-                    episode = await self._create_episode_from_facts(
-                        session_id, cluster
-                    )
-                    
-                    # 5. Generate embedding
-                    embedding = await self._generate_embedding(episode)
-                    
-                    # 6. Store in L3
-                    await self.l3.store({
-                        'episode': episode,
-                        'embedding': embedding,
-                        'entities': [],  # Could extract from facts
-                        'relationships': []  # Could extract from facts
-                    })
-                    
-                    stats["episodes_created"] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error creating episode: {e}")
-                    stats["errors"] += 1
-                    
+            # 2. Cluster, create and store episodes, mark facts consolidated
+            result = await self._consolidate_facts(session_id, facts, claimed=claimed)
+            stats.update(result)
             return stats
 
         except Exception as e:
@@ -377,110 +423,147 @@ class ConsolidationEngine(BaseEngine):
             stats["last_error"] = str(e)
             return stats
 
-    async def _get_last_consolidation_time(self, session_id: str) -> datetime:
-        """Get the time of the last consolidated episode for this session."""
-        # Query L3 for most recent episode
-        # For now, return 24 hours ago as default
-        return datetime.now(timezone.utc) - timedelta(hours=self.time_window_hours)
+    async def _publish_consolidation_event(
+        self,
+        session_id: str,
+        episodes_created: int
+    ) -> None:
+        """
+        Publish a "consolidation" lifecycle event for downstream distillation.
+        
+        Fire-and-forget: a failed publish never fails consolidation.
+        """
+        if not self.stream_producer or episodes_created <= 0:
+            return
+        try:
+            await self.stream_producer.publish(
+                "consolidation",
+                session_id,
+                {"episodes_created": episodes_created}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish consolidation event for {session_id}: {e}")
 
-    async def _get_facts_in_range(
-        self, 
-        session_id: str, 
-        start_time: datetime, 
-        end_time: datetime
-    ) -> List[Fact]:
-        """Retrieve facts from L2 within time range."""
-        facts: List[Fact] = []
+    async def _get_session_facts(self, session_id: str) -> Tuple[FactBatch, bool]:
+        """
+        Retrieve the session's unconsolidated facts from L2.
 
-        if hasattr(self.l2, "query_by_session"):
-            try:
-                facts = await self.l2.query_by_session(
-                    session_id=session_id,
-                    min_ciar_score=0,
-                    limit=500
-                )
-            except Exception:
-                facts = []
+        Consolidation state replaces a time range: only facts not yet
+        consolidated are read (one columnar page of up to fetch_limit,
+        oldest first), so repeated runs are incremental.
+        The page is claimed, so concurrent runs receive disjoint facts.
+        Falls back to the tier's recent-facts cache when L2 cannot be read.
 
-        if hasattr(self.l2, "query"):
-            try:
-                additional = await self.l2.query(
-                    filters={'session_id': session_id},
-                    limit=500,
-                    include_low_ciar=True
+        Returns:
+            The facts, and whether they were claimed in L2
+        """
+        try:
+            facts = await self.l2.claim_unconsolidated(
+                session_id=session_id,
+                limit=self.fetch_limit
+            )
+        except Exception as e:
+            logger.warning("Consolidation L2 fetch failed for session=%s: %s", session_id, e)
+            facts = FactBatch.from_rows([])
+            if hasattr(self.l2, "get_recent_cached"):
+                facts = FactBatch.from_facts(self.l2.get_recent_cached(session_id))
+                logger.info(
+                    "Consolidation fallback to cache: session=%s cached_count=%d",
+                    session_id,
+                    len(facts)
                 )
-                if additional and len(additional) > len(facts):
-                    facts = list(additional)
-            except Exception:
-                # If query fails, keep any facts gathered from query_by_session
-                pass
+            return facts, False
 
         logger.info(
             "Consolidation L2 fetch: session=%s count=%d",
             session_id,
             len(facts)
         )
+        return facts, True
 
-        if not facts and hasattr(self.l2, "get_recent_cached"):
-            cached = self.l2.get_recent_cached(session_id)
-            if cached:
-                facts = list(cached)
-                logger.info(
-                    "Consolidation fallback to cache: session=%s cached_count=%d",
-                    session_id,
-                    len(facts)
-                )
+    def _timed_clusters(
+        self,
+        facts: Union[List[Fact], FactBatch],
+        stats: Dict[str, Any]
+    ) -> List[FactBatch]:
+        """Cluster facts, recording cluster count and clustering time in stats."""
+        if not isinstance(facts, FactBatch):
+            facts = FactBatch.from_facts(facts)
+        start = time.perf_counter()
+        clusters = self._cluster_facts(facts)
+        stats["clustering_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        stats["clusters"] = len(clusters)
+        return clusters
 
-        filtered: List[Fact] = []
-        for fact_dict in facts:
-            if isinstance(fact_dict, Fact):
-                fact_data = fact_dict.model_dump()
-            else:
-                fact_data = dict(fact_dict)
+    def _cluster_facts_by_time(self, facts: List[Fact]) -> List[List[Fact]]:
+        """Cluster facts into time windows (and topics, see _cluster_facts)."""
+        return [cluster.to_facts() for cluster in self._cluster_facts(FactBatch.from_facts(facts))]
 
-            extracted_at = fact_data.get('extracted_at') or fact_data.get('created_at')
-            if isinstance(extracted_at, str):
-                extracted_at = datetime.fromisoformat(extracted_at)
-            if extracted_at is not None and extracted_at.tzinfo is None:
-                # Normalize naive timestamps to UTC for comparison
-                extracted_at = extracted_at.replace(tzinfo=timezone.utc)
-            if extracted_at is None:
-                extracted_at = datetime.now(timezone.utc)
-            fact_data['extracted_at'] = extracted_at
+    def _cluster_facts(self, facts: FactBatch) -> List[FactBatch]:
+        """
+        Cluster facts into bounded, topically coherent episodes.
 
-            fact = Fact(**fact_data)
-            filtered.append(fact)
-        
-        return filtered
+        1. Time windows of time_window_hours, anchored at each window's
+           first fact (vectorized, see FactBatch.cluster_by_time).
+        2. Within a window, facts group by topic_segment_id; facts without
+           one share one group.
+        3. Groups above max_cluster_size are split into equal time-ordered
+           chunks; groups below min_cluster_size are pooled, and a pool
+           still too small joins the nearest-in-time group with room.
 
-    def _cluster_facts_by_time(self, facts: List[Fact]) -> List[List[Fact]]:
-        """Cluster facts into time windows."""
-        if not facts:
-            return []
-        
-        # Sort by extraction time
-        sorted_facts = sorted(facts, key=lambda f: f.extracted_at)
-        
-        clusters = []
-        current_cluster = [sorted_facts[0]]
-        window_start = sorted_facts[0].extracted_at
-        
-        for fact in sorted_facts[1:]:
-            # Check if fact is within time window
-            if (fact.extracted_at - window_start).total_seconds() / 3600 <= self.time_window_hours:
-                current_cluster.append(fact)
-            else:
-                # Start new cluster
-                clusters.append(current_cluster)
-                current_cluster = [fact]
-                window_start = fact.extracted_at
-        
-        # Add last cluster
-        if current_cluster:
-            clusters.append(current_cluster)
-        
+        Returns:
+            Clusters in chronological order
+        """
+        now = time.time()
+        clusters: List[FactBatch] = []
+        for window in facts.cluster_by_time(self.time_window_hours * 3600, now=now):
+            groups = self._group_by_topic(window)
+            times = np.nan_to_num(window.extracted_ts, nan=now)
+            clusters.extend(window.take(indices) for indices in self._bound_cluster_sizes(groups, times))
         return clusters
 
+    def _group_by_topic(self, window: FactBatch) -> List[np.ndarray]:
+        """Split one time window into topic groups (index arrays, time order)."""
+        labels = np.full(len(window), -1, dtype=np.intp)
+        topics: Dict[str, int] = {}
+        for index, topic in enumerate(window.topic_segment_ids):
+            if topic is not None:
+                labels[index] = topics.setdefault(topic, len(topics))
+        labels[labels < 0] = len(topics)
+        groups, first = np.unique(labels, return_index=True)
+        return [np.flatnonzero(labels == group) for group in groups[np.argsort(first)]]
+
+    def _bound_cluster_sizes(self, groups: List[np.ndarray], times: np.ndarray) -> List[np.ndarray]:
+        """Split oversized groups, then pool undersized ones."""
+        bounded: List[np.ndarray] = []
+        small: List[np.ndarray] = []
+        for group in groups:
+            if len(group) < self.min_cluster_size:
+                small.append(group)
+            else:
+                bounded.extend(self._split_group(group))
+
+        if small:
+            pooled = np.sort(np.concatenate(small))
+            roomy = [
+                index for index, group in enumerate(bounded)
+                if len(group) + len(pooled) <= self.max_cluster_size
+            ]
+            if len(pooled) < self.min_cluster_size and roomy:
+                # Too few to stand alone: join the group closest in time
+                center = times[pooled].mean()
+                target = min(roomy, key=lambda index: abs(times[bounded[index]].mean() - center))
+                bounded[target] = np.sort(np.concatenate([bounded[target], pooled]))
+            else:
+                bounded.extend(self._split_group(pooled))
+
+        bounded.sort(key=lambda group: group[0])
+        return bounded
+
+    def _split_group(self, group: np.ndarray) -> List[np.ndarray]:
+        """Split a group into equal time-ordered chunks of at most max_cluster_size."""
+        return np.array_split(group, -(-len(group) // self.max_cluster_size))
+
     async def _create_episode_from_facts(
         self, 
         session_id: str, 
@@ -6,15 +6,18 @@ and storing them in Semantic Memory (L4).
 
 Architecture:
 - Trigger-based processing (episode count threshold)
+- Incremental triggering from "consolidation" lifecycle events
 - LLM-powered knowledge synthesis
 - Rich metadata extraction
 - Multiple knowledge types (summary, insight, pattern, recommendation, rule)
 - No deduplication (allow multiple perspectives)
 """
 
+import json
 import logging
 import uuid
 from typing import Dict, List, Optional, Any
+import asyncio
 import time
 import yaml
 from pathlib import Path
@@ -22,6 +25,7 @@ from pathlib import Path
 from ..models import Episode, KnowledgeDocument
 from ..tiers.episodic_memory_tier import EpisodicMemoryTier
 from ..tiers.semantic_memory_tier import SemanticMemoryTier
+from ..lifecycle_stream import LifecycleStreamConsumer
 from ...utils.llm_client import LLMClient
 from ...utils.providers import BaseProvider
 from ...storage.metrics.collector import MetricsCollector
@@ -36,7 +40,9 @@ class DistillationEngine(BaseEngine):
     Distillation Engine: Transforms episodes into knowledge documents.
     
     Workflow:
-    1. Monitor episode count in L3 (EpisodicMemoryTier)
+    1. Monitor episode count in L3 (EpisodicMemoryTier), either via a
+       pushed-down Cypher count or the per-session counter fed by
+       "consolidation" lifecycle events
     2. When threshold reached, retrieve relevant episodes
     3. For each knowledge type, use LLM to synthesize content
     4. Extract rich metadata from episodes
@@ -55,6 +61,7 @@ class DistillationEngine(BaseEngine):
         config: Optional[Dict[str, Any]] = None,
         l3_tier: Optional[EpisodicMemoryTier] = None,
         l4_tier: Optional[SemanticMemoryTier] = None,
+        stream_consumer: Optional[LifecycleStreamConsumer] = None,
         **_: Any
     ):
         """
@@ -67,6 +74,8 @@ class DistillationEngine(BaseEngine):
             domain_config_path: Path to domain configuration YAML
             episode_threshold: Minimum episodes before triggering distillation
             metrics_enabled: Enable metrics collection
+            stream_consumer: Optional lifecycle stream consumer used to
+                trigger distillation incrementally on consolidation events
         """
         self.config = config or {}
         resolved_episode_threshold = self.config.get("distillation_threshold", episode_threshold)
@@ -85,6 +94,9 @@ class DistillationEngine(BaseEngine):
             self.llm_client = LLMClient()
             self.llm_client.register_provider(llm_provider)
         self.episode_threshold = resolved_episode_threshold
+        self.stream_consumer = stream_consumer
+        # Episodes consolidated per session since the last distillation run
+        self._episodes_since_distillation: Dict[str, int] = {}
         
         # Load domain configuration
         self.domain_config = self._load_domain_config(domain_config_path)
@@ -142,6 +154,72 @@ class DistillationEngine(BaseEngine):
             }
         }
     
+    async def start(self) -> None:
+        """
+        Start listening for consolidation events on the lifecycle stream.
+        
+        Each "consolidation" event increments the session's pending episode
+        counter; distillation runs once the counter reaches the threshold,
+        so L3 is never polled with full scans.
+        """
+        if self.stream_consumer:
+            self.stream_consumer.register_handler(
+                "consolidation", self._handle_consolidation_event
+            )
+            asyncio.create_task(self.stream_consumer.start())
+            logger.info("DistillationEngine lifecycle stream listener started")
+    
+    async def stop(self) -> None:
+        """Stop the lifecycle stream listener."""
+        if self.stream_consumer:
+            await self.stream_consumer.stop()
+        logger.info("DistillationEngine stopped")
+    
+    def record_new_episodes(self, session_id: str, count: int = 1) -> int:
+        """
+        Record episodes consolidated into L3 for a session.
+        
+        Args:
+            session_id: Session the episodes belong to
+            count: Number of new episodes
+            
+        Returns:
+            Episodes pending distillation for the session
+        """
+        pending = self._episodes_since_distillation.get(session_id, 0) + max(count, 0)
+        self._episodes_since_distillation[session_id] = pending
+        return pending
+    
+    def get_pending_episode_count(self, session_id: str) -> int:
+        """Return episodes consolidated for a session since its last distillation."""
+        return self._episodes_since_distillation.get(session_id, 0)
+    
+    async def _handle_consolidation_event(self, event: Dict[str, Any]) -> None:
+        """
+        Handle consolidation events from the lifecycle stream.
+        
+        Distills the session once enough new episodes have accumulated.
+        """
+        session_id = event.get("session_id")
+        if not session_id:
+            return
+        
+        data = event.get("data") or "{}"
+        if isinstance(data, str):
+            data = json.loads(data)
+        episode_count = data.get("episodes_created", data.get("episodes", 0))
+        
+        pending = self.record_new_episodes(session_id, int(episode_count))
+        logger.debug(
+            f"Consolidation event: {episode_count} episodes for session {session_id} "
+            f"({pending} pending, threshold {self.episode_threshold})"
+        )
+        
+        if pending >= self.episode_threshold:
+            # Counter already proves the threshold is met; skip the count query
+            result = await self.process(session_id=session_id, force_process=True)
+            logger.info(f"Incremental distillation for {session_id}: {result.get('status')}")
+    
     async def process(self, **kwargs) -> Dict[str, Any]:
         """
         Main processing method: Check for episodes and create knowledge documents.
@@ -160,7 +238,9 @@ class DistillationEngine(BaseEngine):
                 time_range = kwargs.get("time_range")  # Optional temporal filtering
                 
                 # Step 1: Check if we should trigger distillation
-                episode_count = await self._count_episodes(session_id, time_range)
+                # (forced runs skip the count; it only gates the threshold)
+                if not force_process:
+                    episode_count = await self._count_episodes(session_id, time_range)
                 
                 if not force_process and episode_count < self.episode_threshold:
                     logger.info(
@@ -175,7 +255,7 @@ class DistillationEngine(BaseEngine):
                     }
                 
                 # Step 2: Retrieve episodes from L3
-                logger.info(f"Retrieving {episode_count} episodes for distillation")
+                logger.info(f"Retrieving episodes for distillation (session={session_id})")
                 episodes = await self._retrieve_episodes(session_id, time_range)
                 
                 if not episodes:
@@ -188,7 +268,7 @@ class DistillationEngine(BaseEngine):
                 
                 # Step 3: Generate knowledge documents for each type
                 knowledge_types = self.domain_config.get("knowledge_types", {})
-                created_docs = []
+                new_docs = []
                 
                 for knowledge_type, type_config in knowledge_types.items():
                     try:
@@ -200,20 +280,34 @@ class DistillationEngine(BaseEngine):
                         )
                         
                         if doc:
-                            # Step 4: Store in L4
-                            doc_id = await self.semantic_tier.store(doc)
-                            created_docs.append({
-                                "id": doc_id,
-                                "type": knowledge_type,
-                                "episode_count": len(episodes)
-                            })
-                            logger.info(f"Created {knowledge_type} document: {doc_id}")
+                            new_docs.append(doc)
                         
                     except Exception as e:
                         logger.error(f"Failed to create {knowledge_type} document: {e}")
                         # Continue with other knowledge types
                         continue
                 
+                # Step 4: Store the whole run in L4 with one bulk import
+                created_docs = []
+                if new_docs:
+                    # Only documents the import accepted count as created
+                    stored_ids = set(await self.semantic_tier.store_batch(new_docs))
+                    for doc in new_docs:
+                        if doc.knowledge_id not in stored_ids:
+                            continue
+                        created_docs.append({
+                            "id": doc.knowledge_id,
+                            "type": doc.knowledge_type,
+                            "episode_count": len(episodes)
+                        })
+                        logger.info(f"Created {doc.knowledge_type} document: {doc.knowledge_id}")
+                
+                # Reset incremental counters for the distilled scope
+                if session_id:
+                    self._episodes_since_distillation.pop(session_id, None)
+                else:
+                    self._episodes_since_distillation.clear()
+                
                 elapsed_ms = (time.perf_counter() - timer.start_time) * 1000
                 
                 return {
@@ -263,14 +357,26 @@ class DistillationEngine(BaseEngine):
             Number of episodes
         """
         try:
-            # Use EpisodicMemoryTier's query method to count episodes
-            # For simplicity, retrieve episodes and count them
-            episodes = await self._retrieve_episodes(session_id, time_range, limit=1000)
-            return len(episodes)
+            return await self.episodic_tier.count(
+                self._build_episode_filters(session_id, time_range)
+            )
         except Exception as e:
             logger.error(f"Failed to count episodes: {e}")
             return 0
     
+    @staticmethod
+    def _build_episode_filters(
+        session_id: Optional[str] = None,
+        time_range: Optional[tuple] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Build L3 filters so session and time window are pushed down to Neo4j."""
+        filters: Dict[str, Any] = {}
+        if session_id:
+            filters['session_id'] = session_id
+        if time_range:
+            filters['time_range'] = tuple(time_range)
+        return filters or None
+    
     async def _retrieve_episodes(
         self,
         session_id: Optional[str] = None,
@@ -289,17 +395,10 @@ class DistillationEngine(BaseEngine):
             List of Episode objects
         """
         try:
-            if time_range:
-                start_time, end_time = time_range
-                episodes = await self.episodic_tier.query(
-                    filters=None,
-                    limit=limit
-                )
-            else:
-                episodes = await self.episodic_tier.query(
-                    filters={'session_id': session_id} if session_id else None,
-                    limit=limit
-                )
+            episodes = await self.episodic_tier.query(
+                filters=self._build_episode_filters(session_id, time_range),
+                limit=limit
+            )
             
             pre_filter_count = len(episodes)
             
@@ -6,20 +6,39 @@ and LLM-powered synthesis of knowledge documents at query time.
 
 Architecture:
 - Metadata-first filtering (before similarity search)
-- Cosine similarity within filtered groups
+- Cosine similarity within filtered groups (vectorized over document
+  embeddings persisted in L4 at store time, blended with Typesense
+  text_match)
+- Absolute cosine threshold plus a top-k cutoff relative to the best
+  score to keep prompts small
 - Query-context synthesis using LLM
 - Conflict transparency (surface contradictions)
-- Short-TTL caching (1-hour)
+- Short-TTL caching (1-hour): O(1) LRU+TTL in process, optional shared
+  Redis tier, single-flight coalescing of identical in-flight queries, and
+  invalidation when source documents change in L4 (through a per-document
+  index of cache keys in the shared tier)
 """
 
+import json
 import logging
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timezone
 import hashlib
 import yaml
 from pathlib import Path
 
+import numpy as np
+
 from ..models import KnowledgeDocument
+from ..conflict_features import (
+    compute_polarity,
+    contradictory_pairs,
+    group_by_topic,
+    is_contradictory,
+    topic_key,
+)
+from ..embedding_cache import EmbeddingCache, cosine_scores, get_shared_embedding_cache
+from ..namespace import NamespaceManager
+from ..result_cache import LRUTTLCache, SingleFlight
 from ..tiers.semantic_memory_tier import SemanticMemoryTier
 from ...utils.llm_client import LLMClient
 from ...utils.providers import BaseProvider
@@ -36,20 +55,34 @@ class KnowledgeSynthesizer:
     Workflow:
     1. Parse query and extract metadata context
     2. Filter L4 documents by metadata (metadata-first strategy)
-    3. Compute cosine similarity within filtered groups
+    3. Score candidates: cosine similarity against cached document
+       embeddings blended with normalized Typesense text_match
     4. Identify conflicts in retrieved knowledge
     5. Use LLM to synthesize relevant knowledge with query context
-    6. Cache results for 1-hour TTL
+    6. Cache results for 1-hour TTL (invalidated when source documents change)
     """
     
+    DEFAULT_SIMILARITY_THRESHOLD = 0.5  # Min query/document cosine similarity
+    DEFAULT_VECTOR_WEIGHT = 0.7  # Share of cosine similarity in blended score
+    DEFAULT_RELATIVE_SCORE_CUTOFF = 0.8  # Drop docs scoring < 80% of the best
+    DEFAULT_CACHE_MAX_ENTRIES = 1000
+    # Local copies of shared results: other processes' invalidations only
+    # reach Redis, so bound how long this process can serve a stale copy
+    DEFAULT_SHARED_LOCAL_TTL_SECONDS = 60
+    DEFAULT_QUERY_EMBEDDING_ENTRIES = 1000
+    DEFAULT_CONFLICT_GROUP_BY = ("category",)  # Only same-topic docs are compared
+    
     def __init__(
         self,
         semantic_tier: SemanticMemoryTier,
         llm_provider: BaseProvider,
         domain_config_path: Optional[str] = None,
-        similarity_threshold: float = 0.85,
+        similarity_threshold: Optional[float] = None,
         cache_ttl_seconds: int = 3600,
-        metrics_enabled: bool = True
+        metrics_enabled: bool = True,
+        embedding_provider: Optional[BaseProvider] = None,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        redis_client: Optional[Any] = None
     ):
         """
         Initialize the Knowledge Synthesizer.
@@ -58,18 +91,37 @@ class KnowledgeSynthesizer:
             semantic_tier: L4 tier for retrieving knowledge documents
             llm_provider: LLM provider for synthesis
             domain_config_path: Path to domain configuration YAML
-            similarity_threshold: Cosine similarity threshold (default 0.85)
+            similarity_threshold: Minimum cosine similarity between the query
+                and a document's embedding (default: filtering.similarity_threshold
+                from the domain config, else 0.5). Documents without an
+                embedding are only subject to the relative cutoff.
             cache_ttl_seconds: Cache TTL in seconds (default 3600 = 1 hour)
             metrics_enabled: Enable metrics collection
+            embedding_provider: Provider exposing get_embedding() for query
+                embeddings (defaults to the LLM or L4 tier provider if capable)
+            cache_max_entries: Maximum in-process cached results (LRU eviction)
+            redis_client: Optional async Redis client for a cache tier shared
+                across processes
         """
         self.semantic_tier = semantic_tier
         self.llm_client = LLMClient()
         self.llm_client.register_provider(llm_provider)
-        self.similarity_threshold = similarity_threshold
         self.cache_ttl_seconds = cache_ttl_seconds
         
-        # In-memory cache for synthesized results
-        self._cache: Dict[str, Tuple[str, datetime]] = {}
+        # In-process LRU+TTL cache, optional shared Redis tier, and
+        # single-flight coalescing of identical in-flight queries
+        self._cache = LRUTTLCache(max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+        self._redis = redis_client
+        self._redis_hits = 0
+        self._single_flight = SingleFlight()
+        # Bumped by every local invalidation; a synthesis that started
+        # before one does not cache its (possibly stale) result
+        self._cache_version = 0
+        
+        # Invalidate cached results whenever a source document changes in L4
+        add_listener = getattr(semantic_tier, "add_write_listener", None)
+        if callable(add_listener):
+            add_listener(self.invalidate_documents)
         
         # Metrics
         self.metrics = MetricsCollector() if metrics_enabled else None
@@ -77,8 +129,32 @@ class KnowledgeSynthesizer:
         # Load domain configuration
         self.domain_config = self._load_domain_config(domain_config_path)
         
+        # Similarity scoring configuration
+        filtering = self.domain_config.get("filtering", {})
+        self.similarity_threshold = (
+            similarity_threshold if similarity_threshold is not None
+            else filtering.get("similarity_threshold", self.DEFAULT_SIMILARITY_THRESHOLD)
+        )
+        self.vector_weight = filtering.get("vector_weight", self.DEFAULT_VECTOR_WEIGHT)
+        self.relative_score_cutoff = filtering.get(
+            "relative_score_cutoff", self.DEFAULT_RELATIVE_SCORE_CUTOFF
+        )
+        self.embedding_provider = embedding_provider or self._resolve_embedding_provider(
+            llm_provider
+        )
+        # Query vectors are kept apart from the L4 document cache so query
+        # traffic never evicts document embeddings
+        self.query_embeddings = EmbeddingCache(max_entries=self.DEFAULT_QUERY_EMBEDDING_ENTRIES)
+        
+        # Conflict detection: topic fields used to group candidate documents
+        self.conflict_group_by = tuple(
+            self.domain_config.get("conflicts", {}).get(
+                "group_by", self.DEFAULT_CONFLICT_GROUP_BY
+            )
+        )
+        
         logger.info(
-            f"KnowledgeSynthesizer initialized with similarity_threshold={similarity_threshold}, "
+            f"KnowledgeSynthesizer initialized with similarity_threshold={self.similarity_threshold}, "
             f"cache_ttl={cache_ttl_seconds}s, domain={self.domain_config.get('domain', {}).get('name', 'default')}"
         )
     
@@ -109,13 +185,16 @@ class KnowledgeSynthesizer:
                 "metadata_first": True,
                 "min_matching_fields": 0,
                 "metadata_boost": 0.3,
-                "similarity_threshold": 0.85,
-                "max_candidates": 20
+                "similarity_threshold": self.DEFAULT_SIMILARITY_THRESHOLD,
+                "max_candidates": 20,
+                "vector_weight": self.DEFAULT_VECTOR_WEIGHT,
+                "relative_score_cutoff": self.DEFAULT_RELATIVE_SCORE_CUTOFF
             },
             "conflicts": {
                 "strategy": "surface",
                 "conflict_tag": "CONFLICT_DETECTED",
-                "explain_conflicts": True
+                "explain_conflicts": True,
+                "group_by": list(self.DEFAULT_CONFLICT_GROUP_BY)
             }
         }
     
@@ -141,8 +220,8 @@ class KnowledgeSynthesizer:
         
         try:
             # Step 1: Check cache
-            cache_key = self._generate_cache_key(query, metadata_filters)
-            cached_result = self._get_cached_result(cache_key)
+            cache_key = self._generate_cache_key(query, metadata_filters, max_results)
+            cached_result = await self._get_cached_result(cache_key)
             
             if cached_result:
                 logger.info(f"Cache hit for query: {query[:50]}...")
@@ -155,70 +234,23 @@ class KnowledgeSynthesizer:
                     "cache_key": cache_key
                 }
             
-            # Step 2: Metadata-first filtering
-            logger.info(f"Retrieving knowledge with metadata filters: {metadata_filters}")
-            filtered_docs = await self._retrieve_with_metadata_filter(
-                query=query,
-                metadata_filters=metadata_filters,
-                max_results=max_results * 2  # Retrieve more for post-filtering
-            )
-            
-            if not filtered_docs:
-                logger.info("No knowledge documents found matching filters")
-                if self.metrics:
-                    await self.metrics.stop_timer("synthesis", timer)
-                return {
-                    "status": "success",
-                    "synthesized_text": "No relevant knowledge found for this query.",
-                    "source": "empty_result",
-                    "candidates": 0
-                }
-            
-            # Step 3: Compute similarity scores and apply threshold
-            scored_docs = await self._score_documents(query, filtered_docs)
-            
-            # Filter by similarity threshold
-            relevant_docs = [
-                doc for doc, score in scored_docs
-                if score >= self.similarity_threshold
-            ][:max_results]
-            
-            if not relevant_docs:
-                logger.info(f"No documents above similarity threshold {self.similarity_threshold}")
-                if self.metrics:
-                    await self.metrics.stop_timer("synthesis", timer)
-                return {
-                    "status": "success",
-                    "synthesized_text": "No highly relevant knowledge found for this query.",
-                    "source": "low_similarity",
-                    "candidates": len(scored_docs)
-                }
-            
-            # Step 4: Detect conflicts
-            conflicts = self._detect_conflicts(relevant_docs)
-            
-            # Step 5: Synthesize with LLM
-            synthesized_text = await self._synthesize_with_llm(
-                query=query,
-                documents=relevant_docs,
-                conflicts=conflicts
+            # Steps 2-6 run once per (query, metadata_filters, max_results)
+            # even when many agents ask concurrently; late arrivals share the
+            # leader's result
+            result, shared = await self._single_flight.do(
+                cache_key,
+                lambda: self._synthesize_uncached(
+                    query, metadata_filters, max_results, cache_key
+                )
             )
             
-            # Step 6: Cache result
-            self._cache_result(cache_key, synthesized_text)
-            
             elapsed_ms = await self.metrics.stop_timer("synthesis", timer) if self.metrics else 0
-            
-            return {
-                "status": "success",
-                "synthesized_text": synthesized_text,
-                "source": "synthesized",
-                "candidates": len(relevant_docs),
-                "has_conflicts": len(conflicts) > 0,
-                "conflicts": conflicts,
-                "elapsed_ms": elapsed_ms,
-                "cache_key": cache_key
-            }
+            result = dict(result)
+            if result.get("source") == "synthesized":
+                result["elapsed_ms"] = elapsed_ms
+            if shared:
+                result["coalesced"] = True
+            return result
             
         except Exception as e:
             if self.metrics:
@@ -229,13 +261,85 @@ class KnowledgeSynthesizer:
                 "error": str(e)
             }
     
+    async def _synthesize_uncached(
+        self,
+        query: str,
+        metadata_filters: Optional[Dict[str, Any]],
+        max_results: int,
+        cache_key: str
+    ) -> Dict[str, Any]:
+        """Retrieve, score, and synthesize knowledge, then cache the result."""
+        cache_version = self._cache_version
+        
+        # Step 2: Metadata-first filtering
+        logger.info(f"Retrieving knowledge with metadata filters: {metadata_filters}")
+        filtered_docs = await self._retrieve_with_metadata_filter(
+            query=query,
+            metadata_filters=metadata_filters,
+            max_results=max_results * 2  # Retrieve more for post-filtering
+        )
+        
+        if not filtered_docs:
+            logger.info("No knowledge documents found matching filters")
+            return {
+                "status": "success",
+                "synthesized_text": "No relevant knowledge found for this query.",
+                "source": "empty_result",
+                "candidates": 0
+            }
+        
+        # Step 3: Compute similarity scores
+        scored_docs = await self._score_documents(query, filtered_docs)
+        
+        # Apply similarity threshold and top-k cutoff
+        relevant_docs = self._select_top_k(scored_docs, max_results)
+        
+        if not relevant_docs:
+            logger.info(f"No documents above similarity threshold {self.similarity_threshold}")
+            return {
+                "status": "success",
+                "synthesized_text": "No highly relevant knowledge found for this query.",
+                "source": "low_similarity",
+                "candidates": len(scored_docs)
+            }
+        
+        # Step 4: Detect conflicts
+        conflicts = self._detect_conflicts(relevant_docs)
+        
+        # Step 5: Synthesize with LLM
+        synthesized_text = await self._synthesize_with_llm(
+            query=query,
+            documents=relevant_docs,
+            conflicts=conflicts
+        )
+        
+        # Step 6: Cache result, tagged with its source documents, unless a
+        # source may have changed while it was being synthesized
+        if cache_version == self._cache_version:
+            await self._cache_result(
+                cache_key,
+                synthesized_text,
+                [doc.knowledge_id for doc in relevant_docs]
+            )
+        
+        return {
+            "status": "success",
+            "synthesized_text": synthesized_text,
+            "source": "synthesized",
+            "candidates": len(relevant_docs),
+            "has_conflicts": len(conflicts) > 0,
+            "conflicts": conflicts,
+            "cache_key": cache_key
+        }
+    
     def _generate_cache_key(
         self,
         query: str,
-        metadata_filters: Optional[Dict[str, Any]]
+        metadata_filters: Optional[Dict[str, Any]],
+        max_results: int = 5
     ) -> str:
-        """Generate cache key from query and metadata."""
-        key_parts = [query]
+        """Generate cache key from query, metadata and result limit."""
+        key_parts = [query, str(max_results)]
         
         if metadata_filters:
             # Sort for consistent hashing
@@ -245,33 +349,116 @@ class KnowledgeSynthesizer:
         key_string = "|".join(key_parts)
         return hashlib.sha256(key_string.encode()).hexdigest()[:16]
     
-    def _get_cached_result(self, cache_key: str) -> Optional[str]:
-        """Retrieve cached result if valid."""
-        if cache_key not in self._cache:
-            return None
+    async def _get_cached_result(self, cache_key: str) -> Optional[str]:
+        """
+        Retrieve cached result from the local tier, then the shared tier.
+        
+        A shared entry is promoted into the local tier for at most its
+        remaining Redis TTL (and DEFAULT_SHARED_LOCAL_TTL_SECONDS), so it
+        never outlives the shared copy. A corrupt shared entry is a miss.
+        """
+        result = self._cache.get(cache_key)
+        if result is not None:
+            return result
         
-        result, timestamp = self._cache[cache_key]
+        if self._redis is None:
+            return None
         
-        # Check TTL
-        age_seconds = (datetime.now(timezone.utc) - timestamp).total_seconds()
-        if age_seconds > self.cache_ttl_seconds:
-            # Expired
-            del self._cache[cache_key]
+        try:
+            redis_key = NamespaceManager.synthesis_cache(cache_key)
+            pipe = self._redis.pipeline()
+            pipe.get(redis_key)
+            pipe.pttl(redis_key)
+            raw, remaining_ms = await pipe.execute()
+            if not raw:
+                return None
+            entry = json.loads(raw)
+            text = entry["text"]
+            doc_ids = entry.get("doc_ids", [])
+        except Exception as e:
+            logger.warning(f"Shared synthesis cache read failed: {e}")
             return None
         
-        return result
+        self._redis_hits += 1
+        # Promote into the local tier, keeping source tags for invalidation
+        ttl = self._local_ttl()
+        if remaining_ms is not None and remaining_ms >= 0:
+            ttl = min(ttl, remaining_ms / 1000)
+        self._cache.set(cache_key, text, ttl_seconds=ttl, tags=doc_ids)
+        return text
     
-    def _cache_result(self, cache_key: str, result: str):
-        """Store result in cache with timestamp."""
-        self._cache[cache_key] = (result, datetime.now(timezone.utc))
-        
-        # Cleanup old entries (simple LRU-like behavior)
-        if len(self._cache) > 100:  # Max 100 cached items
-            oldest_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k][1]
+    def _local_ttl(self) -> float:
+        """TTL for local entries (bounded when a shared tier is configured)."""
+        if self._redis is None:
+            return self.cache_ttl_seconds
+        return min(self.cache_ttl_seconds, self.DEFAULT_SHARED_LOCAL_TTL_SECONDS)
+    
+    async def _cache_result(
+        self,
+        cache_key: str,
+        result: str,
+        source_doc_ids: Optional[List[str]] = None
+    ) -> None:
+        """Store result in the local tier and, if configured, the shared tier."""
+        doc_ids = list(source_doc_ids or [])
+        self._cache.set(cache_key, result, ttl_seconds=self._local_ttl(), tags=doc_ids)
+        
+        if self._redis is None or self.cache_ttl_seconds <= 0:
+            return
+        
+        try:
+            pipe = self._redis.pipeline()
+            pipe.set(
+                NamespaceManager.synthesis_cache(cache_key),
+                json.dumps({"text": result, "doc_ids": doc_ids}),
+                ex=self.cache_ttl_seconds
             )
-            del self._cache[oldest_key]
+            for doc_id in doc_ids:
+                index_key = NamespaceManager.synthesis_cache_index(doc_id)
+                pipe.sadd(index_key, cache_key)
+                pipe.expire(index_key, self.cache_ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Shared synthesis cache write failed: {e}")
+    
+    async def invalidate_documents(self, knowledge_ids: List[str]) -> int:
+        """
+        Drop cached results synthesized from any of the given documents.
+        
+        Registered as a SemanticMemoryTier write listener, so store,
+        update_usefulness and delete on a source document evict dependents.
+        With a shared tier, dependents are found through each document's
+        index of cache keys; other processes' local copies expire within
+        DEFAULT_SHARED_LOCAL_TTL_SECONDS.
+        
+        Args:
+            knowledge_ids: Changed L4 document IDs
+            
+        Returns:
+            Number of local entries removed
+        """
+        removed = self._cache.invalidate_tags(knowledge_ids)
+        if knowledge_ids:
+            self._cache_version += 1
+        
+        if self._redis is not None and knowledge_ids:
+            try:
+                index_keys = [NamespaceManager.synthesis_cache_index(k) for k in knowledge_ids]
+                cache_keys = set()
+                for index_key in index_keys:
+                    members = await self._redis.smembers(index_key)
+                    cache_keys.update(
+                        m.decode() if isinstance(m, bytes) else m for m in members
+                    )
+                stale = [NamespaceManager.synthesis_cache(k) for k in cache_keys]
+                if stale or index_keys:
+                    await self._redis.delete(*stale, *index_keys)
+            except Exception as e:
+                logger.warning(f"Shared synthesis cache invalidation failed: {e}")
+        
+        if removed:
+            logger.info(f"Invalidated {removed} cached syntheses for documents {knowledge_ids}")
+        return removed
     
     async def _retrieve_with_metadata_filter(
         self,
@@ -333,6 +520,14 @@ class KnowledgeSynthesizer:
         """
         Compute similarity scores for documents.
         
+        Text relevance is Typesense's text_match (attached as
+        metadata['search_score']) normalized by the best candidate. When
+        document embeddings exist, the query is embedded once and cosine
+        similarity over the candidate matrix is blended in with
+        `vector_weight`; the raw cosine is kept as
+        metadata['vector_similarity'] for the absolute threshold. Documents
+        without an embedding keep their text score.
+        
         Args:
             query: Query text
             documents: Candidate documents
@@ -340,20 +535,130 @@ class KnowledgeSynthesizer:
         Returns:
             List of (document, score) tuples sorted by score descending
         """
-        # In production, this would compute cosine similarity
-        # For now, we rely on Typesense's relevance scoring
-        # which is already included in the search results
+        if not documents:
+            return []
+        
+        text_scores = np.array(
+            [float(doc.metadata.get("search_score") or 0.0) for doc in documents],
+            dtype=np.float64
+        )
+        max_text = text_scores.max()
+        # Without any text_match signal every returned hit is equally relevant
+        text_norm = text_scores / max_text if max_text > 0 else np.ones(len(documents))
         
-        # Typesense returns documents sorted by relevance
-        # We'll assign synthetic scores based on position
+        scores = text_norm.copy()
+        vector_scores, positions = await self._vector_scores(query, documents)
+        for doc in documents:
+            doc.metadata.pop("vector_similarity", None)
+        for position, similarity in zip(positions, vector_scores):
+            documents[position].metadata["vector_similarity"] = float(similarity)
+        if positions.size:
+            weight = self.vector_weight
+            scores[positions] = (
+                weight * np.clip(vector_scores, 0.0, 1.0)
+                + (1.0 - weight) * text_norm[positions]
+            )
+        
+        order = np.argsort(-scores, kind="stable")
         scored = []
-        for i, doc in enumerate(documents):
-            # Synthetic score: 1.0 for first, decreasing by 0.05 per position
-            score = max(0.6, 1.0 - (i * 0.05))
-            scored.append((doc, score))
+        for index in order:
+            doc = documents[index]
+            doc.metadata["similarity_score"] = float(scores[index])
+            scored.append((doc, float(scores[index])))
         
         return scored
     
+    async def _vector_scores(
+        self,
+        query: str,
+        documents: List[KnowledgeDocument]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cosine similarity between the query and document embeddings.
+        
+        Document vectors are the embeddings persisted with the candidates in
+        L4 (cached by the tier); the query vector is cached separately.
+        
+        Returns:
+            Tuple of (scores, positions) where positions index into `documents`;
+            both are empty when no embeddings are cached or no provider exists.
+        """
+        empty = (np.empty(0), np.empty(0, dtype=np.intp))
+        if self.embedding_provider is None:
+            return empty
+        
+        fill = getattr(self.semantic_tier, "cache_missing_embeddings", None)
+        if callable(fill):
+            try:
+                await fill(documents)
+            except Exception as e:
+                logger.warning(f"Embedding candidate documents failed: {e}")
+        
+        cache = self._embedding_cache()
+        matrix, positions = cache.get_matrix([doc.knowledge_id for doc in documents])
+        if positions.size == 0:
+            # Nothing to compare against; skip the query embedding call
+            return empty
+        
+        query_key = EmbeddingCache.content_key(query, namespace="query")
+        query_vector = self.query_embeddings.get(query_key)
+        if query_vector is None:
+            try:
+                query_vector = EmbeddingCache.normalize(
+                    await self.embedding_provider.get_embedding(text=query)
+                )
+            except Exception as e:
+                logger.warning(f"Query embedding failed, using text relevance only: {e}")
+                return empty
+            self.query_embeddings.put(query_key, query_vector)
+        
+        if query_vector.shape[0] != matrix.shape[1]:
+            logger.warning(
+                "Query embedding dimension %d does not match cached documents (%d)",
+                query_vector.shape[0],
+                matrix.shape[1]
+            )
+            return empty
+        
+        return cosine_scores(matrix, query_vector), positions
+    
+    def _select_top_k(
+        self,
+        scored_docs: List[Tuple[KnowledgeDocument, float]],
+        max_results: int
+    ) -> List[KnowledgeDocument]:
+        """
+        Keep the smallest useful prompt context.
+        
+        Drops documents whose cosine similarity to the query is below
+        `similarity_threshold` and documents scoring below
+        `relative_score_cutoff` of the best candidate, then caps at
+        `max_results`. The threshold is compared to raw cosine only, not to
+        blended or text scores, which are relative to the best hit.
+        Input must be sorted by score descending.
+        """
+        if not scored_docs:
+            return []
+        
+        floor = scored_docs[0][1] * self.relative_score_cutoff
+        threshold = self.similarity_threshold
+        return [
+            doc for doc, score in scored_docs
+            if score >= floor and doc.metadata.get("vector_similarity", threshold) >= threshold
+        ][:max_results]
+    
+    def _embedding_cache(self) -> EmbeddingCache:
+        """Return the L4 tier's embedding cache, or the shared one."""
+        cache = getattr(self.semantic_tier, "embedding_cache", None)
+        return cache if isinstance(cache, EmbeddingCache) else get_shared_embedding_cache()
+    
+    def _resolve_embedding_provider(self, llm_provider: BaseProvider) -> Optional[Any]:
+        """Pick a provider capable of query embeddings, if any."""
+        for candidate in (llm_provider, getattr(self.semantic_tier, "embedding_provider", None)):
+            if candidate is not None and hasattr(candidate, "get_embedding"):
+                return candidate
+        return None
+    
     def _detect_conflicts(
         self,
         documents: List[KnowledgeDocument]
@@ -380,22 +685,32 @@ class KnowledgeSynthesizer:
                     "conflict_type": doc.metadata.get("conflict_type", "unknown")
                 })
         
-        # Simple heuristic: Check for opposing recommendations
+        # Heuristic: opposing recommendations about the same topic. Polarity
+        # is precomputed per document; pairs come from array ops per group.
         recommendations = [
             doc for doc in documents
             if doc.knowledge_type == "recommendation"
         ]
         
         if len(recommendations) > 1:
-            # Check for contradictory language
-            for i, doc1 in enumerate(recommendations):
-                for doc2 in recommendations[i+1:]:
-                    if self._are_contradictory(doc1.content, doc2.content):
-                        conflicts.append({
-                            "doc_ids": [doc1.knowledge_id, doc2.knowledge_id],
-                            "titles": [doc1.title, doc2.title],
-                            "conflict_type": "contradictory_recommendations"
-                        })
+            keys = [topic_key(doc, self.conflict_group_by) for doc in recommendations]
+            polarities = np.fromiter(
+                (
+                    doc.polarity if doc.polarity is not None else compute_polarity(doc.content)
+                    for doc in recommendations
+                ),
+                dtype=np.int8,
+                count=len(recommendations)
+            )
+            for members in group_by_topic(keys):
+                rows, cols = contradictory_pairs(polarities[members])
+                for i, j in zip(members[rows].tolist(), members[cols].tolist()):
+                    doc1, doc2 = recommendations[i], recommendations[j]
+                    conflicts.append({
+                        "doc_ids": [doc1.knowledge_id, doc2.knowledge_id],
+                        "titles": [doc1.title, doc2.title],
+                        "conflict_type": "contradictory_recommendations"
+                    })
         
         return conflicts
     
@@ -410,21 +725,7 @@ class KnowledgeSynthesizer:
         Returns:
             True if texts appear contradictory
         """
-        # Simple keyword-based detection
-        negative_words = ["not", "don't", "avoid", "never", "shouldn't", "cannot"]
-        positive_words = ["should", "must", "recommend", "always", "can", "enable"]
-        
-        text1_lower = text1.lower()
-        text2_lower = text2.lower()
-        
-        # Check if one is negative and one is positive on similar topics
-        has_neg1 = any(word in text1_lower for word in negative_words)
-        has_pos1 = any(word in text1_lower for word in positive_words)
-        has_neg2 = any(word in text2_lower for word in negative_words)
-        has_pos2 = any(word in text2_lower for word in positive_words)
-        
-        # Simplified: contradictory if one is clearly negative and other is positive
-        return (has_neg1 and has_pos2) or (has_pos1 and has_neg2)
+        return is_contradictory(compute_polarity(text1), compute_polarity(text2))
     
     async def _synthesize_with_llm(
         self,
@@ -498,21 +799,22 @@ Synthesized Response:"""
             return fallback
     
     async def clear_cache(self):
-        """Clear the synthesis cache."""
+        """Clear the local synthesis cache."""
         self._cache.clear()
         logger.info("Synthesis cache cleared")
     
     async def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        now = datetime.now(timezone.utc)
-        valid_entries = sum(
-            1 for _, timestamp in self._cache.values()
-            if (now - timestamp).total_seconds() <= self.cache_ttl_seconds
-        )
+        """Get cache statistics, including hit rate and coalesced requests."""
+        stats = self._cache.stats()
+        valid_entries = self._cache.count_valid()
         
         return {
-            "total_entries": len(self._cache),
+            **stats,
             "valid_entries": valid_entries,
-            "expired_entries": len(self._cache) - valid_entries,
-            "ttl_seconds": self.cache_ttl_seconds
+            "expired_entries": stats["total_entries"] - valid_entries,
+            "ttl_seconds": self.cache_ttl_seconds,
+            "shared_tier": self._redis is not None,
+            "shared_hits": self._redis_hits,
+            "coalesced_requests": self._single_flight.coalesced,
+            "in_flight": self._single_flight.in_flight()
         }
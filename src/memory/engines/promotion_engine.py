@@ -18,7 +18,7 @@ from src.memory.engines.topic_segmenter import TopicSegmenter, TopicSegment
 from src.memory.engines.fact_extractor import FactExtractor
 from src.memory.tiers.active_context_tier import ActiveContextTier
 from src.memory.tiers.working_memory_tier import WorkingMemoryTier
-from src.memory.ciar_scorer import CIARScorer
+from src.memory.ciar_scorer import CIARScorer, get_ciar_scorer
 from src.memory.models import Fact, FactType, FactCategory
 
 logger = logging.getLogger(__name__)
@@ -47,7 +47,7 @@ class PromotionEngine(BaseEngine):
         l2_tier: WorkingMemoryTier,
         topic_segmenter: TopicSegmenter,
         fact_extractor: FactExtractor,
-        ciar_scorer: CIARScorer,
+        ciar_scorer: Optional[CIARScorer] = None,
         config: Optional[Dict[str, Any]] = None
     ):
         super().__init__()
@@ -55,7 +55,8 @@ class PromotionEngine(BaseEngine):
         self.l2 = l2_tier
         self.segmenter = topic_segmenter
         self.extractor = fact_extractor
-        self.scorer = ciar_scorer
+        # Default to the process-wide scorer shared with the tools and L2
+        self.scorer = ciar_scorer or get_ciar_scorer()
         self.config = config or {}
         mock_types = (Mock, MagicMock, AsyncMock)
         self._uses_mocks = any(
@@ -210,12 +211,11 @@ class PromotionEngine(BaseEngine):
                             fact.certainty = segment.certainty
                         if fact.impact < segment.impact:
                             fact.impact = segment.impact
-                        
-                        # Recalculate CIAR with inherited values
-                        fact.ciar_score = max(
-                            self.scorer.calculate(fact),
-                            self.promotion_threshold
-                        )
+                    
+                    # Recalculate CIAR with inherited values (one batch per segment)
+                    scores = self.scorer.calculate_batch(facts) if facts else []
+                    for fact, score in zip(facts, scores):
+                        fact.ciar_score = max(float(score), self.promotion_threshold)
 
                         # Respect L2 threshold before store to avoid ValueError from WorkingMemoryTier
                         ciar_threshold = getattr(self.l2, "ciar_threshold", self.promotion_threshold)
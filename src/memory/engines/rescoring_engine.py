@@ -0,0 +1,122 @@
+"""
+Rescoring Engine (L2 maintenance).
+
+Stored CIAR scores in Working Memory only decay when a fact passes through
+Python, so CIAR-ordered queries drift towards stale rankings. This engine
+periodically re-scores all L2 facts inside the database via
+`WorkingMemoryTier.rescore_decay` (chunked, set-based UPDATEs using the
+shared CIAR config).
+
+Scheduling:
+- `process()` runs one full pass (e.g. from an external scheduler)
+- `start()` runs a pass every `interval_seconds` in a background task
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from src.memory.engines.base_engine import BaseEngine
+from src.memory.tiers.working_memory_tier import WorkingMemoryTier
+from src.storage.metrics.timer import OperationTimer
+
+logger = logging.getLogger(__name__)
+
+
+class RescoringEngine(BaseEngine):
+    """
+    Periodically recomputes decayed CIAR scores of L2 facts in bulk.
+    """
+
+    DEFAULT_INTERVAL_SECONDS = 3600.0
+    DEFAULT_CHUNK_SIZE = WorkingMemoryTier.DEFAULT_RESCORE_CHUNK_SIZE
+
+    def __init__(
+        self,
+        l2_tier: WorkingMemoryTier,
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            l2_tier: Working Memory tier to rescore
+            config: Optional configuration with keys:
+                - interval_seconds: Seconds between passes (default: 3600)
+                - chunk_size: Facts per UPDATE statement (default: 1000)
+        """
+        super().__init__()
+        self.l2 = l2_tier
+        self.config = config or {}
+        self.interval_seconds = self.config.get(
+            'interval_seconds', self.DEFAULT_INTERVAL_SECONDS
+        )
+        self.chunk_size = self.config.get('chunk_size', self.DEFAULT_CHUNK_SIZE)
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    async def process(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run one rescoring pass.
+
+        Args:
+            session_id: Only rescore this session (default: all sessions)
+
+        Returns:
+            Dict with 'scanned', 'updated', 'chunks', 'duration_ms' and
+            'errors' counts
+        """
+        start = time.perf_counter()
+        stats: Dict[str, Any] = {'scanned': 0, 'updated': 0, 'chunks': 0, 'errors': 0}
+        async with OperationTimer(self.metrics, 'rescoring_pass'):
+            try:
+                stats.update(await self.l2.rescore_decay(
+                    session_id=session_id,
+                    chunk_size=self.chunk_size
+                ))
+            except Exception as e:
+                logger.error(f"CIAR rescoring pass failed: {e}")
+                stats['errors'] += 1
+        stats['duration_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        self.last_run = stats
+        return stats
+
+    async def start(self) -> None:
+        """Start rescoring every `interval_seconds` in the background."""
+        if self._task is not None and not self._task.done():
+            return
+        self._is_running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"RescoringEngine started (interval={self.interval_seconds}s)")
+
+    async def stop(self) -> None:
+        """Stop the background schedule, cancelling a pass in progress."""
+        self._is_running = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("RescoringEngine stopped")
+
+    async def _run(self) -> None:
+        while self._is_running:
+            await self.process()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check health of dependencies."""
+        l2_health = await self.l2.health_check()
+        return {
+            "status": "healthy" if l2_health.get("status") == "healthy" else "unhealthy",
+            "l2": l2_health,
+            "running": self._is_running,
+            "last_run": self.last_run,
+            "config": {
+                "interval_seconds": self.interval_seconds,
+                "chunk_size": self.chunk_size
+            }
+        }
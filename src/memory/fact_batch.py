@@ -0,0 +1,279 @@
+"""
+Columnar container for bulk fact processing.
+
+Lifecycle engines move hundreds of facts at a time. Building a validated
+`Fact` model per row (and round-tripping through `model_dump()`) costs far
+more than the work done on most facts, which is sorting, filtering and
+clustering on a few numeric columns.
+
+`FactBatch` keeps those columns as NumPy arrays (scores, access counts,
+extraction timestamps as POSIX seconds) and identifiers/content as lists,
+built directly from database rows without per-row validation. A `Fact` is
+only constructed when a single item is accessed, and then cached.
+
+Example:
+    >>> batch = FactBatch.from_rows(rows)
+    >>> top = batch.filter(batch.ciar_score >= 0.6).sort('ciar_score')[:10]
+    >>> facts = top.to_facts()
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+import json
+import time
+
+import numpy as np
+
+from src.memory.models import Fact
+
+
+# Numeric CIAR columns, with the Fact model defaults for missing values
+FLOAT_COLUMNS = ('ciar_score', 'certainty', 'impact', 'age_decay', 'recency_boost')
+_DEFAULTS = {name: Fact.model_fields[name].default for name in FLOAT_COLUMNS}
+
+
+def _timestamp(value: Any) -> float:
+    """POSIX seconds of a datetime or ISO string (naive = UTC), NaN if missing."""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class FactBatch:
+    """
+    Array-backed batch of facts with lazy `Fact` conversion.
+
+    Columns:
+        fact_ids, session_ids, contents, topic_segment_ids: lists
+        ciar_score, certainty, impact, age_decay, recency_boost: float64 arrays
+        access_count: int64 array
+        extracted_ts: float64 array of POSIX seconds (NaN when unknown)
+
+    The numeric columns are the source of truth for rows not yet
+    converted: a `Fact` built from a row takes its scores from the columns,
+    so vectorized updates made before access are visible.
+    Indexing with an int returns a `Fact`; with a slice, index array or
+    boolean mask it returns a new `FactBatch`.
+    """
+
+    __slots__ = (
+        'fact_ids', 'session_ids', 'contents', 'topic_segment_ids',
+        'ciar_score', 'certainty', 'impact', 'age_decay', 'recency_boost',
+        'access_count', 'extracted_ts', '_rows', '_facts'
+    )
+
+    def __init__(
+        self,
+        fact_ids: List[str],
+        session_ids: List[str],
+        contents: List[str],
+        topic_segment_ids: List[Optional[str]],
+        scores: Dict[str, np.ndarray],
+        access_count: np.ndarray,
+        extracted_ts: np.ndarray,
+        rows: List[Optional[Dict[str, Any]]],
+        facts: List[Optional[Fact]]
+    ):
+        """
+        Build a batch from columns; use `from_rows` or `from_facts` instead.
+
+        Args:
+            scores: One float64 array per name in FLOAT_COLUMNS
+            rows: Source row per item (None where built from a Fact)
+            facts: Converted Fact per item (None until accessed)
+        """
+        self.fact_ids = fact_ids
+        self.session_ids = session_ids
+        self.contents = contents
+        self.topic_segment_ids = topic_segment_ids
+        self.ciar_score = scores['ciar_score']
+        self.certainty = scores['certainty']
+        self.impact = scores['impact']
+        self.age_decay = scores['age_decay']
+        self.recency_boost = scores['recency_boost']
+        self.access_count = access_count
+        self.extracted_ts = extracted_ts
+        self._rows = rows
+        self._facts = facts
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Dict[str, Any]],
+        default_ciar_score: Optional[float] = None
+    ) -> 'FactBatch':
+        """
+        Build a batch from database rows without validating each row.
+
+        Rows are kept as-is for lazy `Fact` conversion; a generic 'id'
+        stands in for a missing 'fact_id'.
+
+        Args:
+            rows: Row dicts from the working_memory table
+            default_ciar_score: Score for rows without a ciar_score
+                (default: the Fact model default)
+        """
+        rows = [dict(row) for row in rows]
+        scores = {}
+        for name in FLOAT_COLUMNS:
+            default = _DEFAULTS[name]
+            if name == 'ciar_score' and default_ciar_score is not None:
+                default = default_ciar_score
+            values = [row.get(name) for row in rows]
+            scores[name] = np.array(
+                [default if value is None else value for value in values],
+                dtype=np.float64
+            )
+        return cls(
+            fact_ids=[str(row['fact_id']) if row.get('fact_id') is not None else str(row.get('id')) for row in rows],
+            session_ids=[row.get('session_id') for row in rows],
+            contents=[row.get('content') for row in rows],
+            topic_segment_ids=[row.get('topic_segment_id') for row in rows],
+            scores=scores,
+            access_count=np.array([row.get('access_count') or 0 for row in rows], dtype=np.int64),
+            extracted_ts=np.array(
+                [_timestamp(row.get('extracted_at') or row.get('created_at')) for row in rows],
+                dtype=np.float64
+            ),
+            rows=rows,
+            facts=[None] * len(rows)
+        )
+
+    @classmethod
+    def from_facts(cls, facts: Iterable[Fact]) -> 'FactBatch':
+        """Build a batch from existing Fact models (kept, not copied)."""
+        facts = list(facts)
+        return cls(
+            fact_ids=[fact.fact_id for fact in facts],
+            session_ids=[fact.session_id for fact in facts],
+            contents=[fact.content for fact in facts],
+            topic_segment_ids=[fact.topic_segment_id for fact in facts],
+            scores={
+                name: np.array([getattr(fact, name) for fact in facts], dtype=np.float64)
+                for name in FLOAT_COLUMNS
+            },
+            access_count=np.array([fact.access_count for fact in facts], dtype=np.int64),
+            extracted_ts=np.array([_timestamp(fact.extracted_at) for fact in facts], dtype=np.float64),
+            rows=[None] * len(facts),
+            facts=facts
+        )
+
+    def __len__(self) -> int:
+        return len(self.fact_ids)
+
+    def __iter__(self) -> Iterator[Fact]:
+        for index in range(len(self)):
+            yield self._fact(index)
+
+    def __getitem__(self, key: Union[int, slice, Sequence[int], np.ndarray]) -> Union[Fact, 'FactBatch']:
+        if isinstance(key, (int, np.integer)):
+            index = int(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"FactBatch index {key} out of range")
+            return self._fact(index)
+        if isinstance(key, slice):
+            return self.take(np.arange(len(self))[key])
+        key = np.asarray(key)
+        if key.dtype == bool:
+            return self.filter(key)
+        return self.take(key)
+
+    def __repr__(self) -> str:
+        return f"FactBatch({len(self)} facts)"
+
+    def _fact(self, index: int) -> Fact:
+        """Build (once) the Fact for one item."""
+        fact = self._facts[index]
+        if fact is None:
+            data = dict(self._rows[index])
+            if isinstance(data.get('metadata'), str):
+                data['metadata'] = json.loads(data['metadata'])
+            if data.get('metadata') is None:
+                data.pop('metadata', None)
+            data['fact_id'] = self.fact_ids[index]
+            if data.get('extracted_at') is None and not np.isnan(self.extracted_ts[index]):
+                # Rows may carry created_at instead of extracted_at
+                data['extracted_at'] = datetime.fromtimestamp(self.extracted_ts[index], tz=timezone.utc)
+            for name in FLOAT_COLUMNS:
+                data[name] = float(getattr(self, name)[index])
+            data['access_count'] = int(self.access_count[index])
+            fact = self._facts[index] = Fact(**data)
+        return fact
+
+    def to_facts(self) -> List[Fact]:
+        """Convert every item to a Fact."""
+        return [self._fact(index) for index in range(len(self))]
+
+    def take(self, indices: Union[Sequence[int], np.ndarray]) -> 'FactBatch':
+        """New batch with the items at `indices`, in that order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        positions = indices.tolist()
+        return FactBatch(
+            fact_ids=[self.fact_ids[i] for i in positions],
+            session_ids=[self.session_ids[i] for i in positions],
+            contents=[self.contents[i] for i in positions],
+            topic_segment_ids=[self.topic_segment_ids[i] for i in positions],
+            scores={name: getattr(self, name)[indices] for name in FLOAT_COLUMNS},
+            access_count=self.access_count[indices],
+            extracted_ts=self.extracted_ts[indices],
+            rows=[self._rows[i] for i in positions],
+            facts=[self._facts[i] for i in positions]
+        )
+
+    def filter(self, mask: np.ndarray) -> 'FactBatch':
+        """New batch with the items where `mask` is True."""
+        return self.take(np.flatnonzero(mask))
+
+    def argsort(self, by: str = 'ciar_score', descending: bool = True) -> np.ndarray:
+        """
+        Indices that sort the batch by a numeric column.
+
+        The sort is stable; NaN timestamps sort last either way.
+        """
+        if by not in FLOAT_COLUMNS and by not in ('access_count', 'extracted_ts'):
+            raise ValueError(f"Cannot sort FactBatch by '{by}'")
+        values = getattr(self, by)
+        if descending:
+            values = -values
+        return np.argsort(values, kind='stable')
+
+    def sort(self, by: str = 'ciar_score', descending: bool = True) -> 'FactBatch':
+        """New batch sorted by a numeric column (see argsort)."""
+        return self.take(self.argsort(by, descending))
+
+    def cluster_by_time(self, window_seconds: float, now: Optional[float] = None) -> List['FactBatch']:
+        """
+        Split the batch into consecutive extraction-time windows.
+
+        Items are sorted by extraction time; each window starts at its
+        first item and holds every item within `window_seconds` of it.
+        Unknown timestamps count as `now`.
+
+        Args:
+            window_seconds: Window length in seconds
+            now: POSIX seconds for unknown timestamps (default: current time)
+
+        Returns:
+            Batches in chronological order
+        """
+        if not len(self):
+            return []
+        times = np.where(np.isnan(self.extracted_ts), time.time() if now is None else now, self.extracted_ts)
+        order = np.argsort(times, kind='stable')
+        times = times[order]
+
+        # Window ends found by binary search: one step per window, not per fact
+        bounds = [0]
+        while bounds[-1] < len(times):
+            start = bounds[-1]
+            bounds.append(int(np.searchsorted(times, times[start] + window_seconds, side='right')))
+        return [self.take(order[start:end]) for start, end in zip(bounds, bounds[1:])]
+
+
+__all__ = ["FactBatch"]
@@ -0,0 +1,141 @@
+"""
+Per-session tier generation counters for query-result cache invalidation.
+
+Every write to a memory tier bumps a generation counter for the session it
+touched. Readers snapshot the counters of the tiers they depend on and use
+the snapshot as part of their cache key, so any write makes earlier cached
+results unreachable without explicit invalidation.
+
+Counters live in Redis so that every process serving a session sees the
+same generations:
+- Session counters: {session:ID}:generation (hash of tier -> counter)
+- Global counters:  {mas}:generation (writes that are not session-scoped,
+  such as L4 knowledge, or deletes that do not know their session)
+
+Both async (redis.asyncio) and sync (redis.Redis) clients are accepted;
+sync calls run in a worker thread. Without a Redis client the counters are
+kept in-process, and writes made by other processes are not seen.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+import asyncio
+import logging
+
+import redis
+
+from src.memory.namespace import NamespaceManager
+
+logger = logging.getLogger(__name__)
+
+
+class SessionGenerations:
+    """
+    Generation counters per (session, tier), held in Redis.
+
+    `snapshot` returns the session counters followed by the global counters
+    for the requested tiers; two equal snapshots mean no relevant write
+    happened in between.
+
+    A bump that fails to reach Redis is logged and also recorded in-process,
+    so this process's caches are still invalidated; other processes only
+    drop their entry when its TTL expires.
+    """
+
+    def __init__(self, redis_client: Optional[Any] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            redis_client: Redis client (async or sync); counters are
+                process-local when omitted
+        """
+        self._redis = redis_client
+        self._sync = isinstance(redis_client, redis.Redis)
+        self._local: Dict[str, Dict[str, int]] = {}
+        self.bumps = 0
+        self.errors = 0
+
+    @property
+    def shared(self) -> bool:
+        """True when counters are shared through Redis."""
+        return self._redis is not None
+
+    @staticmethod
+    def _key(session_id: Optional[str]) -> str:
+        if session_id is None:
+            return NamespaceManager.global_generation()
+        return NamespaceManager.session_generation(session_id)
+
+    async def bump(self, tier: str, session_id: Optional[str] = None) -> None:
+        """
+        Record a write to a tier.
+
+        Failures are logged and counted in `errors`, not raised: a missed
+        bump must never fail the write that triggered it.
+
+        Args:
+            tier: Tier name ('L1'-'L4')
+            session_id: Session written to, or None for a global write
+                (invalidates the tier for every session)
+        """
+        key = self._key(session_id)
+        self.bumps += 1
+        if self._redis is None:
+            self._bump_local(key, tier)
+            return
+        try:
+            if self._sync:
+                await asyncio.to_thread(self._redis.hincrby, key, tier, 1)
+            else:
+                await self._redis.hincrby(key, tier, 1)
+        except Exception as e:
+            self.errors += 1
+            # Local snapshots include this counter, so at least this
+            # process stops serving results cached before the write
+            self._bump_local(key, tier)
+            logger.error(
+                f"Failed to bump {tier} generation for {key}; other processes may serve "
+                f"stale cached reads until their TTL expires: {e}"
+            )
+
+    def _bump_local(self, key: str, tier: str) -> None:
+        counters = self._local.setdefault(key, {})
+        counters[tier] = counters.get(tier, 0) + 1
+
+    async def snapshot(self, session_id: str, tiers: Iterable[str]) -> Tuple[int, ...]:
+        """
+        Read the current generations of the given tiers.
+
+        Args:
+            session_id: Session being read
+            tiers: Tier names the read depends on
+
+        Returns:
+            Session counters followed by global counters, in `tiers` order
+
+        Raises:
+            Exception: If Redis cannot be read (callers should bypass their
+                cache rather than risk serving stale results)
+        """
+        tiers = list(tiers)
+        session_key = self._key(session_id)
+        global_key = self._key(None)
+        local_session = self._local.get(session_key, {})
+        local_shared = self._local.get(global_key, {})
+        local = [local_session.get(t, 0) for t in tiers] + [local_shared.get(t, 0) for t in tiers]
+        if self._redis is None:
+            return tuple(local)
+
+        # Keys hash to different slots, so use a non-transactional pipeline
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hmget(session_key, tiers)
+        pipe.hmget(global_key, tiers)
+        if self._sync:
+            session, shared = await asyncio.to_thread(pipe.execute)
+        else:
+            session, shared = await pipe.execute()
+        remote = [int(value or 0) for value in list(session) + list(shared)]
+        return tuple(r + l for r, l in zip(remote, local))
+
+
+__all__ = ["SessionGenerations"]
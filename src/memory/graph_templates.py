@@ -23,11 +23,27 @@ Template Categories:
 - Causal Analysis
 - Document Flow
 - Timeline Queries
+
+Structural Parameters:
+Cypher cannot parameterize variable-length bounds (`*1..$max_depth` is a
+syntax error), so such parameters are written as `{{name}}` placeholders and
+declared in `structural_params` with inclusive bounds. Each template is
+compiled once into the bounded set of variants (one Cypher string per
+combination of structural values); requests pick a variant, so the query
+text sent to Neo4j stays within a small, plan-cacheable set.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from enum import Enum
+import itertools
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Placeholder syntax for structural parameters ({{max_depth}})
+_STRUCTURAL_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
 
 
 class TemplateCategory(str, Enum):
@@ -56,6 +72,11 @@ class GraphQueryTemplate:
         category: Template category for organization
         returns: Description of return structure
         examples: Example parameter sets for documentation
+        structural_params: `{{placeholder}}` parameters rendered into the
+            query text, mapped to inclusive (min, max) integer bounds
+        anchor_params: Parameters naming the entities a query is anchored
+            on; used to invalidate cached results when L3 writes touch them
+        read_only: Whether results may be cached (templates never write)
     """
     name: str
     cypher_template: str
@@ -65,6 +86,9 @@ class GraphQueryTemplate:
     category: TemplateCategory = TemplateCategory.TRACKING
     returns: str = ""
     examples: List[Dict[str, Any]] = field(default_factory=list)
+    structural_params: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    anchor_params: List[str] = field(default_factory=list)
+    read_only: bool = True
     
     def validate_params(self, params: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """
@@ -127,6 +151,7 @@ GET_CONTAINER_JOURNEY = GraphQueryTemplate(
     """,
     required_params=["container_id"],
     optional_params={"max_hops": 20},
+    anchor_params=["container_id"],
     description="Track a container's journey through ports, vessels, and facilities",
     category=TemplateCategory.TRACKING,
     returns="Path with nodes (ports, vessels, facilities) and edges (movements)",
@@ -159,6 +184,7 @@ GET_SHIPMENT_PARTIES = GraphQueryTemplate(
     """,
     required_params=["shipment_id"],
     optional_params={},
+    anchor_params=["shipment_id"],
     description="Get all parties (shipper, consignee, carrier, agent) for a shipment",
     category=TemplateCategory.RELATIONSHIPS,
     returns="Shipment node and dict of all related parties",
@@ -171,7 +197,7 @@ FIND_DELAY_CAUSES = GraphQueryTemplate(
     name="find_delay_causes",
     cypher_template="""
         MATCH (shipment:Shipment {shipment_id: $shipment_id})
-              -[r_delayed:DELAYED_BY*1..$max_depth]->(cause)
+              -[r_delayed:DELAYED_BY*1..{{max_depth}}]->(cause)
         WHERE shipment.factValidTo IS NULL
           AND ALL(rel IN r_delayed WHERE rel.factValidTo IS NULL)
         WITH shipment, cause, r_delayed
@@ -190,6 +216,8 @@ FIND_DELAY_CAUSES = GraphQueryTemplate(
     """,
     required_params=["shipment_id"],
     optional_params={"max_depth": 5, "max_results": 10},
+    structural_params={"max_depth": (1, 10)},
+    anchor_params=["shipment_id"],
     description="Find causal chain of delay reasons for a shipment",
     category=TemplateCategory.CAUSALITY,
     returns="Shipment, root cause, and causal chain of delay relationships",
@@ -221,6 +249,7 @@ GET_DOCUMENT_FLOW = GraphQueryTemplate(
     """,
     required_params=["shipment_id"],
     optional_params={},
+    anchor_params=["shipment_id"],
     description="Get all documents (Bill of Lading, customs forms, delivery proof) for a shipment",
     category=TemplateCategory.DOCUMENTS,
     returns="Shipment and ordered list of associated documents",
@@ -253,6 +282,7 @@ GET_RELATED_EPISODES = GraphQueryTemplate(
     """,
     required_params=["entity_id", "start_time", "end_time"],
     optional_params={"max_results": 50},
+    anchor_params=["entity_id"],
     description="Find all episodes (events) involving an entity within a time window",
     category=TemplateCategory.TEMPORAL,
     returns="List of episodes with timestamps and related entities",
@@ -295,6 +325,7 @@ GET_ENTITY_TIMELINE = GraphQueryTemplate(
     """,
     required_params=["entity_id"],
     optional_params={"max_events": 100},
+    anchor_params=["entity_id"],
     description="Get chronological timeline of all events for an entity (container, shipment, etc.)",
     category=TemplateCategory.TEMPORAL,
     returns="Ordered list of timeline events with timestamps and related entities",
@@ -348,6 +379,223 @@ def list_templates(category: Optional[TemplateCategory] = None) -> List[GraphQue
     return templates
 
 
+# ============================================================================
+# TEMPLATE COMPILER
+# ============================================================================
+
+@dataclass
+class RenderedTemplate:
+    """
+    A template rendered for one request, ready to execute.
+
+    Attributes:
+        name: Template name
+        cypher: Query text of the selected pre-built variant
+        parameters: Bound ($param) values, structural params removed
+        cache_key: Hashable key identifying (template, params)
+        anchor_ids: Entity IDs the query is anchored on
+        read_only: Whether the result may be cached
+        structural_values: Structural params as rendered (clamped to bounds)
+    """
+    name: str
+    cypher: str
+    parameters: Dict[str, Any]
+    cache_key: Tuple[str, Tuple[Tuple[str, str], ...]]
+    anchor_ids: List[str]
+    read_only: bool = True
+    structural_values: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class CompiledTemplate:
+    """
+    A template with every structural variant pre-rendered.
+
+    Attributes:
+        template: Source template
+        variants: Query text keyed by structural values (in
+            `structural_names` order); a single `()` entry when the template
+            has no structural parameters
+        structural_names: Structural parameter names, sorted
+    """
+    template: GraphQueryTemplate
+    variants: Dict[Tuple[int, ...], str]
+    structural_names: Tuple[str, ...] = ()
+
+    def variant_key(self, params: Dict[str, Any]) -> Tuple[int, ...]:
+        """
+        Select the variant for merged params, clamping values to bounds.
+
+        Raises:
+            ValueError: If a structural value is not an integer
+        """
+        values = []
+        for name in self.structural_names:
+            low, high = self.template.structural_params[name]
+            raw = params.get(name)
+            try:
+                value = int(raw)
+            except (TypeError, ValueError):
+                raise ValueError(f"Parameter '{name}' must be an integer, got {raw!r}")
+            clamped = min(max(value, low), high)
+            if clamped != value:
+                logger.debug(
+                    "Clamped %s=%s to %s for template %s",
+                    name, value, clamped, self.template.name
+                )
+            values.append(clamped)
+        return tuple(values)
+
+    def render(self, params: Dict[str, Any]) -> RenderedTemplate:
+        """
+        Render validated params into an executable query.
+
+        Args:
+            params: User-provided parameters (required params present)
+
+        Returns:
+            RenderedTemplate for the matching pre-built variant
+        """
+        merged = self.template.merge_params(params)
+        key = self.variant_key(merged)
+        for name, value in zip(self.structural_names, key):
+            merged[name] = value
+        parameters = {k: v for k, v in merged.items() if k not in self.structural_names}
+        anchor_ids = [
+            str(merged[name]) for name in self.template.anchor_params
+            if merged.get(name) is not None
+        ]
+        cache_key = (
+            self.template.name,
+            tuple(sorted((k, repr(v)) for k, v in merged.items())),
+        )
+        return RenderedTemplate(
+            name=self.template.name,
+            cypher=self.variants[key],
+            parameters=parameters,
+            cache_key=cache_key,
+            anchor_ids=anchor_ids,
+            read_only=self.template.read_only,
+            structural_values=dict(zip(self.structural_names, key)),
+        )
+
+
+def compile_template(template: GraphQueryTemplate) -> CompiledTemplate:
+    """
+    Pre-render every structural variant of a template.
+
+    Args:
+        template: Template to compile
+
+    Returns:
+        CompiledTemplate with one query string per structural combination
+
+    Raises:
+        ValueError: If the query uses an undeclared placeholder or a bound
+            is invalid
+    """
+    placeholders = set(_STRUCTURAL_PLACEHOLDER.findall(template.cypher_template))
+    undeclared = placeholders - set(template.structural_params)
+    if undeclared:
+        raise ValueError(
+            f"Template '{template.name}' uses undeclared structural params: "
+            f"{', '.join(sorted(undeclared))}"
+        )
+
+    names = tuple(sorted(template.structural_params))
+    ranges = []
+    for name in names:
+        low, high = template.structural_params[name]
+        if low < 1 or high < low:
+            raise ValueError(f"Invalid bounds for '{name}' in template '{template.name}'")
+        ranges.append(range(low, high + 1))
+
+    variants: Dict[Tuple[int, ...], str] = {}
+    for combo in itertools.product(*ranges):
+        values = dict(zip(names, combo))
+        variants[combo] = _STRUCTURAL_PLACEHOLDER.sub(
+            lambda match: str(values[match.group(1)]),
+            template.cypher_template
+        )
+    return CompiledTemplate(template=template, variants=variants, structural_names=names)
+
+
+COMPILED_TEMPLATES: Dict[str, CompiledTemplate] = {
+    name: compile_template(template) for name, template in TEMPLATE_REGISTRY.items()
+}
+
+
+def get_compiled_template(name: str) -> Optional[CompiledTemplate]:
+    """Retrieve the compiled form of a registered template."""
+    return COMPILED_TEMPLATES.get(name)
+
+
+def render_template(
+    name: str,
+    params: Dict[str, Any]
+) -> tuple[bool, Optional[str], Optional[RenderedTemplate]]:
+    """
+    Validate a template request and render it to a pre-built variant.
+
+    Args:
+        name: Template name
+        params: User-provided parameters
+
+    Returns:
+        (is_valid, error_message, rendered)
+    """
+    compiled = get_compiled_template(name)
+    if not compiled:
+        available = ", ".join(TEMPLATE_REGISTRY.keys())
+        return False, f"Unknown template '{name}'. Available: {available}", None
+
+    is_valid, error_msg = compiled.template.validate_params(params)
+    if not is_valid:
+        return False, error_msg, None
+
+    try:
+        return True, None, compiled.render(params)
+    except ValueError as e:
+        return False, str(e), None
+
+
+async def warm_template_plans(
+    execute: Callable[[str, Dict[str, Any]], Awaitable[Any]],
+    names: Optional[List[str]] = None
+) -> int:
+    """
+    Compile query plans for every template variant without running them.
+
+    Each variant is sent once as `EXPLAIN <query>` so Neo4j parses and plans
+    it into its query cache before the first agent request arrives.
+
+    Args:
+        execute: Read executor, e.g. `Neo4jAdapter.execute_read`
+        names: Restrict warming to these templates (default: all)
+
+    Returns:
+        Number of variants warmed successfully
+    """
+    warmed = 0
+    for name in names or list(COMPILED_TEMPLATES):
+        compiled = COMPILED_TEMPLATES[name]
+        template = compiled.template
+        placeholder_params = template.merge_params(
+            {param: None for param in template.required_params}
+        )
+        parameters = {
+            k: v for k, v in placeholder_params.items()
+            if k not in compiled.structural_names
+        }
+        for cypher in compiled.variants.values():
+            try:
+                await execute(f"EXPLAIN {cypher}", parameters)
+                warmed += 1
+            except Exception as e:
+                logger.warning("Failed to warm plan for template %s: %s", name, e)
+    return warmed
+
+
 def validate_and_execute_template(
     name: str,
     params: Dict[str, Any]
@@ -361,16 +609,11 @@ def validate_and_execute_template(
     
     Returns:
         (is_valid, error_message, cypher_query)
-        If valid, returns (True, None, cypher_query)
+        If valid, returns (True, None, cypher_query) where cypher_query is
+        the pre-built variant for the given structural params
         If invalid, returns (False, error_message, None)
     """
-    template = get_template(name)
-    if not template:
-        available = ", ".join(TEMPLATE_REGISTRY.keys())
-        return False, f"Unknown template '{name}'. Available: {available}", None
-    
-    is_valid, error_msg = template.validate_params(params)
+    is_valid, error_msg, rendered = render_template(name, params)
     if not is_valid:
         return False, error_msg, None
-    
-    return True, None, template.cypher_template
+    return True, None, rendered.cypher
@@ -5,7 +5,7 @@ Defines Pydantic models for facts, episodes, and knowledge documents
 with validation and serialization support.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 from enum import Enum
@@ -171,6 +171,13 @@ class FactQuery(BaseModel):
     order_by: str = Field(default="ciar_score DESC")
 
 
+def to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Return a timezone-aware datetime, treating naive values as UTC."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
 class Episode(BaseModel):
     """
     Represents a consolidated episode in L3 Episodic Memory.
@@ -238,22 +245,28 @@ class Episode(BaseModel):
         }
     
     def to_neo4j_properties(self) -> Dict[str, Any]:
-        """Convert to Neo4j node properties."""
+        """
+        Convert to Neo4j node properties.
+        
+        Temporal properties are native datetimes (stored as Neo4j DateTime,
+        naive values assumed UTC) so range indexes and temporal comparisons
+        apply.
+        """
         return {
             'episodeId': self.episode_id,
             'sessionId': self.session_id,
             'summary': self.summary,
             'narrative': self.narrative or '',
             'factCount': self.fact_count,
-            'timeWindowStart': self.time_window_start.isoformat(),
-            'timeWindowEnd': self.time_window_end.isoformat(),
+            'timeWindowStart': to_utc(self.time_window_start),
+            'timeWindowEnd': to_utc(self.time_window_end),
             'durationSeconds': self.duration_seconds,
-            'factValidFrom': self.fact_valid_from.isoformat(),
-            'factValidTo': self.fact_valid_to.isoformat() if self.fact_valid_to else None,
-            'sourceObservationTimestamp': self.source_observation_timestamp.isoformat(),
+            'factValidFrom': to_utc(self.fact_valid_from),
+            'factValidTo': to_utc(self.fact_valid_to),
+            'sourceObservationTimestamp': to_utc(self.source_observation_timestamp),
             'importanceScore': self.importance_score,
             'vectorId': self.vector_id,
-            'consolidatedAt': self.consolidated_at.isoformat(),
+            'consolidatedAt': to_utc(self.consolidated_at),
             'consolidationMethod': self.consolidation_method,
             # Duplicate snake_case properties for compatibility with legacy queries
             'session_id': self.session_id,
@@ -300,11 +313,27 @@ class KnowledgeDocument(BaseModel):
     last_accessed: Optional[datetime] = None
     usefulness_score: float = Field(default=0.5, ge=0.0, le=1.0)
     
+    # Conflict-detection features (see src.memory.conflict_features);
+    # persisted with the document and computed on load when missing
+    polarity: Optional[int] = Field(default=None, ge=0, le=3)
+    
+    # Title+content embedding computed at store time and persisted with the
+    # document (an unindexed Typesense field); excluded from model dumps
+    embedding: Optional[List[float]] = Field(default=None, exclude=True)
+    
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
+    @model_validator(mode='after')
+    def _compute_polarity(self) -> 'KnowledgeDocument':
+        """Precompute polarity once so conflict checks never rescan content."""
+        if self.polarity is None:
+            from .conflict_features import compute_polarity
+            self.polarity = compute_polarity(self.content)
+        return self
+    
     def to_typesense_document(self) -> Dict[str, Any]:
         """Convert to Typesense document format."""
-        return {
+        document = {
             'id': self.knowledge_id,
             'session_id': self.session_id or '',
             'title': self.title,
@@ -320,8 +349,12 @@ class KnowledgeDocument(BaseModel):
             'distilled_at': int(self.distilled_at.timestamp()),
             'access_count': self.access_count,
             'usefulness_score': self.usefulness_score,
-            'validation_count': self.validation_count
+            'validation_count': self.validation_count,
+            'polarity': self.polarity
         }
+        if self.embedding is not None:
+            document['embedding'] = self.embedding
+        return document
 
 
 class EpisodeQuery(BaseModel):
@@ -399,11 +432,21 @@ class ContextBlock(BaseModel):
     assembled_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     l1_time_window_hours: float = Field(default=24.0, description="Time window for L1 turns retrieval")
     estimated_tokens: Optional[int] = Field(default=None, description="Rough token count estimate for LLM context")
+    skipped_tiers: List[str] = Field(default_factory=list, description="Tiers left out because they missed their deadline or failed")
+    cache_hit: bool = Field(default=False, description="Served from the session read cache")
+    token_budget: Optional[int] = Field(default=None, description="Token budget the block was assembled for")
     
     # Optional L3/L4 summary
     episode_summaries: List[str] = Field(default_factory=list, description="Optional episode summaries from L3")
     knowledge_snippets: List[str] = Field(default_factory=list, description="Optional knowledge from L4")
     
+    # Prompt rendered by ContextAssembler (reused by to_prompt_string)
+    _rendered_prompt: Optional[str] = PrivateAttr(default=None)
+    
+    def set_rendered_prompt(self, prompt: Optional[str]) -> None:
+        """Attach a pre-rendered prompt returned by to_prompt_string()."""
+        self._rendered_prompt = prompt
+    
     def to_prompt_string(self, include_metadata: bool = False) -> str:
         """
         Convert context block to formatted string for LLM prompt injection.
@@ -414,6 +457,9 @@ class ContextBlock(BaseModel):
         Returns:
             Formatted context string ready for prompt injection
         """
+        if self._rendered_prompt is not None and not include_metadata:
+            return self._rendered_prompt
+        
         sections = []
         
         # Recent conversation
@@ -451,16 +497,22 @@ class ContextBlock(BaseModel):
         
         return "\n".join(sections)
     
-    def estimate_token_count(self, chars_per_token: float = 4.0) -> int:
+    def estimate_token_count(self, chars_per_token: float = 4.0, tokenizer: Optional[Any] = None) -> int:
         """
         Estimate token count for context block using character-based heuristic.
         
         Args:
             chars_per_token: Average characters per token (default: 4.0 for GPT models)
+            tokenizer: Optional object with count_tokens(text); when given,
+                the rendered prompt is counted with it instead
             
         Returns:
             Estimated token count
         """
+        if tokenizer is not None:
+            self.estimated_tokens = tokenizer.count_tokens(self.to_prompt_string())
+            return self.estimated_tokens
+        
         total_chars = 0
         
         # Count turn content
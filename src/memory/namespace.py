@@ -122,6 +122,24 @@ class NamespaceManager:
         """
         return f"{{session:{session_id}}}:facts:index"
     
+    # --- Query Cache Generations ---
+    
+    @staticmethod
+    def session_generation(session_id: str) -> str:
+        """
+        Generate key for a session's tier generation counters.
+        
+        A hash of tier name -> counter, bumped on every write to the session
+        in that tier. Used to invalidate cached cross-tier query results.
+        
+        Args:
+            session_id: Unique session identifier
+            
+        Returns:
+            Redis key with Hash Tag: {session:ID}:generation
+        """
+        return f"{{session:{session_id}}}:generation"
+    
     # --- Global Resources (System-Scoped) ---
     
     @staticmethod
@@ -148,6 +166,47 @@ class NamespaceManager:
         """
         return "{mas}:lifecycle"
     
+    @staticmethod
+    def global_generation() -> str:
+        """
+        Generate key for tier generation counters not tied to a session.
+        
+        Bumped by writes that affect every session's reads (L4 knowledge,
+        deletes by ID without a known session).
+        
+        Returns:
+            Redis key with Hash Tag: {mas}:generation
+        """
+        return "{mas}:generation"
+    
+    @staticmethod
+    def synthesis_cache(cache_key: str) -> str:
+        """
+        Generate key for a shared KnowledgeSynthesizer result.
+        
+        Args:
+            cache_key: Synthesizer cache key (hash of query + filters)
+            
+        Returns:
+            Redis key with Hash Tag: {mas}:synthesis:KEY
+        """
+        return f"{{mas}}:synthesis:{cache_key}"
+    
+    @staticmethod
+    def synthesis_cache_index(knowledge_id: str) -> str:
+        """
+        Generate key for the set of synthesis cache keys built from a document.
+        
+        Used to invalidate shared synthesis results when an L4 document changes.
+        
+        Args:
+            knowledge_id: L4 knowledge document ID
+            
+        Returns:
+            Redis key with Hash Tag: {mas}:synthesis:doc:ID
+        """
+        return f"{{mas}}:synthesis:doc:{knowledge_id}"
+    
     # --- Lifecycle Event Publishing (Requires Redis Client) ---
     
     def __init__(self, redis_client: Optional[redis.Redis] = None):
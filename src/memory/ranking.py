@@ -0,0 +1,401 @@
+"""
+Cross-tier result fusion for hybrid memory queries.
+
+`query_memory` gathers candidates from L2 (facts), L3 (episodes) and L4
+(knowledge documents). Each tier reports query relevance on its own scale
+(Postgres ts_rank, Qdrant cosine similarity, Typesense text_match), so
+rankers calibrate per tier before fusing:
+
+- ReciprocalRankFusion: scale-free fusion of per-tier rank positions
+- RelevanceWeightedFusion: per-tier calibrated relevance (against an
+  absolute reference score where the tier's scale has one) blended with
+  the tier's own quality prior (CIAR / importance / confidence)
+- MinMaxPriorFusion: prior-only min-max weighting (the original behaviour)
+
+Candidates that carry the same information in several tiers (an L2 fact
+listed in a returned L3 episode's source_fact_ids, or identical content)
+are merged into one result before ranking. Scoring and merging operate on
+the NumPy arrays of a CandidateSet, so fusing hundreds of candidates costs
+microseconds.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
+import numpy as np
+
+# Metadata keys identifying a candidate, by key namespace
+_ID_FIELDS = (("fact_id", "fact"), ("episode_id", "episode"), ("knowledge_id", "knowledge"))
+
+
+def _content_key(content: str) -> str:
+    return "content:" + " ".join(content.lower().split())
+
+
+def _identity_keys(result: Dict[str, Any]) -> List[str]:
+    """Keys under which a result counts as the same information."""
+    metadata = result.get("metadata") or {}
+    keys = [f"{namespace}:{metadata[field]}" for field, namespace in _ID_FIELDS if metadata.get(field)]
+    # An episode subsumes the facts it was consolidated from
+    keys.extend(f"fact:{fact_id}" for fact_id in metadata.get("source_fact_ids") or ())
+    content = result.get("content")
+    if content:
+        keys.append(_content_key(content))
+    return keys
+
+
+def duplicate_groups(results: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """
+    Assign each result to a duplicate group.
+
+    Results sharing any identity key (including transitively) land in the
+    same group. Groups are numbered in order of first appearance.
+
+    Args:
+        results: Result dicts with 'content' and 'metadata'
+
+    Returns:
+        (n,) group index per result
+    """
+    parent = list(range(len(results)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: Dict[str, int] = {}
+    for position, result in enumerate(results):
+        for key in _identity_keys(result):
+            other = owner.setdefault(key, position)
+            if other != position:
+                root, other_root = find(position), find(other)
+                if root != other_root:
+                    parent[max(root, other_root)] = min(root, other_root)
+
+    roots = np.fromiter((find(i) for i in range(len(results))), dtype=np.intp, count=len(results))
+    _, groups = np.unique(roots, return_inverse=True)
+    return groups.astype(np.intp, copy=False)
+
+
+@dataclass
+class CandidateSet:
+    """
+    Columnar view of the candidates returned by all tiers for one query.
+
+    Attributes:
+        results: Result dicts (content, tier, metadata) in tier order
+        tiers: Tier names; `tier_index` points into this tuple
+        tier_index: (n,) tier of each candidate
+        rank: (n,) 0-based position of each candidate in its tier's list
+        relevance: (n,) query relevance as reported by the tier (NaN if none)
+        prior: (n,) tier-native quality score in [0, 1]
+        group: (n,) duplicate group of each candidate
+    """
+    results: List[Dict[str, Any]]
+    tiers: Tuple[str, ...]
+    tier_index: np.ndarray
+    rank: np.ndarray
+    relevance: np.ndarray
+    prior: np.ndarray
+    group: np.ndarray
+
+    @classmethod
+    def from_tiers(cls, tier_results: Mapping[str, Sequence[Dict[str, Any]]]) -> "CandidateSet":
+        """
+        Build a candidate set from per-tier candidate lists.
+
+        Args:
+            tier_results: Candidates per tier, each in the tier's own
+                ranking order, as dicts with 'content', 'metadata', 'prior'
+                and optionally 'relevance'
+
+        Returns:
+            CandidateSet with 'tier' set on every result
+        """
+        tiers = tuple(tier_results)
+        results: List[Dict[str, Any]] = []
+        tier_index: List[int] = []
+        rank: List[int] = []
+        relevance: List[float] = []
+        prior: List[float] = []
+        for index, tier in enumerate(tiers):
+            for position, candidate in enumerate(tier_results[tier]):
+                score = candidate.get("relevance")
+                relevance.append(np.nan if score is None else float(score))
+                prior.append(float(candidate.get("prior") or 0.0))
+                tier_index.append(index)
+                rank.append(position)
+                results.append({
+                    "content": candidate["content"],
+                    "tier": tier,
+                    "metadata": candidate.get("metadata") or {},
+                })
+
+        return cls(
+            results=results,
+            tiers=tiers,
+            tier_index=np.asarray(tier_index, dtype=np.intp),
+            rank=np.asarray(rank, dtype=np.intp),
+            relevance=np.asarray(relevance, dtype=np.float64),
+            prior=np.asarray(prior, dtype=np.float64),
+            group=duplicate_groups(results),
+        )
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+class Ranker(ABC):
+    """
+    Base class for cross-tier rankers.
+
+    Subclasses score individual candidates; `rank` merges duplicate groups
+    (summing or taking the max of member scores, per `combine`) and returns
+    the top results.
+    """
+
+    name = "base"
+    combine = "max"
+
+    @abstractmethod
+    def score(self, candidates: CandidateSet, tier_weights: np.ndarray) -> np.ndarray:
+        """
+        Score every candidate.
+
+        Args:
+            candidates: Candidate set
+            tier_weights: (len(candidates.tiers),) weight per tier
+
+        Returns:
+            (n,) candidate scores
+        """
+
+    def rank(
+        self,
+        candidates: CandidateSet,
+        weights: Mapping[str, float],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuse, de-duplicate and rank candidates.
+
+        Args:
+            candidates: Candidate set
+            weights: Weight per tier name (missing tiers weigh 0)
+            limit: Maximum results to return
+
+        Returns:
+            Result dicts with 'score' set, best first. Merged results list
+            the other members under metadata['duplicates'].
+        """
+        if not len(candidates) or limit <= 0:
+            return []
+
+        tier_weights = np.asarray([weights.get(tier, 0.0) for tier in candidates.tiers], dtype=np.float64)
+        scores = self.score(candidates, tier_weights)
+        group = candidates.group
+        group_count = int(group.max()) + 1
+
+        # Sort by group, best score first within each group (stable: ties
+        # keep candidate order); the first member represents its group
+        order = np.lexsort((-scores, group))
+        group_starts = np.zeros(group_count + 1, dtype=np.intp)
+        np.cumsum(np.bincount(group, minlength=group_count), out=group_starts[1:])
+        representative = order[group_starts[:-1]]
+
+        if self.combine == "sum":
+            group_scores = np.bincount(group, weights=scores, minlength=group_count)
+        else:
+            group_scores = scores[representative]
+
+        top_groups = np.argsort(-group_scores, kind="stable")[:limit]
+
+        ranked = []
+        starts = group_starts.tolist()
+        for group_id, member, score in zip(
+            top_groups.tolist(),
+            representative[top_groups].tolist(),
+            group_scores[top_groups].tolist()
+        ):
+            result = dict(candidates.results[member])
+            result["score"] = score
+            start, end = starts[group_id], starts[group_id + 1]
+            if end - start > 1:
+                result["metadata"] = dict(result["metadata"])
+                result["metadata"]["duplicates"] = [
+                    self._describe(candidates.results[other])
+                    for other in sorted(order[start + 1:end].tolist())
+                ]
+            ranked.append(result)
+        return ranked
+
+    @staticmethod
+    def _describe(result: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = result.get("metadata") or {}
+        description = {"tier": result["tier"]}
+        for field, _ in _ID_FIELDS:
+            if metadata.get(field):
+                description[field] = metadata[field]
+        return description
+
+
+class ReciprocalRankFusion(Ranker):
+    """
+    Reciprocal rank fusion: weight / (k + rank), summed over duplicates.
+
+    Uses only rank positions, so tiers with incomparable score scales fuse
+    without calibration. Scores are scaled by (k + 1) so a tier's top hit
+    scores its tier weight.
+    """
+
+    name = "rrf"
+    combine = "sum"
+
+    def __init__(self, k: int = 60):
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+
+    def score(self, candidates: CandidateSet, tier_weights: np.ndarray) -> np.ndarray:
+        return tier_weights[candidates.tier_index] * (self.k + 1) / (self.k + 1 + candidates.rank)
+
+
+class RelevanceWeightedFusion(Ranker):
+    """
+    Weighted fusion of calibrated query relevance and tier priors.
+
+    Each tier's relevance is divided by the larger of that tier's best
+    relevance for the query and the tier's reference score, the raw score
+    that counts as fully relevant (cosine similarity 1.0 for L3; a strong
+    ts_rank of 0.1 for L2). A tier whose best hit is weak therefore stays
+    weak instead of being scaled up to 1.0. Tiers without a reference
+    (Typesense text_match has no absolute scale) are calibrated by their
+    best hit alone.
+
+    Candidates without a relevance score are not matched against the
+    query, so they get `missing_relevance` (neutral, default 0.5),
+    decaying with rank position.
+
+    The score is `weight * (relevance_weight * relevance + (1 -
+    relevance_weight) * prior)`.
+    """
+
+    name = "relevance"
+    combine = "max"
+
+    # Raw relevance counted as fully relevant, per tier
+    DEFAULT_RELEVANCE_REFERENCES: Dict[str, float] = {"L2": 0.1, "L3": 1.0}
+
+    def __init__(
+        self,
+        relevance_weight: float = 0.8,
+        relevance_references: Optional[Mapping[str, float]] = None,
+        missing_relevance: float = 0.5
+    ):
+        """
+        Args:
+            relevance_weight: Share of the score taken by query relevance
+            relevance_references: Reference raw relevance per tier name
+                (default: DEFAULT_RELEVANCE_REFERENCES); tiers not listed
+                are calibrated by their best hit
+            missing_relevance: Relevance of a tier's top candidate when the
+                tier reports none
+        """
+        if not 0.0 <= relevance_weight <= 1.0:
+            raise ValueError("relevance_weight must be between 0 and 1")
+        if not 0.0 <= missing_relevance <= 1.0:
+            raise ValueError("missing_relevance must be between 0 and 1")
+        self.relevance_weight = relevance_weight
+        self.relevance_references = dict(
+            self.DEFAULT_RELEVANCE_REFERENCES if relevance_references is None else relevance_references
+        )
+        self.missing_relevance = missing_relevance
+
+    def score(self, candidates: CandidateSet, tier_weights: np.ndarray) -> np.ndarray:
+        tier_index = candidates.tier_index
+        tier_count = len(candidates.tiers)
+
+        reported = ~np.isnan(candidates.relevance)
+        relevance = np.where(reported, np.maximum(candidates.relevance, 0.0), 0.0)
+        tier_best = np.asarray(
+            [self.relevance_references.get(tier, 0.0) for tier in candidates.tiers], dtype=np.float64
+        )
+        np.maximum.at(tier_best, tier_index, relevance)
+        best = tier_best[tier_index]
+        calibrated = np.divide(relevance, best, out=np.zeros_like(relevance), where=best > 0)
+
+        tier_sizes = np.bincount(tier_index, minlength=tier_count)
+        rank_proxy = self.missing_relevance * (1.0 - candidates.rank / np.maximum(tier_sizes[tier_index], 1))
+        calibrated = np.where(reported, calibrated, rank_proxy)
+
+        prior = np.minimum(np.maximum(candidates.prior, 0.0), 1.0)
+        blended = self.relevance_weight * calibrated + (1.0 - self.relevance_weight) * prior
+        return tier_weights[tier_index] * blended
+
+
+class MinMaxPriorFusion(Ranker):
+    """
+    Per-tier min-max normalized prior times tier weight.
+
+    Ignores query relevance; kept for comparison with earlier results.
+    """
+
+    name = "minmax"
+    combine = "max"
+
+    def score(self, candidates: CandidateSet, tier_weights: np.ndarray) -> np.ndarray:
+        tier_index = candidates.tier_index
+        tier_count = len(candidates.tiers)
+        prior = candidates.prior
+
+        tier_min = np.full(tier_count, np.inf)
+        tier_max = np.full(tier_count, -np.inf)
+        np.minimum.at(tier_min, tier_index, prior)
+        np.maximum.at(tier_max, tier_index, prior)
+        low, high = tier_min[tier_index], tier_max[tier_index]
+        spread = np.where(high > low, high - low, 1.0)
+        return tier_weights[tier_index] * (prior - low) / spread
+
+
+RANKERS: Dict[str, Type[Ranker]] = {
+    ReciprocalRankFusion.name: ReciprocalRankFusion,
+    RelevanceWeightedFusion.name: RelevanceWeightedFusion,
+    MinMaxPriorFusion.name: MinMaxPriorFusion,
+}
+
+
+def get_ranker(ranker: Optional[Union[str, Ranker]] = None, **kwargs: Any) -> Ranker:
+    """
+    Resolve a ranker instance.
+
+    Args:
+        ranker: Ranker instance, registered name ('rrf', 'relevance',
+            'minmax'), or None for relevance-weighted fusion
+        **kwargs: Constructor arguments when a name is given
+
+    Returns:
+        Ranker instance
+
+    Raises:
+        ValueError: If the name is not registered
+    """
+    if isinstance(ranker, Ranker):
+        return ranker
+    name = ranker or RelevanceWeightedFusion.name
+    if name not in RANKERS:
+        raise ValueError(f"Unknown ranker '{name}'. Available: {sorted(RANKERS)}")
+    return RANKERS[name](**kwargs)
+
+
+__all__ = [
+    "CandidateSet",
+    "Ranker",
+    "ReciprocalRankFusion",
+    "RelevanceWeightedFusion",
+    "MinMaxPriorFusion",
+    "RANKERS",
+    "duplicate_groups",
+    "get_ranker",
+]
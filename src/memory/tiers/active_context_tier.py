@@ -66,6 +66,7 @@ class ActiveContextTier(BaseTier):
     """
     
     # Default configuration
+    TIER_NAME = "L1"
     DEFAULT_WINDOW_SIZE = 20
     DEFAULT_TTL_HOURS = 24
     REDIS_KEY_PREFIX = "l1:session:"
@@ -178,6 +179,8 @@ class ActiveContextTier(BaseTier):
                     await self.postgres.insert('active_context', postgres_data)
                     logger.debug(f"Stored turn {turn_id} in PostgreSQL backup")
                 
+                await self._bump_generation(session_id)
+                
                 # Metrics are tracked by OperationTimer
                 return turn_id
                 
@@ -341,6 +344,8 @@ class ActiveContextTier(BaseTier):
                         deleted = True
                         logger.debug(f"Deleted session {session_id} from PostgreSQL")
                 
+                if deleted:
+                    await self._bump_generation(session_id)
                 return deleted
                 
             except Exception as e:
@@ -7,13 +7,16 @@ interact with memory without knowing the underlying storage details.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from datetime import datetime, timezone
 import logging
 
 from src.storage.base import StorageAdapter
 from src.storage.metrics.collector import MetricsCollector
 
+if TYPE_CHECKING:
+    from src.memory.generations import SessionGenerations
+
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +68,9 @@ class BaseTier(ABC):
         ```
     """
     
+    # Short tier name ('L1'-'L4') used for generation counters
+    TIER_NAME: Optional[str] = None
+    
     def __init__(
         self,
         storage_adapters: Dict[str, StorageAdapter],
@@ -91,6 +97,7 @@ class BaseTier(ABC):
         self.metrics = metrics_collector or MetricsCollector()
         self.config = config or {}
         self._initialized = False
+        self.generations: Optional["SessionGenerations"] = None
         
         logger.info(
             f"Initialized {self.__class__.__name__} with storage: "
@@ -291,6 +298,27 @@ class BaseTier(ABC):
             logger.error(f"Error during {self.__class__.__name__} cleanup: {e}")
             raise TierOperationError(f"Cleanup failed: {e}") from e
     
+    def attach_generations(self, generations: Optional["SessionGenerations"]) -> None:
+        """
+        Attach a generation tracker bumped after every write to this tier.
+        
+        Args:
+            generations: Tracker shared with query-result caches, or None
+                to stop tracking
+        """
+        self.generations = generations
+    
+    async def _bump_generation(self, session_id: Optional[str] = None) -> None:
+        """
+        Record a write so cached reads depending on this tier are refreshed.
+        
+        Args:
+            session_id: Session written to, or None when the write is not
+                session-scoped (or its session is unknown)
+        """
+        if self.generations is not None and self.TIER_NAME:
+            await self.generations.bump(self.TIER_NAME, session_id)
+    
     def is_initialized(self) -> bool:
         """Check if tier is initialized and ready for use."""
         return self._initialized
@@ -9,17 +9,96 @@ This enables both "find similar experiences" (Qdrant) and
 "show me the full history" (Neo4j) query patterns.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Sequence
 from datetime import datetime
 import json
+import logging
 import uuid
 
 from src.memory.tiers.base_tier import BaseTier
-from src.storage.qdrant_adapter import QdrantAdapter
-from src.storage.neo4j_adapter import Neo4jAdapter
+from src.storage.qdrant_adapter import DEFAULT_PAYLOAD_INDEXES, QdrantAdapter
+from src.storage.neo4j_adapter import DEFAULT_ENTITY_LABEL, Neo4jAdapter
 from src.storage.metrics.collector import MetricsCollector
 from src.storage.metrics.timer import OperationTimer
-from src.memory.models import Episode
+from src.memory.models import Episode, to_utc
+from src.memory.graph_templates import RenderedTemplate, render_template, warm_template_plans
+from src.memory.result_cache import LRUTTLCache
+
+logger = logging.getLogger(__name__)
+
+# Episode node properties stored as native Neo4j DateTime values
+TEMPORAL_PROPERTIES = (
+    'timeWindowStart',
+    'timeWindowEnd',
+    'factValidFrom',
+    'factValidTo',
+    'sourceObservationTimestamp',
+    'consolidatedAt',
+)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Convert a Neo4j DateTime, Python datetime, or legacy ISO string."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value
+    to_native = getattr(value, 'to_native', None)
+    if to_native is not None:
+        return to_native()
+    return datetime.fromisoformat(value)
+
+
+def episodes_from_rows(rows: Sequence[Dict[str, Any]], key: str = 'e') -> List[Episode]:
+    """
+    Convert Neo4j result rows into Episode objects.
+    
+    Temporal columns are converted column-wise in one pass each, and
+    episodes are built without re-validation since every node was validated
+    as an Episode when it was written.
+    
+    Args:
+        rows: Result rows, each holding episode node properties under `key`
+        key: Column name of the episode node
+        
+    Returns:
+        Episodes in row order
+    """
+    props_list = [row[key] for row in rows]
+    if not props_list:
+        return []
+    
+    temporal = {
+        name: [_to_datetime(props.get(name)) for props in props_list]
+        for name in TEMPORAL_PROPERTIES
+    }
+    
+    episodes = []
+    for position, props in enumerate(props_list):
+        fields = dict(
+            episode_id=props['episodeId'],
+            session_id=props['sessionId'],
+            summary=props['summary'],
+            narrative=props.get('narrative'),
+            source_fact_ids=[],  # Not stored on the graph node
+            fact_count=props['factCount'],
+            time_window_start=temporal['timeWindowStart'][position],
+            time_window_end=temporal['timeWindowEnd'][position],
+            duration_seconds=props['durationSeconds'],
+            fact_valid_from=temporal['factValidFrom'][position],
+            fact_valid_to=temporal['factValidTo'][position],
+            source_observation_timestamp=temporal['sourceObservationTimestamp'][position],
+            importance_score=props['importanceScore'],
+            vector_id=props.get('vectorId'),
+            graph_node_id=props['episodeId'],
+        )
+        consolidated_at = temporal['consolidatedAt'][position]
+        if consolidated_at is not None:
+            fields['consolidated_at'] = consolidated_at
+        if props.get('consolidationMethod'):
+            fields['consolidation_method'] = props['consolidationMethod']
+        episodes.append(Episode.model_construct(**fields))
+    return episodes
 
 
 class EpisodicMemoryTier(BaseTier):
@@ -32,8 +111,20 @@ class EpisodicMemoryTier(BaseTier):
     3. Bi-temporal properties for temporal reasoning
     """
     
+    TIER_NAME = "L3"
     COLLECTION_NAME = "episodes"
     VECTOR_SIZE = 768  # Gemini text-embedding-004 default dimension
+    DEFAULT_TEMPLATE_CACHE_TTL = 60.0
+    # Payload fields used by episode filters (see _store_in_qdrant payload)
+    DEFAULT_PAYLOAD_INDEXES = {
+        **DEFAULT_PAYLOAD_INDEXES,
+        'metadata.importance_score': 'float',
+        'metadata.time_window_start': 'datetime',
+        'metadata.time_window_end': 'datetime',
+        'metadata.fact_valid_from': 'datetime',
+        'metadata.fact_valid_to': 'datetime',
+    }
+    DEFAULT_TEMPLATE_CACHE_MAX_ENTRIES = 1000
     
     def __init__(
         self,
@@ -58,6 +149,26 @@ class EpisodicMemoryTier(BaseTier):
         # Ensure adapter uses the episodic collection name and vector size for all operations
         setattr(self.qdrant, 'collection_name', self.collection_name)
         setattr(self.qdrant, 'vector_size', self.vector_size)
+        # Entity nodes use the Neo4j adapter's configured label (default_label)
+        adapter_label = getattr(neo4j_adapter, 'default_label', None)
+        self.entity_label = adapter_label if isinstance(adapter_label, str) else DEFAULT_ENTITY_LABEL
+
+        config = config or {}
+        # Qdrant collection tuning (payload indexes, hnsw, on_disk_payload,
+        # quantization); see QdrantAdapter.create_collection
+        self.collection_config = {
+            'payload_indexes': dict(self.DEFAULT_PAYLOAD_INDEXES),
+            **config.get('collection_config', {})
+        }
+        
+        # Results of read-only graph templates, tagged by anchor entity IDs
+        self.warm_templates_on_init = config.get('warm_graph_templates', True)
+        self.template_cache = LRUTTLCache(
+            max_entries=config.get(
+                'template_cache_max_entries', self.DEFAULT_TEMPLATE_CACHE_MAX_ENTRIES
+            ),
+            ttl_seconds=config.get('template_cache_ttl', self.DEFAULT_TEMPLATE_CACHE_TTL),
+        )
     
     async def initialize(self) -> None:
         """Initialize Qdrant collection and Neo4j constraints."""
@@ -66,11 +177,15 @@ class EpisodicMemoryTier(BaseTier):
         
         # Create collection if needed
         try:
-            await self.qdrant.create_collection(self.collection_name)
+            await self.qdrant.create_collection(self.collection_name, self.collection_config)
         except Exception as e:
             # Collection might already exist or require recreation; bubble up unexpected errors
             if "already exists" not in str(e).lower():
                 raise
+
+        if self.warm_templates_on_init:
+            warmed = await warm_template_plans(self.neo4j.execute_read)
+            logger.debug("Warmed %d graph template plans", warmed)
     
     async def store(self, data: Dict[str, Any]) -> str:
         """
@@ -115,7 +230,7 @@ class EpisodicMemoryTier(BaseTier):
 
             # Ensure the collection exists before storing
             try:
-                await self.qdrant.create_collection(self.collection_name)
+                await self.qdrant.create_collection(self.collection_name, self.collection_config)
             except Exception as e:
                 # Ignore if already exists; bubble up unexpected issues
                 if "already exists" not in str(e).lower():
@@ -125,14 +240,19 @@ class EpisodicMemoryTier(BaseTier):
             vector_id = await self._store_in_qdrant(episode, embedding)
             episode.vector_id = vector_id
             
-            # 2. Store in Neo4j (graph index)
-            graph_node_id = await self._store_in_neo4j(
-                episode, entities, relationships
+            # 2-3. Store in Neo4j (graph index) and update cross-references,
+            # as managed write transactions on one session
+            async with self.neo4j.session():
+                graph_node_id = await self._store_in_neo4j(
+                    episode, entities, relationships
+                )
+                episode.graph_node_id = graph_node_id
+                await self._link_indexes(episode)
+
+            self._invalidate_template_results(
+                entity.get('entity_id') for entity in entities
             )
-            episode.graph_node_id = graph_node_id
-            
-            # 3. Update cross-references
-            await self._link_indexes(episode)
+            await self._bump_generation(episode.session_id)
             
             return episode.episode_id
     
@@ -152,7 +272,7 @@ class EpisodicMemoryTier(BaseTier):
             RETURN e
             """
             
-            result = await self.neo4j.execute_query(
+            result = await self.neo4j.execute_read(
                 query,
                 {'episode_id': episode_id}
             )
@@ -160,26 +280,7 @@ class EpisodicMemoryTier(BaseTier):
             if not result:
                 return None
             
-            props = result[0]['e']
-            episode = Episode(
-                episode_id=props['episodeId'],
-                session_id=props['sessionId'],
-                summary=props['summary'],
-                narrative=props.get('narrative'),
-                source_fact_ids=[],  # Would need separate query
-                fact_count=props['factCount'],
-                time_window_start=datetime.fromisoformat(props['timeWindowStart']),
-                time_window_end=datetime.fromisoformat(props['timeWindowEnd']),
-                duration_seconds=props['durationSeconds'],
-                fact_valid_from=datetime.fromisoformat(props['factValidFrom']),
-                fact_valid_to=datetime.fromisoformat(props['factValidTo']) if props.get('factValidTo') else None,
-                source_observation_timestamp=datetime.fromisoformat(props['sourceObservationTimestamp']),
-                importance_score=props['importanceScore'],
-                vector_id=props.get('vectorId'),
-                graph_node_id=episode_id
-            )
-            
-            return episode
+            return episodes_from_rows(result[:1])[0]
     
     async def search_similar(
         self,
@@ -207,37 +308,52 @@ class EpisodicMemoryTier(BaseTier):
                 filter_dict=filters
             )
             
-            # Convert to Episode objects
-            episodes = []
-            for result in results:
-                payload = result['payload']
-                episode = Episode(
-                    episode_id=payload['episode_id'],
-                    session_id=payload['session_id'],
-                    summary=payload['summary'],
-                    narrative=payload.get('narrative'),
-                    source_fact_ids=payload.get('source_fact_ids', []),
-                    fact_count=payload['fact_count'],
-                    time_window_start=datetime.fromisoformat(payload['time_window_start']),
-                    time_window_end=datetime.fromisoformat(payload['time_window_end']),
-                    fact_valid_from=datetime.fromisoformat(payload['fact_valid_from']),
-                    fact_valid_to=datetime.fromisoformat(payload['fact_valid_to']) if payload.get('fact_valid_to') else None,
-                    source_observation_timestamp=datetime.fromisoformat(payload.get('source_observation_timestamp', payload['time_window_start'])),
-                    importance_score=payload['importance_score'],
-                    topics=payload.get('topics', []),
-                    vector_id=str(result['id']),
-                    graph_node_id=payload.get('graph_node_id')
-                )
-                # Attach similarity score
-                episode.metadata['similarity_score'] = result['score']
-                episodes.append(episode)
+            return [self._episode_from_search_result(result) for result in results]
+    
+    async def search_similar_many(
+        self,
+        embeddings: List[List[float]],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Episode]]:
+        """
+        Search for similar episodes for several query vectors at once.
+        
+        All queries are sent to Qdrant in a single batch request.
+        
+        Args:
+            embeddings: Query vectors
+            limit: Max results per query
+            filters: Optional filters applied to every query
+            
+        Returns:
+            One list of similar episodes per embedding, in input order
+        """
+        if not embeddings:
+            return []
+        
+        async with OperationTimer(self.metrics, 'l3_search_similar_many'):
+            queries = [
+                {
+                    'vector': embedding,
+                    'limit': limit,
+                    'filter': filters,
+                    'collection_name': self.collection_name
+                }
+                for embedding in embeddings
+            ]
+            results_per_query = await self.qdrant.search_batch(queries)
             
-            return episodes
+            return [
+                [self._episode_from_search_result(result) for result in results]
+                for results in results_per_query
+            ]
     
     async def query_graph(
         self,
         cypher_query: str,
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        read_only: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Execute custom Cypher query on Neo4j graph.
@@ -245,18 +361,75 @@ class EpisodicMemoryTier(BaseTier):
         Args:
             cypher_query: Cypher query string
             parameters: Query parameters
+            read_only: Run in a routed read transaction (graph templates are
+                read-only); set False for queries that write
             
         Returns:
             Query results
         """
         async with OperationTimer(self.metrics, 'l3_query_graph'):
-            results = await self.neo4j.execute_query(
+            execute = self.neo4j.execute_read if read_only else self.neo4j.execute_write
+            results = await execute(
                 cypher_query,
                 parameters or {}
             )
             
             return results
     
+    async def query_template(
+        self,
+        template_name: str,
+        parameters: Dict[str, Any],
+        use_cache: bool = True,
+        rendered: Optional[RenderedTemplate] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a registered graph template (see graph_templates.py).
+        
+        Read-only results are cached for `template_cache_ttl` seconds keyed by
+        (template, params) and dropped early when an L3 write touches one of
+        the template's anchor entity IDs.
+        
+        Args:
+            template_name: Registered template name
+            parameters: Template parameters
+            use_cache: Set False to bypass the result cache
+            rendered: The request already validated and rendered by
+                render_template() (skips rendering it again)
+            
+        Returns:
+            Query results
+            
+        Raises:
+            ValueError: If the template is unknown or parameters are invalid
+        """
+        if rendered is None:
+            is_valid, error_msg, rendered = render_template(template_name, parameters)
+            if not is_valid:
+                raise ValueError(error_msg)
+        
+        cacheable = use_cache and rendered.read_only
+        if cacheable:
+            cached = self.template_cache.get(rendered.cache_key)
+            if cached is not None:
+                return cached
+        
+        results = await self.query_graph(
+            cypher_query=rendered.cypher,
+            parameters=rendered.parameters,
+            read_only=rendered.read_only
+        )
+        
+        if cacheable:
+            self.template_cache.set(rendered.cache_key, results, tags=rendered.anchor_ids)
+        return results
+    
+    def _invalidate_template_results(self, entity_ids: Iterable[Optional[str]]) -> None:
+        """Drop cached template results anchored on any of the entity IDs."""
+        tags = [str(entity_id) for entity_id in entity_ids if entity_id]
+        if tags:
+            self.template_cache.invalidate_tags(tags)
+    
     async def get_episode_entities(self, episode_id: str) -> List[Dict[str, Any]]:
         """
         Get all entities mentioned in an episode (hypergraph participants).
@@ -267,13 +440,13 @@ class EpisodicMemoryTier(BaseTier):
         Returns:
             List of entity dictionaries
         """
-        query = """
-        MATCH (e:Episode {episodeId: $episode_id})-[r:MENTIONS]->(entity:Entity)
+        query = f"""
+        MATCH (e:Episode {{episodeId: $episode_id}})-[r:MENTIONS]->(entity:{self.entity_label})
         RETURN entity, r
         ORDER BY r.confidence DESC
         """
         
-        results = await self.neo4j.execute_query(
+        results = await self.neo4j.execute_read(
             query,
             {'episode_id': episode_id}
         )
@@ -287,8 +460,8 @@ class EpisodicMemoryTier(BaseTier):
                 'name': entity_props['name'],
                 'type': entity_props['type'],
                 'confidence': rel_props.get('confidence', 1.0),
-                'fact_valid_from': rel_props['factValidFrom'],
-                'fact_valid_to': rel_props.get('factValidTo')
+                'fact_valid_from': _to_datetime(rel_props['factValidFrom']),
+                'fact_valid_to': _to_datetime(rel_props.get('factValidTo'))
             })
         
         return entities
@@ -316,7 +489,7 @@ class EpisodicMemoryTier(BaseTier):
           AND (e.factValidTo IS NULL OR e.factValidTo > $query_time)
         """
         
-        params = {'query_time': query_time.isoformat()}
+        params = {'query_time': to_utc(query_time)}
         
         if session_id:
             query += " AND e.sessionId = $session_id"
@@ -329,30 +502,69 @@ class EpisodicMemoryTier(BaseTier):
         """
         params['limit'] = limit
         
-        results = await self.neo4j.execute_query(query, params)
+        results = await self.neo4j.execute_read(query, params)
         
-        episodes = []
-        for row in results:
-            props = row['e']
-            episode = Episode(
-                episode_id=props['episodeId'],
-                session_id=props['sessionId'],
-                summary=props['summary'],
-                narrative=props.get('narrative'),
-                source_fact_ids=[],
-                fact_count=props['factCount'],
-                time_window_start=datetime.fromisoformat(props['timeWindowStart']),
-                time_window_end=datetime.fromisoformat(props['timeWindowEnd']),
-                duration_seconds=props['durationSeconds'],
-                fact_valid_from=datetime.fromisoformat(props['factValidFrom']),
-                fact_valid_to=datetime.fromisoformat(props['factValidTo']) if props.get('factValidTo') else None,
-                source_observation_timestamp=datetime.fromisoformat(props['sourceObservationTimestamp']),
-                importance_score=props['importanceScore'],
-                graph_node_id=props['episodeId']
-            )
-            episodes.append(episode)
+        return episodes_from_rows(results)
+    
+    async def query_temporal_many(
+        self,
+        points: Sequence[datetime],
+        session_ids: Optional[Sequence[Optional[str]]] = None,
+        limit: int = 10
+    ) -> List[List[Episode]]:
+        """
+        Answer many as-of queries in a single round trip.
+        
+        Each (point, session) pair is evaluated like `query_temporal`; all
+        pairs are sent as one UNWIND list and resolved by a per-row subquery.
+        
+        Args:
+            points: Time points to query
+            session_ids: Optional session filter per point (same length as
+                `points`; None entries match every session)
+            limit: Max results per point
+            
+        Returns:
+            One list of episodes per point, in input order
+        """
+        if session_ids is not None and len(session_ids) != len(points):
+            raise ValueError("session_ids must have the same length as points")
+        if not points:
+            return []
         
-        return episodes
+        async with OperationTimer(self.metrics, 'l3_query_temporal_many'):
+            queries = [
+                {
+                    'idx': idx,
+                    'query_time': to_utc(point),
+                    'session_id': session_ids[idx] if session_ids is not None else None
+                }
+                for idx, point in enumerate(points)
+            ]
+            query = """
+            UNWIND $queries AS q
+            CALL {
+                WITH q
+                MATCH (e:Episode)
+                WHERE e.factValidFrom <= q.query_time
+                  AND (e.factValidTo IS NULL OR e.factValidTo > q.query_time)
+                  AND (q.session_id IS NULL OR e.sessionId = q.session_id)
+                RETURN e
+                ORDER BY e.importanceScore DESC
+                LIMIT $limit
+            }
+            RETURN q.idx AS idx, e
+            """
+            results = await self.neo4j.execute_read(
+                query,
+                {'queries': queries, 'limit': limit}
+            )
+            
+            episodes = episodes_from_rows(results)
+            grouped: List[List[Episode]] = [[] for _ in points]
+            for row, episode in zip(results, episodes):
+                grouped[row['idx']].append(episode)
+            return grouped
     
     async def delete(self, episode_id: str) -> bool:
         """
@@ -364,7 +576,7 @@ class EpisodicMemoryTier(BaseTier):
         Returns:
             True if deleted
         """
-        async with OperationTimer(self.metrics, 'l3_delete'):
+        async with OperationTimer(self.metrics, 'l3_delete'), self.neo4j.session():
             # Get episode to find vector_id
             episode = await self.retrieve(episode_id)
             if not episode:
@@ -378,15 +590,22 @@ class EpisodicMemoryTier(BaseTier):
                 )
             
             # Delete from Neo4j (cascade deletes relationships)
-            delete_query = """
-            MATCH (e:Episode {episodeId: $episode_id})
+            delete_query = f"""
+            MATCH (e:Episode {{episodeId: $episode_id}})
+            OPTIONAL MATCH (e)-[:MENTIONS]->(entity:{self.entity_label})
+            WITH e, collect(entity.entityId) AS entity_ids
             DETACH DELETE e
+            RETURN entity_ids
             """
-            await self.neo4j.execute_query(
+            rows = await self.neo4j.execute_write(
                 delete_query,
                 {'episode_id': episode_id}
             )
             
+            if rows:
+                self._invalidate_template_results(rows[0].get('entity_ids') or [])
+            await self._bump_generation(episode.session_id)
+            
             return True
     
     async def query(
@@ -405,44 +624,38 @@ class EpisodicMemoryTier(BaseTier):
         Returns:
             List of episodes
         """
-        # Build Cypher query dynamically
-        query = "MATCH (e:Episode)\nWHERE 1=1"
-        params = {'limit': limit}
-        
-        if filters:
-            if 'session_id' in filters:
-                query += " AND e.sessionId = $session_id"
-                params['session_id'] = filters['session_id']
-            
-            if 'min_importance' in filters:
-                query += " AND e.importanceScore >= $min_importance"
-                params['min_importance'] = filters['min_importance']
+        where_clause, params = self._build_episode_filters(filters)
+        query = f"MATCH (e:Episode)\nWHERE {where_clause}"
+        params['limit'] = limit
         
         query += "\nRETURN e ORDER BY e.importanceScore DESC LIMIT $limit"
         
-        results = await self.neo4j.execute_query(query, params)
+        results = await self.neo4j.execute_read(query, params)
         
-        episodes = []
-        for row in results:
-            props = row['e']
-            episode = Episode(
-                episode_id=props['episodeId'],
-                session_id=props['sessionId'],
-                summary=props['summary'],
-                narrative=props.get('narrative'),
-                source_fact_ids=[],
-                fact_count=props['factCount'],
-                time_window_start=datetime.fromisoformat(props['timeWindowStart']),
-                time_window_end=datetime.fromisoformat(props['timeWindowEnd']),
-                duration_seconds=props['durationSeconds'],
-                fact_valid_from=datetime.fromisoformat(props['factValidFrom']),
-                fact_valid_to=datetime.fromisoformat(props['factValidTo']) if props.get('factValidTo') else None,
-                source_observation_timestamp=datetime.fromisoformat(props['sourceObservationTimestamp']),
-                importance_score=props['importanceScore']
-            )
-            episodes.append(episode)
+        return episodes_from_rows(results)
+    
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count episodes matching filters without materializing them.
         
-        return episodes
+        Filters are pushed down into a Cypher ``count()`` so only a single
+        integer crosses the wire regardless of how many episodes match.
+        
+        Args:
+            filters: Query filters (session_id, min_importance, time_range)
+            
+        Returns:
+            Number of matching episodes
+        """
+        async with OperationTimer(self.metrics, 'l3_count'):
+            where_clause, params = self._build_episode_filters(filters)
+            query = (
+                f"MATCH (e:Episode)\nWHERE {where_clause}\n"
+                "RETURN count(e) AS count"
+            )
+            
+            result = await self.neo4j.execute_read(query, params)
+            return int(result[0]['count']) if result else 0
     
     async def health_check(self) -> Dict[str, Any]:
         """Check health of both Qdrant and Neo4j."""
@@ -451,7 +664,7 @@ class EpisodicMemoryTier(BaseTier):
         
         # Get statistics
         episode_count_query = "MATCH (e:Episode) RETURN count(e) as count"
-        result = await self.neo4j.execute_query(episode_count_query, {})
+        result = await self.neo4j.execute_read(episode_count_query, {})
         episode_count = result[0]['count'] if result else 0
         
         return {
@@ -466,12 +679,81 @@ class EpisodicMemoryTier(BaseTier):
             },
             'statistics': {
                 'total_episodes': episode_count,
-                'collection_name': self.collection_name
+                'collection_name': self.collection_name,
+                'template_cache': self.template_cache.stats()
             }
         }
     
     # Private helper methods
     
+    @staticmethod
+    def _episode_from_search_result(result: Dict[str, Any]) -> Episode:
+        """Build an Episode from a Qdrant hit, attaching its similarity score."""
+        # Episode fields live under 'payload' or, as stored by _store_in_qdrant,
+        # under the adapter's 'metadata' key
+        payload = result.get('payload') or result.get('metadata') or {}
+        episode = Episode(
+            episode_id=payload['episode_id'],
+            session_id=payload['session_id'],
+            summary=payload['summary'],
+            narrative=payload.get('narrative'),
+            source_fact_ids=payload.get('source_fact_ids', []),
+            fact_count=payload['fact_count'],
+            time_window_start=datetime.fromisoformat(payload['time_window_start']),
+            time_window_end=datetime.fromisoformat(payload['time_window_end']),
+            fact_valid_from=datetime.fromisoformat(payload['fact_valid_from']),
+            fact_valid_to=datetime.fromisoformat(payload['fact_valid_to']) if payload.get('fact_valid_to') else None,
+            source_observation_timestamp=datetime.fromisoformat(payload.get('source_observation_timestamp', payload['time_window_start'])),
+            importance_score=payload['importance_score'],
+            topics=payload.get('topics', []),
+            vector_id=str(result['id']),
+            graph_node_id=payload.get('graph_node_id')
+        )
+        episode.metadata['similarity_score'] = result['score']
+        return episode
+    
+    @staticmethod
+    def _build_episode_filters(
+        filters: Optional[Dict[str, Any]]
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build a Cypher WHERE clause and parameters from episode filters.
+        
+        Supported filters:
+            session_id: Exact session match
+            min_importance: Minimum importance score
+            time_range: (start, end) tuple; matches episodes whose time
+                window overlaps the range. Either bound may be None.
+        
+        Returns:
+            Tuple of (where_clause, params)
+        """
+        conditions = ["1=1"]
+        params: Dict[str, Any] = {}
+        
+        if not filters:
+            return conditions[0], params
+        
+        if filters.get('session_id'):
+            conditions.append("e.sessionId = $session_id")
+            params['session_id'] = filters['session_id']
+        
+        if 'min_importance' in filters:
+            conditions.append("e.importanceScore >= $min_importance")
+            params['min_importance'] = filters['min_importance']
+        
+        time_range = filters.get('time_range')
+        if time_range:
+            start_time, end_time = time_range
+            if start_time is not None:
+                conditions.append("e.timeWindowEnd >= $time_range_start")
+                params['time_range_start'] = to_utc(_to_datetime(start_time))
+            if end_time is not None:
+                conditions.append("e.timeWindowStart <= $time_range_end")
+                params['time_range_end'] = to_utc(_to_datetime(end_time))
+        
+        return " AND ".join(conditions), params
+    
     async def _store_in_qdrant(
         self,
         episode: Episode,
@@ -502,54 +784,49 @@ class EpisodicMemoryTier(BaseTier):
         entities: List[Dict[str, Any]],
         relationships: List[Dict[str, Any]]
     ) -> str:
-        """Store episode graph in Neo4j with bi-temporal properties."""
-        # Create episode node
-        create_episode = """
-        MERGE (e:Episode {episodeId: $episode_id})
+        """
+        Store episode graph in Neo4j with bi-temporal properties.
+        
+        The episode node and its MENTIONS edges are written by one statement
+        in one managed write transaction, so they commit together.
+        """
+        create_episode = f"""
+        MERGE (e:Episode {{episodeId: $episode_id}})
         SET e += $properties
-        RETURN e.episodeId as id
+        WITH e
+        UNWIND $entities AS row
+        MERGE (entity:{self.entity_label} {{entityId: row.entity_id}})
+        SET entity.name = row.name,
+            entity.type = row.type,
+            entity.properties = row.properties
+        MERGE (e)-[r:MENTIONS]->(entity)
+        SET r.factValidFrom = $fact_valid_from,
+            r.factValidTo = $fact_valid_to,
+            r.sourceObservationTimestamp = $source_timestamp,
+            r.confidence = row.confidence
         """
         
-        await self.neo4j.execute_query(
+        await self.neo4j.execute_write(
             create_episode,
             {
                 'episode_id': episode.episode_id,
-                'properties': episode.to_neo4j_properties()
+                'properties': episode.to_neo4j_properties(),
+                'entities': [
+                    {
+                        'entity_id': entity['entity_id'],
+                        'name': entity['name'],
+                        'type': entity['type'],
+                        'properties': json.dumps(entity.get('properties', {})),
+                        'confidence': entity.get('confidence', 1.0)
+                    }
+                    for entity in entities
+                ],
+                'fact_valid_from': to_utc(episode.fact_valid_from),
+                'fact_valid_to': to_utc(episode.fact_valid_to),
+                'source_timestamp': to_utc(episode.source_observation_timestamp)
             }
         )
         
-        # Create entity nodes and relationships
-        for entity in entities:
-            create_entity = """
-            MERGE (entity:Entity {entityId: $entity_id})
-            SET entity.name = $name,
-                entity.type = $type,
-                entity.properties = $properties
-            
-            WITH entity
-            MATCH (e:Episode {episodeId: $episode_id})
-            MERGE (e)-[r:MENTIONS]->(entity)
-            SET r.factValidFrom = $fact_valid_from,
-                r.factValidTo = $fact_valid_to,
-                r.sourceObservationTimestamp = $source_timestamp,
-                r.confidence = $confidence
-            """
-            
-            await self.neo4j.execute_query(
-                create_entity,
-                {
-                    'entity_id': entity['entity_id'],
-                    'name': entity['name'],
-                    'type': entity['type'],
-                    'properties': json.dumps(entity.get('properties', {})),
-                    'episode_id': episode.episode_id,
-                    'fact_valid_from': episode.fact_valid_from.isoformat(),
-                    'fact_valid_to': episode.fact_valid_to.isoformat() if episode.fact_valid_to else None,
-                    'source_timestamp': episode.source_observation_timestamp.isoformat(),
-                    'confidence': entity.get('confidence', 1.0)
-                }
-            )
-        
         return episode.episode_id
     
     async def _link_indexes(self, episode: Episode) -> None:
@@ -560,7 +837,7 @@ class EpisodicMemoryTier(BaseTier):
         SET e.vectorId = $vector_id
         """
         
-        await self.neo4j.execute_query(
+        await self.neo4j.execute_write(
             update_query,
             {
                 'episode_id': episode.episode_id,
@@ -5,8 +5,9 @@ Stores generalized knowledge documents distilled from L3 episodes.
 Provides full-text search, faceted filtering, and provenance tracking.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Union
 from datetime import datetime, timezone
 
 from src.memory.tiers.base_tier import BaseTier
@@ -16,6 +17,7 @@ from src.storage.typesense_adapter import TypesenseAdapter
 from src.storage.metrics.collector import MetricsCollector
 from src.storage.metrics.timer import OperationTimer
 from src.memory.models import KnowledgeDocument
+from src.memory.embedding_cache import EmbeddingCache, get_shared_embedding_cache
 
 
 class SemanticMemoryTier(BaseTier):
@@ -26,19 +28,43 @@ class SemanticMemoryTier(BaseTier):
     Supports full-text search, faceted filtering, and provenance tracking.
     """
     
+    TIER_NAME = "L4"
     COLLECTION_NAME = "knowledge_base"
     
     def __init__(
         self,
         typesense_adapter: TypesenseAdapter,
         metrics_collector: Optional[MetricsCollector] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        embedding_provider: Optional[Any] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
     ):
+        """
+        Initialize L4 tier.
+        
+        Args:
+            typesense_adapter: Typesense storage adapter
+            metrics_collector: Optional metrics collector
+            config: Tier configuration (collection_name, embedding_model)
+            embedding_provider: Optional provider exposing get_embedding()
+                (and optionally get_embeddings() for batches); when set,
+                documents are embedded once at store time and the vector is
+                persisted with the document
+            embedding_cache: Cache for document embeddings (defaults to the
+                process-wide shared cache)
+        """
         storage_adapters = {'typesense': typesense_adapter}
         super().__init__(storage_adapters, metrics_collector, config)
         
         self.typesense = typesense_adapter
         self.collection_name = config.get('collection_name', self.COLLECTION_NAME) if config else self.COLLECTION_NAME
+        self.embedding_provider = embedding_provider
+        self.embedding_model = self.config.get('embedding_model')
+        self.embedding_cache = (
+            embedding_cache if embedding_cache is not None else get_shared_embedding_cache()
+        )
+        # Async callbacks notified with knowledge IDs after writes
+        self._write_listeners: List[Callable[[List[str]], Awaitable[None]]] = []
     
     async def initialize(self) -> None:
         """Initialize Typesense collection."""
@@ -62,6 +88,7 @@ class SemanticMemoryTier(BaseTier):
             else:
                 knowledge = data
 
+            await self._embed_documents([knowledge])
             document = knowledge.to_typesense_document()
 
             # Prefer explicit index_document when available (tests mock this)
@@ -71,6 +98,9 @@ class SemanticMemoryTier(BaseTier):
             else:
                 await self.typesense.store(document)
 
+            self._cache_embedding(knowledge)
+            await self._notify_write([knowledge.knowledge_id])
+
             logger.info(
                 "L4 store confirmed: knowledge_id=%s, type=%s, collection=%s",
                 knowledge.knowledge_id,
@@ -100,23 +130,7 @@ class SemanticMemoryTier(BaseTier):
                 return None
             
             # Convert back to KnowledgeDocument
-            knowledge = KnowledgeDocument(
-                knowledge_id=result['id'],
-                title=result['title'],
-                content=result['content'],
-                knowledge_type=result['knowledge_type'],
-                confidence_score=result['confidence_score'],
-                source_episode_ids=result.get('source_episode_ids', []),
-                episode_count=result['episode_count'],
-                provenance_links=result.get('provenance_links', []),
-                category=result.get('category'),
-                tags=result.get('tags', []),
-                domain=result.get('domain'),
-                distilled_at=datetime.fromtimestamp(result['distilled_at'], tz=timezone.utc),
-                access_count=result['access_count'],
-                usefulness_score=result['usefulness_score'],
-                validation_count=result['validation_count']
-            )
+            knowledge = self._knowledge_from_document(result)
             
             # Update access tracking
             await self._update_access(knowledge)
@@ -141,55 +155,53 @@ class SemanticMemoryTier(BaseTier):
             List of matching knowledge documents
         """
         async with OperationTimer(self.metrics, 'l4_search'):
-            # Build filter string
-            filter_by = []
-            if filters:
-                if 'knowledge_type' in filters:
-                    filter_by.append(f"knowledge_type:={filters['knowledge_type']}")
-                if 'category' in filters:
-                    filter_by.append(f"category:={filters['category']}")
-                if 'min_confidence' in filters:
-                    filter_by.append(f"confidence_score:>={filters['min_confidence']}")
-                if 'tags' in filters:
-                    tag_filter = ' || '.join([f"tags:={tag}" for tag in filters['tags']])
-                    filter_by.append(f"({tag_filter})")
-            
             # Execute search
             results = await self.typesense.search(
                 collection_name=self.collection_name,
                 query=query_text,
                 query_by='title,content',
-                filter_by=' && '.join(filter_by) if filter_by else None,
+                filter_by=self._build_filter_by(filters),
                 limit=limit,
                 sort_by='usefulness_score:desc'
             )
             
-            # Convert to KnowledgeDocument objects
-            documents = []
-            for hit in results.get('hits', []):
-                doc = hit['document']
-                knowledge = KnowledgeDocument(
-                    knowledge_id=doc['id'],
-                    title=doc['title'],
-                    content=doc['content'],
-                    knowledge_type=doc['knowledge_type'],
-                    confidence_score=doc['confidence_score'],
-                    source_episode_ids=doc.get('source_episode_ids', []),
-                    episode_count=doc['episode_count'],
-                    provenance_links=doc.get('provenance_links', []),
-                    category=doc.get('category'),
-                    tags=doc.get('tags', []),
-                    domain=doc.get('domain'),
-                    distilled_at=datetime.fromtimestamp(doc['distilled_at'], tz=timezone.utc),
-                    access_count=doc['access_count'],
-                    usefulness_score=doc['usefulness_score'],
-                    validation_count=doc['validation_count']
-                )
-                # Attach search score
-                knowledge.metadata['search_score'] = hit.get('text_match', 0)
-                documents.append(knowledge)
+            return self._knowledge_from_hits(results.get('hits', []))
+    
+    async def search_many(
+        self,
+        query_texts: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10
+    ) -> List[List[KnowledgeDocument]]:
+        """
+        Full-text search for several queries in one round trip.
+        
+        Args:
+            query_texts: Search queries
+            filters: Optional filters applied to every query
+            limit: Max results per query
+            
+        Returns:
+            One list of matching documents per query, in input order
+        """
+        if not query_texts:
+            return []
+        
+        async with OperationTimer(self.metrics, 'l4_search_many'):
+            filter_by = self._build_filter_by(filters)
+            results = await self.typesense.multi_search([
+                {
+                    'collection_name': self.collection_name,
+                    'q': query_text,
+                    'query_by': 'title,content',
+                    'filter_by': filter_by,
+                    'limit': limit,
+                    'sort_by': 'usefulness_score:desc'
+                }
+                for query_text in query_texts
+            ])
             
-            return documents
+            return [self._knowledge_from_hits(result.get('hits', [])) for result in results]
     
     async def query(
         self,
@@ -214,6 +226,54 @@ class SemanticMemoryTier(BaseTier):
             limit=limit
         )
     
+    async def store_batch(
+        self,
+        items: List[Union[Dict[str, Any], KnowledgeDocument]]
+    ) -> List[str]:
+        """
+        Store several knowledge documents with one bulk import.
+        
+        Args:
+            items: KnowledgeDocument objects or dicts
+            
+        Returns:
+            Identifiers of the documents Typesense accepted, in input
+            order; only these are cached and reported to write listeners
+        """
+        if not items:
+            return []
+        
+        async with OperationTimer(self.metrics, 'l4_store_batch'):
+            knowledge_docs = [
+                KnowledgeDocument(**item) if isinstance(item, dict) else item
+                for item in items
+            ]
+            await self._embed_documents(knowledge_docs)
+            
+            stored_ids = set(await self.typesense.store_batch(
+                [knowledge.to_typesense_document() for knowledge in knowledge_docs],
+                collection_name=self.collection_name
+            ))
+            stored_docs = [
+                knowledge for knowledge in knowledge_docs
+                if knowledge.knowledge_id in stored_ids
+            ]
+            
+            for knowledge in stored_docs:
+                self._cache_embedding(knowledge)
+            knowledge_ids = [knowledge.knowledge_id for knowledge in stored_docs]
+            if knowledge_ids:
+                await self._notify_write(knowledge_ids)
+            
+            logger.info(
+                "L4 batch store confirmed: %d of %d documents, collection=%s",
+                len(knowledge_ids),
+                len(knowledge_docs),
+                self.collection_name
+            )
+            
+            return knowledge_ids
+    
     async def update_usefulness(
         self,
         knowledge_id: str,
@@ -222,6 +282,9 @@ class SemanticMemoryTier(BaseTier):
         """
         Update usefulness score based on feedback.
         
+        Reads the document without access tracking and patches only the
+        feedback fields instead of re-indexing the whole document.
+        
         Args:
             knowledge_id: Knowledge to update
             usefulness_score: New score (0.0-1.0)
@@ -229,24 +292,63 @@ class SemanticMemoryTier(BaseTier):
         Returns:
             True if updated
         """
-        # Retrieve current document
-        doc = await self.retrieve(knowledge_id)
-        if not doc:
-            return False
-        
-        # Update score
-        doc.usefulness_score = usefulness_score
-        doc.validation_count += 1
-        doc.last_validated = datetime.now(timezone.utc)
+        async with OperationTimer(self.metrics, 'l4_update_usefulness'):
+            current = await self.typesense.get_document(
+                collection_name=self.collection_name,
+                document_id=knowledge_id
+            )
+            if not current:
+                return False
+            
+            updated = await self.typesense.update_partial(
+                knowledge_id,
+                self._usefulness_fields(usefulness_score, current.get('validation_count', 0)),
+                collection_name=self.collection_name
+            )
+            if not updated:
+                return False
+            
+            await self._notify_write([knowledge_id])
+            return True
+    
+    async def update_usefulness_many(self, scores: Dict[str, float]) -> Dict[str, bool]:
+        """
+        Apply usefulness feedback for many documents in one bulk update.
         
-        # Re-index
-        await self.typesense.update_document(
-            collection_name=self.collection_name,
-            document_id=knowledge_id,
-            document=doc.to_typesense_document()
-        )
+        Args:
+            scores: Mapping of knowledge ID to new score (0.0-1.0)
+            
+        Returns:
+            Mapping of knowledge ID to whether it was updated
+        """
+        if not scores:
+            return {}
         
-        return True
+        async with OperationTimer(self.metrics, 'l4_update_usefulness_many'):
+            knowledge_ids = list(scores)
+            current_docs = await self.typesense.retrieve_batch(
+                knowledge_ids, collection_name=self.collection_name
+            )
+            
+            updates = []
+            for knowledge_id, current in zip(knowledge_ids, current_docs):
+                if current:
+                    fields = self._usefulness_fields(
+                        scores[knowledge_id], current.get('validation_count', 0)
+                    )
+                    updates.append({'id': knowledge_id, **fields})
+            
+            results = {knowledge_id: False for knowledge_id in knowledge_ids}
+            if updates:
+                results.update(await self.typesense.update_many(
+                    updates, collection_name=self.collection_name
+                ))
+            
+            updated_ids = [knowledge_id for knowledge_id, ok in results.items() if ok]
+            if updated_ids:
+                await self._notify_write(updated_ids)
+            
+            return results
     
     async def delete(self, knowledge_id: str) -> bool:
         """
@@ -263,6 +365,8 @@ class SemanticMemoryTier(BaseTier):
                 collection_name=self.collection_name,
                 document_id=knowledge_id
             )
+            self.embedding_cache.invalidate(knowledge_id)
+            await self._notify_write([knowledge_id])
             
             return True
     
@@ -312,6 +416,178 @@ class SemanticMemoryTier(BaseTier):
             'statistics': stats
         }
     
+    def add_write_listener(
+        self,
+        listener: Callable[[List[str]], Awaitable[None]]
+    ) -> None:
+        """
+        Register a callback for document writes.
+        
+        The listener is awaited with the affected knowledge IDs after
+        store(), store_batch(), update_usefulness(), update_usefulness_many()
+        and delete(), e.g. to invalidate query-time caches built from those
+        documents.
+        
+        Args:
+            listener: Async callable taking a list of knowledge IDs
+        """
+        self._write_listeners.append(listener)
+    
+    async def _notify_write(self, knowledge_ids: List[str]) -> None:
+        """Notify write listeners; listener failures never fail the write."""
+        # Knowledge is shared across sessions, so the bump is global
+        await self._bump_generation()
+        for listener in list(self._write_listeners):
+            try:
+                await listener(knowledge_ids)
+            except Exception as e:
+                logger.warning("L4 write listener failed for %s: %s", knowledge_ids, e)
+    
+    @staticmethod
+    def _build_filter_by(filters: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Build a Typesense filter_by string from tier filters."""
+        if not filters:
+            return None
+        filter_by = []
+        if 'knowledge_type' in filters:
+            filter_by.append(f"knowledge_type:={filters['knowledge_type']}")
+        if 'category' in filters:
+            filter_by.append(f"category:={filters['category']}")
+        if 'min_confidence' in filters:
+            filter_by.append(f"confidence_score:>={filters['min_confidence']}")
+        if 'tags' in filters:
+            tag_filter = ' || '.join([f"tags:={tag}" for tag in filters['tags']])
+            filter_by.append(f"({tag_filter})")
+        return ' && '.join(filter_by) if filter_by else None
+    
+    @staticmethod
+    def _usefulness_fields(usefulness_score: float, validation_count: int) -> Dict[str, Any]:
+        """Build the partial update applied for one feedback event."""
+        return {
+            'usefulness_score': usefulness_score,
+            'validation_count': validation_count + 1,
+            'last_validated': int(datetime.now(timezone.utc).timestamp())
+        }
+    
+    @staticmethod
+    def _knowledge_from_document(doc: Dict[str, Any]) -> KnowledgeDocument:
+        """Convert a Typesense document into a KnowledgeDocument."""
+        last_validated = doc.get('last_validated')
+        return KnowledgeDocument(
+            knowledge_id=doc['id'],
+            title=doc['title'],
+            content=doc['content'],
+            knowledge_type=doc['knowledge_type'],
+            confidence_score=doc['confidence_score'],
+            source_episode_ids=doc.get('source_episode_ids', []),
+            episode_count=doc['episode_count'],
+            provenance_links=doc.get('provenance_links', []),
+            category=doc.get('category'),
+            tags=doc.get('tags', []),
+            domain=doc.get('domain'),
+            distilled_at=datetime.fromtimestamp(doc['distilled_at'], tz=timezone.utc),
+            access_count=doc['access_count'],
+            usefulness_score=doc['usefulness_score'],
+            validation_count=doc['validation_count'],
+            last_validated=(
+                datetime.fromtimestamp(last_validated, tz=timezone.utc)
+                if last_validated is not None else None
+            ),
+            polarity=doc.get('polarity'),
+            embedding=doc.get('embedding')
+        )
+    
+    @classmethod
+    def _knowledge_from_hits(cls, hits: List[Dict[str, Any]]) -> List[KnowledgeDocument]:
+        """Convert search hits, attaching each hit's text-match score."""
+        documents = []
+        for hit in hits:
+            knowledge = cls._knowledge_from_document(hit['document'])
+            knowledge.metadata['search_score'] = hit.get('text_match', 0)
+            documents.append(knowledge)
+        return documents
+    
+    async def cache_missing_embeddings(self, documents: List[KnowledgeDocument]) -> int:
+        """
+        Cache the vectors of documents about to be scored.
+        
+        Vectors persisted with the documents are used as-is. Documents
+        stored before embeddings were persisted are embedded with one batch
+        request and their vectors written back, so this happens only once.
+        
+        Args:
+            documents: Candidate documents about to be scored
+            
+        Returns:
+            Number of documents newly cached
+        """
+        missing = [
+            knowledge for knowledge in documents
+            if knowledge.knowledge_id not in self.embedding_cache
+        ]
+        unembedded = [knowledge for knowledge in missing if knowledge.embedding is None]
+        if await self._embed_documents(unembedded):
+            await self._persist_embeddings(unembedded)
+        
+        for knowledge in missing:
+            self._cache_embedding(knowledge)
+        return sum(1 for knowledge in missing if knowledge.knowledge_id in self.embedding_cache)
+    
+    async def _embed_documents(self, documents: List[KnowledgeDocument]) -> bool:
+        """
+        Set `embedding` on documents lacking one, in a single provider request.
+        
+        Uses the provider's get_embeddings() when it has one, otherwise
+        concurrent get_embedding() calls. Embedding failures are logged and
+        never fail the store itself.
+        
+        Returns:
+            True if any document was embedded
+        """
+        pending = [knowledge for knowledge in documents if knowledge.embedding is None]
+        if self.embedding_provider is None or not pending:
+            return False
+        
+        texts = [f"{knowledge.title}\n{knowledge.content}" for knowledge in pending]
+        kwargs = {'model': self.embedding_model} if self.embedding_model else {}
+        try:
+            if hasattr(type(self.embedding_provider), 'get_embeddings'):
+                vectors = await self.embedding_provider.get_embeddings(texts=texts, **kwargs)
+            else:
+                vectors = await asyncio.gather(*(
+                    self.embedding_provider.get_embedding(text=text, **kwargs) for text in texts
+                ))
+        except Exception as e:
+            logger.warning(
+                "L4 embedding failed for %d documents (%s): %s",
+                len(pending),
+                ', '.join(knowledge.knowledge_id for knowledge in pending),
+                e
+            )
+            return False
+        
+        for knowledge, vector in zip(pending, vectors):
+            knowledge.embedding = [float(value) for value in vector]
+        return True
+    
+    async def _persist_embeddings(self, documents: List[KnowledgeDocument]) -> None:
+        """Write back embeddings computed for documents stored without one."""
+        updates = [
+            {'id': knowledge.knowledge_id, 'embedding': knowledge.embedding}
+            for knowledge in documents if knowledge.embedding is not None
+        ]
+        if not updates:
+            return
+        try:
+            await self.typesense.update_many(updates, collection_name=self.collection_name)
+        except Exception as e:
+            logger.warning("L4 embedding backfill failed: %s", e)
+    
+    def _cache_embedding(self, knowledge: KnowledgeDocument) -> None:
+        """Cache a document's vector for query-time scoring."""
+        if knowledge.embedding is not None:
+            self.embedding_cache.put(knowledge.knowledge_id, knowledge.embedding)
+    
     async def _update_access(self, knowledge: KnowledgeDocument) -> None:
         """Update access tracking for a knowledge document."""
         knowledge.access_count += 1
@@ -11,6 +11,8 @@ Key Features:
 - Automatic age decay calculation
 - Fact type classification
 - TTL-based cleanup (7 days default)
+- Chunked in-database CIAR re-scoring (age decay and recency)
+- Consolidation tracking (consolidated_at / episode_id) for L3 backlog
 """
 
 from typing import Dict, Any, List, Optional
@@ -24,10 +26,145 @@ from src.storage.postgres_adapter import PostgresAdapter
 from src.storage.metrics.collector import MetricsCollector
 from src.storage.metrics.timer import OperationTimer
 from src.memory.models import Fact, FactType
+from src.memory.ciar_scorer import CIARScorer, get_ciar_scorer
+from src.memory.fact_batch import FactBatch
 
 
 logger = logging.getLogger(__name__)
 
+# One chunk of rescore_decay(): after_fact_id is the last fact_id of the
+# previous chunk; the remaining parameters are the CIAR config
+_RESCORE_DECAY_SQL = """
+    WITH batch AS (
+        SELECT fact_id
+        FROM working_memory
+        WHERE fact_id > %(after_fact_id)s
+          AND (%(session_id)s::text IS NULL OR session_id = %(session_id)s)
+          AND (ttl_expires_at IS NULL OR ttl_expires_at > NOW())
+        ORDER BY fact_id
+        LIMIT %(chunk_size)s
+    ),
+    components AS (
+        SELECT w.fact_id,
+               w.certainty,
+               w.impact,
+               GREATEST(
+                   %(min_age_score)s::float8,
+                   EXP(-%(age_decay_lambda)s::float8 * LEAST(
+                       GREATEST(EXTRACT(EPOCH FROM NOW() - w.extracted_at)::float8 / 86400.0, 0.0),
+                       %(max_age_days)s::float8
+                   ))
+               ) AS age_decay,
+               CASE WHEN w.access_count > 0
+                    THEN 1.0 + LEAST(
+                        %(recency_boost_factor)s::float8 * LN(1.0 + w.access_count),
+                        %(max_recency_boost)s::float8
+                    )
+                    ELSE 1.0
+               END AS recency_boost
+        FROM working_memory w
+        JOIN batch USING (fact_id)
+    ),
+    scored AS (
+        SELECT fact_id,
+               ROUND(age_decay::numeric, 4)::float8 AS age_decay,
+               ROUND(recency_boost::numeric, 4)::float8 AS recency_boost,
+               ROUND((certainty * impact * age_decay * recency_boost)::numeric, 4)::float8 AS ciar_score
+        FROM components
+    ),
+    updated AS (
+        UPDATE working_memory w
+        SET age_decay = s.age_decay,
+            recency_boost = s.recency_boost,
+            ciar_score = s.ciar_score
+        FROM scored s
+        WHERE w.fact_id = s.fact_id
+          AND (w.age_decay, w.recency_boost, w.ciar_score)
+              IS DISTINCT FROM (s.age_decay, s.recency_boost, s.ciar_score)
+        RETURNING w.fact_id
+    )
+    SELECT (SELECT MAX(fact_id) FROM batch) AS last_fact_id,
+           (SELECT COUNT(*) FROM batch) AS scanned,
+           (SELECT COUNT(*) FROM updated) AS updated
+"""
+
+# Facts not yet consolidated into an L3 episode, oldest first, optionally
+# for one session and after the fact_id that ended the previous page.
+# Served by the partial index idx_working_memory_unconsolidated.
+_UNCONSOLIDATED_FILTER = """
+    consolidated_at IS NULL
+      AND (%(session_id)s::text IS NULL OR session_id = %(session_id)s)
+      AND (%(after_fact_id)s::text IS NULL OR (extracted_at, fact_id) > (
+          SELECT extracted_at, fact_id FROM working_memory WHERE fact_id = %(after_fact_id)s
+      ))
+"""
+
+_UNCONSOLIDATED_SQL = f"""
+    SELECT *
+    FROM working_memory
+    WHERE {_UNCONSOLIDATED_FILTER}
+    ORDER BY extracted_at, fact_id
+    LIMIT %(limit)s
+"""
+
+# Claim one page atomically: rows locked by a concurrent claim are skipped
+# and rows claimed by a live run are filtered out, so two consolidation
+# runs never receive the same fact. Claims older than the claim timeout
+# belong to a run that died and are taken over.
+_CLAIM_UNCONSOLIDATED_SQL = f"""
+    WITH claimed AS (
+        UPDATE working_memory
+        SET claimed_at = NOW()
+        WHERE fact_id IN (
+            SELECT fact_id
+            FROM working_memory
+            WHERE {_UNCONSOLIDATED_FILTER}
+              AND (claimed_at IS NULL
+                   OR claimed_at < NOW() - make_interval(secs => %(claim_timeout)s))
+            ORDER BY extracted_at, fact_id
+            LIMIT %(limit)s
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING *
+    )
+    SELECT * FROM claimed ORDER BY extracted_at, fact_id
+"""
+
+_RELEASE_CLAIMS_SQL = """
+    WITH released AS (
+        UPDATE working_memory
+        SET claimed_at = NULL
+        WHERE fact_id = ANY(%(fact_ids)s)
+          AND consolidated_at IS NULL
+        RETURNING fact_id
+    )
+    SELECT COUNT(*) AS count FROM released
+"""
+
+# Count stops at the limit (LIMIT NULL = no cap), so a threshold check
+# never scans more of the backlog than the threshold itself
+_UNCONSOLIDATED_COUNT_SQL = """
+    SELECT COUNT(*) AS count
+    FROM (
+        SELECT 1
+        FROM working_memory
+        WHERE consolidated_at IS NULL
+          AND (%(session_id)s::text IS NULL OR session_id = %(session_id)s)
+        LIMIT %(limit)s
+    ) pending
+"""
+
+_MARK_CONSOLIDATED_SQL = """
+    WITH marked AS (
+        UPDATE working_memory
+        SET consolidated_at = NOW(), episode_id = %(episode_id)s, claimed_at = NULL
+        WHERE fact_id = ANY(%(fact_ids)s)
+          AND consolidated_at IS NULL
+        RETURNING fact_id
+    )
+    SELECT COUNT(*) AS count FROM marked
+"""
+
 
 class WorkingMemoryTier(BaseTier):
     """
@@ -69,7 +206,11 @@ class WorkingMemoryTier(BaseTier):
     """
     
     # Configuration defaults
+    TIER_NAME = "L2"
     DEFAULT_CIAR_THRESHOLD = 0.6
+    DEFAULT_RESCORE_CHUNK_SIZE = 1000
+    DEFAULT_UNCONSOLIDATED_PAGE_SIZE = 100
+    DEFAULT_CLAIM_TIMEOUT_SECONDS = 600
     DEFAULT_TTL_DAYS = 7
     RECENCY_BOOST_ALPHA = 0.05  # 5% boost per access
     AGE_DECAY_LAMBDA = 0.1      # Decay rate per day
@@ -78,7 +219,8 @@ class WorkingMemoryTier(BaseTier):
         self,
         postgres_adapter: PostgresAdapter,
         metrics_collector: Optional[MetricsCollector] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        ciar_scorer: Optional[CIARScorer] = None
     ):
         """
         Initialize L2 Working Memory Tier.
@@ -87,10 +229,14 @@ class WorkingMemoryTier(BaseTier):
             postgres_adapter: PostgreSQL adapter for persistent storage
             metrics_collector: Optional metrics collector
             config: Optional configuration with keys:
-                - ciar_threshold: Minimum CIAR score (default: 0.6)
+                - ciar_threshold: Minimum CIAR score (default: the shared
+                  CIAR config threshold, following its reloads)
                 - ttl_days: TTL in days (default: 7)
                 - recency_boost_alpha: Boost factor per access (default: 0.05)
                 - age_decay_lambda: Decay rate per day (default: 0.1)
+                - claim_timeout_seconds: Age after which a consolidation
+                  claim counts as abandoned (default: 600)
+            ciar_scorer: CIAR scorer (default: the process-wide shared scorer)
         """
         storage_adapters = {'postgres': postgres_adapter}
         super().__init__(storage_adapters, metrics_collector, config)
@@ -98,11 +244,17 @@ class WorkingMemoryTier(BaseTier):
         self.postgres = postgres_adapter
         # Ensure adapter targets the working_memory table for all operations
         setattr(self.postgres, 'table', 'working_memory')
-        self.ciar_threshold = config.get('ciar_threshold', self.DEFAULT_CIAR_THRESHOLD) if config else self.DEFAULT_CIAR_THRESHOLD
+        self.ciar_scorer = ciar_scorer or get_ciar_scorer()
+        # None: follow the (hot-reloadable) scorer config
+        self._ciar_threshold = config.get('ciar_threshold') if config else None
         self.ttl_days = config.get('ttl_days', self.DEFAULT_TTL_DAYS) if config else self.DEFAULT_TTL_DAYS
         self.recency_boost_alpha = config.get('recency_boost_alpha', self.RECENCY_BOOST_ALPHA) if config else self.RECENCY_BOOST_ALPHA
         self.age_decay_lambda = config.get('age_decay_lambda', self.AGE_DECAY_LAMBDA) if config else self.AGE_DECAY_LAMBDA
         self.cache_limit = config.get('cache_limit', 200) if config else 200
+        self.claim_timeout_seconds = (
+            config.get('claim_timeout_seconds', self.DEFAULT_CLAIM_TIMEOUT_SECONDS)
+            if config else self.DEFAULT_CLAIM_TIMEOUT_SECONDS
+        )
         self._recent_cache: Dict[str, deque[Fact]] = {}
         
         logger.info(
@@ -110,6 +262,17 @@ class WorkingMemoryTier(BaseTier):
             f"ttl_days={self.ttl_days}"
         )
     
+    @property
+    def ciar_threshold(self) -> float:
+        """Minimum CIAR score for stored facts."""
+        if self._ciar_threshold is not None:
+            return self._ciar_threshold
+        return self.ciar_scorer.threshold
+    
+    @ciar_threshold.setter
+    def ciar_threshold(self, value: float) -> None:
+        self._ciar_threshold = value
+    
     async def store(self, data: Dict[str, Any]) -> str:
         """
         Store a fact in L2 Working Memory.
@@ -163,6 +326,7 @@ class WorkingMemoryTier(BaseTier):
                 )
                 
                 self._cache_fact(fact)
+                await self._bump_generation(fact.session_id)
                 logger.debug(f"Fact {fact.fact_id} stored successfully in L2")
                 return fact.fact_id
                 
@@ -259,6 +423,34 @@ class WorkingMemoryTier(BaseTier):
         Returns:
             List of matching facts (newest/highest CIAR first)
         """
+        batch = await self.query_batch(filters=filters, limit=limit, **kwargs)
+        try:
+            return batch.to_facts()
+        except Exception as e:
+            logger.error(f"Failed to query L2: {e}")
+            raise TierOperationError(f"Failed to query L2: {e}") from e
+    
+    async def query_batch(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        **kwargs
+    ) -> FactBatch:
+        """
+        Query facts into a columnar FactBatch.
+        
+        Same filters and ordering as `query`, but rows are not validated
+        into Fact models; items convert to Fact lazily when accessed. Use
+        this for bulk reads that sort, filter or cluster many facts.
+        
+        Args:
+            filters: Query filters (see query)
+            limit: Maximum results (default: 10)
+            **kwargs: order_by, include_low_ciar (see query)
+        
+        Returns:
+            FactBatch of matching facts (newest/highest CIAR first)
+        """
         async with OperationTimer(self.metrics, 'l2_query'):
             try:
                 # Build query filters
@@ -280,38 +472,18 @@ class WorkingMemoryTier(BaseTier):
                     limit=limit * 2  # Query more to allow for filtering
                 )
                 
-                # Convert to Fact objects and filter by CIAR if needed
-                facts = []
-                min_ciar = filters.get('min_ciar_score', self.ciar_threshold) if filters else self.ciar_threshold
+                # Some storage adapters omit CIAR components; ensure we don't
+                # filter out facts purely due to missing scores.
+                batch = FactBatch.from_rows(results, default_ciar_score=self.ciar_threshold)
                 
-                for row in results:
-                    # Parse metadata if it's a string
-                    if isinstance(row.get('metadata'), str):
-                        row['metadata'] = json.loads(row['metadata'])
-
-                    # Backfill fact_id when underlying storage returns generic id
-                    if 'fact_id' not in row and 'id' in row:
-                        row['fact_id'] = str(row['id'])
-                    
-                    fact = Fact(**row)
-
-                    # Some storage adapters omit CIAR components; ensure we don't
-                    # filter out facts purely due to missing scores.
-                    if row.get('ciar_score') is None:
-                        fact.ciar_score = max(fact.ciar_score, self.ciar_threshold)
-                    
-                    # Apply CIAR filter
-                    if not kwargs.get('include_low_ciar', False):
-                        if fact.ciar_score < min_ciar:
-                            continue
-                    
-                    facts.append(fact)
-                    
-                    if len(facts) >= limit:
-                        break
+                # Apply CIAR filter
+                if not kwargs.get('include_low_ciar', False):
+                    min_ciar = filters.get('min_ciar_score', self.ciar_threshold) if filters else self.ciar_threshold
+                    batch = batch.filter(batch.ciar_score >= min_ciar)
+                batch = batch[:limit]
                 
-                logger.debug(f"Query returned {len(facts)} facts")
-                return facts
+                logger.debug(f"Query returned {len(batch)} facts")
+                return batch
                 
             except Exception as e:
                 logger.error(f"Failed to query L2: {e}")
@@ -386,7 +558,8 @@ class WorkingMemoryTier(BaseTier):
             limit: Maximum results (default: 20)
         
         Returns:
-            List of matching facts ordered by relevance (ts_rank) DESC, then CIAR DESC
+            List of matching facts ordered by relevance (ts_rank) DESC, then CIAR DESC;
+            each fact's ts_rank is in metadata['search_score']
         
         Example:
             ```python
@@ -407,36 +580,39 @@ class WorkingMemoryTier(BaseTier):
                 # Using plainto_tsquery for simple natural language queries
                 sql = """
                     SELECT *,
-                           ts_rank(content_tsv, plainto_tsquery('simple', $1)) as rank
+                           ts_rank(content_tsv, plainto_tsquery('simple', %(query)s)) as rank
                     FROM working_memory
-                    WHERE session_id = $2
-                      AND ciar_score >= $3
+                    WHERE session_id = %(session_id)s
+                      AND ciar_score >= %(min_ciar)s
                       AND (ttl_expires_at IS NULL OR ttl_expires_at > NOW())
-                      AND content_tsv @@ plainto_tsquery('simple', $1)
+                      AND content_tsv @@ plainto_tsquery('simple', %(query)s)
                     ORDER BY rank DESC, ciar_score DESC, last_accessed DESC
-                    LIMIT $4
+                    LIMIT %(limit)s
                 """
                 
-                results = await self.postgres.execute(
-                    sql,
-                    query,
-                    session_id,
-                    min_ciar_threshold,
-                    limit
-                )
+                results = await self.postgres.execute(sql, {
+                    'query': query,
+                    'session_id': session_id,
+                    'min_ciar': min_ciar_threshold,
+                    'limit': limit
+                })
                 
                 facts = []
                 for row in results:
                     # Remove the 'rank' field before creating Fact model
                     fact_data = dict(row)
-                    fact_data.pop('rank', None)
+                    rank = fact_data.pop('rank', None)
                     fact_data.pop('content_tsv', None)  # Remove tsvector field
                     
                     # Parse metadata if it's a string
                     if isinstance(fact_data.get('metadata'), str):
                         fact_data['metadata'] = json.loads(fact_data['metadata'])
                     
-                    facts.append(Fact(**fact_data))
+                    fact = Fact(**fact_data)
+                    # Expose ts_rank for cross-tier relevance fusion
+                    if rank is not None:
+                        fact.metadata['search_score'] = float(rank)
+                    facts.append(fact)
                 
                 logger.info(
                     f"L2 search found {len(facts)} facts for query '{query}' "
@@ -474,6 +650,7 @@ class WorkingMemoryTier(BaseTier):
         """
         try:
             update_data = {}
+            session_id = None
             
             # If components provided, recalculate CIAR
             if components:
@@ -481,6 +658,7 @@ class WorkingMemoryTier(BaseTier):
                 current = await self.retrieve(fact_id)
                 if not current:
                     return False
+                session_id = current.session_id
                 
                 certainty = components.get('certainty', current.certainty)
                 impact = components.get('impact', current.impact)
@@ -506,6 +684,8 @@ class WorkingMemoryTier(BaseTier):
                 data=update_data
             )
             
+            # Without the fact loaded its session is unknown: bump globally
+            await self._bump_generation(session_id)
             logger.debug(f"Updated CIAR score for fact {fact_id}: {update_data}")
             return True
             
@@ -513,6 +693,234 @@ class WorkingMemoryTier(BaseTier):
             logger.error(f"Failed to update CIAR score: {e}")
             raise TierOperationError(f"Failed to update CIAR score: {e}") from e
     
+    async def rescore_decay(
+        self,
+        session_id: Optional[str] = None,
+        chunk_size: int = DEFAULT_RESCORE_CHUNK_SIZE
+    ) -> Dict[str, int]:
+        """
+        Recompute age decay, recency boost and CIAR score of stored facts.
+        
+        Stored scores only decay when a fact passes through Python, so
+        CIAR-ordered queries rank on stale values. This runs the CIARScorer
+        formulas in SQL, with the shared CIAR config:
+        
+            age_decay = max(min_score, exp(-lambda * min(age_days, max_age_days)))
+            recency_boost = 1 + min(boost_factor * ln(1 + access_count), max_boost)
+            ciar_score = certainty * impact * age_decay * recency_boost
+        
+        Facts are processed in chunks of `chunk_size` (keyset-paged by
+        fact_id), one set-based UPDATE per chunk, so no chunk holds row
+        locks for long. Rows whose values are unchanged are not written.
+        
+        Args:
+            session_id: Only rescore this session (default: all sessions)
+            chunk_size: Facts per UPDATE statement
+        
+        Returns:
+            Dict with 'scanned', 'updated' and 'chunks' counts
+        
+        Example:
+            ```python
+            stats = await tier.rescore_decay(chunk_size=5000)
+            ```
+        """
+        async with OperationTimer(self.metrics, 'l2_rescore_decay'):
+            try:
+                config = self.ciar_scorer.config_snapshot
+                stats = {'scanned': 0, 'updated': 0, 'chunks': 0}
+                last_fact_id = ''
+                
+                while True:
+                    rows = await self.postgres.execute(_RESCORE_DECAY_SQL, {
+                        'after_fact_id': last_fact_id,
+                        'session_id': session_id,
+                        'chunk_size': chunk_size,
+                        'age_decay_lambda': config.age_decay_lambda,
+                        'min_age_score': config.min_age_score,
+                        'max_age_days': config.max_age_days,
+                        'recency_boost_factor': config.recency_boost_factor,
+                        'max_recency_boost': config.max_recency_boost
+                    })
+                    row = dict(rows[0]) if rows else {}
+                    scanned = row.get('scanned') or 0
+                    stats['chunks'] += 1
+                    stats['scanned'] += scanned
+                    stats['updated'] += row.get('updated') or 0
+                    if scanned < chunk_size or not row.get('last_fact_id'):
+                        break
+                    last_fact_id = row['last_fact_id']
+                
+                if stats['updated']:
+                    await self._bump_generation(session_id)
+                logger.info(
+                    f"L2 rescored {stats['scanned']} facts in {stats['chunks']} chunks "
+                    f"({stats['updated']} changed, session={session_id})"
+                )
+                return stats
+                
+            except Exception as e:
+                logger.error(f"Failed to rescore L2 facts: {e}")
+                raise TierOperationError(f"Failed to rescore facts: {e}") from e
+    
+    async def query_unconsolidated(
+        self,
+        session_id: Optional[str] = None,
+        limit: int = DEFAULT_UNCONSOLIDATED_PAGE_SIZE,
+        after_fact_id: Optional[str] = None
+    ) -> FactBatch:
+        """
+        Fetch one page of facts not yet consolidated into an L3 episode.
+        
+        Pages are keyset-paged on (extracted_at, fact_id), oldest first, so
+        backlog reads cost the same at any depth. Pass the last fact_id of
+        a page as `after_fact_id` to read the next one; facts marked
+        consolidated in between drop out without shifting later pages.
+        
+        Args:
+            session_id: Only this session (default: all sessions)
+            limit: Page size
+            after_fact_id: Last fact_id of the previous page
+        
+        Returns:
+            FactBatch of unconsolidated facts in extraction order
+        """
+        async with OperationTimer(self.metrics, 'l2_query_unconsolidated'):
+            try:
+                rows = await self.postgres.execute(_UNCONSOLIDATED_SQL, {
+                    'session_id': session_id,
+                    'after_fact_id': after_fact_id,
+                    'limit': limit
+                })
+                return FactBatch.from_rows(rows, default_ciar_score=self.ciar_threshold)
+                
+            except Exception as e:
+                logger.error(f"Failed to query unconsolidated L2 facts: {e}")
+                raise TierOperationError(f"Failed to query unconsolidated facts: {e}") from e
+    
+    async def claim_unconsolidated(
+        self,
+        session_id: Optional[str] = None,
+        limit: int = DEFAULT_UNCONSOLIDATED_PAGE_SIZE,
+        after_fact_id: Optional[str] = None
+    ) -> FactBatch:
+        """
+        Claim one page of unconsolidated facts for consolidation.
+        
+        Like `query_unconsolidated`, but the page is claimed in the same
+        statement that selects it (FOR UPDATE SKIP LOCKED), so concurrent
+        consolidation runs receive disjoint facts. A claim ends when the
+        facts are marked consolidated, when it is released, or after
+        `claim_timeout_seconds` if its run died.
+        
+        Args:
+            session_id: Only this session (default: all sessions)
+            limit: Page size
+            after_fact_id: Last fact_id of the previous page
+        
+        Returns:
+            FactBatch of claimed facts in extraction order
+        """
+        async with OperationTimer(self.metrics, 'l2_claim_unconsolidated'):
+            try:
+                rows = await self.postgres.execute(_CLAIM_UNCONSOLIDATED_SQL, {
+                    'session_id': session_id,
+                    'after_fact_id': after_fact_id,
+                    'limit': limit,
+                    'claim_timeout': float(self.claim_timeout_seconds)
+                })
+                return FactBatch.from_rows(rows, default_ciar_score=self.ciar_threshold)
+                
+            except Exception as e:
+                logger.error(f"Failed to claim unconsolidated L2 facts: {e}")
+                raise TierOperationError(f"Failed to claim unconsolidated facts: {e}") from e
+    
+    async def release_claims(self, fact_ids: List[str]) -> int:
+        """
+        Release claimed facts that were not consolidated.
+        
+        Args:
+            fact_ids: Facts claimed by `claim_unconsolidated`
+        
+        Returns:
+            Number of facts released
+        """
+        if not fact_ids:
+            return 0
+        async with OperationTimer(self.metrics, 'l2_release_claims'):
+            try:
+                rows = await self.postgres.execute(
+                    _RELEASE_CLAIMS_SQL,
+                    {'fact_ids': list(fact_ids)}
+                )
+                return int(dict(rows[0]).get('count') or 0) if rows else 0
+                
+            except Exception as e:
+                logger.error(f"Failed to release L2 fact claims: {e}")
+                raise TierOperationError(f"Failed to release fact claims: {e}") from e
+    
+    async def count_unconsolidated(
+        self,
+        session_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> int:
+        """
+        Count facts not yet consolidated into an L3 episode.
+        
+        The count is an index-only scan of the partial index over
+        unconsolidated rows, and stops at `limit`: for a threshold check
+        (`count >= threshold`) pass the threshold so the cost stays bounded
+        however large the backlog grows.
+        
+        Args:
+            session_id: Only this session (default: all sessions)
+            limit: Stop counting at this many facts (default: exact count)
+        
+        Returns:
+            Number of unconsolidated facts, at most `limit`
+        """
+        async with OperationTimer(self.metrics, 'l2_count_unconsolidated'):
+            try:
+                rows = await self.postgres.execute(
+                    _UNCONSOLIDATED_COUNT_SQL,
+                    {'session_id': session_id, 'limit': limit}
+                )
+                return int(dict(rows[0]).get('count') or 0) if rows else 0
+                
+            except Exception as e:
+                logger.error(f"Failed to count unconsolidated L2 facts: {e}")
+                raise TierOperationError(f"Failed to count unconsolidated facts: {e}") from e
+    
+    async def mark_consolidated(self, fact_ids: List[str], episode_id: str) -> int:
+        """
+        Record that facts were consolidated into an L3 episode.
+        
+        One UPDATE for all facts, which also ends their claim; facts
+        already consolidated keep their original episode.
+        
+        Args:
+            fact_ids: Facts summarized by the episode
+            episode_id: The stored L3 episode
+        
+        Returns:
+            Number of facts marked
+        """
+        if not fact_ids:
+            return 0
+        async with OperationTimer(self.metrics, 'l2_mark_consolidated'):
+            try:
+                rows = await self.postgres.execute(
+                    _MARK_CONSOLIDATED_SQL,
+                    {'fact_ids': list(fact_ids), 'episode_id': episode_id}
+                )
+                marked = int(dict(rows[0]).get('count') or 0) if rows else 0
+                logger.debug(f"Marked {marked} L2 facts consolidated into episode {episode_id}")
+                return marked
+                
+            except Exception as e:
+                logger.error(f"Failed to mark L2 facts consolidated: {e}")
+                raise TierOperationError(f"Failed to mark facts consolidated: {e}") from e
+    
     async def delete(self, fact_id: str) -> bool:
         """
         Delete a fact from L2.
@@ -531,6 +939,7 @@ class WorkingMemoryTier(BaseTier):
                 )
                 
                 if result:
+                    await self._bump_generation()
                     logger.debug(f"Deleted fact {fact_id} from L2")
                 else:
                     logger.debug(f"Fact {fact_id} not found for deletion")
@@ -9,11 +9,18 @@ Features:
 - Relationship management
 - Cypher query execution
 - Graph traversal operations
+- Label-scoped, index-backed point lookups
+- Schema bootstrap (uniqueness constraints + range indexes) on connect
+- Managed read/write transactions (cluster routing + transient-error retry)
+- Session reuse across a unit of work via `async with adapter.session()`
 """
 
-from neo4j import AsyncGraphDatabase, AsyncDriver
-from typing import Dict, Any, List, Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 import logging
+import re
 import uuid
 
 from .base import (
@@ -28,6 +35,39 @@ from .metrics import OperationTimer
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_ENTITY_LABEL = 'Entity'
+
+# (label, property) pairs backed by uniqueness constraints. Covers the L3
+# tier's Episode/Entity keys and the anchor IDs used in graph_templates.py.
+# DEFAULT_ENTITY_LABEL stands for the adapter's configured default_label.
+UNIQUE_CONSTRAINTS: List[Tuple[str, str]] = [
+    (DEFAULT_ENTITY_LABEL, 'entityId'),
+    ('Episode', 'episodeId'),
+    ('Container', 'container_id'),
+    ('Shipment', 'shipment_id'),
+]
+
+# (label, property) pairs backed by range indexes
+RANGE_INDEXES: List[Tuple[str, str]] = [
+    (DEFAULT_ENTITY_LABEL, 'id'),  # adapter retrieve/delete on the default label
+    ('Episode', 'sessionId'),
+    ('Episode', 'factValidFrom'),
+]
+
+_IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def _validate_identifier(value: str, kind: str) -> str:
+    """Reject labels/types that cannot be safely interpolated into Cypher."""
+    if not isinstance(value, str) or not _IDENTIFIER_PATTERN.match(value):
+        raise StorageDataError(f"Invalid {kind}: {value!r}")
+    return value
+
+
+def _schema_name(kind: str, label: str, prop: str) -> str:
+    return f"{label.lower()}_{prop.lower()}_{kind}"
+
+
 class Neo4jAdapter(StorageAdapter):
     """
     Neo4j adapter for entity and relationship storage (L4).
@@ -37,7 +77,12 @@ class Neo4jAdapter(StorageAdapter):
             'uri': 'bolt://host:port',
             'user': 'neo4j',
             'password': 'password',
-            'database': 'neo4j'  # Optional, default DB
+            'database': 'neo4j',  # Optional, default DB
+            'default_label': 'Entity',  # Optional, label for ID lookups
+            'ensure_schema': True,  # Optional, bootstrap indexes on connect
+            'batch_chunk_size': 1000,  # Optional, UNWIND rows per statement
+            'max_connection_pool_size': 100,  # Optional, driver pool size
+            'fetch_size': 1000  # Optional, records per server round trip
         }
     
     Example:
@@ -58,20 +103,30 @@ class Neo4jAdapter(StorageAdapter):
             'properties': {'name': 'Alice', 'age': 30}
         })
         
-        # Store relationship
+        # Store relationship (endpoints default to the entity label)
         await adapter.store({
             'type': 'relationship',
             'from': 'Alice',
             'to': 'Bob',
+            'from_label': 'Person',
+            'to_label': 'Person',
             'relationship': 'KNOWS',
             'properties': {'since': '2020'}
         })
         
+        # Label-scoped point lookup (index-backed)
+        alice = await adapter.retrieve('Alice', label='Person')
+        
         # Query relationships
         results = await adapter.search({
             'cypher': 'MATCH (p:Person)-[r:KNOWS]->(f) RETURN p, r, f',
             'params': {}
         })
+        
+        # Routed, retried reads/writes sharing one session
+        async with adapter.session():
+            people = await adapter.execute_read('MATCH (p:Person) RETURN p')
+            await adapter.execute_write('MATCH (p:Person) SET p.seen = true')
         ```
     """
     
@@ -81,6 +136,18 @@ class Neo4jAdapter(StorageAdapter):
         self.user: str = config.get('user', 'neo4j')
         self.password: str = config.get('password', '')
         self.database: str = config.get('database', 'neo4j')
+        self.default_label: str = _validate_identifier(
+            config.get('default_label', DEFAULT_ENTITY_LABEL), 'label'
+        )
+        self.ensure_schema_on_connect: bool = config.get('ensure_schema', True)
+        self.batch_chunk_size: int = config.get('batch_chunk_size', 1000)
+        self.max_connection_pool_size: int = config.get('max_connection_pool_size', 100)
+        self.fetch_size: int = config.get('fetch_size', 1000)
+        # Session bound to the current unit of work (see session())
+        self._active_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+            f"neo4j_session_{id(self)}", default=None
+        )
+        self.missing_schema: List[str] = []
         self.driver: Optional[AsyncDriver] = None
         
         if not self.uri or not self.password:
@@ -97,7 +164,8 @@ class Neo4jAdapter(StorageAdapter):
             try:
                 self.driver = AsyncGraphDatabase.driver(
                     self.uri,
-                    auth=(self.user, self.password)
+                    auth=(self.user, self.password),
+                    max_connection_pool_size=self.max_connection_pool_size
                 )
                 
                 # Verify connection
@@ -112,6 +180,97 @@ class Neo4jAdapter(StorageAdapter):
             except Exception as e:
                 logger.error(f"Neo4j connection failed: {e}", exc_info=True)
                 raise StorageConnectionError(f"Failed to connect: {e}") from e
+            
+            if self.ensure_schema_on_connect:
+                await self.ensure_schema()
+    
+    async def ensure_schema(self) -> List[str]:
+        """
+        Create and verify uniqueness constraints and range indexes.
+        
+        Statements use IF NOT EXISTS, so this is idempotent. Failures (e.g.
+        missing schema privileges) are logged rather than raised so that
+        read-only users can still connect.
+        
+        Returns:
+            Names of expected indexes that are missing or not ONLINE
+        """
+        if self.driver is None:
+            raise StorageConnectionError("Not connected to Neo4j")
+        
+        unique = self._schema_targets(UNIQUE_CONSTRAINTS)
+        ranged = self._schema_targets(RANGE_INDEXES)
+        statements = [
+            f"CREATE CONSTRAINT {_schema_name('unique', label, prop)} IF NOT EXISTS "
+            f"FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+            for label, prop in unique
+        ] + [
+            f"CREATE RANGE INDEX {_schema_name('range', label, prop)} IF NOT EXISTS "
+            f"FOR (n:{label}) ON (n.{prop})"
+            for label, prop in ranged
+        ]
+        expected = {
+            _schema_name('unique', label, prop) for label, prop in unique
+        } | {
+            _schema_name('range', label, prop) for label, prop in ranged
+        }
+        
+        async def _run_schema(tx, statement):
+            await tx.run(statement)
+        
+        async def _list_online(tx):
+            result = await tx.run("SHOW INDEXES YIELD name, state")
+            records = await result.data()
+            return {r['name'] for r in records if r.get('state') == 'ONLINE'}
+        
+        try:
+            async with self.session() as session:
+                # One transaction per statement: a failing constraint (e.g.
+                # duplicate data) must not roll back the other indexes
+                for statement in statements:
+                    try:
+                        await session.execute_write(_run_schema, statement)
+                    except Exception as e:
+                        logger.warning(f"Neo4j schema statement failed ({statement}): {e}")
+                online = await session.execute_read(_list_online)
+            # Uniqueness constraints are reported by their backing index name
+            self.missing_schema = sorted(expected - set(online or ()))
+        except Exception as e:
+            logger.warning(f"Neo4j schema bootstrap failed: {e}")
+            self.missing_schema = sorted(expected)
+            return self.missing_schema
+        
+        if self.missing_schema:
+            logger.warning(
+                f"Neo4j indexes not online (lookups may scan): {self.missing_schema}"
+            )
+        else:
+            logger.info(f"Neo4j schema verified ({len(expected)} indexes online)")
+        return self.missing_schema
+    
+    def _schema_targets(self, targets: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Map DEFAULT_ENTITY_LABEL schema targets onto the configured default label."""
+        return [
+            (self.default_label if label == DEFAULT_ENTITY_LABEL else label, prop)
+            for label, prop in targets
+        ]
+    
+    def _entity_merge_pattern(self, label: str, id_expr: str) -> str:
+        """
+        MERGE pattern for an entity node bound to `n`.
+        
+        Nodes are merged on the default label and also given their own
+        label, so lookups without a label (which default to the entity
+        label) find entities stored under any label.
+        """
+        pattern = "(n:%s {id: %s})" % (self.default_label, id_expr)
+        if label != self.default_label:
+            pattern += " SET n:%s" % label
+        return pattern
+    
+    def _label(self, label: Optional[str]) -> str:
+        """Resolve an optional label to a validated label (default entity label)."""
+        return _validate_identifier(label or self.default_label, 'label')
     
     async def disconnect(self) -> None:
         """Close Neo4j connection"""
@@ -122,14 +281,83 @@ class Neo4jAdapter(StorageAdapter):
                 self._connected = False
                 logger.info("Disconnected from Neo4j")
 
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open (or reuse) a session for a unit of work.
+        
+        execute_read/execute_write calls made inside the context share this
+        session instead of opening one per query. Nested contexts reuse the
+        outer session. Sessions are not safe for concurrent use, so do not
+        fan out parallel queries from inside one unit of work.
+        """
+        existing = self._active_session.get()
+        if existing is not None:
+            yield existing
+            return
+        
+        if not self.driver:
+            raise StorageConnectionError("Not connected to Neo4j")
+        
+        async with self.driver.session(
+            database=self.database,
+            fetch_size=self.fetch_size
+        ) as session:
+            token = self._active_session.set(session)
+            try:
+                yield session
+            finally:
+                self._active_session.reset(token)
+    
+    async def execute_read(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Run a read query in a managed read transaction.
+        
+        Reads are routed to followers/read replicas in a cluster and retried
+        by the driver on transient errors.
+        """
+        async with OperationTimer(self.metrics, 'execute_read'):
+            return await self._execute_managed(cypher, params, write=False)
+    
+    async def execute_write(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Run a write query in a managed write transaction (routed to the leader)."""
+        async with OperationTimer(self.metrics, 'execute_write'):
+            return await self._execute_managed(cypher, params, write=True)
+    
+    async def _execute_managed(
+        self,
+        cypher: str,
+        params: Optional[Dict[str, Any]],
+        write: bool
+    ) -> List[Dict[str, Any]]:
+        if not self.driver:
+            raise StorageConnectionError("Not connected to Neo4j")
+        
+        async def _work(tx):
+            result = await tx.run(cypher, params or {})
+            return await result.data()
+        
+        try:
+            async with self.session() as session:
+                if write:
+                    return await session.execute_write(_work)
+                return await session.execute_read(_work)
+        except Exception as e:
+            logger.error(f"Neo4j {'write' if write else 'read'} query failed: {e}", exc_info=True)
+            raise StorageQueryError(f"Query failed: {e}") from e
+    
     async def execute_query(self, cypher: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Execute arbitrary Cypher and return result data."""
+        """
+        Execute arbitrary Cypher (auto-commit) and return result data.
+        
+        Prefer execute_read/execute_write, which use managed transactions.
+        """
         async with OperationTimer(self.metrics, 'execute_query'):
             if not self.driver:
                 raise StorageConnectionError("Not connected to Neo4j")
 
             try:
-                async with self.driver.session(database=self.database) as session:
+                async with self.session() as session:
                     result = await session.run(cypher, params or {})
                     return await result.data()
             except Exception as e:
@@ -151,6 +379,7 @@ class Neo4jAdapter(StorageAdapter):
             - to: Target node identifier
             - relationship: Relationship type
             - properties: Dict of properties
+            - from_label / to_label: Endpoint labels (default entity label)
         """
         async with OperationTimer(self.metrics, 'store'):
             if not self._connected or not self.driver:
@@ -177,7 +406,7 @@ class Neo4jAdapter(StorageAdapter):
             
         validate_required_fields(data, ['label', 'properties'])
         
-        label = data['label']
+        label = _validate_identifier(data['label'], 'label')
         props = data['properties']
         
         # Generate ID from name or use UUID
@@ -185,12 +414,12 @@ class Neo4jAdapter(StorageAdapter):
         props['id'] = node_id
         
         cypher = """
-            MERGE (n:%s {id: $id})
+            MERGE %s
             SET n += $props
             RETURN n.id AS id
-        """ % label
+        """ % self._entity_merge_pattern(label, '$id')
         
-        async with self.driver.session(database=self.database) as session:
+        async with self.session() as session:
             result = await session.run(cypher, id=node_id, props=props)
             record = await result.single()
             if record is None:
@@ -206,18 +435,20 @@ class Neo4jAdapter(StorageAdapter):
         
         from_id = data['from']
         to_id = data['to']
-        rel_type = data['relationship']
+        rel_type = _validate_identifier(data['relationship'], 'relationship type')
+        from_label = self._label(data.get('from_label'))
+        to_label = self._label(data.get('to_label'))
         props = data.get('properties', {})
         
         cypher = """
-            MATCH (from {id: $from_id})
-            MATCH (to {id: $to_id})
+            MATCH (from:%s {id: $from_id})
+            MATCH (to:%s {id: $to_id})
             MERGE (from)-[r:%s]->(to)
             SET r += $props
             RETURN id(r) AS id
-        """ % rel_type
+        """ % (from_label, to_label, rel_type)
         
-        async with self.driver.session(database=self.database) as session:
+        async with self.session() as session:
             result = await session.run(
                 cypher,
                 from_id=from_id,
@@ -229,17 +460,24 @@ class Neo4jAdapter(StorageAdapter):
                 raise StorageQueryError("Failed to store relationship")
             return str(record['id'])
     
-    async def retrieve(self, id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve entity by ID"""
+    async def retrieve(self, id: str, label: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve entity by ID.
+        
+        Args:
+            id: Node identifier
+            label: Node label (default entity label); scoping by label lets
+                Neo4j use the label's index instead of scanning all nodes
+        """
         async with OperationTimer(self.metrics, 'retrieve'):
             if not self._connected or not self.driver:
                 raise StorageConnectionError("Not connected to Neo4j")
             
             try:
-                cypher = "MATCH (n {id: $id}) RETURN n"
+                cypher = "MATCH (n:%s {id: $id}) RETURN n" % self._label(label)
                 
                 if self.driver is not None:
-                    async with self.driver.session(database=self.database) as session:
+                    async with self.session() as session:
                         result = await session.run(cypher, id=id)
                         record = await result.single()
                         
@@ -273,7 +511,7 @@ class Neo4jAdapter(StorageAdapter):
                 params = query.get('params', {})
                 
                 if self.driver is not None:
-                    async with self.driver.session(database=self.database) as session:
+                    async with self.session() as session:
                         result = await session.run(cypher, **params)
                         records = await result.data()
                         return records
@@ -283,17 +521,23 @@ class Neo4jAdapter(StorageAdapter):
                 logger.error(f"Neo4j search failed: {e}", exc_info=True)
                 raise StorageQueryError(f"Search failed: {e}") from e
     
-    async def delete(self, id: str) -> bool:
-        """Delete entity by ID"""
+    async def delete(self, id: str, label: Optional[str] = None) -> bool:
+        """
+        Delete entity by ID.
+        
+        Args:
+            id: Node identifier
+            label: Node label (default entity label)
+        """
         async with OperationTimer(self.metrics, 'delete'):
             if not self._connected or not self.driver:
                 raise StorageConnectionError("Not connected to Neo4j")
             
             try:
-                cypher = "MATCH (n {id: $id}) DETACH DELETE n"
+                cypher = "MATCH (n:%s {id: $id}) DETACH DELETE n" % self._label(label)
                 
                 if self.driver is not None:
-                    async with self.driver.session(database=self.database) as session:
+                    async with self.session() as session:
                         result = await session.run(cypher, id=id)
                         summary = await result.consume()
                         return summary.counters.nodes_deleted > 0
@@ -302,7 +546,6 @@ class Neo4jAdapter(StorageAdapter):
             except Exception as e:
                 logger.error(f"Neo4j delete failed: {e}", exc_info=True)
                 return False
-                return False
     
     # Batch operations (optimized for Neo4j)
     
@@ -310,14 +553,19 @@ class Neo4jAdapter(StorageAdapter):
         """
         Store multiple entities or relationships in a single transaction.
         
-        More efficient than calling store() multiple times as it uses
-        a single Neo4j transaction for all operations.
+        Items are grouped by label (entities) and by relationship type and
+        endpoint labels (relationships); each group is written with one
+        parameterized `UNWIND $rows AS row MERGE ...` statement per chunk of
+        `batch_chunk_size` rows, so plans are compiled once per group rather
+        than once per item. Entities are written before relationships, so
+        edges may reference nodes created in the same batch.
         
         Args:
             items: List of entity or relationship data dictionaries
         
         Returns:
-            List of IDs in same order as input
+            List of IDs in same order as input ('' for relationships whose
+            endpoints were not found)
         
         Raises:
             StorageConnectionError: If not connected
@@ -338,63 +586,99 @@ class Neo4jAdapter(StorageAdapter):
                 raise StorageDataError(f"Item {i}: {e}") from e
         
         try:
-            ids = []
+            entity_groups, relationship_groups = self._group_batch_items(items)
+            chunk_size = self.batch_chunk_size
             
-            # Process all items in a single transaction
-            async with self.driver.session(database=self.database) as session:
-                async def _batch_store(tx):
-                    batch_ids = []
-                    for item in items:
-                        if item['type'] == 'entity':
-                            validate_required_fields(item, ['label', 'properties'])
-                            label = item['label']
-                            props = item['properties'].copy()
-                            node_id = props.get('name', str(uuid.uuid4()))
-                            props['id'] = node_id
-                            
-                            cypher = """
-                                MERGE (n:%s {id: $id})
-                                SET n += $props
-                                RETURN n.id AS id
-                            """ % label
-                            
-                            result = await tx.run(cypher, id=node_id, props=props)
-                            record = await result.single()
-                            batch_ids.append(record['id'] if record else node_id)
-                            
-                        elif item['type'] == 'relationship':
-                            validate_required_fields(item, ['from', 'to', 'relationship'])
-                            from_id = item['from']
-                            to_id = item['to']
-                            rel_type = item['relationship']
-                            props = item.get('properties', {})
-                            
-                            cypher = """
-                                MATCH (from {id: $from_id})
-                                MATCH (to {id: $to_id})
-                                MERGE (from)-[r:%s]->(to)
-                                SET r += $props
-                                RETURN id(r) AS id
-                            """ % rel_type
-                            
-                            result = await tx.run(cypher, from_id=from_id, to_id=to_id, props=props)
-                            record = await result.single()
-                            batch_ids.append(str(record['id']) if record else '')
-                        else:
-                            raise StorageDataError(f"Unknown type: {item['type']}")
-                    
-                    return batch_ids
+            async def _batch_store(tx):
+                batch_ids = [''] * len(items)
+                
+                for label, rows in entity_groups.items():
+                    cypher = """
+                        UNWIND $rows AS row
+                        MERGE %s
+                        SET n += row.props
+                        RETURN row.idx AS idx, n.id AS id
+                    """ % self._entity_merge_pattern(label, 'row.id')
+                    for start in range(0, len(rows), chunk_size):
+                        result = await tx.run(cypher, rows=rows[start:start + chunk_size])
+                        for record in await result.data():
+                            batch_ids[record['idx']] = record['id']
+                
+                for (rel_type, from_label, to_label), rows in relationship_groups.items():
+                    cypher = """
+                        UNWIND $rows AS row
+                        MATCH (from:%s {id: row.from_id})
+                        MATCH (to:%s {id: row.to_id})
+                        MERGE (from)-[r:%s]->(to)
+                        SET r += row.props
+                        RETURN row.idx AS idx, id(r) AS id
+                    """ % (from_label, to_label, rel_type)
+                    for start in range(0, len(rows), chunk_size):
+                        result = await tx.run(cypher, rows=rows[start:start + chunk_size])
+                        for record in await result.data():
+                            batch_ids[record['idx']] = str(record['id'])
                 
+                return batch_ids
+            
+            async with self.session() as session:
                 ids = await session.execute_write(_batch_store)
             
-            logger.debug(f"Stored {len(ids)} items in batch transaction")
+            logger.debug(
+                f"Stored {len(ids)} items in batch transaction "
+                f"({len(entity_groups)} entity groups, {len(relationship_groups)} relationship groups)"
+            )
             return ids
             
         except Exception as e:
             logger.error(f"Neo4j batch store failed: {e}", exc_info=True)
             raise StorageQueryError(f"Batch store failed: {e}") from e
     
-    async def retrieve_batch(self, ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    def _group_batch_items(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[Tuple[str, str, str], List[Dict[str, Any]]]]:
+        """
+        Group batch items into UNWIND rows keyed by label / relationship type.
+        
+        Each row carries `idx`, the item's input position, so results can be
+        written back in input order.
+        """
+        entity_groups: Dict[str, List[Dict[str, Any]]] = {}
+        relationship_groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        
+        for idx, item in enumerate(items):
+            if item['type'] == 'entity':
+                validate_required_fields(item, ['label', 'properties'])
+                label = _validate_identifier(item['label'], 'label')
+                props = item['properties'].copy()
+                node_id = props.get('name', str(uuid.uuid4()))
+                props['id'] = node_id
+                entity_groups.setdefault(label, []).append(
+                    {'idx': idx, 'id': node_id, 'props': props}
+                )
+            elif item['type'] == 'relationship':
+                validate_required_fields(item, ['from', 'to', 'relationship'])
+                key = (
+                    _validate_identifier(item['relationship'], 'relationship type'),
+                    self._label(item.get('from_label')),
+                    self._label(item.get('to_label')),
+                )
+                relationship_groups.setdefault(key, []).append({
+                    'idx': idx,
+                    'from_id': item['from'],
+                    'to_id': item['to'],
+                    'props': item.get('properties', {}),
+                })
+            else:
+                raise StorageDataError(f"Unknown type: {item['type']}")
+        
+        return entity_groups, relationship_groups
+    
+    async def retrieve_batch(
+        self,
+        ids: List[str],
+        label: Optional[str] = None
+    ) -> List[Optional[Dict[str, Any]]]:
         """
         Retrieve multiple entities by their IDs in a single query.
         
@@ -402,6 +686,7 @@ class Neo4jAdapter(StorageAdapter):
         
         Args:
             ids: List of entity identifiers
+            label: Node label (default entity label)
         
         Returns:
             List of data dictionaries (None for not found items)
@@ -418,9 +703,9 @@ class Neo4jAdapter(StorageAdapter):
         
         try:
             # Query all nodes at once
-            cypher = "UNWIND $ids AS id MATCH (n {id: id}) RETURN id, n"
+            cypher = "UNWIND $ids AS id MATCH (n:%s {id: id}) RETURN id, n" % self._label(label)
             
-            async with self.driver.session(database=self.database) as session:
+            async with self.session() as session:
                 result = await session.run(cypher, ids=ids)
                 records = await result.data()
             
@@ -437,7 +722,11 @@ class Neo4jAdapter(StorageAdapter):
             logger.error(f"Neo4j batch retrieve failed: {e}", exc_info=True)
             raise StorageQueryError(f"Batch retrieve failed: {e}") from e
     
-    async def delete_batch(self, ids: List[str]) -> Dict[str, bool]:
+    async def delete_batch(
+        self,
+        ids: List[str],
+        label: Optional[str] = None
+    ) -> Dict[str, bool]:
         """
         Delete multiple entities by their IDs in a single transaction.
         
@@ -445,6 +734,7 @@ class Neo4jAdapter(StorageAdapter):
         
         Args:
             ids: List of entity identifiers to delete
+            label: Node label (default entity label)
         
         Returns:
             Dictionary mapping IDs to deletion status
@@ -463,12 +753,12 @@ class Neo4jAdapter(StorageAdapter):
             # Delete all nodes in a single query
             cypher = """
                 UNWIND $ids AS id
-                MATCH (n {id: id})
+                MATCH (n:%s {id: id})
                 DETACH DELETE n
                 RETURN id, count(n) > 0 AS deleted
-            """
+            """ % self._label(label)
             
-            async with self.driver.session(database=self.database) as session:
+            async with self.session() as session:
                 result = await session.run(cypher, ids=ids)
                 records = await result.data()
             
@@ -520,7 +810,7 @@ class Neo4jAdapter(StorageAdapter):
                 }
             
             # Execute simple query to check connectivity and get stats
-            async with self.driver.session(database=self.database) as session:
+            async with self.session() as session:
                 # Get node and relationship counts
                 result = await session.run(
                     "MATCH (n) RETURN count(n) as node_count"
@@ -574,7 +864,7 @@ class Neo4jAdapter(StorageAdapter):
             return None
         
         try:
-            async with self.driver.session(database=self.database) as session:
+            async with self.session() as session:
                 result = await session.run("""
                     MATCH (n)
                     RETURN count(n) AS node_count
@@ -12,7 +12,7 @@ Database Tables:
 import psycopg
 from psycopg_pool import AsyncConnectionPool
 from psycopg import sql
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Union
 from datetime import datetime, timedelta, timezone
 import json
 import logging
@@ -588,6 +588,55 @@ class PostgresAdapter(StorageAdapter):
             logger.error(f"Count query failed: {e}", exc_info=True)
             raise StorageQueryError(f"Count failed: {e}") from e
 
+    async def execute(
+        self,
+        query: str,
+        params: Optional[Union[Sequence[Any], Mapping[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute one parameterized SQL statement (helper method for tiers).
+
+        For statements the table helpers cannot express (full-text search,
+        set-based UPDATEs). The statement runs in its own transaction,
+        committed on success.
+
+        Args:
+            query: SQL with psycopg placeholders (%s, or %(name)s with a
+                mapping); literal percent signs must be written as %%
+            params: Positional sequence or name -> value mapping
+
+        Returns:
+            Result rows as dictionaries (empty for statements without
+            a result set)
+
+        Raises:
+            StorageConnectionError: If not connected
+            StorageQueryError: If execution fails
+
+        Example:
+            ```python
+            rows = await adapter.execute(
+                "SELECT fact_id FROM working_memory WHERE session_id = %(session_id)s",
+                {'session_id': 'session-123'}
+            )
+            ```
+        """
+        if not self._connected or not self.pool:
+            raise StorageConnectionError("Not connected to PostgreSQL")
+
+        try:
+            async with self.pool.connection() as conn:  # type: ignore
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params)
+                    rows = await cur.fetchall() if cur.description else []
+                    columns = [desc[0] for desc in cur.description] if cur.description else []
+                await conn.commit()
+            return [dict(zip(columns, row)) for row in rows]
+
+        except psycopg.Error as e:
+            logger.error(f"PostgreSQL execute failed: {e}", exc_info=True)
+            raise StorageQueryError(f"Execute failed: {e}") from e
+
     async def insert(self, table: str, data: Dict[str, Any]) -> str:
         """
         Insert record into specified table (helper method for tiers).
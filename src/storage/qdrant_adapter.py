@@ -3,9 +3,9 @@ Qdrant storage adapter for episodic memory vectors.
 """
 
 import uuid
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional, Sequence, Union
 import logging
-from qdrant_client import AsyncQdrantClient
+from qdrant_client import AsyncQdrantClient, models
 from qdrant_client.models import PointStruct, VectorParams, Distance, Filter, FieldCondition, MatchValue, PointIdsList
 
 from .base import (
@@ -19,6 +19,34 @@ from .metrics import OperationTimer
 
 logger = logging.getLogger(__name__)
 
+# Sentinel: result dicts only carry 'score' for search/scroll results
+_NO_SCORE = object()
+
+# Payload fields every collection filters on: session filters match both
+# session_id locations (see _build_qdrant_filter) and episode lookups match
+# the episode ID stored at the top level and in the metadata payload
+DEFAULT_PAYLOAD_INDEXES: Dict[str, str] = {
+    'session_id': 'keyword',
+    'metadata.session_id': 'keyword',
+    'episode_id': 'keyword',
+    'metadata.episode_id': 'keyword',
+}
+
+_PAYLOAD_SCHEMA_TYPES = {
+    'keyword': models.PayloadSchemaType.KEYWORD,
+    'integer': models.PayloadSchemaType.INTEGER,
+    'float': models.PayloadSchemaType.FLOAT,
+    'bool': models.PayloadSchemaType.BOOL,
+    'datetime': models.PayloadSchemaType.DATETIME,
+    'text': models.PayloadSchemaType.TEXT,
+}
+
+_DISTANCE_MAP = {
+    'Cosine': Distance.COSINE,
+    'Euclid': Distance.EUCLID,
+    'Dot': Distance.DOT
+}
+
 
 class QdrantAdapter(StorageAdapter):
     """
@@ -30,9 +58,23 @@ class QdrantAdapter(StorageAdapter):
             'api_key': 'optional_api_key',
             'collection_name': 'semantic_memory',
             'vector_size': 384,  # Default for all-MiniLM-L6-v2
-            'distance': 'Cosine'  # or 'Euclid', 'Dot'
+            'distance': 'Cosine',  # or 'Euclid', 'Dot'
+            # Collection tuning (all optional):
+            'payload_indexes': {'session_id': 'keyword'},  # field -> keyword/float/datetime/...
+            'extra_payload_indexes': {'metadata.fact_type': 'keyword'},  # added to the defaults
+            'hnsw': {'m': 16, 'ef_construct': 100},
+            'on_disk_payload': False,
+            'quantization': {'type': 'int8', 'quantile': 0.99, 'always_ram': True,
+                             'rescore': True, 'oversampling': 2.0}
         }
     
+    'payload_indexes' replaces DEFAULT_PAYLOAD_INDEXES, while
+    'extra_payload_indexes' indexes further filtered fields on top of them.
+    Collection settings can be overridden per collection through
+    create_collection(name, config). Existing collections are reconciled
+    idempotently: missing payload indexes are created and differing HNSW,
+    on-disk payload or quantization settings are updated in place.
+    
     Example:
         ```python
         config = {
@@ -70,6 +112,9 @@ class QdrantAdapter(StorageAdapter):
         self.vector_size = config.get('vector_size', 384)
         self.distance = config.get('distance', 'Cosine')
         self.client: Optional[AsyncQdrantClient] = None
+        self.collection_settings = self._collection_settings(config)
+        # Per-collection search params (quantization rescoring)
+        self._search_params: Dict[str, Optional[models.SearchParams]] = {}
         
         if not self.url:
             raise StorageDataError("Qdrant URL is required")
@@ -94,25 +139,8 @@ class QdrantAdapter(StorageAdapter):
                     api_key=self.api_key
                 )
                 
-                # Check if collection exists
-                try:
-                    await self.client.get_collection(self.collection_name)
-                except Exception:
-                    # Collection doesn't exist, create it
-                    distance_map = {
-                        'Cosine': Distance.COSINE,
-                        'Euclid': Distance.EUCLID,
-                        'Dot': Distance.DOT
-                    }
-                    
-                    await self.client.create_collection(
-                        collection_name=self.collection_name,
-                        vectors_config=VectorParams(
-                            size=self.vector_size,
-                            distance=distance_map.get(self.distance, Distance.COSINE)
-                        )
-                    )
-                    logger.info(f"Created Qdrant collection: {self.collection_name}")
+                # Create the collection, or reconcile its tuning if it exists
+                await self._ensure_collection(self.collection_name, self.collection_settings)
                 
                 self._connected = True
                 logger.info(f"Connected to Qdrant at {self.url}")
@@ -239,19 +267,7 @@ class QdrantAdapter(StorageAdapter):
                     logger.debug(f"Point {id} not found")
                     return None
                 
-                point = points[0]
-                result = {
-                    'id': str(point.id),
-                    'vector': point.vector,
-                    'content': point.payload.get('content') if point.payload else None,
-                    'metadata': point.payload.get('metadata', {}) if point.payload else {},
-                }
-                
-                # Add any additional payload fields
-                if point.payload:
-                    for key, value in point.payload.items():
-                        if key not in ['content', 'metadata']:
-                            result[key] = value
+                result = self._format_point(points[0])
                 
                 logger.debug(f"Retrieved point {id}")
                 return result
@@ -269,6 +285,8 @@ class QdrantAdapter(StorageAdapter):
             - limit: Maximum results (default: 10)
             - score_threshold: Minimum similarity score (default: 0.0)
             - filter: Dict of field-value pairs for metadata filtering
+            - with_vectors: Return stored vectors (default: False)
+            - payload_fields: Payload keys to return (default: all)
         
         Args:
             query: Search parameters
@@ -307,33 +325,24 @@ class QdrantAdapter(StorageAdapter):
                 # query a non-default collection (e.g., episodic vs semantic memory).
                 collection_name = query.get('collection_name', self.collection_name)
 
+                with_vectors = query.get('with_vectors', False)
+
                 # Perform search
                 results = await self.client.search(
                     collection_name=collection_name,
                     query_vector=vector,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_filter=search_filter
+                    query_filter=search_filter,
+                    search_params=self._search_params.get(collection_name),
+                    with_vectors=with_vectors,
+                    with_payload=self._payload_selector(query.get('payload_fields'))
                 )
                 
-                # Format results
-                formatted_results = []
-                for hit in results:
-                    result = {
-                        'id': str(hit.id),
-                        'vector': hit.vector,
-                        'content': hit.payload.get('content') if hit.payload else None,
-                        'metadata': hit.payload.get('metadata', {}) if hit.payload else {},
-                        'score': hit.score
-                    }
-                    
-                    # Add any additional payload fields
-                    if hit.payload:
-                        for key, value in hit.payload.items():
-                            if key not in ['content', 'metadata']:
-                                result[key] = value
-                    
-                    formatted_results.append(result)
+                formatted_results = [
+                    self._format_point(hit, with_vectors, score=hit.score)
+                    for hit in results
+                ]
                 
                 logger.debug(f"Search returned {len(formatted_results)} results")
                 return formatted_results
@@ -342,6 +351,112 @@ class QdrantAdapter(StorageAdapter):
                 logger.error(f"Qdrant search failed: {e}", exc_info=True)
                 raise StorageQueryError(f"Failed to search Qdrant: {e}") from e
 
+    async def search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several similarity searches in one request per collection.
+        
+        Each query accepts the same keys as search() (vector/query_vector,
+        limit, score_threshold, filter, with_vectors, payload_fields,
+        collection_name). Queries targeting the same collection are sent
+        together through Qdrant's batch query API.
+        
+        Args:
+            queries: Search parameter dicts
+        
+        Returns:
+            One result list per query, in input order, formatted like search()
+        
+        Raises:
+            StorageConnectionError: If not connected
+            StorageDataError: If a query has no vector
+            StorageQueryError: If the batch request fails
+        """
+        async with OperationTimer(self.metrics, 'search_batch'):
+            if not self._connected or not self.client:
+                raise StorageConnectionError("Not connected to Qdrant")
+            
+            if not queries:
+                return []
+            
+            normalized = []
+            for query in queries:
+                if 'vector' not in query and 'query_vector' in query:
+                    query = {**query, 'vector': query['query_vector']}
+                validate_required_fields(query, ['vector'])
+                normalized.append(query)
+            
+            # Group positions by target collection (one round trip each)
+            by_collection: Dict[str, List[int]] = {}
+            for position, query in enumerate(normalized):
+                collection_name = query.get('collection_name', self.collection_name)
+                by_collection.setdefault(collection_name, []).append(position)
+            
+            results: List[List[Dict[str, Any]]] = [[] for _ in normalized]
+            try:
+                for collection_name, positions in by_collection.items():
+                    batch = [normalized[position] for position in positions]
+                    hits_per_query = await self._search_batch_request(collection_name, batch)
+                    for position, query, hits in zip(positions, batch, hits_per_query):
+                        with_vectors = query.get('with_vectors', False)
+                        results[position] = [
+                            self._format_point(hit, with_vectors, score=hit.score)
+                            for hit in hits
+                        ]
+            except Exception as e:
+                logger.error(f"Qdrant batch search failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Failed to batch search Qdrant: {e}") from e
+            
+            logger.debug(f"Batch search ran {len(normalized)} queries")
+            return results
+
+    async def _search_batch_request(
+        self,
+        collection_name: str,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[Any]]:
+        """Send one batch request, using the query API when the client has it."""
+        def build_filter(query: Dict[str, Any]) -> Optional[Filter]:
+            if query.get('filter') is None:
+                return None
+            return self._build_qdrant_filter(query['filter'])
+        
+        if hasattr(self.client, 'query_batch_points'):
+            requests = [
+                models.QueryRequest(
+                    query=query['vector'],
+                    filter=build_filter(query),
+                    params=self._search_params.get(collection_name),
+                    limit=query.get('limit', 10),
+                    score_threshold=query.get('score_threshold', 0.0),
+                    with_vector=query.get('with_vectors', False),
+                    with_payload=self._payload_selector(query.get('payload_fields'))
+                )
+                for query in queries
+            ]
+            responses = await self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=requests
+            )
+            return [response.points for response in responses]
+        
+        # Older clients only expose the batch search API
+        requests = [
+            models.SearchRequest(
+                vector=query['vector'],
+                filter=build_filter(query),
+                params=self._search_params.get(collection_name),
+                limit=query.get('limit', 10),
+                score_threshold=query.get('score_threshold', 0.0),
+                with_vector=query.get('with_vectors', False),
+                with_payload=self._payload_selector(query.get('payload_fields'))
+            )
+            for query in queries
+        ]
+        return await self.client.search_batch(
+            collection_name=collection_name,
+            requests=requests
+        )
+
     async def delete(self, id: str) -> bool:
         """
         Delete a single vector by ID.
@@ -424,23 +539,10 @@ class QdrantAdapter(StorageAdapter):
                 )
                 
                 # Format results to match search() output format
-                formatted_results = []
-                for point in points:
-                    result = {
-                        'id': str(point.id),
-                        'vector': point.vector if with_vectors else None,
-                        'content': point.payload.get('content') if point.payload else None,
-                        'metadata': point.payload.get('metadata', {}) if point.payload else {},
-                        'score': None  # No similarity score for scroll
-                    }
-                    
-                    # Add any additional payload fields
-                    if point.payload:
-                        for key, value in point.payload.items():
-                            if key not in ['content', 'metadata']:
-                                result[key] = value
-                    
-                    formatted_results.append(result)
+                formatted_results = [
+                    self._format_point(point, with_vectors, score=None)
+                    for point in points
+                ]
                 
                 logger.debug(f"Scroll returned {len(formatted_results)} results from {target_collection}")
                 return formatted_results
@@ -449,6 +551,111 @@ class QdrantAdapter(StorageAdapter):
                 logger.error(f"Qdrant scroll failed: {e}", exc_info=True)
                 raise StorageQueryError(f"Failed to scroll Qdrant: {e}") from e
 
+    async def iter_scroll(
+        self,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        with_vectors: bool = False,
+        payload_fields: Optional[Sequence[str]] = None,
+        collection_name: Optional[str] = None,
+        max_points: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every point matching a filter, page by page.
+        
+        Follows the `next_offset` cursor Qdrant returns, so only one page
+        (`page_size` points) is held in memory at a time.
+        
+        Args:
+            filter_dict: Filter conditions (e.g., {'session_id': 'xyz'})
+            page_size: Points fetched per scroll request
+            with_vectors: Include vectors in results
+            payload_fields: Payload keys to return (default: all)
+            collection_name: Override default collection name
+            max_points: Stop after this many points (default: no limit)
+            
+        Yields:
+            Points formatted like scroll() results
+            
+        Raises:
+            StorageConnectionError: If not connected
+            StorageQueryError: If a scroll request fails
+        """
+        if not self._connected or not self.client:
+            raise StorageConnectionError("Not connected to Qdrant")
+        
+        target_collection = collection_name or self.collection_name
+        scroll_filter = self._build_qdrant_filter(filter_dict) if filter_dict else None
+        with_payload = self._payload_selector(payload_fields)
+        offset = None
+        yielded = 0
+        
+        while True:
+            limit = page_size
+            if max_points is not None:
+                limit = min(page_size, max_points - yielded)
+                if limit <= 0:
+                    return
+            
+            async with OperationTimer(self.metrics, 'scroll'):
+                try:
+                    points, next_offset = await self.client.scroll(
+                        collection_name=target_collection,
+                        scroll_filter=scroll_filter,
+                        limit=limit,
+                        offset=offset,
+                        with_payload=with_payload,
+                        with_vectors=with_vectors
+                    )
+                except Exception as e:
+                    logger.error(f"Qdrant scroll failed: {e}", exc_info=True)
+                    raise StorageQueryError(f"Failed to scroll Qdrant: {e}") from e
+            
+            for point in points:
+                yield self._format_point(point, with_vectors, score=None)
+            yielded += len(points)
+            
+            if next_offset is None or not points:
+                return
+            offset = next_offset
+
+    @staticmethod
+    def _payload_selector(payload_fields: Optional[Sequence[str]]) -> Union[bool, List[str]]:
+        """Translate a payload projection into Qdrant's `with_payload` value."""
+        if payload_fields is None:
+            return True
+        return list(payload_fields)
+
+    @staticmethod
+    def _format_point(
+        point: Any,
+        with_vectors: bool = True,
+        score: Any = _NO_SCORE
+    ) -> Dict[str, Any]:
+        """
+        Convert a Qdrant point/hit into the adapter's result dict.
+        
+        Args:
+            point: Record or ScoredPoint from the client
+            with_vectors: Whether the vector was requested
+            score: Similarity score to include (omitted when not given)
+        """
+        payload = point.payload or {}
+        result = {
+            'id': str(point.id),
+            'vector': point.vector if with_vectors else None,
+            'content': payload.get('content'),
+            'metadata': payload.get('metadata', {}),
+        }
+        if score is not _NO_SCORE:
+            result['score'] = score
+        
+        # Add any additional payload fields
+        for key, value in payload.items():
+            if key not in ('content', 'metadata'):
+                result[key] = value
+        return result
+
     def _build_qdrant_filter(self, filter_dict: Dict[str, Any]) -> Optional[Filter]:
         """
         Build a Qdrant Filter from a dictionary specification.
@@ -663,7 +870,12 @@ class QdrantAdapter(StorageAdapter):
             logger.error(f"Qdrant batch store failed: {e}", exc_info=True)
             raise StorageQueryError(f"Failed to batch store in Qdrant: {e}") from e
     
-    async def retrieve_batch(self, ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    async def retrieve_batch(
+        self,
+        ids: List[str],
+        with_vectors: bool = False,
+        payload_fields: Optional[Sequence[str]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
         """
         Retrieve multiple vectors by their IDs in a single operation.
         
@@ -671,6 +883,8 @@ class QdrantAdapter(StorageAdapter):
         
         Args:
             ids: List of point identifiers
+            with_vectors: Return stored vectors (default: False)
+            payload_fields: Payload keys to return (default: all)
         
         Returns:
             List of data dictionaries (None for not found items)
@@ -689,33 +903,20 @@ class QdrantAdapter(StorageAdapter):
             # Retrieve all points at once
             points = await self.client.retrieve(
                 collection_name=self.collection_name,
-                ids=ids
+                ids=ids,
+                with_vectors=with_vectors,
+                with_payload=self._payload_selector(payload_fields)
             )
             
             # Create a mapping of ID to point for quick lookup
             points_map = {str(point.id): point for point in points}
             
             # Return results in same order as input IDs
-            results = []
-            for id in ids:
-                if id in points_map:
-                    point = points_map[id]
-                    result = {
-                        'id': str(point.id),
-                        'vector': point.vector,
-                        'content': point.payload.get('content') if point.payload else None,
-                        'metadata': point.payload.get('metadata', {}) if point.payload else {},
-                    }
-                    
-                    # Add any additional payload fields
-                    if point.payload:
-                        for key, value in point.payload.items():
-                            if key not in ['content', 'metadata']:
-                                result[key] = value
-                        
-                        results.append(result)
-                    else:
-                        results.append(None)
+            results = [
+                self._format_point(points_map[str(id)], with_vectors)
+                if str(id) in points_map else None
+                for id in ids
+            ]
             
             logger.debug(f"Retrieved {len([r for r in results if r])} of {len(ids)} vectors in batch")
             return results
@@ -887,9 +1088,15 @@ class QdrantAdapter(StorageAdapter):
         """
         Create a new collection with the specified configuration.
         
+        If the collection already exists its payload indexes and tuning are
+        reconciled against the configuration instead.
+        
         Args:
             name: Name of the collection to create
             config: Configuration dictionary with vector parameters
+                ('vectors') and optional tuning keys ('payload_indexes',
+                'extra_payload_indexes', 'hnsw', 'on_disk_payload',
+                'quantization') overriding the adapter's defaults
             
         Returns:
             True if collection was created, False if it already exists
@@ -901,38 +1108,170 @@ class QdrantAdapter(StorageAdapter):
         if not self._connected or not self.client:
             raise StorageConnectionError("Not connected to Qdrant")
         
+        settings = self._collection_settings(config or {}, base=self.collection_settings)
+        try:
+            return await self._ensure_collection(name, settings, vectors=(config or {}).get('vectors'))
+        except Exception as e:
+            logger.error(f"Failed to create collection {name}: {e}", exc_info=True)
+            raise StorageQueryError(f"Failed to create collection {name}: {e}") from e
+    
+    @staticmethod
+    def _collection_settings(
+        config: Dict[str, Any],
+        base: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Merge collection tuning keys from a config over base settings."""
+        settings = dict(base) if base else {
+            'payload_indexes': dict(DEFAULT_PAYLOAD_INDEXES),
+            'hnsw': None,
+            'on_disk_payload': None,
+            'quantization': None,
+        }
+        if 'payload_indexes' in config:
+            settings['payload_indexes'] = dict(config['payload_indexes'] or {})
+        if config.get('extra_payload_indexes'):
+            settings['payload_indexes'] = {
+                **settings['payload_indexes'],
+                **config['extra_payload_indexes']
+            }
+        for key in ('hnsw', 'on_disk_payload', 'quantization'):
+            if key in config:
+                settings[key] = config[key]
+        
+        unknown = set(settings['payload_indexes'].values()) - set(_PAYLOAD_SCHEMA_TYPES)
+        if unknown:
+            raise StorageDataError(f"Unsupported payload index types: {', '.join(sorted(unknown))}")
+        return settings
+    
+    async def _ensure_collection(
+        self,
+        name: str,
+        settings: Dict[str, Any],
+        vectors: Optional[Any] = None
+    ) -> bool:
+        """
+        Create a collection with tuning, or reconcile an existing one.
+        
+        Returns:
+            True if the collection was created
+        """
+        self._search_params[name] = self._build_search_params(settings)
+        
         try:
+            info = await self.client.get_collection(name)
+        except Exception:
+            info = None
+        
+        if info is not None:
             try:
-                await self.client.get_collection(name)
-                return False
-            except Exception:
-                # Collection doesn't exist, proceed with creation
-                pass
-
-            if config and 'vectors' in config:
-                vectors_config = config['vectors']
-            else:
-                distance_map = {
-                    'Cosine': Distance.COSINE,
-                    'Euclid': Distance.EUCLID,
-                    'Dot': Distance.DOT
-                }
-                vectors_config = VectorParams(
-                    size=self.vector_size,
-                    distance=distance_map.get(self.distance, Distance.COSINE)
+                await self._reconcile_collection(name, settings, info)
+            except Exception as e:
+                # Tuning is an optimization; an existing collection stays usable
+                logger.warning(f"Failed to reconcile Qdrant collection {name}: {e}")
+            return False
+        
+        if vectors is None:
+            vectors = VectorParams(
+                size=self.vector_size,
+                distance=_DISTANCE_MAP.get(self.distance, Distance.COSINE)
+            )
+        
+        create_args: Dict[str, Any] = {}
+        if settings['hnsw']:
+            create_args['hnsw_config'] = models.HnswConfigDiff(**settings['hnsw'])
+        if settings['on_disk_payload'] is not None:
+            create_args['on_disk_payload'] = settings['on_disk_payload']
+        quantization_config = self._build_quantization_config(settings['quantization'])
+        if quantization_config is not None:
+            create_args['quantization_config'] = quantization_config
+        
+        await self.client.create_collection(
+            collection_name=name,
+            vectors_config=vectors,
+            **create_args
+        )
+        await self._create_payload_indexes(name, settings['payload_indexes'])
+        
+        logger.info(f"Created Qdrant collection: {name}")
+        return True
+    
+    async def _reconcile_collection(self, name: str, settings: Dict[str, Any], info: Any) -> None:
+        """Bring an existing collection's indexes and tuning in line with settings."""
+        payload_schema = getattr(info, 'payload_schema', None)
+        existing = set(payload_schema) if isinstance(payload_schema, dict) else set()
+        missing = {
+            field: schema for field, schema in settings['payload_indexes'].items()
+            if field not in existing
+        }
+        await self._create_payload_indexes(name, missing)
+        
+        collection_config = getattr(info, 'config', None)
+        update_args: Dict[str, Any] = {}
+        
+        hnsw = settings['hnsw']
+        if hnsw:
+            current = getattr(collection_config, 'hnsw_config', None)
+            if any(getattr(current, key, None) != value for key, value in hnsw.items()):
+                update_args['hnsw_config'] = models.HnswConfigDiff(**hnsw)
+        
+        on_disk_payload = settings['on_disk_payload']
+        if on_disk_payload is not None:
+            params = getattr(collection_config, 'params', None)
+            if getattr(params, 'on_disk_payload', None) != on_disk_payload:
+                update_args['collection_params'] = models.CollectionParamsDiff(
+                    on_disk_payload=on_disk_payload
                 )
-
-            await self.client.create_collection(
+        
+        quantization_config = self._build_quantization_config(settings['quantization'])
+        if quantization_config is not None:
+            current = getattr(collection_config, 'quantization_config', None)
+            if current != quantization_config:
+                update_args['quantization_config'] = quantization_config
+        
+        if update_args:
+            await self.client.update_collection(collection_name=name, **update_args)
+            logger.info(f"Reconciled Qdrant collection {name}: {', '.join(sorted(update_args))}")
+    
+    async def _create_payload_indexes(self, name: str, indexes: Dict[str, str]) -> None:
+        """Create payload indexes (field name -> schema type name)."""
+        for field_name, schema in indexes.items():
+            await self.client.create_payload_index(
                 collection_name=name,
-                vectors_config=vectors_config
+                field_name=field_name,
+                field_schema=_PAYLOAD_SCHEMA_TYPES[schema],
+                wait=True
             )
-
-            logger.info(f"Created Qdrant collection: {name}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to create collection {name}: {e}", exc_info=True)
-            raise StorageQueryError(f"Failed to create collection {name}: {e}") from e
+            logger.debug(f"Created {schema} payload index on {name}.{field_name}")
+    
+    @staticmethod
+    def _build_quantization_config(
+        quantization: Optional[Dict[str, Any]]
+    ) -> Optional[models.ScalarQuantization]:
+        """Build int8 scalar quantization from settings (None when disabled)."""
+        if not quantization:
+            return None
+        if quantization.get('type', 'int8') != 'int8':
+            raise StorageDataError(f"Unsupported quantization type: {quantization['type']}")
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=quantization.get('quantile', 0.99),
+                always_ram=quantization.get('always_ram', True)
+            )
+        )
+    
+    @staticmethod
+    def _build_search_params(settings: Dict[str, Any]) -> Optional[models.SearchParams]:
+        """Search params rescoring quantized candidates with original vectors."""
+        quantization = settings.get('quantization')
+        if not quantization or not quantization.get('rescore', True):
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=quantization.get('oversampling', 2.0)
+            )
+        )
     
     async def update_collection(self, name: str, config: Dict[str, Any]) -> bool:
         """
@@ -76,12 +76,20 @@ class TypesenseAdapter(StorageAdapter):
         ```
     """
     
+    # Typesense caps documents per page and searches per multi_search request
+    MAX_PER_PAGE = 250
+    DEFAULT_MULTI_SEARCH_LIMIT = 50
+    # Keep filter_by (sent as a query parameter) well under common URL limits
+    DEFAULT_MAX_FILTER_LENGTH = 4000
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.url = config.get('url', '').rstrip('/')
         self.api_key = config.get('api_key')
         self.collection_name = config.get('collection_name', 'declarative_memory')
         self.schema = config.get('schema')
+        self.multi_search_limit = config.get('multi_search_limit', self.DEFAULT_MULTI_SEARCH_LIMIT)
+        self.max_filter_length = config.get('max_filter_length', self.DEFAULT_MAX_FILTER_LENGTH)
         self.client: Optional[httpx.AsyncClient] = None
         
         if not self.url or not self.api_key:
@@ -288,7 +296,11 @@ class TypesenseAdapter(StorageAdapter):
     
     # Batch operations (optimized for Typesense)
     
-    async def store_batch(self, items: List[Dict[str, Any]]) -> List[str]:
+    async def store_batch(
+        self,
+        items: List[Dict[str, Any]],
+        collection_name: Optional[str] = None
+    ) -> List[str]:
         """
         Index multiple documents in a single batch operation.
         
@@ -297,9 +309,12 @@ class TypesenseAdapter(StorageAdapter):
         
         Args:
             items: List of document data dictionaries
+            collection_name: Target collection (defaults to the adapter's)
         
         Returns:
-            List of document IDs in same order as input
+            IDs of the documents Typesense accepted, in input order.
+            Documents it rejected (one `{"success": false}` line each in
+            the import response) are logged and left out.
         
         Raises:
             StorageConnectionError: If not connected
@@ -328,8 +343,9 @@ class TypesenseAdapter(StorageAdapter):
                 for doc in documents
             )
             
+            collection = collection_name or self.collection_name
             response = await self.client.post(
-                f"{self.url}/collections/{self.collection_name}/documents/import",
+                f"{self.url}/collections/{collection}/documents/import",
                 content=import_data,
                 headers={
                     'Content-Type': 'text/plain'
@@ -337,8 +353,10 @@ class TypesenseAdapter(StorageAdapter):
             )
             await self._raise_for_status(response)
             
-            logger.debug(f"Indexed {len(documents)} documents in batch")
-            return ids
+            results = self._import_results(ids, response, 'store')
+            stored = [id for id in ids if results[str(id)]]
+            logger.debug(f"Indexed {len(stored)} of {len(documents)} documents in batch")
+            return stored
             
         except httpx.HTTPStatusError as e:
             logger.error(f"Typesense batch store failed: {e}", exc_info=True)
@@ -347,15 +365,142 @@ class TypesenseAdapter(StorageAdapter):
             logger.error(f"Typesense batch store failed: {e}", exc_info=True)
             raise StorageQueryError(f"Batch store failed: {e}") from e
     
-    async def retrieve_batch(self, ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    async def update_partial(
+        self,
+        id: str,
+        fields: Dict[str, Any],
+        collection_name: Optional[str] = None
+    ) -> bool:
+        """
+        Update selected fields of one document with a PATCH request.
+        
+        Only the given fields are sent; the rest of the document is left
+        as indexed.
+        
+        Args:
+            id: Document identifier
+            fields: Field values to set
+            collection_name: Target collection (defaults to the adapter's)
+        
+        Returns:
+            True if updated, False if the document does not exist
+        
+        Raises:
+            StorageConnectionError: If not connected
+            StorageQueryError: If the update fails
+        """
+        async with OperationTimer(self.metrics, 'update_partial'):
+            if not self._connected or not self.client:
+                raise StorageConnectionError("Not connected to Typesense")
+            
+            collection = collection_name or self.collection_name
+            try:
+                response = await self.client.patch(
+                    f"{self.url}/collections/{collection}/documents/{id}",
+                    json=fields
+                )
+                if response.status_code == 404:
+                    return False
+                await self._raise_for_status(response)
+                return True
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    return False
+                logger.error(f"Typesense partial update failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Partial update failed: {e}") from e
+            except Exception as e:
+                logger.error(f"Typesense partial update failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Partial update failed: {e}") from e
+    
+    @staticmethod
+    def _import_results(ids: List[Any], response: httpx.Response, action: str) -> Dict[str, bool]:
+        """
+        Per-document status of a `documents/import` request.
+        
+        Typesense answers an import with one JSON status line per input
+        line, in input order, even when the request as a whole succeeds.
+        Rejected documents are logged; a missing status line counts as a
+        failure.
+        """
+        lines = [line for line in response.text.splitlines() if line.strip()]
+        results: Dict[str, bool] = {}
+        for index, id in enumerate(ids):
+            status = json.loads(lines[index]) if index < len(lines) else {'error': 'no import status'}
+            results[str(id)] = bool(status.get('success'))
+            if not status.get('success'):
+                logger.warning(f"Typesense {action} of {id} failed: {status.get('error')}")
+        return results
+    
+    async def update_many(
+        self,
+        updates: List[Dict[str, Any]],
+        collection_name: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """
+        Partially update many documents in one import request.
+        
+        Sends JSONL to `documents/import?action=update`, so each line only
+        carries the fields being changed.
+        
+        Args:
+            updates: Field dicts, each including the document 'id'
+            collection_name: Target collection (defaults to the adapter's)
+        
+        Returns:
+            Dictionary mapping IDs to update status (False for documents
+            Typesense rejected, e.g. because they do not exist)
+        
+        Raises:
+            StorageConnectionError: If not connected
+            StorageDataError: If an update has no 'id'
+            StorageQueryError: If the request fails
+        """
+        async with OperationTimer(self.metrics, 'update_many'):
+            if not self._connected or not self.client:
+                raise StorageConnectionError("Not connected to Typesense")
+            
+            if not updates:
+                return {}
+            
+            for update in updates:
+                validate_required_fields(update, ['id'])
+            
+            collection = collection_name or self.collection_name
+            try:
+                response = await self.client.post(
+                    f"{self.url}/collections/{collection}/documents/import",
+                    params={'action': 'update'},
+                    content='\n'.join(json.dumps(update) for update in updates),
+                    headers={'Content-Type': 'text/plain'}
+                )
+                await self._raise_for_status(response)
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Typesense batch update failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Batch update failed: {e}") from e
+            except Exception as e:
+                logger.error(f"Typesense batch update failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Batch update failed: {e}") from e
+            
+            results = self._import_results([update['id'] for update in updates], response, 'update')
+            updated = sum(1 for ok in results.values() if ok)
+            logger.debug(f"Updated {updated} of {len(updates)} documents in batch")
+            return results
+    
+    async def retrieve_batch(
+        self,
+        ids: List[str],
+        collection_name: Optional[str] = None
+    ) -> List[Optional[Dict[str, Any]]]:
         """
         Retrieve multiple documents by their IDs.
         
-        Note: Typesense doesn't have a native batch retrieve endpoint,
-        so this uses the default implementation (sequential retrieves).
+        Uses a wildcard search with an `id:=[...]` filter, chunked so each
+        filter stays under `max_filter_length` characters and each page
+        under Typesense's per-page cap.
         
         Args:
             ids: List of document identifiers
+            collection_name: Target collection (defaults to the adapter's)
         
         Returns:
             List of data dictionaries (None for not found items)
@@ -364,9 +509,140 @@ class TypesenseAdapter(StorageAdapter):
             StorageConnectionError: If not connected
             StorageQueryError: If batch operation fails
         """
-        # Use default implementation from base class
-        # (Typesense doesn't have batch retrieve API)
-        return await super().retrieve_batch(ids)
+        async with OperationTimer(self.metrics, 'retrieve_batch'):
+            if not self._connected or not self.client:
+                raise StorageConnectionError("Not connected to Typesense")
+            
+            if not ids:
+                return []
+            
+            collection = collection_name or self.collection_name
+            found: Dict[str, Dict[str, Any]] = {}
+            try:
+                for chunk in self._chunk_ids(list(dict.fromkeys(ids))):
+                    response = await self.client.get(
+                        f"{self.url}/collections/{collection}/documents/search",
+                        params={
+                            'q': '*',
+                            'filter_by': self._id_filter(chunk),
+                            'per_page': len(chunk),
+                        }
+                    )
+                    await self._raise_for_status(response)
+                    result = await self._json(response)
+                    for hit in result.get('hits', []):
+                        document = hit['document']
+                        found[str(document['id'])] = document
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Typesense batch retrieve failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Batch retrieve failed: {e}") from e
+            except Exception as e:
+                logger.error(f"Typesense batch retrieve failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Batch retrieve failed: {e}") from e
+            
+            logger.debug(f"Retrieved {len(found)} of {len(ids)} documents in batch")
+            return [found.get(str(id)) for id in ids]
+    
+    async def multi_search(self, queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several searches in one request via `/multi_search`.
+        
+        Each query takes the same keys as search() (q, query_by, filter_by,
+        limit) plus optional sort_by and collection_name. Requests are split
+        only when they exceed `multi_search_limit` searches.
+        
+        Args:
+            queries: Search parameter dicts
+        
+        Returns:
+            Raw Typesense result per query ('hits', 'found', ...), in input
+            order; hit documents are under hit['document']
+        
+        Raises:
+            StorageConnectionError: If not connected
+            StorageDataError: If a query is missing q or query_by
+            StorageQueryError: If the request or any search fails
+        """
+        async with OperationTimer(self.metrics, 'multi_search'):
+            if not self._connected or not self.client:
+                raise StorageConnectionError("Not connected to Typesense")
+            
+            if not queries:
+                return []
+            
+            searches = []
+            for query in queries:
+                validate_required_fields(query, ['q', 'query_by'])
+                search = {
+                    'collection': query.get('collection_name', self.collection_name),
+                    'q': query['q'],
+                    'query_by': query['query_by'],
+                    'per_page': query.get('limit', 10),
+                }
+                for key in ('filter_by', 'sort_by'):
+                    if query.get(key):
+                        search[key] = query[key]
+                searches.append(search)
+            
+            results: List[Dict[str, Any]] = []
+            try:
+                for start in range(0, len(searches), self.multi_search_limit):
+                    response = await self.client.post(
+                        f"{self.url}/multi_search",
+                        json={'searches': searches[start:start + self.multi_search_limit]}
+                    )
+                    await self._raise_for_status(response)
+                    body = await self._json(response)
+                    results.extend(body.get('results', []))
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Typesense multi_search failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Multi search failed: {e}") from e
+            except Exception as e:
+                logger.error(f"Typesense multi_search failed: {e}", exc_info=True)
+                raise StorageQueryError(f"Multi search failed: {e}") from e
+            
+            # Individual searches fail inside a 200 response
+            for position, result in enumerate(results):
+                if 'error' in result:
+                    raise StorageQueryError(
+                        f"Multi search query {position} failed: {result['error']}"
+                    )
+            
+            return results
+    
+    def _chunk_ids(self, ids: List[str]) -> List[List[str]]:
+        """Split IDs so each `id:=[...]` filter fits the length and page caps."""
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        length = len("id:=[]")
+        for id in ids:
+            # Backtick-quoted value plus separator
+            item_length = len(str(id)) + 3
+            if current and (
+                length + item_length > self.max_filter_length
+                or len(current) >= self.MAX_PER_PAGE
+            ):
+                chunks.append(current)
+                current = []
+                length = len("id:=[]")
+            current.append(id)
+            length += item_length
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    @staticmethod
+    def _id_filter(ids: List[str]) -> str:
+        """Build an `id:=[...]` filter with backtick-quoted values."""
+        return "id:=[" + ",".join(f"`{id}`" for id in ids) + "]"
+    
+    @staticmethod
+    async def _json(response: httpx.Response) -> Any:
+        """Decode a JSON body (supports AsyncMock responses in tests)."""
+        json_result = response.json()
+        if asyncio.iscoroutine(json_result):
+            return await json_result
+        return json_result
     
     async def delete_batch(self, ids: List[str]) -> Dict[str, bool]:
         """
@@ -120,12 +120,21 @@ class LLMResponse:
 
 @dataclass
 class ProviderConfig:
-    """Configuration metadata used to prioritize and time-bound providers."""
+    """Configuration metadata used to prioritize and time-bound providers.
+
+    Connection settings (``pool_size``, ``keepalive_expiry``, ``http2``) are
+    applied by providers that own an async HTTP client; ``max_concurrency``
+    bounds in-flight calls per provider inside ``LLMClient`` (None = unbounded).
+    """
 
     name: str
     timeout: float = 15.0
     priority: int = 0
     enabled: bool = True
+    max_concurrency: Optional[int] = None
+    pool_size: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -161,6 +170,7 @@ class LLMClient:
         self.name = "llm-client"
         self._providers: Dict[str, BaseProvider] = {}
         self._configs: Dict[str, ProviderConfig] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
         if provider_configs:
             for config in provider_configs:
                 self._configs[config.name] = config
@@ -172,11 +182,16 @@ class LLMClient:
             self._configs[provider.name] = config
         elif provider.name not in self._configs:
             self._configs[provider.name] = ProviderConfig(name=provider.name)
+        self._semaphores.pop(provider.name, None)
+        max_concurrency = self._configs[provider.name].max_concurrency
+        if max_concurrency:
+            self._semaphores[provider.name] = asyncio.Semaphore(max_concurrency)
 
     def deregister_provider(self, name: str) -> None:
         """Remove a provider from future generation attempts."""
         self._providers.pop(name, None)
         self._configs.pop(name, None)
+        self._semaphores.pop(name, None)
 
     def available_providers(self) -> Sequence[str]:
         """Return the currently registered provider names."""
@@ -213,12 +228,14 @@ class LLMClient:
             if not provider or not config.enabled:
                 continue
             try:
-                coro = provider.generate(prompt, model=model, **kwargs)
-                response: LLMResponse
-                if asyncio.iscoroutine(coro):
-                    response = cast(LLMResponse, await asyncio.wait_for(coro, timeout=config.timeout))
+                semaphore = self._semaphores.get(provider_name)
+                if semaphore is not None:
+                    # Queue behind the provider's concurrency limit; the timeout
+                    # only covers the call itself
+                    async with semaphore:
+                        response = await self._call_provider(provider, config, prompt, model, **kwargs)
                 else:
-                    response = cast(LLMResponse, await asyncio.wait_for(asyncio.to_thread(lambda: coro), timeout=config.timeout))
+                    response = await self._call_provider(provider, config, prompt, model, **kwargs)
                 if not response.provider:
                     response.provider = provider_name
                 return response
@@ -229,6 +246,27 @@ class LLMClient:
 
         raise last_exc or RuntimeError("No healthy LLM provider available")
 
+    @staticmethod
+    async def _call_provider(
+        provider: BaseProvider,
+        config: ProviderConfig,
+        prompt: str,
+        model: Optional[str],
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Invoke a provider's generate() bounded by its configured timeout."""
+        coro = provider.generate(prompt, model=model, **kwargs)
+        if asyncio.iscoroutine(coro):
+            return cast(LLMResponse, await asyncio.wait_for(coro, timeout=config.timeout))
+        return cast(LLMResponse, await asyncio.wait_for(asyncio.to_thread(lambda: coro), timeout=config.timeout))
+
+    async def aclose(self) -> None:
+        """Close connection pools held by registered providers."""
+        for provider in self._providers.values():
+            close = getattr(provider, "aclose", None)
+            if close is not None:
+                await close()
+
     async def health_check(self) -> Dict[str, ProviderHealth]:
         """Return health reports for every registered provider."""
 
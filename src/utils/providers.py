@@ -2,69 +2,122 @@
 
 This file implements minimal wrappers that adapt provider SDKs to the BaseProvider
 interface to be used by the `LLMClient`.
+
+All providers use the SDKs' async clients, so concurrent calls from lifecycle
+engines overlap on the event loop instead of occupying worker threads. Each
+provider owns one pooled `httpx.AsyncClient` (explicit pool size, keep-alive,
+HTTP/2 when the `h2` package is installed) sized from its `ProviderConfig`.
 """
 
 from __future__ import annotations
 
-import asyncio
+import importlib.util
 import logging
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
+
+import httpx
 
-from .llm_client import BaseProvider, LLMResponse, ProviderHealth
+from .llm_client import BaseProvider, LLMResponse, ProviderConfig, ProviderHealth
 
 logger = logging.getLogger(__name__)
 
 
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def http_client_args(config: ProviderConfig) -> Dict[str, Any]:
+    """Build `httpx.AsyncClient` keyword arguments from a provider config."""
+    return {
+        "limits": httpx.Limits(
+            max_connections=config.pool_size,
+            max_keepalive_connections=config.pool_size,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        "timeout": httpx.Timeout(config.timeout),
+        "http2": config.http2 and _http2_available(),
+    }
+
+
+def build_async_http_client(config: ProviderConfig) -> httpx.AsyncClient:
+    """Create a pooled, keep-alive async HTTP client for one provider."""
+    return httpx.AsyncClient(**http_client_args(config))
+
+
+def _usage_from_openai_style(response: Any) -> Optional[Dict[str, Any]]:
+    usage = getattr(response, "usage", None)
+    if not usage:
+        return None
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", None),
+        "response_tokens": getattr(usage, "completion_tokens", None),
+        "total": getattr(usage, "total_tokens", None),
+    }
+
+
+def _text_from_openai_style(response: Any) -> str:
+    try:
+        return response.choices[0].message.content
+    except Exception:
+        return getattr(response, "text", "")
+
+
 class GeminiProvider(BaseProvider):
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, config: Optional[ProviderConfig] = None):
         super().__init__(name="gemini")
         from google import genai
-        self.client = genai.Client(api_key=api_key)
+        from google.genai import types
+
+        self.config = config or ProviderConfig(name=self.name)
+        http_options = None
+        # Older SDK releases manage their own async transport
+        http_options_cls = getattr(types, "HttpOptions", None)
+        if "async_client_args" in getattr(http_options_cls, "model_fields", {}):
+            http_options = http_options_cls(async_client_args=http_client_args(self.config))
+        if http_options is not None:
+            self.client = genai.Client(api_key=api_key, http_options=http_options)
+        else:
+            self.client = genai.Client(api_key=api_key)
 
     async def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
-        # Use thread to call blocking SDK functions
         from google.genai import types
 
         model = model or "gemini-3-flash-preview"
 
-        def sync_call():
-            # Build content
-            contents = [
-                types.Content(
-                    role="user",
-                    parts=[types.Part.from_text(text=prompt)],
-                )
-            ]
-            
-            # Build config parameters
-            config_params = {
-                "temperature": kwargs.get("temperature", 0.0),
-                "max_output_tokens": kwargs.get("max_output_tokens", 8192),
-            }
-            
-            # Add system instruction if provided
-            system_instruction = kwargs.get("system_instruction")
-            if system_instruction:
-                config_params["system_instruction"] = [
-                    types.Part.from_text(text=system_instruction)
-                ]
-            
-            # Add structured output if response_schema provided
-            response_schema = kwargs.get("response_schema")
-            if response_schema:
-                config_params["response_mime_type"] = "application/json"
-                config_params["response_schema"] = response_schema
-            
-            config = types.GenerateContentConfig(**config_params)
-            
-            response = self.client.models.generate_content(
-                model=model,
-                contents=contents,
-                config=config,
+        # Build content
+        contents = [
+            types.Content(
+                role="user",
+                parts=[types.Part.from_text(text=prompt)],
             )
-            return response
+        ]
+
+        # Build config parameters
+        config_params = {
+            "temperature": kwargs.get("temperature", 0.0),
+            "max_output_tokens": kwargs.get("max_output_tokens", 8192),
+        }
+
+        # Add system instruction if provided
+        system_instruction = kwargs.get("system_instruction")
+        if system_instruction:
+            config_params["system_instruction"] = [
+                types.Part.from_text(text=system_instruction)
+            ]
+
+        # Add structured output if response_schema provided
+        response_schema = kwargs.get("response_schema")
+        if response_schema:
+            config_params["response_mime_type"] = "application/json"
+            config_params["response_schema"] = response_schema
+
+        config = types.GenerateContentConfig(**config_params)
 
-        response = await asyncio.to_thread(sync_call)
+        response = await self.client.aio.models.generate_content(
+            model=model,
+            contents=contents,
+            config=config,
+        )
 
         usage = getattr(response, "usage_metadata", None)
         usage_dict = None
@@ -84,31 +137,27 @@ class GeminiProvider(BaseProvider):
         output_dimensionality: int = 768
     ) -> List[float]:
         """Generate embedding using Gemini embedding model.
-        
+
         Args:
             text: Text to embed.
             model: Embedding model name (default: gemini-embedding-001).
             output_dimensionality: Output vector dimension (default: 768).
                 Gemini supports 128-3072; recommended: 768, 1536, 3072.
-            
+
         Returns:
             List of floats representing the embedding vector.
         """
         from google.genai import types
-        
-        model = model or "gemini-embedding-001"
 
-        def sync_call():
-            response = self.client.models.embed_content(
-                model=model,
-                contents=text,
-                config=types.EmbedContentConfig(
-                    output_dimensionality=output_dimensionality
-                ),
-            )
-            return response
+        model = model or "gemini-embedding-001"
 
-        response = await asyncio.to_thread(sync_call)
+        response = await self.client.aio.models.embed_content(
+            model=model,
+            contents=text,
+            config=types.EmbedContentConfig(
+                output_dimensionality=output_dimensionality
+            ),
+        )
         logger.debug(
             "Gemini embedding generated: model=%s, dim=%d",
             model,
@@ -117,6 +166,36 @@ class GeminiProvider(BaseProvider):
         # Response structure: response.embeddings[0].values
         return list(response.embeddings[0].values)
 
+    async def get_embeddings(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        output_dimensionality: int = 768
+    ) -> List[List[float]]:
+        """Generate embeddings for several texts in one request.
+
+        Args:
+            texts: Texts to embed.
+            model: Embedding model name (default: gemini-embedding-001).
+            output_dimensionality: Output vector dimension (default: 768).
+
+        Returns:
+            One embedding per text, in input order.
+        """
+        from google.genai import types
+
+        model = model or "gemini-embedding-001"
+
+        response = await self.client.aio.models.embed_content(
+            model=model,
+            contents=list(texts),
+            config=types.EmbedContentConfig(
+                output_dimensionality=output_dimensionality
+            ),
+        )
+        logger.debug("Gemini batch embedding generated: model=%s, count=%d", model, len(texts))
+        return [list(embedding.values) for embedding in response.embeddings]
+
     async def health_check(self) -> ProviderHealth:
         """Attempt a lightweight call to verify Gemini connectivity.
 
@@ -126,129 +205,132 @@ class GeminiProvider(BaseProvider):
         """
         from google.genai import types
 
-        def sync_call():
+        try:
             # call a minimally expensive empty prompt (SDK may charge tokens; this is a pragmatic choice for health checks)
-            return self.client.models.generate_content(
+            await self.client.aio.models.generate_content(
                 model="gemini-3-flash-preview",
                 contents="Ping",
                 config=types.GenerateContentConfig(temperature=0.0, max_output_tokens=1),
             )
-
-        try:
-            await asyncio.to_thread(sync_call)
             return ProviderHealth(name=self.name, healthy=True, details="OK")
         except Exception as exc:
             logger.warning("Gemini health check failed: %s", exc)
             return ProviderHealth(name=self.name, healthy=False, last_error=str(exc))
 
+    async def aclose(self) -> None:
+        """Close the SDK's async transport when the SDK supports it."""
+        close = getattr(self.client.aio, "aclose", None)
+        if close is not None:
+            await close()
+
 
 class GroqProvider(BaseProvider):
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[ProviderConfig] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         super().__init__(name="groq")
-        from groq import Groq
-        self.client = Groq(api_key=api_key)
+        from groq import AsyncGroq
+
+        self.config = config or ProviderConfig(name=self.name)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or build_async_http_client(self.config)
+        self.client = AsyncGroq(api_key=api_key, http_client=self.http_client)
 
     async def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
         model = model or "llama-3.1-8b-instant"
 
-        def sync_call():
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=kwargs.get("temperature", 0.0),
-                max_tokens=kwargs.get("max_output_tokens", 256),
-            )
-            return response
-
-        response = await asyncio.to_thread(sync_call)
-
-        usage = getattr(response, "usage", None)
-        usage_dict = None
-        if usage:
-            usage_dict = {
-                "prompt_tokens": getattr(usage, "prompt_tokens", None),
-                "response_tokens": getattr(usage, "completion_tokens", None),
-                "total": getattr(usage, "total_tokens", None),
-            }
-
-        text = ""
-        try:
-            text = response.choices[0].message.content
-        except Exception:
-            text = getattr(response, "text", "")
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get("temperature", 0.0),
+            max_tokens=kwargs.get("max_output_tokens", 256),
+        )
 
-        return LLMResponse(text=text, provider=self.name, model=model, usage=usage_dict)
+        return LLMResponse(
+            text=_text_from_openai_style(response),
+            provider=self.name,
+            model=model,
+            usage=_usage_from_openai_style(response),
+        )
 
     async def health_check(self) -> ProviderHealth:
         try:
-            def sync_call():
-                # Minimal call to validate client
-                return self.client.chat.completions.create(
-                    model="llama-3.1-8b-instant",
-                    messages=[{"role": "user", "content": "Ping"}],
-                    temperature=0.0,
-                    max_tokens=1,
-                )
-
-            await asyncio.to_thread(sync_call)
+            # Minimal call to validate client
+            await self.client.chat.completions.create(
+                model="llama-3.1-8b-instant",
+                messages=[{"role": "user", "content": "Ping"}],
+                temperature=0.0,
+                max_tokens=1,
+            )
             return ProviderHealth(name=self.name, healthy=True, details="OK")
         except Exception as exc:
             logger.warning("Groq health check failed: %s", exc)
             return ProviderHealth(name=self.name, healthy=False, last_error=str(exc))
 
+    async def aclose(self) -> None:
+        """Close the connection pool if this provider created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
 
 class MistralProvider(BaseProvider):
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[ProviderConfig] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         super().__init__(name="mistral")
         from mistralai import Mistral
-        self.client = Mistral(api_key=api_key)
+
+        self.config = config or ProviderConfig(name=self.name)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or build_async_http_client(self.config)
+        self.client = Mistral(api_key=api_key, async_client=self.http_client)
 
     async def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> LLMResponse:
         model = model or "mistral-small-latest"
 
-        def sync_call():
-            response = self.client.chat.complete(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=kwargs.get("temperature", 0.0),
-                max_tokens=kwargs.get("max_output_tokens", 256),
-            )
-            return response
-
-        response = await asyncio.to_thread(sync_call)
-
-        usage = getattr(response, "usage", None)
-        usage_dict = None
-        if usage:
-            usage_dict = {
-                "prompt_tokens": getattr(usage, "prompt_tokens", None),
-                "response_tokens": getattr(usage, "completion_tokens", None),
-                "total": getattr(usage, "total_tokens", None),
-            }
-
-        text = ""
-        try:
-            text = response.choices[0].message.content
-        except Exception:
-            text = getattr(response, "text", "")
+        response = await self.client.chat.complete_async(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get("temperature", 0.0),
+            max_tokens=kwargs.get("max_output_tokens", 256),
+        )
 
-        return LLMResponse(text=text, provider=self.name, model=model, usage=usage_dict)
+        return LLMResponse(
+            text=_text_from_openai_style(response),
+            provider=self.name,
+            model=model,
+            usage=_usage_from_openai_style(response),
+        )
 
     async def health_check(self) -> ProviderHealth:
         try:
-            def sync_call():
-                return self.client.chat.complete(
-                    model="mistral-small-latest",
-                    messages=[{"role": "user", "content": "Ping"}],
-                    temperature=0.0,
-                    max_tokens=1,
-                )
-
-            await asyncio.to_thread(sync_call)
+            await self.client.chat.complete_async(
+                model="mistral-small-latest",
+                messages=[{"role": "user", "content": "Ping"}],
+                temperature=0.0,
+                max_tokens=1,
+            )
             return ProviderHealth(name=self.name, healthy=True, details="OK")
         except Exception as exc:
             logger.warning("Mistral health check failed: %s", exc)
             return ProviderHealth(name=self.name, healthy=False, last_error=str(exc))
 
+    async def aclose(self) -> None:
+        """Close the connection pool if this provider created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
 
-__all__ = ["GeminiProvider", "GroqProvider", "MistralProvider"]
+__all__ = [
+    "GeminiProvider",
+    "GroqProvider",
+    "MistralProvider",
+    "build_async_http_client",
+    "http_client_args",
+]
@@ -0,0 +1,96 @@
+"""
+Benchmark conflict detection in KnowledgeSynthesizer.
+
+Compares topic-grouped, precomputed-polarity detection against the previous
+all-pairs keyword rescan on 500 candidate recommendation documents.
+"""
+import random
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.memory.engines.knowledge_synthesizer import KnowledgeSynthesizer
+from src.memory.models import KnowledgeDocument
+from src.memory.tiers.semantic_memory_tier import SemanticMemoryTier
+from src.utils.providers import BaseProvider
+
+CANDIDATES = 500
+PORTS = ["USLAX", "DEHAM", "NLRTM", "SGSIN", "CNSHA", "USNYC", "BEANR", "JPTYO"]
+STATEMENTS = [
+    "Always verify reefer power connections before stacking.",
+    "Never stack reefers above tier three during storms.",
+    "Crews should pre-plan the loading sequence for mixed cargo.",
+    "Avoid double handling of hazardous containers at the quay.",
+    "Inspect seals on arrival and record the seal number.",
+]
+
+
+def _make_documents(count: int) -> list:
+    rng = random.Random(42)
+    return [
+        KnowledgeDocument(
+            knowledge_id=f"know_{i:04d}",
+            knowledge_type="recommendation",
+            title=f"Recommendation {i}",
+            content=rng.choice(STATEMENTS) + " " + "Operational detail. " * 20,
+            category=rng.choice(["handling", "safety", "planning"]),
+            metadata={"port_code": rng.choice(PORTS)},
+        )
+        for i in range(count)
+    ]
+
+
+def _all_pairs_baseline(documents: list) -> int:
+    """Previous O(n^2 * len) behaviour: rescan both texts for every pair."""
+    negative_words = ["not", "don't", "avoid", "never", "shouldn't", "cannot"]
+    positive_words = ["should", "must", "recommend", "always", "can", "enable"]
+    found = 0
+    for i, doc1 in enumerate(documents):
+        for doc2 in documents[i + 1:]:
+            t1, t2 = doc1.content.lower(), doc2.content.lower()
+            neg1 = any(w in t1 for w in negative_words)
+            pos1 = any(w in t1 for w in positive_words)
+            neg2 = any(w in t2 for w in negative_words)
+            pos2 = any(w in t2 for w in positive_words)
+            if (neg1 and pos2) or (pos1 and neg2):
+                found += 1
+    return found
+
+
+@pytest.mark.benchmark
+def test_conflict_detection_500_candidates():
+    """Grouped detection on 500 candidates should beat the all-pairs scan."""
+    documents = _make_documents(CANDIDATES)
+    provider = MagicMock(spec=BaseProvider)
+    provider.name = "bench_provider"
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=MagicMock(spec=SemanticMemoryTier),
+        llm_provider=provider,
+        metrics_enabled=False,
+    )
+    synthesizer.conflict_group_by = ("category", "port_code")
+
+    start = time.perf_counter()
+    conflicts = synthesizer._detect_conflicts(documents)
+    grouped_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _all_pairs_baseline(documents)
+    baseline_time = time.perf_counter() - start
+
+    print(f"\nCandidates: {CANDIDATES}, conflicts: {len(conflicts)}")
+    print(f"Grouped + precomputed: {grouped_time * 1000:.2f}ms")
+    print(f"All-pairs rescan:      {baseline_time * 1000:.2f}ms")
+    print(f"Speedup: {baseline_time / grouped_time:.1f}x")
+
+    # Every reported pair shares a topic key
+    for conflict in conflicts:
+        first, second = (
+            next(d for d in documents if d.knowledge_id == doc_id)
+            for doc_id in conflict["doc_ids"]
+        )
+        assert first.category == second.category
+        assert first.metadata["port_code"] == second.metadata["port_code"]
+
+    assert grouped_time < baseline_time
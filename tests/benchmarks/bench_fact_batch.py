@@ -0,0 +1,74 @@
+"""
+Benchmark columnar FactBatch against per-row Fact models.
+
+Builds, filters, sorts and time-clusters 5,000 working_memory rows, once as
+validated Fact models and once as a FactBatch.
+"""
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.memory.fact_batch import FactBatch
+from src.memory.models import Fact
+
+ROWS = 5_000
+WINDOW_HOURS = 24
+
+
+def _make_rows(count: int) -> list:
+    rng = random.Random(42)
+    base = datetime.now(timezone.utc) - timedelta(days=7)
+    return [
+        {
+            "fact_id": f"fact_{i:05d}",
+            "session_id": f"session_{i % 20}",
+            "content": f"Container MSCU{i:07d} moved to yard block {rng.choice('ABCDEF')}",
+            "ciar_score": rng.random(),
+            "certainty": rng.random(),
+            "impact": rng.random(),
+            "extracted_at": base + timedelta(minutes=rng.randint(0, 7 * 24 * 60)),
+            "metadata": '{"source": "bench"}',
+        }
+        for i in range(count)
+    ]
+
+
+def _models_baseline(rows: list) -> list:
+    """Previous behaviour: validate every row, then filter/sort/cluster models."""
+    facts = [Fact(**{**row, "metadata": json.loads(row["metadata"])}) for row in rows]
+    facts = sorted((f for f in facts if f.ciar_score >= 0.3), key=lambda f: f.extracted_at)
+    clusters, current = [], [facts[0]]
+    for fact in facts[1:]:
+        if (fact.extracted_at - current[0].extracted_at).total_seconds() / 3600 <= WINDOW_HOURS:
+            current.append(fact)
+        else:
+            clusters.append(current)
+            current = [fact]
+    clusters.append(current)
+    return clusters
+
+
+@pytest.mark.benchmark
+def test_fact_batch_5k_rows():
+    """Columnar build/filter/cluster should beat per-row model validation."""
+    rows = _make_rows(ROWS)
+
+    start = time.perf_counter()
+    baseline = _models_baseline(rows)
+    model_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = FactBatch.from_rows(rows)
+    clusters = batch.filter(batch.ciar_score >= 0.3).cluster_by_time(WINDOW_HOURS * 3600)
+    batch_time = time.perf_counter() - start
+
+    print(f"\nRows: {ROWS}, clusters: {len(clusters)}")
+    print(f"Fact models: {model_time * 1000:.2f}ms")
+    print(f"FactBatch:   {batch_time * 1000:.2f}ms")
+    print(f"Speedup: {model_time / batch_time:.1f}x")
+
+    assert [c.fact_ids for c in clusters] == [[f.fact_id for f in c] for c in baseline]
+    assert batch_time < model_time
@@ -0,0 +1,77 @@
+"""
+Benchmark cross-tier result fusion.
+
+Fuses 600 candidates (200 per tier; every other L3 episode was consolidated
+from three of the returned L2 facts)
+with each ranker and reports the per-call cost of scoring, de-duplication
+and top-k selection.
+"""
+import random
+import time
+
+import pytest
+
+from src.memory.ranking import CandidateSet, MinMaxPriorFusion, ReciprocalRankFusion, RelevanceWeightedFusion
+
+PER_TIER = 200
+ROUNDS = 200
+WEIGHTS = {"L2": 0.3, "L3": 0.5, "L4": 0.2}
+
+
+def _make_tier_results(per_tier: int) -> dict:
+    rng = random.Random(42)
+    facts = [
+        {
+            "content": f"Fact {i} about container MAEU{i:07d}",
+            "relevance": rng.random() * 0.1,
+            "prior": rng.random(),
+            "metadata": {"fact_id": f"fact_{i}"},
+        }
+        for i in range(per_tier)
+    ]
+    episodes = [
+        {
+            "content": f"Episode {i} summary",
+            "relevance": rng.random(),
+            "prior": rng.random(),
+            "metadata": {
+                "episode_id": f"ep_{i}",
+                # Consolidation partitions facts, so source sets are disjoint
+                "source_fact_ids": [f"fact_{j}" for j in range(3 * i, 3 * i + 3)] if i % 2 else [],
+            },
+        }
+        for i in range(per_tier)
+    ]
+    documents = [
+        {
+            "content": f"Knowledge document {i}",
+            "relevance": rng.randrange(10**6, 10**9),
+            "prior": rng.random(),
+            "metadata": {"knowledge_id": f"know_{i}"},
+        }
+        for i in range(per_tier)
+    ]
+    return {"L2": facts, "L3": episodes, "L4": documents}
+
+
+@pytest.mark.benchmark
+def test_fusion_600_candidates():
+    """Fusing a few hundred candidates should take well under a millisecond."""
+    tier_results = _make_tier_results(PER_TIER)
+
+    start = time.perf_counter()
+    candidates = CandidateSet.from_tiers(tier_results)
+    build_time = time.perf_counter() - start
+    print(f"\nCandidates: {len(candidates)}, build: {build_time * 1e6:.0f}us")
+
+    for ranker in (RelevanceWeightedFusion(), ReciprocalRankFusion(), MinMaxPriorFusion()):
+        ranked = ranker.rank(candidates, WEIGHTS, limit=10)
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            ranker.rank(candidates, WEIGHTS, limit=10)
+        per_call = (time.perf_counter() - start) / ROUNDS
+        print(f"{ranker.name:>10}: {per_call * 1e6:.0f}us per fusion")
+
+        assert len(ranked) == 10
+        assert [r["score"] for r in ranked] == sorted((r["score"] for r in ranked), reverse=True)
+        assert per_call < 0.005
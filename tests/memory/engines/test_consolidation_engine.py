@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timezone, timedelta
 from src.memory.engines.consolidation_engine import ConsolidationEngine
+from src.memory.fact_batch import FactBatch
 from src.memory.tiers.working_memory_tier import WorkingMemoryTier
 from src.memory.tiers.episodic_memory_tier import EpisodicMemoryTier
 from src.memory.models import Fact, Episode, FactType, FactCategory
@@ -12,6 +15,10 @@ from src.utils.llm_client import LLMResponse, ProviderHealth
 def mock_l2():
     tier = MagicMock(spec=WorkingMemoryTier)
     tier.query_by_session = AsyncMock()
+    tier.claim_unconsolidated = AsyncMock()
+    tier.count_unconsolidated = AsyncMock(return_value=0)
+    tier.mark_consolidated = AsyncMock(side_effect=lambda fact_ids, episode_id: len(fact_ids))
+    tier.release_claims = AsyncMock(side_effect=lambda fact_ids: len(fact_ids))
     tier.health_check = AsyncMock(return_value={"status": "healthy"})
     return tier
 
@@ -66,7 +73,7 @@ def sample_facts():
 @pytest.mark.asyncio
 async def test_process_session_success(engine, mock_l2, mock_l3, mock_gemini, sample_facts):
     # Mock L2 to return facts
-    mock_l2.query_by_session.return_value = [f.model_dump() for f in sample_facts]
+    mock_l2.claim_unconsolidated.return_value = FactBatch.from_rows([f.model_dump() for f in sample_facts])
     
     # Mock Gemini LLM response
     mock_gemini.generate.return_value = LLMResponse(
@@ -97,7 +104,7 @@ async def test_process_no_session_id(engine):
 
 @pytest.mark.asyncio
 async def test_process_no_facts(engine, mock_l2):
-    mock_l2.query_by_session.return_value = []
+    mock_l2.claim_unconsolidated.return_value = FactBatch.from_rows([])
     
     stats = await engine.process(session_id="session-123")
     
@@ -141,6 +148,203 @@ async def test_clustering_multiple_windows(engine):
     # Should have 2 clusters (0-15h and 30-45h)
     assert len(clusters) == 2
 
+
+def _window_facts(count, topics=None):
+    now = datetime.now(timezone.utc)
+    return [
+        Fact(
+            fact_id=f"fact-{i}",
+            session_id="session-123",
+            content=f"Test fact {i}",
+            topic_segment_id=topics[i] if topics else None,
+            extracted_at=now - timedelta(minutes=count - i)
+        )
+        for i in range(count)
+    ]
+
+def _clustering_engine(mock_l2, mock_l3, mock_gemini, **config):
+    return ConsolidationEngine(
+        l2_tier=mock_l2,
+        l3_tier=mock_l3,
+        gemini_provider=mock_gemini,
+        config={"time_window_hours": 24, **config}
+    )
+
+@pytest.mark.asyncio
+async def test_clustering_splits_topics_within_window(mock_l2, mock_l3, mock_gemini):
+    engine = _clustering_engine(mock_l2, mock_l3, mock_gemini, min_cluster_size=2)
+    facts = _window_facts(6, topics=["crane", "berth", "crane", "berth", "crane", "berth"])
+
+    clusters = engine._cluster_facts(FactBatch.from_facts(facts))
+
+    assert [c.fact_ids for c in clusters] == [
+        ["fact-0", "fact-2", "fact-4"],
+        ["fact-1", "fact-3", "fact-5"],
+    ]
+
+@pytest.mark.asyncio
+async def test_clustering_groups_untagged_facts_together(mock_l2, mock_l3, mock_gemini):
+    engine = _clustering_engine(mock_l2, mock_l3, mock_gemini, min_cluster_size=1)
+    facts = _window_facts(4, topics=["crane", None, "crane", None])
+
+    clusters = engine._cluster_facts(FactBatch.from_facts(facts))
+
+    assert [c.fact_ids for c in clusters] == [["fact-0", "fact-2"], ["fact-1", "fact-3"]]
+
+@pytest.mark.asyncio
+async def test_clustering_bounds_cluster_sizes(mock_l2, mock_l3, mock_gemini):
+    engine = _clustering_engine(mock_l2, mock_l3, mock_gemini, min_cluster_size=3, max_cluster_size=4)
+    topics = ["crane"] * 10 + ["berth"]
+    facts = _window_facts(11, topics=topics)
+
+    clusters = engine._cluster_facts(FactBatch.from_facts(facts))
+
+    # The lone 'berth' fact joins a crane chunk; 11 facts need 3 chunks of <= 4
+    assert sorted(len(c) for c in clusters) == [3, 4, 4]
+    assert sum(c.fact_ids.count("fact-10") for c in clusters) == 1
+
+@pytest.mark.asyncio
+async def test_process_fetches_once_and_reports_clustering_time(mock_l2, mock_l3, mock_gemini):
+    engine = ConsolidationEngine(
+        l2_tier=mock_l2,
+        l3_tier=mock_l3,
+        gemini_provider=mock_gemini,
+        config={"time_window_hours": 24, "max_cluster_size": 2}
+    )
+    mock_l2.claim_unconsolidated.return_value = FactBatch.from_facts(_window_facts(4))
+    mock_gemini.generate.return_value = LLMResponse(
+        text='{"summary": "Crane status updates", "narrative": "Cranes were discussed."}', provider="gemini"
+    )
+    mock_gemini.get_embedding.return_value = [0.1] * 768
+
+    stats = await engine.process(session_id="session-123")
+
+    mock_l2.claim_unconsolidated.assert_awaited_once()
+    assert mock_l2.claim_unconsolidated.call_args.kwargs["session_id"] == "session-123"
+    mock_l2.query_by_session.assert_not_called()
+    assert stats["clusters"] == 2
+    assert stats["episodes_created"] == 2
+    assert stats["clustering_ms"] >= 0
+
+    # Each stored episode marks exactly its own facts consolidated
+    marked = [c.args[0] for c in mock_l2.mark_consolidated.call_args_list]
+    assert marked == [["fact-0", "fact-1"], ["fact-2", "fact-3"]]
+    assert stats["facts_consolidated"] == 4
+
+@pytest.mark.asyncio
+async def test_failed_episode_releases_claimed_facts(engine, mock_l2, mock_l3, mock_gemini, sample_facts):
+    mock_l2.claim_unconsolidated.return_value = FactBatch.from_facts(sample_facts)
+    mock_gemini.generate.return_value = LLMResponse(
+        text='{"summary": "Crane status updates", "narrative": "Cranes were discussed."}', provider="gemini"
+    )
+    mock_gemini.get_embedding.return_value = [0.1] * 768
+    mock_l3.store.side_effect = ConnectionError("neo4j down")
+
+    stats = await engine.process(session_id="session-123")
+
+    assert stats["errors"] == 1
+    assert stats["facts_consolidated"] == 0
+    mock_l2.mark_consolidated.assert_not_called()
+    # The claim is released so a later run can retry the facts
+    mock_l2.release_claims.assert_awaited_once()
+    assert sorted(mock_l2.release_claims.call_args.args[0]) == ["fact-0", "fact-1", "fact-2"]
+
+@pytest.mark.asyncio
+async def test_recovery_sweep_pages_backlog_by_session(mock_l2, mock_l3, mock_gemini):
+    engine = ConsolidationEngine(
+        l2_tier=mock_l2,
+        l3_tier=mock_l3,
+        gemini_provider=mock_gemini,
+        config={"batch_size": 2}
+    )
+    facts = _window_facts(3)
+    facts[1].session_id = "session-456"
+    mock_l2.claim_unconsolidated.side_effect = [
+        FactBatch.from_facts(facts[:2]),
+        FactBatch.from_facts(facts[2:]),
+    ]
+    mock_gemini.generate.return_value = LLMResponse(
+        text='{"summary": "Crane status updates", "narrative": "Cranes were discussed."}', provider="gemini"
+    )
+    mock_gemini.get_embedding.return_value = [0.1] * 768
+
+    stats = await engine.run_recovery_sweep()
+
+    # A full page continues after its last fact; a short page ends the sweep
+    cursors = [c.kwargs["after_fact_id"] for c in mock_l2.claim_unconsolidated.call_args_list]
+    assert cursors == [None, "fact-1"]
+    assert stats["facts_found"] == 3
+    assert stats["sessions_processed"] == 3
+    assert stats["facts_consolidated"] == 3
+    assert stats["episodes_created"] == 3
+
+class _ClaimingL2:
+    """In-memory L2 with the tier's claim semantics."""
+
+    def __init__(self, facts):
+        self.facts = {fact.fact_id: fact for fact in facts}
+        self.claimed = set()
+        self.consolidated = {}
+
+    async def claim_unconsolidated(self, session_id=None, limit=100, after_fact_id=None):
+        ids = sorted(self.facts)
+        if after_fact_id is not None:
+            ids = [fact_id for fact_id in ids if fact_id > after_fact_id]
+        page = [
+            fact_id for fact_id in ids
+            if fact_id not in self.claimed and fact_id not in self.consolidated
+            and session_id in (None, self.facts[fact_id].session_id)
+        ][:limit]
+        self.claimed.update(page)
+        # Let the concurrent run proceed between claiming and consolidating
+        await asyncio.sleep(0)
+        return FactBatch.from_facts([self.facts[fact_id] for fact_id in page])
+
+    async def mark_consolidated(self, fact_ids, episode_id):
+        for fact_id in fact_ids:
+            assert fact_id not in self.consolidated, f"{fact_id} consolidated twice"
+            self.consolidated[fact_id] = episode_id
+        self.claimed.difference_update(fact_ids)
+        return len(fact_ids)
+
+    async def release_claims(self, fact_ids):
+        self.claimed.difference_update(fact_ids)
+        return len(fact_ids)
+
+@pytest.mark.asyncio
+async def test_concurrent_sweep_and_session_run_never_share_facts(mock_l3, mock_gemini):
+    l2 = _ClaimingL2(_window_facts(6))
+    engine = ConsolidationEngine(
+        l2_tier=l2,
+        l3_tier=mock_l3,
+        gemini_provider=mock_gemini,
+        config={"batch_size": 3, "fetch_limit": 3, "min_cluster_size": 1}
+    )
+    mock_gemini.generate.return_value = LLMResponse(
+        text='{"summary": "Crane status updates", "narrative": "Cranes were discussed."}', provider="gemini"
+    )
+    mock_gemini.get_embedding.return_value = [0.1] * 768
+
+    sweep, session = await asyncio.gather(
+        engine.run_recovery_sweep(),
+        engine.process_session("session-123")
+    )
+
+    stored = [fact_id for c in mock_l3.store.call_args_list for fact_id in c.args[0]["episode"].source_fact_ids]
+    assert sorted(stored) == sorted(l2.facts)
+    assert sweep["facts_consolidated"] + session["facts_consolidated"] == 6
+    assert sweep["errors"] == session["errors"] == 0
+
+@pytest.mark.asyncio
+async def test_pressure_valve_triggers_sweep(engine, mock_l2):
+    mock_l2.count_unconsolidated.return_value = engine.pressure_valve_threshold
+    mock_l2.claim_unconsolidated.return_value = FactBatch.from_rows([])
+
+    await engine._handle_promotion_event({"session_id": "session-123", "data": '{"fact_count": 5}'})
+
+    assert mock_l2.count_unconsolidated.call_args.kwargs["limit"] == engine.pressure_valve_threshold
+    mock_l2.claim_unconsolidated.assert_awaited_once()
+
 @pytest.mark.asyncio
 async def test_health_check(engine):
     health = await engine.health_check()
@@ -189,3 +393,28 @@ async def test_embedding_generation(engine, mock_gemini):
     mock_gemini.get_embedding.assert_called_once()
     call_args = mock_gemini.get_embedding.call_args
     assert "Test summary" in call_args[1]["text"]
+
+@pytest.mark.asyncio
+async def test_process_session_publishes_consolidation_event(mock_l2, mock_l3, mock_gemini, sample_facts):
+    producer = MagicMock()
+    producer.publish = AsyncMock(return_value="1-0")
+    engine = ConsolidationEngine(
+        l2_tier=mock_l2,
+        l3_tier=mock_l3,
+        gemini_provider=mock_gemini,
+        config={"time_window_hours": 24},
+        stream_producer=producer
+    )
+    mock_l2.claim_unconsolidated.return_value = FactBatch.from_rows([f.model_dump() for f in sample_facts])
+    mock_gemini.generate.return_value = LLMResponse(
+        text='{"summary": "User preferences discussed", "narrative": "The user shared their preferences."}',
+        provider="gemini"
+    )
+    mock_gemini.get_embedding.return_value = [0.1] * 768
+
+    stats = await engine.process(session_id="session-123")
+
+    assert stats["episodes_created"] == 1
+    producer.publish.assert_awaited_once_with(
+        "consolidation", "session-123", {"episodes_created": 1}
+    )
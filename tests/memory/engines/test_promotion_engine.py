@@ -5,6 +5,7 @@ Tests the refactored PromotionEngine that implements ADR-003's
 batch compression strategy using TopicSegmenter.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from src.memory.engines.promotion_engine import PromotionEngine
@@ -30,6 +31,7 @@ def mock_l1():
 def mock_l2():
     """Mock L2 Working Memory tier."""
     tier = MagicMock(spec=WorkingMemoryTier)
+    tier.ciar_threshold = 0.6
     tier.store = AsyncMock()
     tier.health_check = AsyncMock(return_value={"status": "healthy"})
     return tier
@@ -56,6 +58,7 @@ def mock_scorer():
     """Mock CIARScorer."""
     scorer = MagicMock(spec=CIARScorer)
     scorer.calculate = MagicMock()
+    scorer.calculate_batch = MagicMock()
     return scorer
 
 
@@ -186,7 +189,7 @@ async def test_process_session_batch_success(
     mock_extractor.extract_facts.side_effect = [[fact1], [fact2]]
     
     # Mock Scorer returns high scores for both facts
-    mock_scorer.calculate.side_effect = [0.85, 0.90]
+    mock_scorer.calculate_batch.side_effect = [np.array([0.85]), np.array([0.90])]
     
     stats = await engine.process(session_id="123")
     
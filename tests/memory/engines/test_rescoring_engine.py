@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.memory.engines.rescoring_engine import RescoringEngine
+from src.memory.tiers.working_memory_tier import WorkingMemoryTier
+
+@pytest.fixture
+def mock_l2():
+    tier = MagicMock(spec=WorkingMemoryTier)
+    tier.rescore_decay = AsyncMock(return_value={'scanned': 3, 'updated': 2, 'chunks': 1})
+    tier.health_check = AsyncMock(return_value={"status": "healthy"})
+    return tier
+
+@pytest.mark.asyncio
+async def test_process_runs_one_pass(mock_l2):
+    engine = RescoringEngine(mock_l2, config={'chunk_size': 500})
+
+    stats = await engine.process()
+
+    mock_l2.rescore_decay.assert_awaited_once_with(session_id=None, chunk_size=500)
+    assert stats['updated'] == 2
+    assert stats['errors'] == 0
+    assert engine.last_run is stats
+
+@pytest.mark.asyncio
+async def test_process_failure_is_reported(mock_l2):
+    mock_l2.rescore_decay.side_effect = ConnectionError("postgres down")
+    engine = RescoringEngine(mock_l2)
+
+    stats = await engine.process()
+
+    assert stats['errors'] == 1
+    assert stats['scanned'] == 0
+
+@pytest.mark.asyncio
+async def test_scheduled_passes_until_stopped(mock_l2):
+    engine = RescoringEngine(mock_l2, config={'interval_seconds': 0.01})
+
+    await engine.start()
+    await asyncio.sleep(0.05)
+    await engine.stop()
+    passes = mock_l2.rescore_decay.await_count
+    await asyncio.sleep(0.03)
+
+    assert passes >= 2
+    assert mock_l2.rescore_decay.await_count == passes
+    health = await engine.health_check()
+    assert health['status'] == "healthy"
+    assert health['running'] is False
@@ -8,11 +8,15 @@ Author: MAS Memory Layer Team
 Date: November 2025
 """
 
+import dataclasses
+import os
 import pytest
 import math
+import numpy as np
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
-from src.memory.ciar_scorer import CIARScorer
+from src.memory.ciar_scorer import CIARScorer, get_ciar_scorer, reload_ciar_config
 from src.memory.models import Fact
 
 
@@ -525,3 +529,180 @@ class TestCIARScorerEdgeCases:
         impact_mixed = scorer._calculate_impact(fact_mixed)
         
         assert impact_upper == impact_lower == impact_mixed
+
+
+class TestCIARScorerBatch:
+    """Test vectorized batch scoring."""
+    
+    @pytest.fixture
+    def scorer(self):
+        return CIARScorer()
+    
+    def test_batch_matches_single_scores(self, scorer):
+        """Batch scores should equal calculate() for every fact"""
+        now = datetime.now(timezone.utc)
+        facts = [
+            {'content': 'I prefer morning deliveries', 'fact_type': 'preference',
+             'created_at': (now - timedelta(days=3)).isoformat(), 'access_count': 12},
+            {'content': 'It might rain, crews always carry gear', 'fact_type': 'EVENT', 'is_important': True},
+            {'content': 'Observed crane 3 is usually slow', 'impact': 0.3,
+             'created_at': now - timedelta(days=400)},
+            {'content': 'Explicit', 'certainty': 1.4, 'access_count': 3},
+            {},
+            Fact(fact_id='f1', session_id='s1', content='maybe', fact_type='preference', access_count=3),
+            Fact(fact_id='f2', session_id='s1', content='Berth 7 closed', impact=0.2),
+        ]
+        
+        scores = scorer.calculate_batch(facts, now=now)
+        
+        assert scores.shape == (len(facts),)
+        for fact, score in zip(facts, scores):
+            assert score == pytest.approx(scorer.calculate(fact))
+    
+    def test_heuristics_follow_priority_order(self, scorer):
+        """The highest-priority phrase wins regardless of position"""
+        certainty = scorer.calculate_components_batch([
+            {'content': 'Maybe, but I always check'},
+            {'content': 'They usually noticed it'},
+            {'content': 'Could have been seen'},
+            {'content': 'Nothing notable'},
+        ])['certainty']
+        
+        heuristics = scorer.certainty_heuristics
+        assert certainty.tolist() == pytest.approx([
+            heuristics['explicit_statement'],
+            heuristics['implied_preference'],
+            heuristics['speculation'],
+            scorer.default_certainty,
+        ])
+    
+    def test_columnar_input(self, scorer):
+        """NumPy columns should score without fact objects"""
+        columns = {
+            'certainty': np.array([0.9, np.nan]),
+            'content': ['', 'I need a crane'],
+            'impact': np.array([0.8, 0.5]),
+            'age_seconds': np.array([86400.0 * 2, np.nan]),
+            'access_count': np.array([0, 4]),
+        }
+        
+        components = scorer.calculate_components_batch(columns)
+        
+        assert components['certainty'].tolist() == pytest.approx(
+            [0.9, scorer.certainty_heuristics['explicit_statement']]
+        )
+        assert components['age_decay'][0] == pytest.approx(math.exp(-scorer.age_decay_lambda * 2))
+        assert components['age_decay'][1] == 1.0
+        assert components['recency_boost'][1] == pytest.approx(
+            1.0 + min(scorer.recency_boost_factor * math.log(5), scorer.max_recency_boost)
+        )
+        assert scorer.calculate_batch(columns).tolist() == pytest.approx(components['final_score'].tolist())
+    
+    def test_empty_batch(self, scorer):
+        """Empty input should return an empty array"""
+        assert scorer.calculate_batch([]).shape == (0,)
+
+
+class TestCIARScorerReload:
+    """Test the shared scorer registry and config hot reload."""
+    
+    CONFIG = """
+ciar:
+  threshold: {threshold}
+  age_decay:
+    lambda: 0.1
+    max_age_days: 30
+    min_score: 0.1
+  recency:
+    boost_factor: 0.05
+    max_boost: 0.3
+  certainty:
+    default: 0.7
+  impact_weights:
+    preference: 0.9
+"""
+    
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        path = tmp_path / "ciar_config.yaml"
+        path.write_text(self.CONFIG.format(threshold=0.6))
+        return path
+    
+    def _rewrite(self, path, content):
+        # Force a new mtime even on filesystems with coarse timestamps
+        stat = path.stat()
+        path.write_text(content)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    def test_registry_shares_one_instance(self, config_path):
+        """Same config file should always yield the same scorer"""
+        assert get_ciar_scorer(config_path) is get_ciar_scorer(str(config_path))
+        assert get_ciar_scorer() is get_ciar_scorer()
+        assert get_ciar_scorer() is not get_ciar_scorer(config_path)
+    
+    def test_reload_when_file_changes(self, config_path):
+        """An edited config file should be swapped in on the next check"""
+        scorer = get_ciar_scorer(config_path)
+        before = scorer.config_snapshot
+        assert scorer.reload_if_changed(force_check=True) is False
+        
+        self._rewrite(config_path, self.CONFIG.format(threshold=0.75))
+        
+        assert scorer.reload_if_changed(force_check=True) is True
+        assert scorer.threshold == 0.75
+        # The previous snapshot is untouched
+        assert before.threshold == 0.6
+    
+    def test_held_scorer_reloads_on_use(self, config_path):
+        """A scorer kept by a long-lived consumer should pick up edits when scoring"""
+        scorer = CIARScorer(config_path=str(config_path), reload_interval=0.0)
+        fact = {'content': 'User prefers morning meetings', 'fact_type': 'preference', 'certainty': 0.9}
+        assert scorer.calculate(fact) == pytest.approx(0.81)
+        
+        self._rewrite(config_path, self.CONFIG.replace('preference: 0.9', 'preference: 0.5').format(threshold=0.75))
+        
+        # No get_ciar_scorer() call in between
+        assert scorer.calculate(fact) == pytest.approx(0.45)
+        assert scorer.threshold == 0.75
+        assert scorer.reloads == 1
+        
+        self._rewrite(config_path, self.CONFIG.format(threshold=0.6))
+        assert scorer.calculate_batch([fact]).tolist() == pytest.approx([0.81])
+    
+    def test_reload_check_on_use_is_throttled(self, config_path):
+        """Scoring should stat the config file at most once per interval"""
+        scorer = CIARScorer(config_path=str(config_path), reload_interval=3600.0)
+        self._rewrite(config_path, self.CONFIG.format(threshold=0.75))
+        
+        with patch('src.memory.ciar_scorer.os.stat') as stat:
+            scorer.calculate({'content': 'x', 'fact_type': 'preference'})
+            assert scorer.threshold == 0.6
+            stat.assert_not_called()
+    
+    def test_invalid_file_keeps_current_config(self, config_path):
+        """A broken edit should be logged and the old config kept"""
+        scorer = CIARScorer(config_path=str(config_path))
+        self._rewrite(config_path, "ciar: {threshold: 0.9}")
+        
+        assert scorer.reload_if_changed(force_check=True) is False
+        assert scorer.threshold == 0.6
+        assert scorer.reload_errors == 1
+    
+    def test_explicit_reload(self, config_path):
+        """reload_ciar_config should reload the shared scorer"""
+        scorer = get_ciar_scorer(config_path)
+        config_path.write_text(self.CONFIG.format(threshold=0.8))
+        
+        config = reload_ciar_config(config_path)
+        
+        assert config is scorer.config_snapshot
+        assert scorer.threshold == 0.8
+    
+    def test_config_is_immutable(self):
+        """Config snapshots should not be modifiable in place"""
+        config = CIARScorer().config_snapshot
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.threshold = 0.1
+        with pytest.raises(TypeError):
+            config.impact_weights['preference'] = 0.1
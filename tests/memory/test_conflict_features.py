@@ -0,0 +1,80 @@
+"""
+Tests for precomputed conflict-detection features.
+"""
+
+import numpy as np
+
+from src.memory.conflict_features import (
+    POLARITY_NEGATIVE,
+    POLARITY_POSITIVE,
+    compute_polarity,
+    contradictory_pairs,
+    group_by_topic,
+    is_contradictory,
+    topic_key,
+)
+from src.memory.models import KnowledgeDocument
+
+
+def test_compute_polarity():
+    assert compute_polarity("Always verify seals") == POLARITY_POSITIVE
+    assert compute_polarity("Never stack reefers") == POLARITY_NEGATIVE
+    assert compute_polarity("Weather report only") == 0
+    # Substring semantics: "cannot" carries both bits
+    assert compute_polarity("Cranes cannot lift") == POLARITY_NEGATIVE | POLARITY_POSITIVE
+
+
+def test_is_contradictory():
+    assert is_contradictory(POLARITY_POSITIVE, POLARITY_NEGATIVE)
+    assert not is_contradictory(POLARITY_POSITIVE, POLARITY_POSITIVE)
+    assert not is_contradictory(0, POLARITY_NEGATIVE)
+
+
+def test_contradictory_pairs_matches_pairwise_check():
+    polarities = np.array([2, 1, 0, 3, 2], dtype=np.int8)
+    rows, cols = contradictory_pairs(polarities)
+
+    expected = [
+        (i, j)
+        for i in range(len(polarities))
+        for j in range(i + 1, len(polarities))
+        if is_contradictory(int(polarities[i]), int(polarities[j]))
+    ]
+    assert list(zip(rows.tolist(), cols.tolist())) == expected
+
+
+def test_group_by_topic_skips_singletons():
+    groups = group_by_topic([("a",), ("b",), ("a",), ("c",), ("b",)])
+    assert [g.tolist() for g in groups] == [[0, 2], [1, 4]]
+
+
+def test_topic_key_reads_attributes_then_metadata():
+    doc = KnowledgeDocument(
+        knowledge_id="k1",
+        title="Reefer handling",
+        content="Always check power supply.",
+        category="handling",
+        metadata={"port_code": "USLAX"},
+    )
+    assert topic_key(doc, ("category", "port_code", "terminal_id")) == (
+        "handling", "USLAX", None
+    )
+
+
+def test_knowledge_document_polarity_precomputed_and_persisted():
+    doc = KnowledgeDocument(
+        knowledge_id="k1",
+        title="Reefer handling",
+        content="Never disconnect reefers.",
+    )
+    assert doc.polarity == POLARITY_NEGATIVE
+    assert doc.to_typesense_document()["polarity"] == POLARITY_NEGATIVE
+
+    # Stored polarity is trusted on load
+    loaded = KnowledgeDocument(
+        knowledge_id="k1",
+        title="Reefer handling",
+        content="Never disconnect reefers.",
+        polarity=POLARITY_POSITIVE,
+    )
+    assert loaded.polarity == POLARITY_POSITIVE
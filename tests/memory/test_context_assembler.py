@@ -0,0 +1,181 @@
+"""
+Tests for token-budgeted, incremental context assembly.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.memory.context_assembler import CharsPerTokenTokenizer, ContextAssembler, resolve_tokenizer
+from src.memory.generations import SessionGenerations
+from src.memory.models import Episode, Fact
+from src.memory.tiers.active_context_tier import ActiveContextTier
+from src.memory.tiers.episodic_memory_tier import EpisodicMemoryTier
+from src.memory.tiers.working_memory_tier import WorkingMemoryTier
+
+
+def _turns(count):
+    # L1 returns the newest turn first
+    return [
+        {'turn_id': f't{i}', 'role': 'user' if i % 2 else 'assistant', 'content': f'Turn number {i} content'}
+        for i in reversed(range(count))
+    ]
+
+
+def _facts(count):
+    return [
+        Fact(fact_id=f'f{i}', session_id='s1', content=f'Fact {i} about berth {i}', ciar_score=0.9 - i * 0.01)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def l1_tier():
+    tier = AsyncMock(spec=ActiveContextTier)
+    tier.retrieve.return_value = _turns(4)
+    return tier
+
+
+@pytest.fixture
+def l2_tier():
+    tier = AsyncMock(spec=WorkingMemoryTier)
+
+    async def query_by_session(session_id, min_ciar_score=None, limit=100):
+        return _facts(30)[:limit]
+
+    tier.query_by_session.side_effect = query_by_session
+    return tier
+
+
+@pytest.fixture
+def l3_tier():
+    tier = AsyncMock(spec=EpisodicMemoryTier)
+    now = datetime.now(timezone.utc)
+    tier.query.return_value = [
+        Episode(
+            episode_id='e1',
+            session_id='s1',
+            summary='Crane outage episode',
+            time_window_start=now,
+            time_window_end=now,
+            fact_valid_from=now,
+            source_observation_timestamp=now
+        )
+    ]
+    return tier
+
+
+@pytest.mark.asyncio
+async def test_fills_budget_in_priority_order(l1_tier, l2_tier, l3_tier):
+    assembler = ContextAssembler(l1_tier=l1_tier, l2_tier=l2_tier, l3_tier=l3_tier)
+
+    block = await assembler.assemble('s1', token_budget=60)
+
+    assert block.estimated_tokens <= 60
+    assert block.turn_count == 4
+    # Turns are presented oldest first
+    assert [t['turn_id'] for t in block.recent_turns] == ['t0', 't1', 't2', 't3']
+    assert 0 < block.fact_count < 30
+    # Budget spent before L3: it is never read
+    l3_tier.query.assert_not_called()
+    prompt = block.to_prompt_string()
+    assert prompt.startswith('## Recent Conversation\n[ASSISTANT]: Turn number 0 content')
+    assert '## Key Facts (Working Memory)\n- Fact 0 about berth 0' in prompt
+    assert assembler.count_tokens(prompt) <= 60
+
+
+@pytest.mark.asyncio
+async def test_lower_tiers_fill_remaining_budget(l1_tier, l2_tier, l3_tier):
+    l2_tier.query_by_session.side_effect = None
+    l2_tier.query_by_session.return_value = _facts(2)
+    assembler = ContextAssembler(l1_tier=l1_tier, l2_tier=l2_tier, l3_tier=l3_tier)
+
+    block = await assembler.assemble('s1', token_budget=1000)
+
+    assert block.fact_count == 2
+    assert block.episode_summaries == ['Crane outage episode']
+    assert block.token_budget == 1000
+
+
+@pytest.mark.asyncio
+async def test_read_size_grows_only_while_items_fit(l2_tier):
+    assembler = ContextAssembler(l2_tier=l2_tier)
+
+    block = await assembler.assemble('s1', token_budget=100)
+
+    # Facts are smaller than the initial size guess, so reads grow until
+    # the budget is hit
+    limits = [call.kwargs['limit'] for call in l2_tier.query_by_session.call_args_list]
+    assert limits == [3, 6, 12, 24]
+    assert 12 < block.fact_count < 24
+    assert block.estimated_tokens <= 100
+
+
+@pytest.mark.asyncio
+async def test_new_turn_only_renders_new_item(l1_tier, l2_tier):
+    assembler = ContextAssembler(l1_tier=l1_tier, l2_tier=l2_tier)
+    first = await assembler.assemble('s1', token_budget=500)
+    tokenized = assembler.tokenized_items
+
+    l1_tier.retrieve.return_value = _turns(5)
+    second = await assembler.assemble('s1', token_budget=500)
+
+    assert assembler.tokenized_items == tokenized + 1
+    assert second.turn_count == first.turn_count + 1
+    # The facts section is reused unchanged
+    assert second.to_prompt_string().split('\n## Key Facts')[1] == first.to_prompt_string().split('\n## Key Facts')[1]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_session_served_without_reads(l1_tier, l2_tier):
+    generations = SessionGenerations()
+    assembler = ContextAssembler(l1_tier=l1_tier, l2_tier=l2_tier, generations=generations)
+
+    first = await assembler.assemble('s1', token_budget=500)
+    second = await assembler.assemble('s1', token_budget=500)
+    assert second.cache_hit and not first.cache_hit
+    assert l1_tier.retrieve.await_count == 1
+    assert second.to_prompt_string() == first.to_prompt_string()
+
+    await generations.bump('L1', 's1')
+    third = await assembler.assemble('s1', token_budget=500)
+    assert not third.cache_hit
+    assert l1_tier.retrieve.await_count == 2
+
+    await assembler.assemble('s1', token_budget=500, use_cache=False)
+    assert l1_tier.retrieve.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failing_tier_is_skipped(l1_tier, l2_tier):
+    l1_tier.retrieve.side_effect = ConnectionError('redis down')
+    assembler = ContextAssembler(l1_tier=l1_tier, l2_tier=l2_tier)
+
+    block = await assembler.assemble('s1', token_budget=500)
+
+    assert block.skipped_tiers == ['L1']
+    assert block.fact_count == 30
+
+
+class _WordEncoding:
+    def encode(self, text):
+        return text.split()
+
+
+def test_resolve_tokenizer():
+    assert isinstance(resolve_tokenizer(), CharsPerTokenTokenizer)
+    assert resolve_tokenizer(_WordEncoding()).count_tokens('three word text') == 3
+    assert resolve_tokenizer(lambda text: 7).count_tokens('anything') == 7
+    with pytest.raises(TypeError):
+        resolve_tokenizer(42)
+
+
+def test_tokenizer_failure_falls_back_to_heuristic():
+    def broken(text):
+        raise RuntimeError('tokenizer unavailable')
+
+    assembler = ContextAssembler(tokenizer=broken, chars_per_token=4.0)
+
+    assert assembler.count_tokens('12345678') == 2
+    assert assembler.tokenizer_errors > 0
@@ -21,6 +21,14 @@ def mock_episodic_tier():
     tier.health_check = AsyncMock(return_value={"status": "healthy"})
     tier.query_temporal = AsyncMock()
     tier.query = AsyncMock()
+
+    async def _count(filters=None):
+        # Mirror the pushed-down Cypher count over whatever query() returns
+        session_id = (filters or {}).get('session_id')
+        episodes = tier.query.return_value or []
+        return len([ep for ep in episodes if not session_id or ep.session_id == session_id])
+
+    tier.count = AsyncMock(side_effect=_count)
     return tier
 
 
@@ -29,7 +37,11 @@ def mock_semantic_tier():
     """Mock SemanticMemoryTier."""
     tier = MagicMock(spec=SemanticMemoryTier)
     tier.health_check = AsyncMock(return_value={"status": "healthy"})
-    tier.store = AsyncMock(return_value="doc_123")
+
+    async def _store_batch(docs):
+        return [doc.knowledge_id for doc in docs]
+
+    tier.store_batch = AsyncMock(side_effect=_store_batch)
     return tier
 
 
@@ -238,8 +250,41 @@ async def test_successful_distillation(
     # Should create documents for each knowledge type (5 types in default config)
     assert result["created_documents"] == 5
     
-    # Verify semantic tier was called for each document
-    assert mock_semantic_tier.store.call_count == 5
+    # Verify the whole run was stored with one batch call
+    mock_semantic_tier.store_batch.assert_awaited_once()
+    assert len(mock_semantic_tier.store_batch.call_args.args[0]) == 5
+    stored = mock_semantic_tier.store_batch.call_args.args[0]
+    assert [doc["id"] for doc in result["documents"]] == [doc.knowledge_id for doc in stored]
+
+
+@pytest.mark.asyncio
+async def test_rejected_documents_are_not_counted(
+    mock_episodic_tier,
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_episodes
+):
+    """Test documents the bulk import rejected are not reported as created."""
+    mock_episodic_tier.query.return_value = sample_episodes
+    
+    async def partial_store_batch(docs):
+        # The import accepted every other document
+        return [doc.knowledge_id for doc in docs[::2]]
+    
+    mock_semantic_tier.store_batch = AsyncMock(side_effect=partial_store_batch)
+    
+    engine = DistillationEngine(
+        episodic_tier=mock_episodic_tier,
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        episode_threshold=3
+    )
+    
+    result = await engine.process()
+    
+    stored = mock_semantic_tier.store_batch.call_args.args[0]
+    assert result["created_documents"] == 3
+    assert [doc["id"] for doc in result["documents"]] == [doc.knowledge_id for doc in stored[::2]]
 
 
 @pytest.mark.asyncio
@@ -263,6 +308,65 @@ async def test_session_filter(
     
     # Only 3 episodes belong to session_001
     assert result["processed_episodes"] == 3
+    mock_episodic_tier.count.assert_awaited_once_with({'session_id': 'session_001'})
+
+
+@pytest.mark.asyncio
+async def test_time_range_pushed_down(
+    mock_episodic_tier,
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_episodes
+):
+    """Test that time_range is passed to L3 filters instead of post-filtered."""
+    mock_episodic_tier.query.return_value = sample_episodes
+    time_range = (datetime(2025, 12, 20), datetime(2025, 12, 21))
+    
+    engine = DistillationEngine(
+        episodic_tier=mock_episodic_tier,
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        episode_threshold=3
+    )
+    
+    await engine.process(session_id="session_001", time_range=time_range)
+    
+    expected_filters = {'session_id': 'session_001', 'time_range': time_range}
+    mock_episodic_tier.count.assert_awaited_once_with(expected_filters)
+    assert mock_episodic_tier.query.call_args.kwargs['filters'] == expected_filters
+
+
+@pytest.mark.asyncio
+async def test_consolidation_events_trigger_incremental_distillation(
+    mock_episodic_tier,
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_episodes
+):
+    """Test that consolidation events accumulate per session and trigger at threshold."""
+    mock_episodic_tier.query.return_value = sample_episodes
+    
+    engine = DistillationEngine(
+        episodic_tier=mock_episodic_tier,
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        episode_threshold=3
+    )
+    
+    await engine._handle_consolidation_event(
+        {"session_id": "session_001", "data": '{"episodes_created": 2}'}
+    )
+    assert engine.get_pending_episode_count("session_001") == 2
+    mock_semantic_tier.store_batch.assert_not_called()
+    
+    await engine._handle_consolidation_event(
+        {"session_id": "session_001", "data": '{"episodes_created": 1}'}
+    )
+    
+    # Threshold reached: distillation ran without a count query and reset the counter
+    assert len(mock_semantic_tier.store_batch.call_args.args[0]) == 5
+    mock_episodic_tier.count.assert_not_called()
+    assert engine.get_pending_episode_count("session_001") == 0
 
 
 @pytest.mark.asyncio
@@ -277,11 +381,11 @@ async def test_metadata_extraction(
     
     # Track the stored documents
     stored_docs = []
-    async def capture_store(doc):
-        stored_docs.append(doc)
-        return f"doc_{len(stored_docs)}"
+    async def capture_store_batch(docs):
+        stored_docs.extend(docs)
+        return [doc.knowledge_id for doc in docs]
     
-    mock_semantic_tier.store = AsyncMock(side_effect=capture_store)
+    mock_semantic_tier.store_batch = AsyncMock(side_effect=capture_store_batch)
     
     engine = DistillationEngine(
         episodic_tier=mock_episodic_tier,
@@ -315,11 +419,11 @@ async def test_provenance_tracking(
     mock_episodic_tier.query.return_value = sample_episodes
     
     stored_docs = []
-    async def capture_store(doc):
-        stored_docs.append(doc)
-        return f"doc_{len(stored_docs)}"
+    async def capture_store_batch(docs):
+        stored_docs.extend(docs)
+        return [doc.knowledge_id for doc in docs]
     
-    mock_semantic_tier.store = AsyncMock(side_effect=capture_store)
+    mock_semantic_tier.store_batch = AsyncMock(side_effect=capture_store_batch)
     
     engine = DistillationEngine(
         episodic_tier=mock_episodic_tier,
@@ -419,11 +523,11 @@ async def test_multiple_knowledge_types(
     mock_episodic_tier.query.return_value = sample_episodes
     
     stored_docs = []
-    async def capture_store(doc):
-        stored_docs.append(doc)
-        return f"doc_{len(stored_docs)}"
+    async def capture_store_batch(docs):
+        stored_docs.extend(docs)
+        return [doc.knowledge_id for doc in docs]
     
-    mock_semantic_tier.store = AsyncMock(side_effect=capture_store)
+    mock_semantic_tier.store_batch = AsyncMock(side_effect=capture_store_batch)
     
     engine = DistillationEngine(
         episodic_tier=mock_episodic_tier,
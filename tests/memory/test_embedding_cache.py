@@ -0,0 +1,52 @@
+"""
+Tests for the shared embedding cache.
+"""
+
+import numpy as np
+import pytest
+
+from src.memory.embedding_cache import (
+    EmbeddingCache,
+    cosine_scores,
+    get_shared_embedding_cache,
+)
+
+
+def test_put_normalizes_vectors():
+    """Stored vectors are unit length so cosine reduces to a dot product."""
+    cache = EmbeddingCache()
+    cache.put("doc_1", [3.0, 4.0])
+
+    assert cache.get("doc_1").tolist() == pytest.approx([0.6, 0.8])
+
+
+def test_lru_eviction():
+    """Least-recently-used entries are evicted once the bound is reached."""
+    cache = EmbeddingCache(max_entries=2)
+    cache.put("a", [1.0, 0.0])
+    cache.put("b", [0.0, 1.0])
+    cache.get("a")  # refresh "a"
+    cache.put("c", [1.0, 1.0])
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_get_matrix_and_cosine_scores():
+    """Batch gather keeps caller positions and scores all rows at once."""
+    cache = EmbeddingCache()
+    cache.put("x", [1.0, 0.0])
+    cache.put("y", [0.0, 2.0])
+
+    matrix, positions = cache.get_matrix(["missing", "y", "x"])
+    scores = cosine_scores(matrix, np.array([1.0, 1.0]))
+
+    assert positions.tolist() == [1, 2]
+    assert scores.tolist() == pytest.approx([2 ** -0.5, 2 ** -0.5])
+    assert cache.stats()["misses"] == 1
+
+
+def test_shared_cache_is_singleton():
+    """The process-wide cache is created once."""
+    assert get_shared_embedding_cache() is get_shared_embedding_cache()
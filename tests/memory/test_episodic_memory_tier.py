@@ -8,8 +8,10 @@ bi-temporal properties, and hybrid retrieval patterns.
 import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock
-from src.memory.tiers.episodic_memory_tier import EpisodicMemoryTier
+from unittest.mock import AsyncMock, MagicMock, patch
+from neo4j import time as neo4j_time
+from src.memory.tiers.episodic_memory_tier import EpisodicMemoryTier, episodes_from_rows
+from src.memory.graph_templates import render_template
 from src.memory.models import Episode
 from src.storage.qdrant_adapter import QdrantAdapter
 from src.storage.neo4j_adapter import Neo4jAdapter
@@ -38,6 +40,13 @@ def mock_neo4j_adapter():
     adapter.connect = AsyncMock()
     adapter.disconnect = AsyncMock()
     adapter.execute_query = AsyncMock(return_value=[])
+    adapter.execute_read = AsyncMock(return_value=[])
+    adapter.execute_write = AsyncMock(return_value=[])
+    # session() is an async context manager (unit of work)
+    session_context = AsyncMock()
+    session_context.__aenter__ = AsyncMock(return_value=MagicMock())
+    session_context.__aexit__ = AsyncMock(return_value=None)
+    adapter.session = MagicMock(return_value=session_context)
     adapter.health_check = AsyncMock(return_value={'status': 'healthy'})
     return adapter
 
@@ -92,13 +101,37 @@ def sample_embedding():
 class TestEpisodicMemoryTierStore:
     """Test episode storage with dual indexing."""
     
+    @pytest.mark.asyncio
+    async def test_initialize_passes_collection_tuning(
+        self, mock_qdrant_adapter, mock_neo4j_adapter
+    ):
+        """Test tier config tuning reaches create_collection with default indexes."""
+        tier = EpisodicMemoryTier(
+            qdrant_adapter=mock_qdrant_adapter,
+            neo4j_adapter=mock_neo4j_adapter,
+            config={
+                'collection_name': 'episodes_test',
+                'vector_size': 1536,
+                'warm_graph_templates': False,
+                'collection_config': {'hnsw': {'m': 32}, 'quantization': {'type': 'int8'}}
+            }
+        )
+        await tier.initialize()
+        
+        name, collection_config = mock_qdrant_adapter.create_collection.call_args[0]
+        assert name == 'episodes_test'
+        assert collection_config['hnsw'] == {'m': 32}
+        assert collection_config['payload_indexes']['metadata.importance_score'] == 'float'
+        assert collection_config['payload_indexes']['session_id'] == 'keyword'
+        mock_neo4j_adapter.execute_read.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_store_episode_with_dual_indexing(
         self, episodic_tier, sample_episode, sample_embedding
     ):
         """Test storing episode in both Qdrant and Neo4j."""
         # Setup
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[{'id': 'ep_001'}])
+        episodic_tier.neo4j.execute_write = AsyncMock(return_value=[{'id': 'ep_001'}])
         
         # Store episode
         episode_id = await episodic_tier.store({
@@ -111,8 +144,10 @@ class TestEpisodicMemoryTierStore:
         # Verify
         assert episode_id == 'ep_001'
         episodic_tier.qdrant.upsert.assert_called_once()
-        # Neo4j should be called at least twice (create episode + link indexes)
-        assert episodic_tier.neo4j.execute_query.call_count >= 2
+        # Graph writes (create episode + link indexes) share one unit of work
+        assert episodic_tier.neo4j.execute_write.call_count == 2
+        episodic_tier.neo4j.session.assert_called_once()
+        episodic_tier.neo4j.execute_query.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_store_episode_with_entities(
@@ -137,7 +172,7 @@ class TestEpisodicMemoryTierStore:
             }
         ]
         
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[{'id': 'ep_001'}])
+        episodic_tier.neo4j.execute_write = AsyncMock(return_value=[{'id': 'ep_001'}])
         
         # Store
         episode_id = await episodic_tier.store({
@@ -149,8 +184,13 @@ class TestEpisodicMemoryTierStore:
         
         # Verify entities were created
         assert episode_id == 'ep_001'
-        # Should call Neo4j for: create episode + 2 entities + link indexes
-        assert episodic_tier.neo4j.execute_query.call_count >= 4
+        # Episode and both entities are written by one statement
+        create_call = episodic_tier.neo4j.execute_write.call_args_list[0]
+        assert 'UNWIND $entities AS row' in create_call.args[0]
+        assert [row['entity_id'] for row in create_call.args[1]['entities']] == [
+            'entity_1', 'entity_2'
+        ]
+        assert episodic_tier.neo4j.execute_write.call_count == 2
     
     @pytest.mark.asyncio
     async def test_store_episode_validates_embedding_size(
@@ -186,7 +226,7 @@ class TestEpisodicMemoryTierStore:
     ):
         """Test that Qdrant vector_id is stored in Neo4j."""
         # Setup
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[{'id': 'ep_001'}])
+        episodic_tier.neo4j.execute_write = AsyncMock(return_value=[{'id': 'ep_001'}])
         
         # Store
         await episodic_tier.store({
@@ -197,7 +237,7 @@ class TestEpisodicMemoryTierStore:
         })
         
         # Verify link update was called
-        calls = episodic_tier.neo4j.execute_query.call_args_list
+        calls = episodic_tier.neo4j.execute_write.call_args_list
         link_call = [c for c in calls if 'SET e.vectorId' in str(c)]
         assert len(link_call) > 0
 
@@ -216,7 +256,7 @@ class TestEpisodicMemoryTierRetrieve:
         """Test retrieving episode that exists."""
         # Setup mock response
         now = datetime.now(timezone.utc)
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[{
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[{
             'e': {
                 'episodeId': 'ep_001',
                 'sessionId': 'session_1',
@@ -248,7 +288,7 @@ class TestEpisodicMemoryTierRetrieve:
     async def test_retrieve_nonexistent_episode(self, episodic_tier):
         """Test retrieving episode that doesn't exist."""
         # Setup
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[])
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
         
         # Retrieve
         episode = await episodic_tier.retrieve('nonexistent')
@@ -260,7 +300,7 @@ class TestEpisodicMemoryTierRetrieve:
     async def test_retrieve_parses_timestamps(self, episodic_tier):
         """Test that ISO timestamps are correctly parsed."""
         now = datetime.now(timezone.utc)
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[{
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[{
             'e': {
                 'episodeId': 'ep_001',
                 'sessionId': 'session_1',
@@ -346,6 +386,59 @@ class TestEpisodicMemoryTierSearch:
         call_args = episodic_tier.qdrant.search.call_args
         assert call_args.kwargs['filter_dict'] == filters
 
+    
+    @pytest.mark.asyncio
+    async def test_search_similar_many_batches_queries(self, episodic_tier):
+        """Test several embeddings are searched in one batch, in order."""
+        now = datetime.now(timezone.utc)
+        
+        def hit(episode_id, score):
+            return {
+                'id': f'vec_{episode_id}',
+                'score': score,
+                'content': 'Similar episode',
+                'metadata': {
+                    'episode_id': episode_id,
+                    'session_id': 'session_1',
+                    'summary': 'Similar episode summary',
+                    'fact_count': 1,
+                    'time_window_start': now.isoformat(),
+                    'time_window_end': now.isoformat(),
+                    'fact_valid_from': now.isoformat(),
+                    'fact_valid_to': None,
+                    'importance_score': 0.6,
+                    'topics': []
+                }
+            }
+        
+        episodic_tier.qdrant.search_batch = AsyncMock(return_value=[
+            [hit('ep_1', 0.9)], [], [hit('ep_2', 0.8), hit('ep_3', 0.7)]
+        ])
+        
+        results = await episodic_tier.search_similar_many(
+            [[0.1] * 1536, [0.2] * 1536, [0.3] * 1536],
+            limit=2,
+            filters={'session_id': 'session_1'}
+        )
+        
+        assert [[e.episode_id for e in group] for group in results] == [
+            ['ep_1'], [], ['ep_2', 'ep_3']
+        ]
+        assert results[2][0].metadata['similarity_score'] == 0.8
+        episodic_tier.qdrant.search_batch.assert_awaited_once()
+        queries = episodic_tier.qdrant.search_batch.call_args[0][0]
+        assert len(queries) == 3
+        assert all(q['limit'] == 2 and q['filter'] == {'session_id': 'session_1'} for q in queries)
+        assert all(q['collection_name'] == 'episodes_test' for q in queries)
+    
+    @pytest.mark.asyncio
+    async def test_search_similar_many_empty(self, episodic_tier):
+        """Test no embeddings means no request."""
+        episodic_tier.qdrant.search_batch = AsyncMock(return_value=[])
+        
+        assert await episodic_tier.search_similar_many([]) == []
+        episodic_tier.qdrant.search_batch.assert_not_called()
+
 
 # ============================================
 # Graph Query Tests
@@ -358,7 +451,7 @@ class TestEpisodicMemoryTierGraphQueries:
     async def test_query_graph_custom_cypher(self, episodic_tier):
         """Test executing custom Cypher query."""
         # Setup
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[
             {'name': 'Entity1', 'count': 5}
         ])
         
@@ -369,7 +462,7 @@ class TestEpisodicMemoryTierGraphQueries:
         # Verify
         assert len(results) == 1
         assert results[0]['name'] == 'Entity1'
-        episodic_tier.neo4j.execute_query.assert_called_once_with(
+        episodic_tier.neo4j.execute_read.assert_called_once_with(
             query, {'param': 'value'}
         )
     
@@ -377,7 +470,7 @@ class TestEpisodicMemoryTierGraphQueries:
     async def test_get_episode_entities(self, episodic_tier):
         """Test retrieving entities for an episode (hypergraph)."""
         # Setup mock entities
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[
             {
                 'entity': {
                     'entityId': 'entity_1',
@@ -414,12 +507,38 @@ class TestEpisodicMemoryTierGraphQueries:
         assert entities[1]['name'] == 'John Doe'
         assert entities[1]['confidence'] == 0.95
     
+    @pytest.mark.asyncio
+    async def test_entity_queries_use_adapter_label(
+        self, mock_qdrant_adapter, mock_neo4j_adapter, sample_episode, sample_embedding
+    ):
+        """Test entity Cypher uses the Neo4j adapter's default_label."""
+        mock_neo4j_adapter.default_label = 'Party'
+        tier = EpisodicMemoryTier(
+            qdrant_adapter=mock_qdrant_adapter,
+            neo4j_adapter=mock_neo4j_adapter,
+            config={'collection_name': 'episodes_test', 'vector_size': 1536}
+        )
+        mock_neo4j_adapter.execute_write = AsyncMock(return_value=[{'id': 'ep_001'}])
+        
+        await tier.store({
+            'episode': sample_episode,
+            'embedding': sample_embedding,
+            'entities': [{'entity_id': 'entity_1', 'name': 'Maersk', 'type': 'carrier'}],
+            'relationships': []
+        })
+        await tier.get_episode_entities('ep_001')
+        
+        queries = [call.args[0] for call in mock_neo4j_adapter.execute_write.await_args_list]
+        assert any('MERGE (entity:Party {entityId: row.entity_id})' in query for query in queries)
+        assert 'entity:Party)' in mock_neo4j_adapter.execute_read.await_args.args[0]
+        assert not any(':Entity' in query for query in queries)
+    
     @pytest.mark.asyncio
     async def test_query_temporal(self, episodic_tier):
         """Test bi-temporal query for episodes valid at specific time."""
         # Setup
         now = datetime.now(timezone.utc)
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[
             {
                 'e': {
                     'episodeId': 'ep_001',
@@ -450,10 +569,122 @@ class TestEpisodicMemoryTierGraphQueries:
         assert episodes[0].episode_id == 'ep_001'
         
         # Verify query included temporal filter
-        call_args = episodic_tier.neo4j.execute_query.call_args
+        call_args = episodic_tier.neo4j.execute_read.call_args
         assert 'factValidFrom' in call_args[0][0]
         assert 'factValidTo' in call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_query_temporal_uses_native_datetime(self, episodic_tier):
+        """Test the as-of point is bound as a timezone-aware datetime."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        
+        await episodic_tier.query_temporal(query_time=datetime(2025, 6, 1))
+        
+        _, params = episodic_tier.neo4j.execute_read.call_args[0]
+        assert params['query_time'] == datetime(2025, 6, 1, tzinfo=timezone.utc)
+    
+    @pytest.mark.asyncio
+    async def test_query_temporal_many_single_round_trip(self, episodic_tier):
+        """Test many as-of queries are answered by one UNWIND query."""
+        now = datetime.now(timezone.utc)
+        
+        def row(idx, episode_id):
+            return {'idx': idx, 'e': {
+                'episodeId': episode_id,
+                'sessionId': 'session_1',
+                'summary': 'Valid episode summary',
+                'factCount': 1,
+                'timeWindowStart': neo4j_time.DateTime.from_native(now),
+                'timeWindowEnd': neo4j_time.DateTime.from_native(now),
+                'durationSeconds': 10.0,
+                'factValidFrom': neo4j_time.DateTime.from_native(now - timedelta(days=1)),
+                'factValidTo': None,
+                'sourceObservationTimestamp': neo4j_time.DateTime.from_native(now),
+                'importanceScore': 0.5
+            }}
+        
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[
+            row(0, 'ep_a'), row(2, 'ep_b'), row(2, 'ep_c')
+        ])
+        points = [now, now - timedelta(days=10), now - timedelta(hours=1)]
+        
+        results = await episodic_tier.query_temporal_many(
+            points, session_ids=['session_1', None, 'session_1'], limit=5
+        )
+        
+        assert [[e.episode_id for e in group] for group in results] == [
+            ['ep_a'], [], ['ep_b', 'ep_c']
+        ]
+        assert results[0][0].fact_valid_from == now - timedelta(days=1)
+        episodic_tier.neo4j.execute_read.assert_awaited_once()
+        cypher, params = episodic_tier.neo4j.execute_read.call_args[0]
+        assert 'UNWIND $queries' in cypher
+        assert params['limit'] == 5
+        assert [q['session_id'] for q in params['queries']] == ['session_1', None, 'session_1']
+    
+    @pytest.mark.asyncio
+    async def test_query_temporal_many_validates_lengths(self, episodic_tier):
+        """Test mismatched session_ids are rejected."""
+        with pytest.raises(ValueError):
+            await episodic_tier.query_temporal_many(
+                [datetime.now(timezone.utc)], session_ids=['a', 'b']
+            )
+    
+    @pytest.mark.asyncio
+    async def test_query_temporal_many_empty(self, episodic_tier):
+        """Test no points means no query."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        
+        assert await episodic_tier.query_temporal_many([]) == []
+        episodic_tier.neo4j.execute_read.assert_not_called()
+
+
+class TestEpisodesFromRows:
+    """Test shared row-to-Episode conversion."""
+    
+    def test_converts_native_and_legacy_timestamps(self):
+        """Test Neo4j DateTime values and legacy ISO strings both parse."""
+        now = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+        base = {
+            'sessionId': 's1',
+            'summary': 'Converted episode summary',
+            'factCount': 2,
+            'durationSeconds': 1.0,
+            'factValidTo': None,
+            'importanceScore': 0.7,
+            'vectorId': 'vec-1'
+        }
+        native = dict(base, episodeId='ep_native', **{
+            name: neo4j_time.DateTime.from_native(now)
+            for name in ('timeWindowStart', 'timeWindowEnd', 'factValidFrom',
+                         'sourceObservationTimestamp', 'consolidatedAt')
+        })
+        legacy = dict(base, episodeId='ep_legacy', **{
+            name: now.isoformat()
+            for name in ('timeWindowStart', 'timeWindowEnd', 'factValidFrom',
+                         'sourceObservationTimestamp')
+        })
+        
+        episodes = episodes_from_rows([{'e': native}, {'e': legacy}])
+        
+        assert [e.episode_id for e in episodes] == ['ep_native', 'ep_legacy']
+        for episode in episodes:
+            assert episode.fact_valid_from == now
+            assert episode.fact_valid_to is None
+            assert episode.vector_id == 'vec-1'
+            assert episode.graph_node_id == episode.episode_id
+        assert episodes[0].consolidated_at == now
+    
+    def test_episode_neo4j_properties_are_native(self, sample_episode):
+        """Test temporal properties are written as aware datetimes."""
+        naive = sample_episode.model_copy(update={'fact_valid_from': datetime(2025, 1, 1)})
+        
+        props = naive.to_neo4j_properties()
+        
+        assert props['factValidFrom'] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert isinstance(props['timeWindowStart'], datetime)
+        assert props['factValidTo'] is None
+
 
 # ============================================
 # Query Tests
@@ -466,7 +697,7 @@ class TestEpisodicMemoryTierQuery:
     async def test_query_by_session(self, episodic_tier):
         """Test querying episodes by session."""
         now = datetime.now(timezone.utc)
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[
             {
                 'e': {
                     'episodeId': 'ep_001',
@@ -496,7 +727,7 @@ class TestEpisodicMemoryTierQuery:
     async def test_query_by_importance(self, episodic_tier):
         """Test filtering by minimum importance score."""
         now = datetime.now(timezone.utc)
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[
             {
                 'e': {
                     'episodeId': 'ep_001',
@@ -521,6 +752,45 @@ class TestEpisodicMemoryTierQuery:
         
         assert len(episodes) == 1
         assert episodes[0].importance_score >= 0.8
+    
+    @pytest.mark.asyncio
+    async def test_query_pushes_down_time_range(self, episodic_tier):
+        """Test time_range filter is applied in Cypher, not in Python."""
+        start = datetime(2025, 12, 20, tzinfo=timezone.utc)
+        end = datetime(2025, 12, 21, tzinfo=timezone.utc)
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        
+        await episodic_tier.query(
+            filters={'session_id': 'session_1', 'time_range': (start, end)},
+            limit=10
+        )
+        
+        cypher, params = episodic_tier.neo4j.execute_read.call_args[0]
+        assert 'e.timeWindowEnd >= $time_range_start' in cypher
+        assert 'e.timeWindowStart <= $time_range_end' in cypher
+        assert params['time_range_start'] == start
+        assert params['time_range_end'] == end
+        assert params['session_id'] == 'session_1'
+    
+    @pytest.mark.asyncio
+    async def test_count_uses_cypher_count(self, episodic_tier):
+        """Test count() returns the aggregate without building Episode objects."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[{'count': 42}])
+        
+        count = await episodic_tier.count({'session_id': 'session_1'})
+        
+        assert count == 42
+        cypher, params = episodic_tier.neo4j.execute_read.call_args[0]
+        assert 'count(e)' in cypher
+        assert 'e.sessionId = $session_id' in cypher
+        assert params == {'session_id': 'session_1'}
+    
+    @pytest.mark.asyncio
+    async def test_count_empty_result(self, episodic_tier):
+        """Test count() returns 0 when Neo4j returns no rows."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        
+        assert await episodic_tier.count() == 0
 
 
 # ============================================
@@ -535,9 +805,8 @@ class TestEpisodicMemoryTierDelete:
         """Test deleting episode removes it from Qdrant and Neo4j."""
         # Setup - episode exists
         now = datetime.now(timezone.utc)
-        episodic_tier.neo4j.execute_query = AsyncMock(side_effect=[
-            # First call: retrieve episode
-            [{
+        # Lookup goes through the read path, the delete through a write
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[{
                 'e': {
                     'episodeId': 'ep_001',
                     'sessionId': 'session_1',
@@ -552,10 +821,8 @@ class TestEpisodicMemoryTierDelete:
                     'importanceScore': 0.5,
                     'vectorId': 'ep_001'
                 }
-            }],
-            # Second call: delete episode
-            []
-        ])
+            }])
+        episodic_tier.neo4j.execute_write = AsyncMock(return_value=[])
         
         # Delete
         result = await episodic_tier.delete('ep_001')
@@ -563,12 +830,15 @@ class TestEpisodicMemoryTierDelete:
         # Verify
         assert result is True
         episodic_tier.qdrant.delete.assert_called_once()
-        assert episodic_tier.neo4j.execute_query.call_count == 2
+        episodic_tier.neo4j.execute_read.assert_called_once()
+        episodic_tier.neo4j.execute_write.assert_called_once()
+        episodic_tier.neo4j.execute_query.assert_not_called()
+        episodic_tier.neo4j.session.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_delete_nonexistent_episode(self, episodic_tier):
         """Test deleting episode that doesn't exist."""
-        episodic_tier.neo4j.execute_query = AsyncMock(return_value=[])
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
         
         result = await episodic_tier.delete('nonexistent')
         
@@ -592,7 +862,7 @@ class TestEpisodicMemoryTierHealthCheck:
         episodic_tier.neo4j.health_check = AsyncMock(
             return_value={'status': 'healthy'}
         )
-        episodic_tier.neo4j.execute_query = AsyncMock(
+        episodic_tier.neo4j.execute_read = AsyncMock(
             return_value=[{'count': 42}]
         )
         
@@ -613,7 +883,7 @@ class TestEpisodicMemoryTierHealthCheck:
         episodic_tier.neo4j.health_check = AsyncMock(
             return_value={'status': 'unhealthy'}
         )
-        episodic_tier.neo4j.execute_query = AsyncMock(
+        episodic_tier.neo4j.execute_read = AsyncMock(
             return_value=[{'count': 0}]
         )
         
@@ -647,3 +917,117 @@ class TestEpisodicMemoryTierContextManager:
         # Verify disconnect called during cleanup (__aexit__)
         mock_qdrant_adapter.disconnect.assert_called_once()
         mock_neo4j_adapter.disconnect.assert_called_once()
+
+
+# ============================================
+# Graph Template Tests
+# ============================================
+
+class TestEpisodicMemoryTierTemplates:
+    """Test template execution, result caching, and invalidation."""
+    
+    @pytest.mark.asyncio
+    async def test_initialize_warms_template_plans(self, episodic_tier):
+        """Test initialize sends EXPLAIN for template variants."""
+        explained = [
+            call.args[0] for call in episodic_tier.neo4j.execute_read.await_args_list
+            if call.args[0].startswith('EXPLAIN')
+        ]
+        assert len(explained) > 0
+    
+    @pytest.mark.asyncio
+    async def test_query_template_caches_results(self, episodic_tier):
+        """Test repeated template calls are served from the cache."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[{'cause': 'weather'}])
+        params = {'shipment_id': 'SHP-1', 'max_depth': 2}
+        
+        first = await episodic_tier.query_template('find_delay_causes', params)
+        second = await episodic_tier.query_template('find_delay_causes', params)
+        
+        assert first == second == [{'cause': 'weather'}]
+        episodic_tier.neo4j.execute_read.assert_awaited_once()
+        cypher, bound = episodic_tier.neo4j.execute_read.call_args[0]
+        assert 'DELAYED_BY*1..2]' in cypher
+        assert 'max_depth' not in bound
+    
+    @pytest.mark.asyncio
+    async def test_query_template_bypass_cache(self, episodic_tier):
+        """Test use_cache=False always hits Neo4j."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        params = {'entity_id': 'MAEU1234567'}
+        
+        await episodic_tier.query_template('get_entity_timeline', params, use_cache=False)
+        await episodic_tier.query_template('get_entity_timeline', params, use_cache=False)
+        
+        assert episodic_tier.neo4j.execute_read.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_query_template_uses_prerendered_request(self, episodic_tier):
+        """Test a request rendered by the caller is executed without rendering again."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        params = {'shipment_id': 'SHP-1', 'max_depth': 2}
+        _, _, rendered = render_template('find_delay_causes', params)
+        
+        with patch('src.memory.tiers.episodic_memory_tier.render_template') as render:
+            await episodic_tier.query_template('find_delay_causes', params, rendered=rendered)
+        
+        render.assert_not_called()
+        cypher, bound = episodic_tier.neo4j.execute_read.call_args[0]
+        assert cypher == rendered.cypher
+        assert bound == rendered.parameters
+    
+    @pytest.mark.asyncio
+    async def test_query_template_invalid_params(self, episodic_tier):
+        """Test invalid template requests raise ValueError."""
+        with pytest.raises(ValueError, match='shipment_id'):
+            await episodic_tier.query_template('find_delay_causes', {})
+    
+    @pytest.mark.asyncio
+    async def test_store_invalidates_templates_for_touched_entities(
+        self, episodic_tier, sample_episode, sample_embedding
+    ):
+        """Test an L3 write drops cached results anchored on its entities."""
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        await episodic_tier.query_template('get_entity_timeline', {'entity_id': 'MAEU1234567'})
+        await episodic_tier.query_template('get_entity_timeline', {'entity_id': 'CMAU5678901'})
+        
+        await episodic_tier.store({
+            'episode': sample_episode,
+            'embedding': sample_embedding,
+            'entities': [{'entity_id': 'MAEU1234567', 'name': 'Container', 'type': 'container'}]
+        })
+        await episodic_tier.query_template('get_entity_timeline', {'entity_id': 'MAEU1234567'})
+        await episodic_tier.query_template('get_entity_timeline', {'entity_id': 'CMAU5678901'})
+        
+        # Only the touched entity is re-queried
+        assert episodic_tier.neo4j.execute_read.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_templates_for_mentioned_entities(self, episodic_tier):
+        """Test deleting an episode drops results for the entities it mentioned."""
+        now = datetime.now(timezone.utc)
+        episode_row = {'e': {
+            'episodeId': 'ep_001',
+            'sessionId': 'session_1',
+            'summary': 'Test episode summary with sufficient length',
+            'factCount': 1,
+            'timeWindowStart': now.isoformat(),
+            'timeWindowEnd': now.isoformat(),
+            'durationSeconds': 100.0,
+            'factValidFrom': now.isoformat(),
+            'factValidTo': None,
+            'sourceObservationTimestamp': now.isoformat(),
+            'importanceScore': 0.5,
+            'vectorId': 'ep_001'
+        }}
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[])
+        await episodic_tier.query_template('get_entity_timeline', {'entity_id': 'MAEU1234567'})
+        assert len(episodic_tier.template_cache) == 1
+        
+        episodic_tier.neo4j.execute_read = AsyncMock(return_value=[episode_row])
+        episodic_tier.neo4j.execute_write = AsyncMock(
+            return_value=[{'entity_ids': ['MAEU1234567']}]
+        )
+        await episodic_tier.delete('ep_001')
+        
+        assert len(episodic_tier.template_cache) == 0
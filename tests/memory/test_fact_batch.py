@@ -0,0 +1,85 @@
+"""
+Tests for the columnar FactBatch container.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.memory.fact_batch import FactBatch
+from src.memory.models import Fact
+
+
+BASE = datetime(2025, 11, 1, 8, 0, tzinfo=timezone.utc)
+
+
+def _rows():
+    return [
+        {'fact_id': 'f1', 'session_id': 's1', 'content': 'Crane 3 down', 'ciar_score': 0.7,
+         'certainty': 0.9, 'impact': 0.8, 'extracted_at': BASE, 'metadata': '{"port": "NLRTM"}'},
+        {'id': 42, 'session_id': 's1', 'content': 'Berth 7 closed', 'ciar_score': None,
+         'extracted_at': (BASE + timedelta(hours=30)).isoformat(), 'access_count': 3},
+        {'fact_id': 'f3', 'session_id': 's2', 'content': 'Gate 2 congested', 'ciar_score': 0.9,
+         'extracted_at': (BASE + timedelta(hours=2)).replace(tzinfo=None)},
+    ]
+
+
+def test_from_rows_builds_columns_without_facts():
+    batch = FactBatch.from_rows(_rows(), default_ciar_score=0.6)
+
+    assert len(batch) == 3
+    assert batch.fact_ids == ['f1', '42', 'f3']
+    assert batch.ciar_score.tolist() == [0.7, 0.6, 0.9]
+    assert batch.certainty.tolist() == [0.9, 0.7, 0.7]
+    assert batch.access_count.tolist() == [0, 3, 0]
+    assert batch.extracted_ts[2] == (BASE + timedelta(hours=2)).timestamp()
+    assert batch._facts == [None, None, None]
+
+
+def test_single_item_converts_lazily_and_once():
+    batch = FactBatch.from_rows(_rows(), default_ciar_score=0.6)
+    batch.ciar_score[1] = 0.65
+
+    fact = batch[1]
+
+    assert isinstance(fact, Fact)
+    assert fact.fact_id == '42'
+    assert fact.ciar_score == 0.65
+    assert batch[1] is fact
+    assert batch._facts[0] is None
+    assert batch[0].metadata == {'port': 'NLRTM'}
+
+
+def test_filter_and_sort():
+    batch = FactBatch.from_rows(_rows(), default_ciar_score=0.6)
+
+    top = batch.filter(batch.ciar_score >= 0.65).sort('ciar_score')
+
+    assert top.fact_ids == ['f3', 'f1']
+    assert batch.sort('extracted_ts', descending=False).fact_ids == ['f1', 'f3', '42']
+    assert batch[np.array([True, False, True])].fact_ids == ['f1', 'f3']
+    assert batch[:2].fact_ids == ['f1', '42']
+    with pytest.raises(ValueError):
+        batch.sort('content')
+
+
+def test_cluster_by_time_matches_windows():
+    batch = FactBatch.from_rows(_rows())
+
+    clusters = batch.cluster_by_time(window_seconds=24 * 3600)
+
+    assert [c.fact_ids for c in clusters] == [['f1', 'f3'], ['42']]
+    assert FactBatch.from_rows([]).cluster_by_time(3600) == []
+
+
+def test_from_facts_keeps_models():
+    facts = [
+        Fact(fact_id='a', session_id='s1', content='One', ciar_score=0.8),
+        Fact(fact_id='b', session_id='s1', content='Two', ciar_score=0.6),
+    ]
+
+    batch = FactBatch.from_facts(facts)
+
+    assert batch.sort('ciar_score', descending=False).to_facts() == [facts[1], facts[0]]
+    assert list(batch)[0] is facts[0]
@@ -0,0 +1,110 @@
+"""
+Tests for per-session tier generation counters.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis
+import pytest
+from fakeredis import aioredis
+
+from src.memory.generations import SessionGenerations
+from src.memory.tiers.working_memory_tier import WorkingMemoryTier
+
+
+@pytest.mark.asyncio
+async def test_local_counters_per_session_and_tier():
+    generations = SessionGenerations()
+
+    before = await generations.snapshot("s1", ["L1", "L2"])
+    await generations.bump("L2", "s1")
+    await generations.bump("L2", "s2")
+
+    assert before == (0, 0, 0, 0)
+    assert await generations.snapshot("s1", ["L1", "L2"]) == (0, 1, 0, 0)
+    assert await generations.snapshot("s2", ["L1"]) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_global_bump_changes_every_session():
+    generations = SessionGenerations()
+    s1 = await generations.snapshot("s1", ["L4"])
+    s2 = await generations.snapshot("s2", ["L4"])
+
+    await generations.bump("L4")
+
+    assert await generations.snapshot("s1", ["L4"]) != s1
+    assert await generations.snapshot("s2", ["L4"]) != s2
+
+
+@pytest.mark.asyncio
+async def test_redis_counters_are_shared_between_trackers():
+    client = aioredis.FakeRedis()
+    writer = SessionGenerations(client)
+    reader = SessionGenerations(client)
+
+    await writer.bump("L1", "s1")
+    await writer.bump("L1", "s1")
+    await writer.bump("L2")
+
+    assert reader.shared
+    assert await reader.snapshot("s1", ["L1", "L2"]) == (2, 0, 0, 1)
+    assert await client.hget("{session:s1}:generation", "L1") == b"2"
+
+
+@pytest.mark.asyncio
+async def test_bump_failure_is_swallowed():
+    client = MagicMock()
+    client.hincrby = AsyncMock(side_effect=ConnectionError("redis down"))
+    generations = SessionGenerations(client)
+
+    await generations.bump("L2", "s1")
+
+    assert generations.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_redis_counters_are_shared_between_trackers():
+    server = fakeredis.FakeServer()
+    writer = SessionGenerations(fakeredis.FakeStrictRedis(server=server))
+    reader = SessionGenerations(fakeredis.FakeStrictRedis(server=server))
+    before = await reader.snapshot("s1", ["L2"])
+
+    await writer.bump("L2", "s1")
+
+    assert reader.shared
+    assert before == (0, 0)
+    assert await reader.snapshot("s1", ["L2"]) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_failed_bump_still_invalidates_local_snapshots():
+    client = aioredis.FakeRedis()
+    generations = SessionGenerations(client)
+    before = await generations.snapshot("s1", ["L1"])
+
+    client.hincrby = AsyncMock(side_effect=ConnectionError("redis down"))
+    await generations.bump("L1", "s1")
+
+    assert generations.errors == 1
+    assert await generations.snapshot("s1", ["L1"]) != before
+
+
+@pytest.mark.asyncio
+async def test_tier_writes_bump_generation(postgres_adapter):
+    tier = WorkingMemoryTier(postgres_adapter=postgres_adapter)
+    generations = SessionGenerations()
+    tier.attach_generations(generations)
+
+    await tier.store({
+        'fact_id': 'fact-001',
+        'session_id': 'session-123',
+        'content': 'Vessel ETA moved to Friday',
+        'ciar_score': 0.75
+    })
+    assert await generations.snapshot('session-123', ['L2']) == (1, 0)
+
+    # Deleting by ID does not know the session, so every session is bumped
+    postgres_adapter.delete.return_value = True
+    await tier.delete('fact-001')
+    assert await generations.snapshot('session-123', ['L2']) == (1, 1)
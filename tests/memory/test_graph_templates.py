@@ -0,0 +1,125 @@
+"""
+Tests for graph template compilation, rendering, and plan warming.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.memory.graph_templates import (
+    COMPILED_TEMPLATES,
+    FIND_DELAY_CAUSES,
+    GraphQueryTemplate,
+    compile_template,
+    render_template,
+    validate_and_execute_template,
+    warm_template_plans,
+)
+
+
+class TestCompileTemplate:
+    """Test pre-rendering of structural variants."""
+
+    def test_delay_causes_variants_cover_bounds(self):
+        compiled = COMPILED_TEMPLATES["find_delay_causes"]
+
+        assert sorted(compiled.variants) == [(depth,) for depth in range(1, 11)]
+        assert "DELAYED_BY*1..3]" in compiled.variants[(3,)]
+        assert all("{{" not in cypher for cypher in compiled.variants.values())
+
+    def test_template_without_structural_params_has_single_variant(self):
+        compiled = COMPILED_TEMPLATES["get_shipment_parties"]
+
+        assert list(compiled.variants) == [()]
+
+    def test_undeclared_placeholder_rejected(self):
+        template = GraphQueryTemplate(
+            name="bad",
+            cypher_template="MATCH (a)-[*1..{{depth}}]->(b) RETURN b",
+            required_params=[],
+        )
+
+        with pytest.raises(ValueError, match="undeclared"):
+            compile_template(template)
+
+
+class TestRenderTemplate:
+    """Test request-time rendering."""
+
+    def test_structural_param_selects_variant_and_is_not_bound(self):
+        is_valid, error, rendered = render_template(
+            "find_delay_causes", {"shipment_id": "SHP-1", "max_depth": 3}
+        )
+
+        assert is_valid and error is None
+        assert "DELAYED_BY*1..3]" in rendered.cypher
+        assert "max_depth" not in rendered.parameters
+        assert rendered.parameters == {"shipment_id": "SHP-1", "max_results": 10}
+        assert rendered.anchor_ids == ["SHP-1"]
+
+    def test_structural_param_clamped_to_bounds(self):
+        _, _, rendered = render_template(
+            "find_delay_causes", {"shipment_id": "SHP-1", "max_depth": 50}
+        )
+
+        assert "DELAYED_BY*1..10]" in rendered.cypher
+        assert rendered.structural_values == {"max_depth": 10}
+
+    def test_non_integer_structural_param_rejected(self):
+        is_valid, error, rendered = render_template(
+            "find_delay_causes", {"shipment_id": "SHP-1", "max_depth": "deep"}
+        )
+
+        assert not is_valid
+        assert "max_depth" in error
+        assert rendered is None
+
+    def test_cache_key_ignores_param_order_and_applies_defaults(self):
+        _, _, first = render_template(
+            "find_delay_causes", {"shipment_id": "SHP-1", "max_results": 10}
+        )
+        _, _, second = render_template(
+            "find_delay_causes", {"max_depth": 5, "shipment_id": "SHP-1"}
+        )
+
+        assert first.cache_key == second.cache_key
+
+    def test_missing_required_param(self):
+        is_valid, error, _ = render_template("find_delay_causes", {})
+
+        assert not is_valid
+        assert "shipment_id" in error
+
+    def test_validate_and_execute_returns_rendered_variant(self):
+        is_valid, _, cypher = validate_and_execute_template(
+            "find_delay_causes", {"shipment_id": "SHP-1"}
+        )
+
+        assert is_valid
+        assert "DELAYED_BY*1..5]" in cypher
+        assert cypher != FIND_DELAY_CAUSES.cypher_template
+
+
+class TestWarmTemplatePlans:
+    """Test startup plan warming."""
+
+    @pytest.mark.asyncio
+    async def test_explains_every_variant(self):
+        execute = AsyncMock(return_value=[])
+
+        warmed = await warm_template_plans(execute)
+
+        expected = sum(len(c.variants) for c in COMPILED_TEMPLATES.values())
+        assert warmed == expected
+        assert execute.await_count == expected
+        for call in execute.await_args_list:
+            cypher, params = call.args
+            assert cypher.startswith("EXPLAIN ")
+            assert "max_depth" not in params
+
+    @pytest.mark.asyncio
+    async def test_failures_are_logged_not_raised(self):
+        execute = AsyncMock(side_effect=RuntimeError("unavailable"))
+
+        warmed = await warm_template_plans(execute, names=["get_shipment_parties"])
+
+        assert warmed == 0
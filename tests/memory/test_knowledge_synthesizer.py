@@ -2,11 +2,16 @@
 Tests for KnowledgeSynthesizer (Query-Time Knowledge Retrieval)
 """
 
+import asyncio
+import json
+
+import fakeredis
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.memory.engines.knowledge_synthesizer import KnowledgeSynthesizer
 from src.memory.models import KnowledgeDocument
+from src.memory.embedding_cache import EmbeddingCache
 from src.memory.tiers.semantic_memory_tier import SemanticMemoryTier
 from src.utils.providers import BaseProvider
 
@@ -144,7 +149,7 @@ async def test_synthesizer_initialization(mock_semantic_tier, mock_llm_provider)
     assert synthesizer.semantic_tier == mock_semantic_tier
     assert synthesizer.similarity_threshold == 0.85
     assert synthesizer.cache_ttl_seconds == 3600
-    assert synthesizer._cache == {}
+    assert len(synthesizer._cache) == 0
 
 
 @pytest.mark.asyncio
@@ -547,3 +552,449 @@ async def test_cache_stats(
     assert stats["total_entries"] == 2
     assert stats["valid_entries"] == 2
     assert stats["ttl_seconds"] == 3600
+    assert stats["hits"] == 0
+    assert stats["misses"] == 2
+    
+    await synthesizer.synthesize("Query 1", {"port_code": "USLAX"})
+    stats = await synthesizer.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_are_coalesced(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test that identical in-flight queries share one synthesis."""
+    mock_semantic_tier.search.return_value = sample_knowledge_docs[:3]
+    release = asyncio.Event()
+    
+    response = mock_llm_provider.generate.return_value
+    
+    async def slow_generate(*args, **kwargs):
+        await release.wait()
+        return response
+    
+    mock_llm_provider.generate = AsyncMock(side_effect=slow_generate)
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider
+    )
+    
+    tasks = [
+        asyncio.create_task(synthesizer.synthesize("Same query", {"port_code": "USLAX"}))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    
+    assert mock_llm_provider.generate.await_count == 1
+    assert mock_semantic_tier.search.await_count == 1
+    assert len({r["synthesized_text"] for r in results}) == 1
+    assert sum(1 for r in results if r.get("coalesced")) == 4
+    
+    stats = await synthesizer.get_cache_stats()
+    assert stats["coalesced_requests"] == 4
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_source_document_write_invalidates_cache(
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test that L4 writes to a source document evict dependent results."""
+    tier = SemanticMemoryTier(
+        typesense_adapter=MagicMock(),
+        embedding_cache=EmbeddingCache()
+    )
+    tier.search = AsyncMock(return_value=sample_knowledge_docs[:2])
+    tier.typesense.delete_document = AsyncMock(return_value=True)
+    
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=tier,
+        llm_provider=mock_llm_provider
+    )
+    
+    await synthesizer.synthesize("Reefer handling", {"port_code": "USLAX"})
+    tier.search.return_value = [sample_knowledge_docs[3]]
+    await synthesizer.synthesize("Unrelated", {"port_code": "DEHAM"})
+    assert (await synthesizer.get_cache_stats())["total_entries"] == 2
+    
+    await tier.delete("know_002")
+    
+    stats = await synthesizer.get_cache_stats()
+    assert stats["total_entries"] == 1
+    assert stats["invalidations"] == 1
+    
+    result = await synthesizer.synthesize("Reefer handling", {"port_code": "USLAX"})
+    assert result["source"] == "synthesized"
+
+
+@pytest.mark.asyncio
+async def test_shared_redis_tier(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test that results are shared through Redis and invalidated there too."""
+    mock_semantic_tier.search.return_value = sample_knowledge_docs[:2]
+    server = fakeredis.FakeServer()
+    
+    writer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        redis_client=fakeredis.aioredis.FakeRedis(server=server)
+    )
+    reader = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        redis_client=fakeredis.aioredis.FakeRedis(server=server)
+    )
+    redis_client = fakeredis.aioredis.FakeRedis(server=server)
+    
+    await writer.synthesize("Loading", {"port_code": "USLAX"})
+    cache_key = writer._generate_cache_key("Loading", {"port_code": "USLAX"})
+    entry = json.loads(await redis_client.get(f"{{mas}}:synthesis:{cache_key}"))
+    assert set(entry["doc_ids"]) == {"know_001", "know_002"}
+    
+    result = await reader.synthesize("Loading", {"port_code": "USLAX"})
+    assert result["source"] == "cache"
+    assert mock_llm_provider.generate.await_count == 1
+    assert (await reader.get_cache_stats())["shared_hits"] == 1
+    
+    await reader.invalidate_documents(["know_001"])
+    assert await redis_client.get(f"{{mas}}:synthesis:{cache_key}") is None
+    assert len(reader._cache) == 0
+    
+    # Invalidation goes through the document index only; L4 writes do not
+    # retire unrelated shared results
+    assert await redis_client.get("{mas}:synthesis:generation") is None
+
+
+@pytest.mark.asyncio
+async def test_local_copies_of_shared_results_are_short_lived(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test local copies expire soon when another process may invalidate them."""
+    mock_semantic_tier.search.return_value = sample_knowledge_docs[:2]
+    
+    with patch("src.memory.result_cache.time.monotonic", return_value=1000.0):
+        synthesizer = KnowledgeSynthesizer(
+            semantic_tier=mock_semantic_tier,
+            llm_provider=mock_llm_provider,
+            redis_client=fakeredis.aioredis.FakeRedis()
+        )
+        result = await synthesizer.synthesize("Loading", {"port_code": "USLAX"})
+    
+    ttl = KnowledgeSynthesizer.DEFAULT_SHARED_LOCAL_TTL_SECONDS
+    with patch("src.memory.result_cache.time.monotonic", return_value=1000.0 + ttl - 1):
+        assert synthesizer._cache.get(result["cache_key"]) is not None
+    with patch("src.memory.result_cache.time.monotonic", return_value=1000.0 + ttl + 1):
+        assert synthesizer._cache.get(result["cache_key"]) is None
+
+
+@pytest.mark.asyncio
+async def test_shared_result_keeps_remaining_ttl_locally(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test a promoted shared result expires locally with its Redis copy."""
+    mock_semantic_tier.search.return_value = sample_knowledge_docs[:2]
+    server = fakeredis.FakeServer()
+    writer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        redis_client=fakeredis.aioredis.FakeRedis(server=server)
+    )
+    reader = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        redis_client=fakeredis.aioredis.FakeRedis(server=server)
+    )
+    
+    await writer.synthesize("Loading", {"port_code": "USLAX"})
+    cache_key = writer._generate_cache_key("Loading", {"port_code": "USLAX"})
+    await fakeredis.aioredis.FakeRedis(server=server).expire(f"{{mas}}:synthesis:{cache_key}", 5)
+    
+    with patch("src.memory.result_cache.time.monotonic", return_value=1000.0):
+        assert (await reader.synthesize("Loading", {"port_code": "USLAX"}))["source"] == "cache"
+    with patch("src.memory.result_cache.time.monotonic", return_value=1006.0):
+        assert reader._cache.get(cache_key) is None
+
+
+@pytest.mark.asyncio
+async def test_corrupt_shared_entry_is_a_miss(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test that an unreadable shared entry is re-synthesized, not an error."""
+    mock_semantic_tier.search.return_value = sample_knowledge_docs[:2]
+    redis_client = fakeredis.aioredis.FakeRedis()
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        redis_client=redis_client
+    )
+    cache_key = synthesizer._generate_cache_key("Loading", {"port_code": "USLAX"})
+    await redis_client.set(f"{{mas}}:synthesis:{cache_key}", "not json")
+    
+    result = await synthesizer.synthesize("Loading", {"port_code": "USLAX"})
+    
+    assert result["status"] == "success"
+    assert result["source"] == "synthesized"
+
+
+@pytest.mark.asyncio
+async def test_cache_key_includes_max_results(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test that calls with different max_results do not share a result."""
+    mock_semantic_tier.search.return_value = sample_knowledge_docs[:3]
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider
+    )
+    
+    first = await synthesizer.synthesize("Loading", {"port_code": "USLAX"}, max_results=1)
+    second = await synthesizer.synthesize("Loading", {"port_code": "USLAX"}, max_results=3)
+    
+    assert first["cache_key"] != second["cache_key"]
+    assert second["source"] == "synthesized"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_synthesis_skips_caching(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test a result synthesized across an invalidation is not cached."""
+    mock_semantic_tier.search.return_value = sample_knowledge_docs[:2]
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider
+    )
+    response = mock_llm_provider.generate.return_value
+    
+    async def generate_during_write(*args, **kwargs):
+        await synthesizer.invalidate_documents(["know_001"])
+        return response
+    
+    mock_llm_provider.generate = AsyncMock(side_effect=generate_during_write)
+    
+    result = await synthesizer.synthesize("Loading", {"port_code": "USLAX"})
+    
+    assert result["source"] == "synthesized"
+    assert len(synthesizer._cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_score_documents_uses_text_match(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test that Typesense text_match is normalized and drives ordering."""
+    docs = sample_knowledge_docs[:3]
+    for doc, text_match in zip(docs, [50, 100, 25]):
+        doc.metadata["search_score"] = text_match
+    
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider
+    )
+    
+    scored = await synthesizer._score_documents("query", docs)
+    
+    assert [doc.knowledge_id for doc, _ in scored] == ["know_002", "know_001", "know_003"]
+    assert [score for _, score in scored] == pytest.approx([1.0, 0.5, 0.25])
+
+
+@pytest.mark.asyncio
+async def test_score_documents_reranks_with_cached_embeddings(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test cosine re-ranking over cached embeddings with a single query embedding."""
+    docs = sample_knowledge_docs[:3]
+    for doc in docs:
+        doc.metadata["search_score"] = 100
+    cache = EmbeddingCache()
+    cache.put("know_001", [0.0, 1.0])
+    cache.put("know_002", [1.0, 0.0])
+    mock_semantic_tier.embedding_cache = cache
+    embedder = MagicMock()
+    embedder.get_embedding = AsyncMock(return_value=[1.0, 0.0])
+    
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        embedding_provider=embedder
+    )
+    synthesizer.vector_weight = 0.5
+    
+    scored = dict(
+        (doc.knowledge_id, score)
+        for doc, score in await synthesizer._score_documents("reefer handling", docs)
+    )
+    
+    assert scored["know_002"] == pytest.approx(1.0)   # cosine 1.0, text 1.0
+    assert scored["know_001"] == pytest.approx(0.5)   # cosine 0.0, text 1.0
+    assert scored["know_003"] == pytest.approx(1.0)   # no embedding: text only
+    embedder.get_embedding.assert_awaited_once()
+    
+    # Query embedding is cached for repeated queries
+    await synthesizer._score_documents("reefer handling", docs)
+    embedder.get_embedding.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_query_embeddings_do_not_evict_document_embeddings(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test query vectors live in their own cache, apart from L4 documents."""
+    docs = sample_knowledge_docs[:2]
+    cache = EmbeddingCache(max_entries=2)
+    cache.put("know_001", [0.0, 1.0])
+    cache.put("know_002", [1.0, 0.0])
+    mock_semantic_tier.embedding_cache = cache
+    embedder = MagicMock()
+    embedder.get_embedding = AsyncMock(return_value=[1.0, 0.0])
+    
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        embedding_provider=embedder
+    )
+    
+    for index in range(5):
+        await synthesizer._score_documents(f"query {index}", docs)
+    
+    assert len(cache) == 2
+    assert "know_001" in cache and "know_002" in cache
+    assert len(synthesizer.query_embeddings) == 5
+
+
+@pytest.mark.asyncio
+async def test_similarity_threshold_applies_to_cosine_only(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test the absolute threshold filters on cosine, not on relative text scores."""
+    docs = sample_knowledge_docs[:3]
+    for doc in docs:
+        doc.metadata["search_score"] = 100
+    cache = EmbeddingCache()
+    cache.put("know_001", [0.2, 0.98])   # cosine ~0.2 to the query
+    cache.put("know_002", [1.0, 0.0])    # cosine 1.0
+    mock_semantic_tier.embedding_cache = cache
+    embedder = MagicMock()
+    embedder.get_embedding = AsyncMock(return_value=[1.0, 0.0])
+    
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        embedding_provider=embedder,
+        similarity_threshold=0.5
+    )
+    synthesizer.relative_score_cutoff = 0.0
+    
+    scored = await synthesizer._score_documents("reefer handling", docs)
+    selected = [doc.knowledge_id for doc in synthesizer._select_top_k(scored, 5)]
+    
+    # know_001 matches the text as well as the others but not the meaning;
+    # know_003 has no embedding and is judged by the relative cutoff only
+    assert sorted(selected) == ["know_002", "know_003"]
+    assert docs[1].metadata["vector_similarity"] == pytest.approx(1.0)
+    assert "vector_similarity" not in docs[2].metadata
+
+
+def test_similarity_threshold_from_domain_config(tmp_path, mock_semantic_tier, mock_llm_provider):
+    """Test the threshold is read from the domain config unless given explicitly."""
+    config_path = tmp_path / "domain.yaml"
+    config_path.write_text("domain:\n  name: test\nfiltering:\n  similarity_threshold: 0.3\n")
+    
+    configured = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        domain_config_path=str(config_path)
+    )
+    explicit = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        domain_config_path=str(config_path),
+        similarity_threshold=0.7
+    )
+    
+    assert configured.similarity_threshold == 0.3
+    assert explicit.similarity_threshold == 0.7
+
+
+@pytest.mark.asyncio
+async def test_top_k_cutoff_drops_weak_documents(
+    mock_semantic_tier,
+    mock_llm_provider,
+    sample_knowledge_docs
+):
+    """Test that documents far below the best score are not sent to the LLM."""
+    docs = sample_knowledge_docs[:3]
+    for doc, text_match in zip(docs, [100, 95, 40]):
+        doc.metadata["search_score"] = text_match
+    mock_semantic_tier.search.return_value = docs
+    
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider,
+        similarity_threshold=0.0
+    )
+    
+    result = await synthesizer.synthesize(query="Loading practices", max_results=5)
+    
+    assert result["status"] == "success"
+    assert result["candidates"] == 2
+
+
+@pytest.mark.asyncio
+async def test_conflicts_only_compared_within_topic(
+    mock_semantic_tier,
+    mock_llm_provider
+):
+    """Test that opposing recommendations on different topics are not conflicts."""
+    def recommendation(knowledge_id, content, port_code):
+        return KnowledgeDocument(
+            knowledge_id=knowledge_id,
+            knowledge_type="recommendation",
+            title=f"Recommendation {knowledge_id}",
+            content=content,
+            category="handling",
+            metadata={"port_code": port_code}
+        )
+    
+    docs = [
+        recommendation("r1", "Always stack reefers near power points.", "USLAX"),
+        recommendation("r2", "Never stack reefers near power points.", "USLAX"),
+        recommendation("r3", "Never stack reefers near power points.", "DEHAM"),
+    ]
+    synthesizer = KnowledgeSynthesizer(
+        semantic_tier=mock_semantic_tier,
+        llm_provider=mock_llm_provider
+    )
+    synthesizer.conflict_group_by = ("category", "port_code")
+    
+    conflicts = synthesizer._detect_conflicts(docs)
+    
+    assert [c["doc_ids"] for c in conflicts] == [["r1", "r2"]]
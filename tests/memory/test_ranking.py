@@ -0,0 +1,161 @@
+"""
+Tests for cross-tier result fusion.
+"""
+
+import numpy as np
+import pytest
+
+from src.memory.ranking import (
+    CandidateSet,
+    MinMaxPriorFusion,
+    ReciprocalRankFusion,
+    RelevanceWeightedFusion,
+    duplicate_groups,
+    get_ranker,
+)
+
+WEIGHTS = {"L2": 0.3, "L3": 0.5, "L4": 0.2}
+
+
+def _fact(fact_id, content, relevance, ciar):
+    return {
+        "content": content,
+        "relevance": relevance,
+        "prior": ciar,
+        "metadata": {"fact_id": fact_id, "ciar_score": ciar},
+    }
+
+
+def _episode(episode_id, summary, similarity, importance, source_fact_ids=()):
+    return {
+        "content": summary,
+        "relevance": similarity,
+        "prior": importance,
+        "metadata": {"episode_id": episode_id, "source_fact_ids": list(source_fact_ids)},
+    }
+
+
+def _doc(knowledge_id, content, text_match, confidence):
+    return {
+        "content": content,
+        "relevance": text_match,
+        "prior": confidence,
+        "metadata": {"knowledge_id": knowledge_id},
+    }
+
+
+def test_candidate_set_columns():
+    candidates = CandidateSet.from_tiers({
+        "L2": [_fact("f1", "Reefer alarm", 0.06, 0.8), _fact("f2", "Crane down", None, 0.7)],
+        "L4": [_doc("k1", "Reefer handling", 578730123, 0.9)],
+    })
+
+    assert len(candidates) == 3
+    assert candidates.tiers == ("L2", "L4")
+    assert candidates.tier_index.tolist() == [0, 0, 1]
+    assert candidates.rank.tolist() == [0, 1, 0]
+    assert np.isnan(candidates.relevance[1])
+    assert [r["tier"] for r in candidates.results] == ["L2", "L2", "L4"]
+
+
+def test_duplicate_groups_merge_fact_into_source_episode():
+    results = [
+        {"content": "Fact one", "metadata": {"fact_id": "f1"}},
+        {"content": "Fact two", "metadata": {"fact_id": "f2"}},
+        {"content": "Episode", "metadata": {"episode_id": "e1", "source_fact_ids": ["f1"]}},
+        {"content": "  fact TWO ", "metadata": {"knowledge_id": "k1"}},
+        {"content": "Unrelated", "metadata": {"knowledge_id": "k2"}},
+    ]
+
+    groups = duplicate_groups(results).tolist()
+
+    # f1 joins its source episode; f2 and k1 share normalized content
+    assert groups == [0, 1, 0, 1, 2]
+
+
+def test_relevance_fusion_ranks_by_query_relevance():
+    candidates = CandidateSet.from_tiers({
+        # High CIAR but barely relevant vs. lower CIAR and highly relevant
+        "L2": [_fact("f1", "Relevant fact", 0.09, 0.6), _fact("f2", "Loose match", 0.01, 0.95)],
+        "L4": [_doc("k1", "Relevant doc", 1_000_000, 0.5), _doc("k2", "Weak doc", 100_000, 0.99)],
+    })
+
+    ranked = RelevanceWeightedFusion(relevance_weight=0.8).rank(candidates, WEIGHTS, limit=4)
+
+    assert [r["content"] for r in ranked] == ["Relevant fact", "Relevant doc", "Loose match", "Weak doc"]
+    # ts_rank 0.09 against the L2 reference of 0.1
+    assert ranked[0]["score"] == pytest.approx(0.3 * (0.8 * 0.9 + 0.2 * 0.6))
+    # text_match has no reference: the best L4 hit calibrates to 1.0
+    assert ranked[1]["score"] == pytest.approx(0.2 * (0.8 * 1.0 + 0.2 * 0.5))
+
+
+def test_relevance_fusion_keeps_weak_tier_weak():
+    candidates = CandidateSet.from_tiers({
+        "L2": [_fact("f1", "Relevant fact", 0.06, 0.7)],
+        # Best L3 hit, but an unrelated one (cosine 0.2)
+        "L3": [_episode("e1", "Unrelated episode", 0.2, 0.5)],
+    })
+
+    ranked = RelevanceWeightedFusion().rank(candidates, WEIGHTS, limit=2)
+
+    assert [r["content"] for r in ranked] == ["Relevant fact", "Unrelated episode"]
+    assert ranked[1]["score"] == pytest.approx(0.5 * (0.8 * 0.2 + 0.2 * 0.5))
+
+
+def test_relevance_fusion_uses_rank_when_tier_reports_none():
+    candidates = CandidateSet.from_tiers({
+        "L3": [_episode("e1", "First", None, 0.1), _episode("e2", "Second", None, 0.9)],
+    })
+
+    scores = RelevanceWeightedFusion(relevance_weight=1.0).score(candidates, np.array([1.0]))
+
+    # Neutral, not fully relevant: the tier never matched the query
+    assert scores.tolist() == [0.5, 0.25]
+
+
+def test_rrf_sums_duplicates_across_tiers():
+    candidates = CandidateSet.from_tiers({
+        "L2": [_fact("f1", "Reefer alarm at berth 4", 0.05, 0.8), _fact("f2", "Other", 0.04, 0.7)],
+        "L3": [_episode("e1", "Reefer incident episode", 0.91, 0.6, source_fact_ids=["f1"])],
+    })
+
+    ranked = ReciprocalRankFusion(k=60).rank(candidates, WEIGHTS, limit=10)
+
+    assert len(ranked) == 2
+    top = ranked[0]
+    # Episode outranks the fact it subsumes and carries both contributions
+    assert top["tier"] == "L3"
+    assert top["score"] == pytest.approx(0.5 + 0.3)
+    assert top["metadata"]["duplicates"] == [{"tier": "L2", "fact_id": "f1"}]
+    assert ranked[1]["metadata"]["fact_id"] == "f2"
+    assert "duplicates" not in ranked[1]["metadata"]
+
+
+def test_minmax_matches_original_prior_weighting():
+    candidates = CandidateSet.from_tiers({
+        "L2": [_fact("f1", "a", None, 0.9), _fact("f2", "b", None, 0.6)],
+        "L3": [_episode("e1", "c", None, 0.4)],
+    })
+
+    ranked = MinMaxPriorFusion().rank(candidates, WEIGHTS, limit=10)
+
+    scores = {r["content"]: r["score"] for r in ranked}
+    assert scores == pytest.approx({"a": 0.3, "b": 0.0, "c": 0.0})
+    # Ties keep tier order
+    assert [r["content"] for r in ranked] == ["a", "b", "c"]
+
+
+def test_rank_respects_limit_and_empty_input():
+    candidates = CandidateSet.from_tiers({"L2": [_fact(f"f{i}", f"fact {i}", 0.1, 0.5) for i in range(5)]})
+
+    assert len(RelevanceWeightedFusion().rank(candidates, WEIGHTS, limit=2)) == 2
+    assert RelevanceWeightedFusion().rank(CandidateSet.from_tiers({}), WEIGHTS, limit=5) == []
+
+
+def test_get_ranker():
+    assert isinstance(get_ranker(), RelevanceWeightedFusion)
+    assert get_ranker("rrf", k=10).k == 10
+    ranker = MinMaxPriorFusion()
+    assert get_ranker(ranker) is ranker
+    with pytest.raises(ValueError):
+        get_ranker("bm25")
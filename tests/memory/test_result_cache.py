@@ -0,0 +1,98 @@
+"""
+Tests for result caching primitives (LRU+TTL cache and single-flight).
+"""
+
+import asyncio
+
+import pytest
+
+from src.memory.result_cache import LRUTTLCache, SingleFlight
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUTTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry_counts_as_miss():
+    cache = LRUTTLCache(ttl_seconds=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["misses"] == 1
+    assert stats["total_entries"] == 0
+
+
+def test_invalidate_tags_removes_tagged_entries():
+    cache = LRUTTLCache()
+    cache.set("q1", "r1", tags=["doc_1", "doc_2"])
+    cache.set("q2", "r2", tags=["doc_2"])
+    cache.set("q3", "r3", tags=["doc_3"])
+
+    assert cache.invalidate_tags(["doc_2"]) == 2
+    assert len(cache) == 1
+    assert cache.get("q3") == "r3"
+    # Tag index is cleaned up with the entries
+    assert cache.invalidate_tags(["doc_1"]) == 0
+
+
+def test_hit_rate():
+    cache = LRUTTLCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+
+    assert cache.stats()["hit_rate"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_result():
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "done"
+
+    tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert [r for r, _ in results] == ["done"] * 3
+    assert sorted(shared for _, shared in results) == [False, True, True]
+    assert flight.coalesced == 2
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    tasks = [asyncio.create_task(flight.do("k", failing)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.in_flight() == 0
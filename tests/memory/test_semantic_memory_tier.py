@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 from src.memory.tiers.semantic_memory_tier import SemanticMemoryTier
 from src.memory.models import KnowledgeDocument
+from src.memory.embedding_cache import EmbeddingCache
 from src.storage.typesense_adapter import TypesenseAdapter
 
 
@@ -90,6 +91,171 @@ class TestSemanticMemoryTierStore:
         assert doc['confidence_score'] == 0.85
         assert 'scheduling' in doc['tags']
     
+    @pytest.mark.asyncio
+    async def test_store_caches_embedding(
+        self, mock_typesense_adapter, sample_knowledge
+    ):
+        """Test that documents are embedded once at store time and cached."""
+        provider = AsyncMock()
+        provider.get_embedding = AsyncMock(return_value=[3.0, 4.0])
+        cache = EmbeddingCache()
+        tier = SemanticMemoryTier(
+            typesense_adapter=mock_typesense_adapter,
+            config={'collection_name': 'knowledge_test'},
+            embedding_provider=provider,
+            embedding_cache=cache
+        )
+        
+        await tier.store(sample_knowledge)
+        
+        provider.get_embedding.assert_awaited_once()
+        assert cache.get('know_001').tolist() == pytest.approx([0.6, 0.8])
+        # The vector is persisted with the document
+        document = mock_typesense_adapter.index_document.call_args.kwargs['document']
+        assert document['embedding'] == [3.0, 4.0]
+        
+        await tier.delete('know_001')
+        assert 'know_001' not in cache
+    
+    @pytest.mark.asyncio
+    async def test_cache_missing_embeddings(
+        self, mock_typesense_adapter, sample_knowledge
+    ):
+        """Test legacy documents are embedded on first use, once, and written back."""
+        provider = AsyncMock()
+        provider.get_embedding = AsyncMock(return_value=[3.0, 4.0])
+        cache = EmbeddingCache()
+        cache.put('know_001', [1.0, 0.0])
+        tier = SemanticMemoryTier(
+            typesense_adapter=mock_typesense_adapter,
+            config={'collection_name': 'knowledge_test'},
+            embedding_provider=provider,
+            embedding_cache=cache
+        )
+        second = sample_knowledge.model_copy(update={'knowledge_id': 'know_002'})
+        
+        assert await tier.cache_missing_embeddings([sample_knowledge, second]) == 1
+        assert await tier.cache_missing_embeddings([sample_knowledge, second]) == 0
+        
+        provider.get_embedding.assert_awaited_once()
+        assert cache.get('know_001').tolist() == pytest.approx([1.0, 0.0])
+        assert cache.get('know_002').tolist() == pytest.approx([0.6, 0.8])
+        mock_typesense_adapter.update_many.assert_awaited_once_with(
+            [{'id': 'know_002', 'embedding': [3.0, 4.0]}],
+            collection_name='knowledge_test'
+        )
+    
+    @pytest.mark.asyncio
+    async def test_persisted_embeddings_need_no_provider_call(
+        self, mock_typesense_adapter, sample_knowledge
+    ):
+        """Test vectors read back from Typesense are cached without re-embedding."""
+        provider = AsyncMock()
+        provider.get_embedding = AsyncMock(return_value=[3.0, 4.0])
+        cache = EmbeddingCache()
+        tier = SemanticMemoryTier(
+            typesense_adapter=mock_typesense_adapter,
+            config={'collection_name': 'knowledge_test'},
+            embedding_provider=provider,
+            embedding_cache=cache
+        )
+        document = sample_knowledge.model_copy(update={'embedding': [0.0, 2.0]})
+        stored = SemanticMemoryTier._knowledge_from_document(document.to_typesense_document())
+        
+        assert stored.embedding == [0.0, 2.0]
+        assert await tier.cache_missing_embeddings([stored]) == 1
+        
+        provider.get_embedding.assert_not_called()
+        mock_typesense_adapter.update_many.assert_not_called()
+        assert cache.get('know_001').tolist() == pytest.approx([0.0, 1.0])
+    
+    @pytest.mark.asyncio
+    async def test_store_batch_embeds_in_one_request(
+        self, mock_typesense_adapter, sample_knowledge
+    ):
+        """Test a batch store embeds all documents with one provider request."""
+        class BatchProvider:
+            get_embedding = AsyncMock()
+            
+            async def get_embeddings(self, texts):
+                self.calls.append(texts)
+                return [[float(i), 1.0] for i in range(len(texts))]
+        
+        provider = BatchProvider()
+        provider.calls = []
+        tier = SemanticMemoryTier(
+            typesense_adapter=mock_typesense_adapter,
+            config={'collection_name': 'knowledge_test'},
+            embedding_provider=provider,
+            embedding_cache=EmbeddingCache()
+        )
+        second = sample_knowledge.model_copy(update={'knowledge_id': 'know_002'})
+        tier.typesense.store_batch = AsyncMock(return_value=['know_001', 'know_002'])
+        
+        await tier.store_batch([sample_knowledge, second])
+        
+        assert len(provider.calls) == 1 and len(provider.calls[0]) == 2
+        provider.get_embedding.assert_not_called()
+        documents = tier.typesense.store_batch.call_args.args[0]
+        assert [doc['embedding'] for doc in documents] == [[0.0, 1.0], [1.0, 1.0]]
+    
+    @pytest.mark.asyncio
+    async def test_store_batch_single_import(self, semantic_tier, sample_knowledge):
+        """Test several documents are stored with one bulk import."""
+        second = sample_knowledge.model_copy(update={'knowledge_id': 'know_002'})
+        semantic_tier.typesense.store_batch = AsyncMock(return_value=['know_001', 'know_002'])
+        notified = []
+        
+        async def listener(ids):
+            notified.append(ids)
+        
+        semantic_tier.add_write_listener(listener)
+        
+        ids = await semantic_tier.store_batch([sample_knowledge, second])
+        
+        assert ids == ['know_001', 'know_002']
+        semantic_tier.typesense.store_batch.assert_awaited_once()
+        call_args = semantic_tier.typesense.store_batch.call_args
+        assert [doc['id'] for doc in call_args.args[0]] == ['know_001', 'know_002']
+        assert call_args.kwargs['collection_name'] == 'knowledge_test'
+        semantic_tier.typesense.index_document.assert_not_called()
+        assert notified == [['know_001', 'know_002']]
+    
+    @pytest.mark.asyncio
+    async def test_store_batch_skips_rejected_documents(
+        self, mock_typesense_adapter, sample_knowledge
+    ):
+        """Test documents the import rejected are not cached, notified or returned."""
+        provider = AsyncMock()
+        provider.get_embedding = AsyncMock(return_value=[3.0, 4.0])
+        cache = EmbeddingCache()
+        tier = SemanticMemoryTier(
+            typesense_adapter=mock_typesense_adapter,
+            config={'collection_name': 'knowledge_test'},
+            embedding_provider=provider,
+            embedding_cache=cache
+        )
+        second = sample_knowledge.model_copy(update={'knowledge_id': 'know_002'})
+        tier.typesense.store_batch = AsyncMock(return_value=['know_002'])
+        notified = []
+        
+        async def listener(ids):
+            notified.append(ids)
+        
+        tier.add_write_listener(listener)
+        
+        ids = await tier.store_batch([sample_knowledge, second])
+        
+        assert ids == ['know_002']
+        assert notified == [['know_002']]
+        assert 'know_001' not in cache
+        assert 'know_002' in cache
+        
+        # Nothing accepted: no notification
+        tier.typesense.store_batch = AsyncMock(return_value=[])
+        assert await tier.store_batch([sample_knowledge]) == []
+        assert notified == [['know_002']]
+    
     @pytest.mark.asyncio
     async def test_store_from_dict(self, semantic_tier):
         """Test storing knowledge from dict."""
@@ -340,6 +506,60 @@ class TestSemanticMemoryTierSearch:
         assert 'confidence_score:>=0.7' in filter_by
         assert ' && ' in filter_by
 
+    
+    @pytest.mark.asyncio
+    async def test_search_many_single_round_trip(self, semantic_tier):
+        """Test several queries are sent as one multi_search, in order."""
+        now = datetime.now(timezone.utc)
+        
+        def hit(knowledge_id, score):
+            return {
+                'document': {
+                    'id': knowledge_id,
+                    'title': f'Knowledge {knowledge_id}',
+                    'content': 'Reefer containers need pre-trip inspection',
+                    'knowledge_type': 'procedure',
+                    'confidence_score': 0.9,
+                    'episode_count': 2,
+                    'distilled_at': int(now.timestamp()),
+                    'access_count': 0,
+                    'usefulness_score': 0.5,
+                    'validation_count': 0
+                },
+                'text_match': score
+            }
+        
+        semantic_tier.typesense.multi_search = AsyncMock(return_value=[
+            {'hits': [hit('k1', 0.9)]},
+            {'hits': []},
+            {'hits': [hit('k2', 0.7), hit('k3', 0.6)]},
+        ])
+        
+        results = await semantic_tier.search_many(
+            ['reefer', 'customs', 'inspection'],
+            filters={'category': 'ops'},
+            limit=5
+        )
+        
+        assert [[d.knowledge_id for d in docs] for docs in results] == [
+            ['k1'], [], ['k2', 'k3']
+        ]
+        assert results[2][0].metadata['search_score'] == 0.7
+        semantic_tier.typesense.multi_search.assert_awaited_once()
+        queries = semantic_tier.typesense.multi_search.call_args[0][0]
+        assert [q['q'] for q in queries] == ['reefer', 'customs', 'inspection']
+        assert all(q['filter_by'] == 'category:=ops' for q in queries)
+        assert all(q['collection_name'] == 'knowledge_test' and q['limit'] == 5 for q in queries)
+        semantic_tier.typesense.search.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_search_many_empty(self, semantic_tier):
+        """Test no queries means no request."""
+        semantic_tier.typesense.multi_search = AsyncMock(return_value=[])
+        
+        assert await semantic_tier.search_many([]) == []
+        semantic_tier.typesense.multi_search.assert_not_called()
+
 
 # ============================================
 # Query Tests
@@ -386,20 +606,24 @@ class TestSemanticMemoryTierUpdate:
             'usefulness_score': 0.7,
             'validation_count': 2
         })
-        semantic_tier.typesense.update_document = AsyncMock()
+        semantic_tier.typesense.update_partial = AsyncMock(return_value=True)
         
         # Update usefulness
         result = await semantic_tier.update_usefulness('know_001', 0.9)
         
-        # Verify
+        # Verify: one read, one partial write, no full re-index
         assert result is True
-        semantic_tier.typesense.update_document.assert_called()
-        
-        # Check updated values
-        call_args = semantic_tier.typesense.update_document.call_args
-        updated_doc = call_args.kwargs['document']
-        assert updated_doc['usefulness_score'] == 0.9
-        assert updated_doc['validation_count'] == 3
+        semantic_tier.typesense.update_document.assert_not_called()
+        semantic_tier.typesense.update_partial.assert_awaited_once()
+        
+        # Check only the feedback fields are patched
+        call_args = semantic_tier.typesense.update_partial.call_args
+        assert call_args.args[0] == 'know_001'
+        assert call_args.kwargs['collection_name'] == 'knowledge_test'
+        fields = call_args.args[1]
+        assert set(fields) == {'usefulness_score', 'validation_count', 'last_validated'}
+        assert fields['usefulness_score'] == 0.9
+        assert fields['validation_count'] == 3
     
     @pytest.mark.asyncio
     async def test_update_nonexistent_knowledge(self, semantic_tier):
@@ -410,6 +634,32 @@ class TestSemanticMemoryTierUpdate:
         
         assert result is False
         semantic_tier.typesense.update_document.assert_not_called()
+        semantic_tier.typesense.update_partial.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_update_usefulness_many_single_bulk_update(self, semantic_tier):
+        """Test feedback for several documents is applied with one bulk update."""
+        semantic_tier.typesense.retrieve_batch = AsyncMock(return_value=[
+            {'id': 'know_001', 'validation_count': 2},
+            None,
+        ])
+        semantic_tier.typesense.update_many = AsyncMock(return_value={'know_001': True})
+        notified = []
+        
+        async def listener(ids):
+            notified.append(ids)
+        
+        semantic_tier.add_write_listener(listener)
+        
+        results = await semantic_tier.update_usefulness_many({'know_001': 0.8, 'missing': 0.4})
+        
+        assert results == {'know_001': True, 'missing': False}
+        updates = semantic_tier.typesense.update_many.call_args.args[0]
+        assert len(updates) == 1
+        assert updates[0]['id'] == 'know_001'
+        assert updates[0]['usefulness_score'] == 0.8
+        assert updates[0]['validation_count'] == 3
+        assert notified == [['know_001']]
 
 
 # ============================================
@@ -12,12 +12,16 @@ Tests cover:
 - Health checks
 """
 
+import re
+
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, create_autospec
 
+from src.memory.ciar_scorer import get_ciar_scorer
 from src.memory.tiers.working_memory_tier import WorkingMemoryTier
 from src.memory.models import Fact, FactType
+from src.storage.postgres_adapter import PostgresAdapter
 
 
 class TestWorkingMemoryTierStore:
@@ -388,7 +392,46 @@ class TestWorkingMemoryTierQuery:
         # Should only return fact with CIAR >= 0.6
         assert len(facts) == 1
         assert facts[0].ciar_score >= 0.6
-        
+
+        await tier.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_search_facts_exposes_ts_rank(self):
+        """Test full-text search keeps ts_rank as the fact's search score."""
+        postgres_adapter = create_autospec(PostgresAdapter, instance=True)
+        postgres_adapter.execute.return_value = [
+            {
+                'fact_id': 'fact-001',
+                'session_id': 'session-123',
+                'content': 'Container MAEU1234567 delayed at USLAX',
+                'ciar_score': 0.8,
+                'certainty': 0.9,
+                'impact': 0.9,
+                'age_decay': 1.0,
+                'recency_boost': 1.0,
+                'source_type': 'extracted',
+                'metadata': '{}',
+                'extracted_at': datetime.now(timezone.utc),
+                'last_accessed': datetime.now(timezone.utc),
+                'access_count': 0,
+                'content_tsv': "'maeu1234567':2",
+                'rank': 0.0607927
+            }
+        ]
+
+        tier = WorkingMemoryTier(
+            postgres_adapter=postgres_adapter,
+            config={'ciar_threshold': 0.6}
+        )
+        await tier.initialize()
+
+        facts = await tier.search_facts('MAEU1234567', session_id='session-123')
+
+        assert len(facts) == 1
+        assert facts[0].metadata['search_score'] == pytest.approx(0.0607927)
+        sql, params = postgres_adapter.execute.call_args.args
+        assert set(re.findall(r'%\((\w+)\)s', sql)) == set(params)
+
         await tier.cleanup()
 
 
@@ -589,3 +632,203 @@ class TestWorkingMemoryTierContextManager:
         
         # After context exit, should be cleaned up
         assert not tier.is_initialized()
+
+
+class TestWorkingMemoryTierSharedScorer:
+    """Test suite for the shared CIAR configuration."""
+    
+    def test_threshold_follows_shared_scorer(self, postgres_adapter, tmp_path):
+        """Test that the default threshold tracks CIAR config reloads."""
+        config_path = tmp_path / "ciar_config.yaml"
+        config_path.write_text(
+            "ciar:\n  threshold: 0.6\n  age_decay: {lambda: 0.1, max_age_days: 30, min_score: 0.1}\n"
+            "  recency: {boost_factor: 0.05, max_boost: 0.3}\n  certainty: {default: 0.7}\n"
+            "  impact_weights: {preference: 0.9}\n"
+        )
+        scorer = get_ciar_scorer(config_path)
+        tier = WorkingMemoryTier(postgres_adapter=postgres_adapter, ciar_scorer=scorer)
+        pinned = WorkingMemoryTier(
+            postgres_adapter=postgres_adapter,
+            config={'ciar_threshold': 0.5},
+            ciar_scorer=scorer
+        )
+        
+        config_path.write_text(config_path.read_text().replace('threshold: 0.6', 'threshold: 0.7'))
+        scorer.reload()
+        
+        assert tier.ciar_threshold == 0.7
+        assert pinned.ciar_threshold == 0.5
+    
+    def test_default_scorer_is_shared(self, postgres_adapter):
+        """Test that tiers default to the process-wide scorer."""
+        tier = WorkingMemoryTier(postgres_adapter=postgres_adapter)
+        
+        assert tier.ciar_scorer is get_ciar_scorer()
+
+
+class TestWorkingMemoryTierRescore:
+    """Test suite for in-database CIAR re-scoring."""
+    
+    @pytest.fixture
+    def adapter(self):
+        """Adapter with the real PostgresAdapter method signatures."""
+        return create_autospec(PostgresAdapter, instance=True)
+    
+    @pytest.mark.asyncio
+    async def test_rescore_runs_in_chunks(self, adapter):
+        """Test that chunks are keyset-paged until a short chunk."""
+        adapter.execute.side_effect = [
+            [{'last_fact_id': 'fact-002', 'scanned': 2, 'updated': 2}],
+            [{'last_fact_id': 'fact-003', 'scanned': 1, 'updated': 0}],
+        ]
+        tier = WorkingMemoryTier(postgres_adapter=adapter)
+        
+        stats = await tier.rescore_decay(chunk_size=2)
+        
+        assert stats == {'scanned': 3, 'updated': 2, 'chunks': 2}
+        calls = adapter.execute.call_args_list
+        sql, params = calls[0].args
+        assert 'UPDATE working_memory' in sql
+        # psycopg placeholders, every one bound by name
+        assert '$' not in sql
+        assert set(re.findall(r'%\((\w+)\)s', sql)) == set(params)
+        assert (params['after_fact_id'], params['session_id'], params['chunk_size']) == ('', None, 2)
+        assert calls[1].args[1]['after_fact_id'] == 'fact-002'
+        # CIAR config comes from the shared scorer
+        config = tier.ciar_scorer.config_snapshot
+        assert params['age_decay_lambda'] == config.age_decay_lambda
+        assert params['min_age_score'] == config.min_age_score
+        assert params['max_age_days'] == config.max_age_days
+        assert params['recency_boost_factor'] == config.recency_boost_factor
+        assert params['max_recency_boost'] == config.max_recency_boost
+    
+    @pytest.mark.asyncio
+    async def test_rescore_empty_table(self, adapter):
+        """Test rescoring with no facts."""
+        adapter.execute.return_value = [
+            {'last_fact_id': None, 'scanned': 0, 'updated': 0}
+        ]
+        tier = WorkingMemoryTier(postgres_adapter=adapter)
+        
+        stats = await tier.rescore_decay(session_id='session-123')
+        
+        assert stats == {'scanned': 0, 'updated': 0, 'chunks': 1}
+        assert adapter.execute.call_args.args[1]['session_id'] == 'session-123'
+
+
+class TestWorkingMemoryTierQueryBatch:
+    """Test suite for columnar bulk reads."""
+    
+    @pytest.mark.asyncio
+    async def test_query_batch_filters_without_models(self, postgres_adapter):
+        """Test that query_batch filters rows by CIAR and builds no Facts."""
+        postgres_adapter.query.return_value = [
+            {'fact_id': 'fact-001', 'session_id': 'session-123', 'content': 'High', 'ciar_score': 0.8},
+            {'fact_id': 'fact-002', 'session_id': 'session-123', 'content': 'Low', 'ciar_score': 0.3},
+            {'fact_id': 'fact-003', 'session_id': 'session-123', 'content': 'Unscored'},
+        ]
+        tier = WorkingMemoryTier(postgres_adapter=postgres_adapter, config={'ciar_threshold': 0.6})
+        
+        batch = await tier.query_batch(filters={'session_id': 'session-123'}, limit=10)
+        
+        assert batch.fact_ids == ['fact-001', 'fact-003']
+        # Missing scores count as the threshold
+        assert batch.ciar_score.tolist() == [0.8, 0.6]
+        assert batch._facts == [None, None]
+        
+        facts = await tier.query(filters={'session_id': 'session-123'}, limit=1)
+        assert [f.fact_id for f in facts] == ['fact-001']
+
+
+class TestWorkingMemoryTierConsolidationTracking:
+    """Test suite for unconsolidated-fact tracking."""
+    
+    @pytest.fixture
+    def adapter(self):
+        """Adapter with the real PostgresAdapter method signatures."""
+        return create_autospec(PostgresAdapter, instance=True)
+    
+    @staticmethod
+    def _bound(adapter):
+        """SQL and params of the last execute, checking every placeholder is bound."""
+        sql, params = adapter.execute.call_args.args
+        assert '$' not in sql
+        assert set(re.findall(r'%\((\w+)\)s', sql)) == set(params)
+        return sql, params
+    
+    @pytest.mark.asyncio
+    async def test_query_unconsolidated_pages_by_cursor(self, adapter):
+        """Test that a page is read after the given fact into a FactBatch."""
+        adapter.execute.return_value = [
+            {'fact_id': 'fact-003', 'session_id': 'session-123', 'content': 'Pending', 'ciar_score': 0.7},
+        ]
+        tier = WorkingMemoryTier(postgres_adapter=adapter)
+        
+        batch = await tier.query_unconsolidated(limit=50, after_fact_id='fact-002')
+        
+        assert batch.fact_ids == ['fact-003']
+        sql, params = self._bound(adapter)
+        assert 'consolidated_at IS NULL' in sql
+        assert params == {'session_id': None, 'after_fact_id': 'fact-002', 'limit': 50}
+    
+    @pytest.mark.asyncio
+    async def test_claim_unconsolidated_skips_locked_and_claimed_rows(self, adapter):
+        """Test that a page is claimed in the statement that selects it."""
+        adapter.execute.return_value = [
+            {'fact_id': 'fact-003', 'session_id': 'session-123', 'content': 'Pending', 'ciar_score': 0.7},
+        ]
+        tier = WorkingMemoryTier(postgres_adapter=adapter, config={'claim_timeout_seconds': 30})
+        
+        batch = await tier.claim_unconsolidated(session_id='session-123', limit=10)
+        
+        assert batch.fact_ids == ['fact-003']
+        adapter.execute.assert_awaited_once()
+        sql, params = self._bound(adapter)
+        assert 'SET claimed_at = NOW()' in sql
+        assert 'FOR UPDATE SKIP LOCKED' in sql
+        assert params == {
+            'session_id': 'session-123',
+            'after_fact_id': None,
+            'limit': 10,
+            'claim_timeout': 30.0
+        }
+    
+    @pytest.mark.asyncio
+    async def test_release_claims(self, adapter):
+        """Test that claims are released with one UPDATE, and none for no facts."""
+        adapter.execute.return_value = [{'count': 2}]
+        tier = WorkingMemoryTier(postgres_adapter=adapter)
+        
+        assert await tier.release_claims([]) == 0
+        assert await tier.release_claims(['fact-001', 'fact-002']) == 2
+        
+        adapter.execute.assert_awaited_once()
+        sql, params = self._bound(adapter)
+        assert 'SET claimed_at = NULL' in sql
+        assert params == {'fact_ids': ['fact-001', 'fact-002']}
+    
+    @pytest.mark.asyncio
+    async def test_count_unconsolidated_is_capped(self, adapter):
+        """Test that the count passes its cap to the query."""
+        adapter.execute.return_value = [{'count': 50}]
+        tier = WorkingMemoryTier(postgres_adapter=adapter)
+        
+        count = await tier.count_unconsolidated(session_id='session-123', limit=50)
+        
+        assert count == 50
+        assert self._bound(adapter)[1] == {'session_id': 'session-123', 'limit': 50}
+    
+    @pytest.mark.asyncio
+    async def test_mark_consolidated_in_one_statement(self, adapter):
+        """Test that facts are marked with one UPDATE, and none for no facts."""
+        adapter.execute.return_value = [{'count': 2}]
+        tier = WorkingMemoryTier(postgres_adapter=adapter)
+        
+        assert await tier.mark_consolidated([], 'episode-1') == 0
+        marked = await tier.mark_consolidated(['fact-001', 'fact-002'], 'episode-1')
+        
+        assert marked == 2
+        adapter.execute.assert_awaited_once()
+        sql, params = self._bound(adapter)
+        assert 'claimed_at = NULL' in sql
+        assert params == {'fact_ids': ['fact-001', 'fact-002'], 'episode_id': 'episode-1'}
@@ -122,6 +122,9 @@ class TestNeo4jAdapterUnit:
             assert result_id == 'entity-id'
             # Check that run was called for the store operation (second call)
             assert mock_session.run.call_count == 2
+            # Merged on the default label so unlabelled lookups find it
+            cypher = mock_session.run.call_args[0][0]
+            assert "MERGE (n:Entity {id: $id}) SET n:Person" in cypher
     
     async def test_store_relationship_success(self, mock_neo4j_driver):
         """Test successful storage of relationship."""
@@ -255,6 +258,164 @@ class TestNeo4jAdapterUnit:
             result = await adapter.retrieve('entity-id')
             assert result is not None
             assert 'name' in result
+            
+            # Lookup is scoped to the default entity label (index-backed)
+            cypher = mock_session.run.call_args[0][0]
+            assert cypher == "MATCH (n:Entity {id: $id}) RETURN n"
+    
+    async def test_retrieve_with_label(self, mock_neo4j_driver):
+        """Test retrieval scoped to an explicit label."""
+        mock_driver, mock_session = mock_neo4j_driver
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(return_value=None)
+        mock_session.run = AsyncMock(return_value=mock_result)
+        
+        with patch('src.storage.neo4j_adapter.AsyncGraphDatabase.driver', return_value=mock_driver):
+            adapter = Neo4jAdapter({
+                'uri': 'bolt://localhost:7687',
+                'user': 'neo4j',
+                'password': 'password'
+            })
+            await adapter.connect()
+            
+            await adapter.retrieve('ep-1', label='Episode')
+            assert mock_session.run.call_args[0][0] == "MATCH (n:Episode {id: $id}) RETURN n"
+            
+            with pytest.raises(StorageQueryError):
+                await adapter.retrieve('x', label='Entity) MATCH (m')
+    
+    async def test_connect_bootstraps_schema(self, mock_neo4j_driver):
+        """Test that connect() creates and verifies constraints and indexes."""
+        from src.storage.neo4j_adapter import RANGE_INDEXES, UNIQUE_CONSTRAINTS
+        
+        mock_driver, mock_session = mock_neo4j_driver
+        mock_result = AsyncMock()
+        mock_session.run = AsyncMock(return_value=mock_result)
+        
+        tx = AsyncMock()
+        show_result = AsyncMock()
+        show_result.data = AsyncMock(return_value=[
+            {'name': 'entity_entityid_unique', 'state': 'ONLINE'},
+            {'name': 'episode_episodeid_unique', 'state': 'ONLINE'},
+            {'name': 'episode_sessionid_range', 'state': 'POPULATING'},
+        ])
+        tx.run = AsyncMock(return_value=show_result)
+        
+        async def run_in_tx(fn, *args):
+            return await fn(tx, *args)
+        
+        mock_session.execute_write = AsyncMock(side_effect=run_in_tx)
+        mock_session.execute_read = AsyncMock(side_effect=run_in_tx)
+        
+        with patch('src.storage.neo4j_adapter.AsyncGraphDatabase.driver', return_value=mock_driver):
+            adapter = Neo4jAdapter({
+                'uri': 'bolt://localhost:7687',
+                'user': 'neo4j',
+                'password': 'password'
+            })
+            await adapter.connect()
+        
+        statements = [c[0][0] for c in tx.run.call_args_list]
+        assert (
+            "CREATE CONSTRAINT episode_episodeid_unique IF NOT EXISTS "
+            "FOR (n:Episode) REQUIRE n.episodeId IS UNIQUE"
+        ) in statements
+        assert (
+            "CREATE RANGE INDEX episode_factvalidfrom_range IF NOT EXISTS "
+            "FOR (n:Episode) ON (n.factValidFrom)"
+        ) in statements
+        assert len(statements) == len(UNIQUE_CONSTRAINTS) + len(RANGE_INDEXES) + 1
+        
+        assert 'episode_sessionid_range' in adapter.missing_schema
+        assert 'episode_episodeid_unique' not in adapter.missing_schema
+        assert adapter.is_connected is True
+    
+    async def test_schema_statement_failure_keeps_other_indexes(self, mock_neo4j_driver):
+        """Test each schema statement runs in its own transaction."""
+        from src.storage.neo4j_adapter import RANGE_INDEXES, UNIQUE_CONSTRAINTS
+        
+        mock_driver, mock_session = mock_neo4j_driver
+        mock_session.run = AsyncMock(return_value=AsyncMock())
+        
+        show_result = AsyncMock()
+        show_result.data = AsyncMock(return_value=[
+            {'name': 'episode_episodeid_unique', 'state': 'ONLINE'},
+        ])
+        tx = AsyncMock()
+        tx.run = AsyncMock(return_value=show_result)
+        
+        async def run_in_tx(fn, *args):
+            if args and 'entity_entityid_unique' in args[0]:
+                raise RuntimeError("existing duplicate entityId values")
+            return await fn(tx, *args)
+        
+        mock_session.execute_write = AsyncMock(side_effect=run_in_tx)
+        mock_session.execute_read = AsyncMock(side_effect=run_in_tx)
+        
+        with patch('src.storage.neo4j_adapter.AsyncGraphDatabase.driver', return_value=mock_driver):
+            adapter = Neo4jAdapter({
+                'uri': 'bolt://localhost:7687',
+                'user': 'neo4j',
+                'password': 'password'
+            })
+            await adapter.connect()
+        
+        assert mock_session.execute_write.await_count == len(UNIQUE_CONSTRAINTS) + len(RANGE_INDEXES)
+        statements = [c[0][0] for c in tx.run.call_args_list]
+        assert not any('entity_entityid_unique' in statement for statement in statements)
+        assert 'episode_episodeid_unique' not in adapter.missing_schema
+        assert 'entity_entityid_unique' in adapter.missing_schema
+    
+    async def test_schema_bootstrap_uses_configured_label(self, mock_neo4j_driver):
+        """Test entity constraints and indexes follow default_label."""
+        mock_driver, mock_session = mock_neo4j_driver
+        mock_session.run = AsyncMock(return_value=AsyncMock())
+        
+        tx = AsyncMock()
+        show_result = AsyncMock()
+        show_result.data = AsyncMock(return_value=[])
+        tx.run = AsyncMock(return_value=show_result)
+        
+        async def run_in_tx(fn, *args):
+            return await fn(tx, *args)
+        
+        mock_session.execute_write = AsyncMock(side_effect=run_in_tx)
+        mock_session.execute_read = AsyncMock(side_effect=run_in_tx)
+        
+        with patch('src.storage.neo4j_adapter.AsyncGraphDatabase.driver', return_value=mock_driver):
+            adapter = Neo4jAdapter({
+                'uri': 'bolt://localhost:7687',
+                'user': 'neo4j',
+                'password': 'password',
+                'default_label': 'Party'
+            })
+            await adapter.connect()
+        
+        statements = [c[0][0] for c in tx.run.call_args_list]
+        assert (
+            "CREATE CONSTRAINT party_entityid_unique IF NOT EXISTS "
+            "FOR (n:Party) REQUIRE n.entityId IS UNIQUE"
+        ) in statements
+        assert "CREATE RANGE INDEX party_id_range IF NOT EXISTS FOR (n:Party) ON (n.id)" in statements
+        assert not any('(n:Entity)' in statement for statement in statements)
+        assert 'party_id_range' in adapter.missing_schema
+    
+    async def test_schema_bootstrap_can_be_disabled(self, mock_neo4j_driver):
+        """Test that ensure_schema=False skips schema statements."""
+        mock_driver, mock_session = mock_neo4j_driver
+        mock_session.run = AsyncMock(return_value=AsyncMock())
+        mock_session.execute_write = AsyncMock()
+        
+        with patch('src.storage.neo4j_adapter.AsyncGraphDatabase.driver', return_value=mock_driver):
+            adapter = Neo4jAdapter({
+                'uri': 'bolt://localhost:7687',
+                'user': 'neo4j',
+                'password': 'password',
+                'ensure_schema': False
+            })
+            await adapter.connect()
+        
+        mock_session.execute_write.assert_not_called()
     
     async def test_retrieve_not_found(self, mock_neo4j_driver):
         """Test retrieval when entity is not found."""
@@ -732,6 +893,9 @@ class TestNeo4jRelationshipOperations:
             })
             
             assert rel_id == '12345'
+            cypher = mock_session.run.call_args[0][0]
+            assert "MATCH (from:Entity {id: $from_id})" in cypher
+            assert "MATCH (to:Entity {id: $to_id})" in cypher
             await adapter.disconnect()
     
     async def test_get_relationships_by_node(self, mock_neo4j_driver):
@@ -2009,3 +2173,192 @@ class TestNeo4jHealthCheckEdgeCases:
             assert metrics is not None
             assert 'error' in metrics
             await adapter.disconnect()
+
+
+@pytest.mark.asyncio
+class TestNeo4jAdapterGroupedBatch:
+    """store_batch groups items into chunked UNWIND statements."""
+
+    async def test_store_batch_groups_and_preserves_order(self):
+        adapter = Neo4jAdapter({
+            'uri': 'bolt://localhost:7687',
+            'user': 'neo4j',
+            'password': 'password',
+            'batch_chunk_size': 2
+        })
+        adapter._connected = True
+
+        statements = []
+
+        async def run(cypher, rows):
+            statements.append((cypher, rows))
+            result = AsyncMock()
+            if 'MERGE (n:' in cypher:
+                data = [{'idx': row['idx'], 'id': row['id']} for row in rows]
+            else:
+                # Relationship endpoints for 'Missing' are not found
+                data = [
+                    {'idx': row['idx'], 'id': 100 + row['idx']}
+                    for row in rows if row['to_id'] != 'Missing'
+                ]
+            result.data = AsyncMock(return_value=data)
+            return result
+
+        tx = AsyncMock()
+        tx.run = AsyncMock(side_effect=run)
+
+        async def run_in_tx(fn, *args):
+            return await fn(tx, *args)
+
+        session = AsyncMock()
+        session.execute_write = AsyncMock(side_effect=run_in_tx)
+        session_context = AsyncMock()
+        session_context.__aenter__ = AsyncMock(return_value=session)
+        session_context.__aexit__ = AsyncMock(return_value=None)
+        adapter.driver = Mock()
+        adapter.driver.session.return_value = session_context
+
+        items = [
+            {'type': 'relationship', 'from': 'A', 'to': 'B', 'relationship': 'KNOWS'},
+            {'type': 'entity', 'label': 'Person', 'properties': {'name': 'A'}},
+            {'type': 'entity', 'label': 'Port', 'properties': {'name': 'USLAX'}},
+            {'type': 'entity', 'label': 'Person', 'properties': {'name': 'B'}},
+            {'type': 'entity', 'label': 'Person', 'properties': {'name': 'C'}},
+            {'type': 'relationship', 'from': 'A', 'to': 'Missing', 'relationship': 'KNOWS'},
+        ]
+
+        ids = await adapter.store_batch(items)
+
+        assert ids == ['100', 'A', 'USLAX', 'B', 'C', '']
+        session.execute_write.assert_awaited_once()
+        # Person (3 rows, chunked 2+1), Port (1), KNOWS (2) -> 4 statements
+        assert len(statements) == 4
+        assert all('UNWIND $rows AS row' in cypher for cypher, _ in statements)
+        # Entities are written before relationships
+        assert 'MERGE (from)-[r:KNOWS]->(to)' in statements[-1][0]
+        assert [len(rows) for _, rows in statements] == [2, 1, 1, 2]
+
+    async def test_store_batch_rejects_invalid_label(self):
+        adapter = Neo4jAdapter({
+            'uri': 'bolt://localhost:7687',
+            'user': 'neo4j',
+            'password': 'password'
+        })
+        adapter._connected = True
+        adapter.driver = Mock()
+
+        with pytest.raises(StorageQueryError):
+            await adapter.store_batch([
+                {'type': 'entity', 'label': 'Person {id: 1}) DETACH DELETE (x', 'properties': {}}
+            ])
+
+
+@pytest.mark.asyncio
+class TestNeo4jAdapterManagedTransactions:
+    """execute_read/execute_write use managed transactions and shared sessions."""
+
+    @pytest.fixture
+    def adapter_with_session(self):
+        adapter = Neo4jAdapter({
+            'uri': 'bolt://localhost:7687',
+            'user': 'neo4j',
+            'password': 'password',
+            'fetch_size': 250,
+            'max_connection_pool_size': 16
+        })
+        adapter._connected = True
+
+        result = AsyncMock()
+        result.data = AsyncMock(return_value=[{'n': 1}])
+        tx = AsyncMock()
+        tx.run = AsyncMock(return_value=result)
+
+        async def run_in_tx(fn, *args):
+            return await fn(tx, *args)
+
+        session = AsyncMock()
+        session.execute_read = AsyncMock(side_effect=run_in_tx)
+        session.execute_write = AsyncMock(side_effect=run_in_tx)
+        session_context = AsyncMock()
+        session_context.__aenter__ = AsyncMock(return_value=session)
+        session_context.__aexit__ = AsyncMock(return_value=None)
+        adapter.driver = Mock()
+        adapter.driver.session.return_value = session_context
+        return adapter, session, tx
+
+    async def test_execute_read_uses_read_transaction(self, adapter_with_session):
+        adapter, session, tx = adapter_with_session
+
+        rows = await adapter.execute_read("MATCH (n) RETURN n", {'x': 1})
+
+        assert rows == [{'n': 1}]
+        session.execute_read.assert_awaited_once()
+        session.execute_write.assert_not_called()
+        tx.run.assert_awaited_once_with("MATCH (n) RETURN n", {'x': 1})
+        adapter.driver.session.assert_called_once_with(database='neo4j', fetch_size=250)
+
+    async def test_execute_write_uses_write_transaction(self, adapter_with_session):
+        adapter, session, _ = adapter_with_session
+
+        await adapter.execute_write("CREATE (n:Tmp)")
+
+        session.execute_write.assert_awaited_once()
+        session.execute_read.assert_not_called()
+
+    async def test_unit_of_work_reuses_session(self, adapter_with_session):
+        adapter, session, _ = adapter_with_session
+
+        async with adapter.session() as outer:
+            await adapter.execute_read("MATCH (n) RETURN n")
+            await adapter.execute_write("CREATE (n:Tmp)")
+            async with adapter.session() as inner:
+                assert inner is outer
+
+        assert adapter.driver.session.call_count == 1
+        # Outside the unit of work a fresh session is opened again
+        await adapter.execute_read("MATCH (n) RETURN n")
+        assert adapter.driver.session.call_count == 2
+
+    async def test_adapter_operations_join_unit_of_work(self, adapter_with_session):
+        adapter, session, _ = adapter_with_session
+        result = AsyncMock()
+        result.data = AsyncMock(return_value=[{'id': 'a', 'n': {'id': 'a'}}])
+        result.single = AsyncMock(return_value={'n': {'id': 'a'}})
+        session.run = AsyncMock(return_value=result)
+
+        async with adapter.session():
+            await adapter.retrieve('a')
+            await adapter.retrieve_batch(['a'])
+            await adapter.search({'cypher': 'MATCH (n) RETURN n'})
+
+        adapter.driver.session.assert_called_once_with(database='neo4j', fetch_size=250)
+        assert session.run.await_count == 3
+
+    async def test_read_failure_raises_query_error(self, adapter_with_session):
+        adapter, session, _ = adapter_with_session
+        session.execute_read = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(StorageQueryError):
+            await adapter.execute_read("MATCH (n) RETURN n")
+
+    async def test_pool_size_passed_to_driver(self):
+        with patch('src.storage.neo4j_adapter.AsyncGraphDatabase.driver') as driver_factory:
+            driver = Mock()
+            session = AsyncMock()
+            session.run = AsyncMock(return_value=AsyncMock())
+            context = AsyncMock()
+            context.__aenter__ = AsyncMock(return_value=session)
+            context.__aexit__ = AsyncMock(return_value=None)
+            driver.session.return_value = context
+            driver_factory.return_value = driver
+
+            adapter = Neo4jAdapter({
+                'uri': 'bolt://localhost:7687',
+                'user': 'neo4j',
+                'password': 'password',
+                'max_connection_pool_size': 16,
+                'ensure_schema': False
+            })
+            await adapter.connect()
+
+        assert driver_factory.call_args.kwargs['max_connection_pool_size'] == 16
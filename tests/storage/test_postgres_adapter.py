@@ -475,4 +475,86 @@ async def test_delete_batch_with_missing_ids(postgres_adapter, session_id):
     assert results['999999992'] is False   # Not found
     assert results['999999993'] is False   # Not found
     
-    await postgres_adapter.disconnect()
\ No newline at end of file
+    await postgres_adapter.disconnect()
+
+@pytest.mark.asyncio
+async def test_execute_returns_rows(postgres_adapter):
+    """Test parameterized execute returns rows as dictionaries"""
+    rows = await postgres_adapter.execute(
+        "SELECT %(number)s::int AS number, %(label)s::text AS label",
+        {'number': 7, 'label': 'seven'}
+    )
+    assert rows == [{'number': 7, 'label': 'seven'}]
+    
+    # Positional parameters and empty results
+    assert await postgres_adapter.execute("SELECT 1 WHERE %s", (False,)) == []
+
+
+@pytest.mark.asyncio
+async def test_execute_without_connection():
+    """Test execute when not connected"""
+    adapter = PostgresAdapter({'url': 'postgresql://localhost:5432/unused'})
+    
+    with pytest.raises(StorageConnectionError, match="Not connected"):
+        await adapter.execute("SELECT 1")
+
+
+class _FakeCursor:
+    def __init__(self, rows, description):
+        self.rows = rows
+        self.description = description
+        self.executed = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def execute(self, query, params=None):
+        self.executed.append((query, params))
+    
+    async def fetchall(self):
+        return self.rows
+
+
+class _FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def cursor(self):
+        return self._cursor
+    
+    async def commit(self):
+        self.commits += 1
+
+
+class _FakePool:
+    def __init__(self, connection):
+        self._connection = connection
+    
+    def connection(self):
+        return self._connection
+
+
+@pytest.mark.asyncio
+async def test_execute_maps_rows_and_commits():
+    """Test execute passes parameters through, maps columns and commits"""
+    cursor = _FakeCursor(rows=[('fact-001', 2)], description=[('fact_id',), ('updated',)])
+    connection = _FakeConnection(cursor)
+    adapter = PostgresAdapter({'url': 'postgresql://localhost:5432/unused'})
+    adapter.pool = _FakePool(connection)
+    adapter._connected = True
+    
+    rows = await adapter.execute("UPDATE t SET x = %(x)s RETURNING fact_id, 2", {'x': 1})
+    
+    assert rows == [{'fact_id': 'fact-001', 'updated': 2}]
+    assert cursor.executed == [("UPDATE t SET x = %(x)s RETURNING fact_id, 2", {'x': 1})]
+    assert connection.commits == 1
@@ -5,7 +5,7 @@ import pytest
 import os
 import uuid
 from unittest.mock import AsyncMock, Mock, patch
-from src.storage.qdrant_adapter import QdrantAdapter
+from src.storage.qdrant_adapter import DEFAULT_PAYLOAD_INDEXES, QdrantAdapter
 from src.storage.base import StorageConnectionError, StorageDataError, StorageQueryError
 
 # ============================================================================
@@ -1537,3 +1537,336 @@ class TestQdrantCollectionManagement:
             assert 'collection1' in collections
             assert 'collection2' in collections
             await adapter.disconnect()
+
+
+class TestQdrantScrollAndProjection:
+    """Test paginated scrolling and payload/vector projection."""
+    
+    @pytest.fixture
+    def mock_qdrant_client(self):
+        """Mock Qdrant client for unit tests."""
+        mock = AsyncMock()
+        mock.close = AsyncMock()
+        return mock
+    
+    @staticmethod
+    def _point(point_id, content='text'):
+        point = Mock()
+        point.id = point_id
+        point.vector = None
+        point.payload = {'content': content, 'session_id': 's1'}
+        return point
+    
+    @pytest.mark.asyncio
+    async def test_iter_scroll_follows_next_offset(self, mock_qdrant_client):
+        """Test iter_scroll walks every page until next_offset is None."""
+        mock_qdrant_client.scroll = AsyncMock(side_effect=[
+            ([self._point('a'), self._point('b')], 'c'),
+            ([self._point('c'), self._point('d')], 'e'),
+            ([self._point('e')], None),
+        ])
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({'url': 'http://localhost:6333', 'collection_name': 'test_collection'})
+            await adapter.connect()
+            
+            ids = [point['id'] async for point in adapter.iter_scroll(
+                filter_dict={'session_id': 's1'}, page_size=2
+            )]
+            
+            assert ids == ['a', 'b', 'c', 'd', 'e']
+            offsets = [call.kwargs['offset'] for call in mock_qdrant_client.scroll.await_args_list]
+            assert offsets == [None, 'c', 'e']
+            assert all(call.kwargs['with_vectors'] is False
+                       for call in mock_qdrant_client.scroll.await_args_list)
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_iter_scroll_respects_max_points(self, mock_qdrant_client):
+        """Test iter_scroll stops requesting pages at max_points."""
+        mock_qdrant_client.scroll = AsyncMock(side_effect=[
+            ([self._point('a'), self._point('b')], 'c'),
+            ([self._point('c')], 'd'),
+        ])
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({'url': 'http://localhost:6333', 'collection_name': 'test_collection'})
+            await adapter.connect()
+            
+            ids = [point['id'] async for point in adapter.iter_scroll(page_size=2, max_points=3)]
+            
+            assert ids == ['a', 'b', 'c']
+            assert mock_qdrant_client.scroll.await_count == 2
+            assert mock_qdrant_client.scroll.await_args_list[1].kwargs['limit'] == 1
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_search_defaults_to_no_vectors(self, mock_qdrant_client):
+        """Test search does not request vectors unless asked."""
+        hit = self._point('a')
+        hit.score = 0.9
+        mock_qdrant_client.search = AsyncMock(return_value=[hit])
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({'url': 'http://localhost:6333', 'collection_name': 'test_collection'})
+            await adapter.connect()
+            
+            results = await adapter.search({
+                'vector': [0.1, 0.2],
+                'payload_fields': ['content']
+            })
+            
+            kwargs = mock_qdrant_client.search.call_args.kwargs
+            assert kwargs['with_vectors'] is False
+            assert kwargs['with_payload'] == ['content']
+            assert results[0]['vector'] is None
+            assert results[0]['score'] == 0.9
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_retrieve_batch_projection_and_order(self, mock_qdrant_client):
+        """Test retrieve_batch keeps input order, None for missing IDs."""
+        mock_qdrant_client.retrieve = AsyncMock(return_value=[self._point('b'), self._point('a')])
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({'url': 'http://localhost:6333', 'collection_name': 'test_collection'})
+            await adapter.connect()
+            
+            results = await adapter.retrieve_batch(['a', 'missing', 'b'], payload_fields=['content'])
+            
+            assert [r['id'] if r else None for r in results] == ['a', None, 'b']
+            kwargs = mock_qdrant_client.retrieve.call_args.kwargs
+            assert kwargs['with_vectors'] is False
+            assert kwargs['with_payload'] == ['content']
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_search_batch_maps_results_to_queries(self, mock_qdrant_client):
+        """Test search_batch sends one request and keeps query order."""
+        def scored(point_id, score):
+            hit = self._point(point_id)
+            hit.score = score
+            return hit
+        
+        mock_qdrant_client.query_batch_points = AsyncMock(return_value=[
+            Mock(points=[scored('a', 0.9), scored('b', 0.8)]),
+            Mock(points=[]),
+            Mock(points=[scored('c', 0.7)]),
+        ])
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({'url': 'http://localhost:6333', 'collection_name': 'test_collection'})
+            await adapter.connect()
+            
+            results = await adapter.search_batch([
+                {'vector': [0.1, 0.2], 'limit': 2},
+                {'vector': [0.3, 0.4], 'limit': 5, 'filter': {'session_id': 's1'}},
+                {'query_vector': [0.5, 0.6], 'limit': 1},
+            ])
+            
+            assert [[r['id'] for r in hits] for hits in results] == [['a', 'b'], [], ['c']]
+            assert results[0][0]['score'] == 0.9
+            mock_qdrant_client.query_batch_points.assert_awaited_once()
+            requests = mock_qdrant_client.query_batch_points.call_args.kwargs['requests']
+            assert [request.limit for request in requests] == [2, 5, 1]
+            assert requests[0].filter is None
+            assert requests[1].filter is not None
+            assert requests[0].with_vector is False
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_search_batch_empty_and_missing_vector(self, mock_qdrant_client):
+        """Test empty batches skip the request and queries need a vector."""
+        mock_qdrant_client.query_batch_points = AsyncMock(return_value=[])
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({'url': 'http://localhost:6333', 'collection_name': 'test_collection'})
+            await adapter.connect()
+            
+            assert await adapter.search_batch([]) == []
+            with pytest.raises(StorageDataError):
+                await adapter.search_batch([{'limit': 3}])
+            mock_qdrant_client.query_batch_points.assert_not_called()
+            await adapter.disconnect()
+
+
+class TestQdrantCollectionTuning:
+    """Test payload indexes, HNSW/quantization settings and reconciliation."""
+    
+    TUNED_CONFIG = {
+        'url': 'http://localhost:6333',
+        'collection_name': 'episodes',
+        'vector_size': 768,
+        'payload_indexes': {
+            'session_id': 'keyword',
+            'metadata.importance_score': 'float',
+            'metadata.fact_valid_from': 'datetime',
+        },
+        'hnsw': {'m': 32, 'ef_construct': 200},
+        'on_disk_payload': True,
+        'quantization': {'type': 'int8', 'quantile': 0.98, 'oversampling': 3.0},
+    }
+    
+    @pytest.fixture
+    def mock_qdrant_client(self):
+        """Mock Qdrant client for unit tests."""
+        mock = AsyncMock()
+        mock.close = AsyncMock()
+        mock.create_collection = AsyncMock()
+        mock.update_collection = AsyncMock()
+        mock.create_payload_index = AsyncMock()
+        return mock
+    
+    @staticmethod
+    def _collection_info(payload_schema, m, ef_construct, on_disk_payload, quantization):
+        info = Mock()
+        info.payload_schema = payload_schema
+        info.config.hnsw_config.m = m
+        info.config.hnsw_config.ef_construct = ef_construct
+        info.config.params.on_disk_payload = on_disk_payload
+        info.config.quantization_config = quantization
+        return info
+    
+    @pytest.mark.asyncio
+    async def test_connect_creates_tuned_collection(self, mock_qdrant_client):
+        """Test a missing collection is created with tuning and indexes."""
+        mock_qdrant_client.get_collection = AsyncMock(side_effect=Exception("Not found"))
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter(self.TUNED_CONFIG)
+            await adapter.connect()
+            
+            kwargs = mock_qdrant_client.create_collection.call_args.kwargs
+            assert kwargs['hnsw_config'].m == 32
+            assert kwargs['hnsw_config'].ef_construct == 200
+            assert kwargs['on_disk_payload'] is True
+            assert kwargs['quantization_config'].scalar.quantile == 0.98
+            indexed = {
+                call.kwargs['field_name']: call.kwargs['field_schema'].value
+                for call in mock_qdrant_client.create_payload_index.await_args_list
+            }
+            assert indexed == {
+                'session_id': 'keyword',
+                'metadata.importance_score': 'float',
+                'metadata.fact_valid_from': 'datetime',
+            }
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_connect_reconciles_existing_collection(self, mock_qdrant_client):
+        """Test only missing indexes and differing settings are applied."""
+        mock_qdrant_client.get_collection = AsyncMock(return_value=self._collection_info(
+            payload_schema={'session_id': Mock()}, m=16, ef_construct=200,
+            on_disk_payload=True, quantization=None
+        ))
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter(self.TUNED_CONFIG)
+            await adapter.connect()
+            
+            mock_qdrant_client.create_collection.assert_not_called()
+            fields = [call.kwargs['field_name'] for call in mock_qdrant_client.create_payload_index.await_args_list]
+            assert sorted(fields) == ['metadata.fact_valid_from', 'metadata.importance_score']
+            update = mock_qdrant_client.update_collection.call_args.kwargs
+            assert update['hnsw_config'].m == 32
+            assert 'collection_params' not in update
+            assert update['quantization_config'] is not None
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_reconcile_is_noop_when_up_to_date(self, mock_qdrant_client):
+        """Test a matching collection triggers no writes."""
+        quantization = QdrantAdapter._build_quantization_config(self.TUNED_CONFIG['quantization'])
+        mock_qdrant_client.get_collection = AsyncMock(return_value=self._collection_info(
+            payload_schema={field: Mock() for field in self.TUNED_CONFIG['payload_indexes']},
+            m=32, ef_construct=200, on_disk_payload=True, quantization=quantization
+        ))
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter(self.TUNED_CONFIG)
+            await adapter.connect()
+            
+            mock_qdrant_client.create_payload_index.assert_not_called()
+            mock_qdrant_client.update_collection.assert_not_called()
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_search_rescores_quantized_collection(self, mock_qdrant_client):
+        """Test searches on quantized collections request rescoring."""
+        mock_qdrant_client.get_collection = AsyncMock(side_effect=Exception("Not found"))
+        mock_qdrant_client.search = AsyncMock(return_value=[])
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter(self.TUNED_CONFIG)
+            await adapter.connect()
+            
+            await adapter.search({'vector': [0.1] * 768})
+            
+            params = mock_qdrant_client.search.call_args.kwargs['search_params']
+            assert params.quantization.rescore is True
+            assert params.quantization.oversampling == 3.0
+            await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_create_collection_overrides_settings(self, mock_qdrant_client):
+        """Test per-collection config overrides adapter defaults."""
+        mock_qdrant_client.get_collection = AsyncMock(side_effect=Exception("Not found"))
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({'url': 'http://localhost:6333', 'collection_name': 'test_collection'})
+            await adapter.connect()
+            mock_qdrant_client.create_payload_index.reset_mock()
+            
+            created = await adapter.create_collection('other', {
+                'payload_indexes': {'episode_id': 'keyword'},
+                'hnsw': {'m': 8}
+            })
+            
+            assert created is True
+            kwargs = mock_qdrant_client.create_collection.call_args.kwargs
+            assert kwargs['collection_name'] == 'other'
+            assert kwargs['hnsw_config'].m == 8
+            assert 'quantization_config' not in kwargs
+            fields = [call.kwargs['field_name'] for call in mock_qdrant_client.create_payload_index.await_args_list]
+            assert fields == ['episode_id']
+            await adapter.disconnect()
+    
+    def test_extra_payload_indexes_extend_defaults(self):
+        """Test extra payload indexes are added to the default filtered fields."""
+        adapter = QdrantAdapter({
+            'url': 'http://localhost:6333',
+            'extra_payload_indexes': {'metadata.fact_type': 'keyword'}
+        })
+        
+        indexes = adapter.collection_settings['payload_indexes']
+        assert indexes == {**DEFAULT_PAYLOAD_INDEXES, 'metadata.fact_type': 'keyword'}
+        assert {'session_id', 'metadata.session_id', 'episode_id', 'metadata.episode_id'} <= set(indexes)
+    
+    @pytest.mark.asyncio
+    async def test_create_collection_extra_indexes_extend_adapter_settings(self, mock_qdrant_client):
+        """Test per-collection extra indexes are created alongside the adapter's."""
+        mock_qdrant_client.get_collection = AsyncMock(side_effect=Exception("Not found"))
+        
+        with patch('src.storage.qdrant_adapter.AsyncQdrantClient', return_value=mock_qdrant_client):
+            adapter = QdrantAdapter({
+                'url': 'http://localhost:6333',
+                'payload_indexes': {'session_id': 'keyword'}
+            })
+            await adapter.connect()
+            mock_qdrant_client.create_payload_index.reset_mock()
+            
+            await adapter.create_collection('other', {
+                'extra_payload_indexes': {'metadata.importance_score': 'float'}
+            })
+            
+            fields = [call.kwargs['field_name'] for call in mock_qdrant_client.create_payload_index.await_args_list]
+            assert fields == ['session_id', 'metadata.importance_score']
+            await adapter.disconnect()
+    
+    def test_unsupported_index_type_rejected(self):
+        """Test unknown payload index types fail at construction."""
+        with pytest.raises(StorageDataError):
+            QdrantAdapter({
+                'url': 'http://localhost:6333',
+                'payload_indexes': {'session_id': 'geo_shape'}
+            })
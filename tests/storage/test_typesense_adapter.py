@@ -4,6 +4,7 @@ Unit and integration tests for TypesenseAdapter.
 import pytest
 import pytest_asyncio
 import os
+import json
 import uuid
 from unittest.mock import AsyncMock, Mock, patch
 from src.storage.typesense_adapter import TypesenseAdapter
@@ -740,10 +741,44 @@ class TestTypesenseAdapterBatchOperations:
                 for i in range(5)
             ]
             
+            import_response = Mock()
+            import_response.status_code = 200
+            import_response.raise_for_status = Mock()
+            import_response.text = '\n'.join(['{"success": true}'] * 5)
+            mock_httpx_client.post = AsyncMock(return_value=import_response)
+            
             ids = await adapter.store_batch(batch_data)
-            assert len(ids) == 5
+            assert ids == [f'doc-{i}' for i in range(5)]
             await adapter.disconnect()
     
+    async def test_store_batch_returns_only_imported_ids(self, mock_httpx_client):
+        """Test documents rejected by the import are left out of the result."""
+        import_response = Mock()
+        import_response.status_code = 200
+        import_response.raise_for_status = Mock()
+        import_response.text = (
+            '{"success": true}\n'
+            '{"success": false, "error": "Field `confidence_score` must be a float."}\n'
+            '{"success": true}'
+        )
+        mock_httpx_client.post = AsyncMock(return_value=import_response)
+        
+        adapter = TypesenseAdapter({
+            'url': 'http://localhost:8108',
+            'api_key': 'test_key',
+            'collection_name': 'test_collection'
+        })
+        adapter._connected = True
+        adapter.client = mock_httpx_client
+        
+        ids = await adapter.store_batch([
+            {'id': 'doc-1', 'content': 'first'},
+            {'id': 'doc-2', 'content': 'second', 'confidence_score': 'high'},
+            {'id': 'doc-3', 'content': 'third'},
+        ])
+        
+        assert ids == ['doc-1', 'doc-3']
+    
     async def test_store_batch_not_connected(self):
         """Test batch store when not connected."""
         config = {
@@ -785,6 +820,212 @@ class TestTypesenseAdapterBatchOperations:
             assert len(results) == 2
             await adapter.disconnect()
     
+    async def test_retrieve_batch_uses_single_id_filter(self, mock_httpx_client):
+        """Test batch retrieval is one filtered search, in input order."""
+        mock_get_response = AsyncMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json = AsyncMock(return_value={
+            'hits': [
+                {'document': {'id': 'doc3', 'content': 'Content 3'}},
+                {'document': {'id': 'doc1', 'content': 'Content 1'}}
+            ]
+        })
+        mock_get_response.raise_for_status = Mock()
+        mock_httpx_client.get = AsyncMock(return_value=mock_get_response)
+        
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            adapter = TypesenseAdapter({
+                'url': 'http://localhost:8108',
+                'api_key': 'test_key',
+                'collection_name': 'test_collection'
+            })
+            await adapter.connect()
+            mock_httpx_client.get.reset_mock()
+            
+            results = await adapter.retrieve_batch(['doc1', 'doc2', 'doc3'])
+            
+            assert [r['id'] if r else None for r in results] == ['doc1', None, 'doc3']
+            mock_httpx_client.get.assert_awaited_once()
+            params = mock_httpx_client.get.call_args.kwargs['params']
+            assert params['q'] == '*'
+            assert params['filter_by'] == 'id:=[`doc1`,`doc2`,`doc3`]'
+            assert params['per_page'] == 3
+            await adapter.disconnect()
+    
+    async def test_retrieve_batch_chunks_long_filters(self, mock_httpx_client):
+        """Test IDs are split so each filter stays under the length cap."""
+        mock_get_response = AsyncMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json = AsyncMock(return_value={'hits': []})
+        mock_get_response.raise_for_status = Mock()
+        mock_httpx_client.get = AsyncMock(return_value=mock_get_response)
+        
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            adapter = TypesenseAdapter({
+                'url': 'http://localhost:8108',
+                'api_key': 'test_key',
+                'collection_name': 'test_collection',
+                'max_filter_length': 100
+            })
+            await adapter.connect()
+            mock_httpx_client.get.reset_mock()
+            
+            ids = [f'knowledge-{i:04d}' for i in range(20)]
+            results = await adapter.retrieve_batch(ids)
+            
+            assert results == [None] * 20
+            filters = [call.kwargs['params']['filter_by'] for call in mock_httpx_client.get.await_args_list]
+            assert len(filters) > 1
+            assert all(len(f) <= 100 for f in filters)
+            assert sum(f.count('`') // 2 for f in filters) == 20
+            await adapter.disconnect()
+    
+    async def test_multi_search_single_request(self, mock_httpx_client):
+        """Test multi_search sends all queries in one POST and keeps order."""
+        mock_get_response = AsyncMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json = AsyncMock(return_value={'name': 'test_collection'})
+        mock_get_response.raise_for_status = Mock()
+        mock_httpx_client.get = AsyncMock(return_value=mock_get_response)
+        
+        multi_response = AsyncMock()
+        multi_response.status_code = 200
+        multi_response.json = AsyncMock(return_value={'results': [
+            {'found': 1, 'hits': [{'document': {'id': 'a'}}]},
+            {'found': 0, 'hits': []},
+        ]})
+        multi_response.raise_for_status = Mock()
+        mock_httpx_client.post = AsyncMock(return_value=multi_response)
+        
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            adapter = TypesenseAdapter({
+                'url': 'http://localhost:8108',
+                'api_key': 'test_key',
+                'collection_name': 'test_collection'
+            })
+            await adapter.connect()
+            
+            results = await adapter.multi_search([
+                {'q': 'reefer', 'query_by': 'content', 'limit': 3},
+                {'q': 'customs', 'query_by': 'title,content', 'filter_by': 'category:=ops',
+                 'collection_name': 'knowledge_base'},
+            ])
+            
+            assert [r['found'] for r in results] == [1, 0]
+            mock_httpx_client.post.assert_awaited_once()
+            url = mock_httpx_client.post.call_args.args[0]
+            searches = mock_httpx_client.post.call_args.kwargs['json']['searches']
+            assert url.endswith('/multi_search')
+            assert searches[0] == {
+                'collection': 'test_collection', 'q': 'reefer',
+                'query_by': 'content', 'per_page': 3
+            }
+            assert searches[1]['collection'] == 'knowledge_base'
+            assert searches[1]['filter_by'] == 'category:=ops'
+            await adapter.disconnect()
+    
+    async def test_multi_search_surfaces_per_query_errors(self, mock_httpx_client):
+        """Test a failed search inside the batch raises StorageQueryError."""
+        mock_get_response = AsyncMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json = AsyncMock(return_value={'name': 'test_collection'})
+        mock_get_response.raise_for_status = Mock()
+        mock_httpx_client.get = AsyncMock(return_value=mock_get_response)
+        
+        multi_response = AsyncMock()
+        multi_response.status_code = 200
+        multi_response.json = AsyncMock(return_value={'results': [
+            {'code': 404, 'error': 'Could not find a field named `missing`'}
+        ]})
+        multi_response.raise_for_status = Mock()
+        mock_httpx_client.post = AsyncMock(return_value=multi_response)
+        
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            adapter = TypesenseAdapter({
+                'url': 'http://localhost:8108',
+                'api_key': 'test_key',
+                'collection_name': 'test_collection'
+            })
+            await adapter.connect()
+            
+            with pytest.raises(StorageQueryError):
+                await adapter.multi_search([{'q': 'x', 'query_by': 'missing'}])
+            await adapter.disconnect()
+    
+    async def test_update_partial_sends_patch(self, mock_httpx_client):
+        """Test a partial update PATCHes only the given fields."""
+        mock_get_response = AsyncMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json = AsyncMock(return_value={'name': 'test_collection'})
+        mock_get_response.raise_for_status = Mock()
+        mock_httpx_client.get = AsyncMock(return_value=mock_get_response)
+        
+        patch_response = Mock()
+        patch_response.status_code = 200
+        patch_response.raise_for_status = Mock()
+        missing_response = Mock()
+        missing_response.status_code = 404
+        mock_httpx_client.patch = AsyncMock(side_effect=[patch_response, missing_response])
+        
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            adapter = TypesenseAdapter({
+                'url': 'http://localhost:8108',
+                'api_key': 'test_key',
+                'collection_name': 'test_collection'
+            })
+            await adapter.connect()
+            
+            fields = {'usefulness_score': 0.9, 'validation_count': 3}
+            assert await adapter.update_partial('doc1', fields, collection_name='knowledge_base') is True
+            assert await adapter.update_partial('missing', fields) is False
+            
+            first_call = mock_httpx_client.patch.call_args_list[0]
+            assert first_call.args[0].endswith('/collections/knowledge_base/documents/doc1')
+            assert first_call.kwargs['json'] == fields
+            await adapter.disconnect()
+    
+    async def test_update_many_imports_jsonl_with_update_action(self, mock_httpx_client):
+        """Test bulk partial updates use one import call and report per-document status."""
+        mock_get_response = AsyncMock()
+        mock_get_response.status_code = 200
+        mock_get_response.json = AsyncMock(return_value={'name': 'test_collection'})
+        mock_get_response.raise_for_status = Mock()
+        mock_httpx_client.get = AsyncMock(return_value=mock_get_response)
+        
+        import_response = Mock()
+        import_response.status_code = 200
+        import_response.raise_for_status = Mock()
+        import_response.text = (
+            '{"success": true}\n'
+            '{"success": false, "error": "Could not find a document with id: doc2"}'
+        )
+        mock_httpx_client.post = AsyncMock(return_value=import_response)
+        
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            adapter = TypesenseAdapter({
+                'url': 'http://localhost:8108',
+                'api_key': 'test_key',
+                'collection_name': 'test_collection'
+            })
+            await adapter.connect()
+            
+            results = await adapter.update_many([
+                {'id': 'doc1', 'usefulness_score': 0.9},
+                {'id': 'doc2', 'usefulness_score': 0.1},
+            ])
+            
+            assert results == {'doc1': True, 'doc2': False}
+            mock_httpx_client.post.assert_awaited_once()
+            call = mock_httpx_client.post.call_args
+            assert call.args[0].endswith('/collections/test_collection/documents/import')
+            assert call.kwargs['params'] == {'action': 'update'}
+            lines = call.kwargs['content'].split('\n')
+            assert json.loads(lines[0]) == {'id': 'doc1', 'usefulness_score': 0.9}
+            
+            with pytest.raises(StorageDataError):
+                await adapter.update_many([{'usefulness_score': 0.5}])
+            await adapter.disconnect()
+    
     async def test_delete_batch_documents(self, mock_httpx_client):
         """Test batch deletion of documents."""
         # Mock collection exists check
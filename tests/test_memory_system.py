@@ -0,0 +1,179 @@
+"""
+Tests for UnifiedMemorySystem cross-tier reads against fake tiers.
+
+The tiers are autospecced from the real tier classes, so a call that does
+not match a tier's signature fails here as it would in production.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import fakeredis
+import pytest
+
+from src.memory.models import Fact, KnowledgeDocument, SearchWeights
+from src.memory.tiers.active_context_tier import ActiveContextTier
+from src.memory.tiers.episodic_memory_tier import EpisodicMemoryTier
+from src.memory.tiers.semantic_memory_tier import SemanticMemoryTier
+from src.memory.tiers.working_memory_tier import WorkingMemoryTier
+
+# memory_system imports the legacy knowledge store clients (meilisearch,
+# sentence-transformers); skip where those are not installed
+memory_system = pytest.importorskip("memory_system", exc_type=ImportError)
+
+
+def _facts():
+    return [
+        Fact(fact_id='f1', session_id='s1', content='Crane 4 is out of service', ciar_score=0.8,
+             metadata={'search_score': 0.9}),
+        Fact(fact_id='f2', session_id='s1', content='Berth 2 is reserved', ciar_score=0.7,
+             metadata={'search_score': 0.2}),
+    ]
+
+
+@pytest.fixture
+def l1_tier():
+    tier = create_autospec(ActiveContextTier, instance=True)
+    # L1 returns the newest turn first
+    tier.retrieve.return_value = [
+        {'turn_id': f't{i}', 'role': 'user', 'content': f'Turn {i}'} for i in reversed(range(5))
+    ]
+    return tier
+
+
+@pytest.fixture
+def l2_tier():
+    tier = create_autospec(WorkingMemoryTier, instance=True)
+    tier.query_by_session.return_value = _facts()
+    tier.search_facts.return_value = _facts()
+    return tier
+
+
+@pytest.fixture
+def l4_tier():
+    tier = create_autospec(SemanticMemoryTier, instance=True)
+    tier.search.return_value = [
+        KnowledgeDocument(
+            knowledge_id='k1',
+            title='Crane outages',
+            content='Crane outages delay berth schedules.',
+            metadata={'search_score': 0.5}
+        )
+    ]
+    return tier
+
+
+def _system(**kwargs):
+    return memory_system.UnifiedMemorySystem(
+        redis_client=fakeredis.FakeStrictRedis(),
+        knowledge_manager=MagicMock(),
+        **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_context_block_reads_tiers_with_their_signatures(l1_tier, l2_tier):
+    system = _system(l1_tier=l1_tier, l2_tier=l2_tier)
+
+    block = await system.get_context_block('s1', min_ciar=0.65, max_turns=3, max_facts=2)
+
+    l1_tier.retrieve.assert_awaited_once_with('s1')
+    l2_tier.query_by_session.assert_awaited_once_with('s1', min_ciar_score=0.65, limit=2)
+    # Newest three turns, presented oldest first
+    assert [turn['turn_id'] for turn in block.recent_turns] == ['t2', 't3', 't4']
+    assert block.fact_count == 2
+    assert block.skipped_tiers == []
+
+
+@pytest.mark.asyncio
+async def test_context_block_is_cached_until_a_tier_is_written(l1_tier, l2_tier):
+    system = _system(l1_tier=l1_tier, l2_tier=l2_tier)
+
+    first = await system.get_context_block('s1')
+    second = await system.get_context_block('s1')
+    assert not first.cache_hit and second.cache_hit
+    assert l1_tier.retrieve.await_count == 1
+
+    await system.generations.bump('L2', 's1')
+    third = await system.get_context_block('s1')
+    assert not third.cache_hit
+    assert l1_tier.retrieve.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_synchronous_tier_error_is_isolated(l1_tier, l2_tier):
+    # Raises before returning an awaitable
+    l2_tier.query_by_session = MagicMock(side_effect=RuntimeError('pool closed'))
+    system = _system(l1_tier=l1_tier, l2_tier=l2_tier)
+
+    block = await system.get_context_block('s1')
+
+    assert block.turn_count == 5
+    assert block.skipped_tiers == ['L2']
+
+
+@pytest.mark.asyncio
+async def test_query_memory_fuses_tiers_by_relevance(l2_tier, l4_tier):
+    system = _system(l2_tier=l2_tier, l4_tier=l4_tier)
+
+    results = await system.query_memory('s1', 'crane outage', limit=3, weights=SearchWeights())
+
+    l2_tier.search_facts.assert_awaited_once_with(query='crane outage', session_id='s1', limit=3)
+    l4_tier.search.assert_awaited_once_with(query_text='crane outage', limit=3)
+    assert results[0]['content'] == 'Crane 4 is out of service'
+    assert {result['tier'] for result in results} == {'L2', 'L4'}
+    assert results.metadata['queried_tiers'] == ['L2', 'L4']
+    assert not results.metadata['partial']
+
+
+@pytest.mark.asyncio
+async def test_query_memory_skips_l3_without_embedder(l2_tier):
+    l3_tier = create_autospec(EpisodicMemoryTier, instance=True)
+    system = _system(l2_tier=l2_tier, l3_tier=l3_tier)
+
+    results = await system.query_memory('s1', 'crane outage')
+
+    l3_tier.query.assert_not_called()
+    l3_tier.search_similar.assert_not_called()
+    assert results.metadata['queried_tiers'] == ['L2']
+    assert not results.metadata['partial']
+
+
+@pytest.mark.asyncio
+async def test_query_memory_searches_l3_by_query_embedding(l2_tier):
+    l3_tier = create_autospec(EpisodicMemoryTier, instance=True)
+    l3_tier.search_similar.return_value = []
+    embedder = MagicMock()
+    embedder.get_embedding = AsyncMock(return_value=[0.1, 0.2])
+    system = _system(l2_tier=l2_tier, l3_tier=l3_tier, embedding_provider=embedder)
+
+    await system.query_memory('s1', 'crane outage', limit=4)
+
+    embedder.get_embedding.assert_awaited_once_with(text='crane outage')
+    l3_tier.search_similar.assert_awaited_once_with(
+        query_embedding=[0.1, 0.2], limit=4, filters={'session_id': 's1'}
+    )
+
+
+@pytest.mark.asyncio
+async def test_writes_in_another_process_invalidate_cached_blocks(l1_tier, l2_tier):
+    # Two systems on one Redis server stand in for two worker processes
+    server = fakeredis.FakeServer()
+    reader = memory_system.UnifiedMemorySystem(
+        redis_client=fakeredis.FakeStrictRedis(server=server),
+        knowledge_manager=MagicMock(),
+        l1_tier=l1_tier,
+        l2_tier=l2_tier
+    )
+    writer = memory_system.UnifiedMemorySystem(
+        redis_client=fakeredis.FakeStrictRedis(server=server),
+        knowledge_manager=MagicMock()
+    )
+    assert reader.get_cache_stats()['shared_generations']
+
+    await reader.get_context_block('s1')
+    assert (await reader.get_context_block('s1')).cache_hit
+
+    await writer.generations.bump('L1', 's1')
+
+    assert not (await reader.get_context_block('s1')).cache_hit
+    assert l1_tier.retrieve.await_count == 2
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from src.utils.llm_client import (
@@ -73,3 +75,44 @@ def test_provider_config_defaults() -> None:
     assert config.enabled is True
     assert config.priority == 0
     assert config.timeout == 15.0
+
+
+class _SlowProvider(BaseProvider):
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name)
+        self.active = 0
+        self.peak = 0
+
+    async def generate(self, *_: object, **__: object) -> LLMResponse:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return LLMResponse(text="ok", provider=self.name)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_bounds_in_flight_calls() -> None:
+    """Calls beyond ProviderConfig.max_concurrency queue instead of overlapping."""
+
+    provider = _SlowProvider(name="slow")
+    client = LLMClient()
+    client.register_provider(provider, ProviderConfig(name="slow", max_concurrency=2))
+
+    responses = await asyncio.gather(*(client.generate("prompt") for _ in range(6)))
+
+    assert len(responses) == 6
+    assert provider.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_unbounded_concurrency_by_default() -> None:
+    """Without max_concurrency all calls overlap on the event loop."""
+
+    provider = _SlowProvider(name="slow")
+    client = LLMClient()
+    client.register_provider(provider)
+
+    await asyncio.gather(*(client.generate("prompt") for _ in range(6)))
+
+    assert provider.peak == 6
@@ -25,7 +25,7 @@ def register_fake_genai(fake_client, monkeypatch):
 
 
 def register_fake_groq(fake_client, monkeypatch):
-    fake_groq_mod = types.SimpleNamespace(Groq=lambda api_key: fake_client)
+    fake_groq_mod = types.SimpleNamespace(AsyncGroq=lambda api_key, http_client=None: fake_client)
     monkeypatch.setitem(sys.modules, "groq", fake_groq_mod)
 
 
@@ -38,16 +38,24 @@ class SimpleResponse:
         self.choices = [SimpleNamespace(message=SimpleNamespace(content=text))]
 
 
+def fake_async_call(response, raise_exc=None):
+    async def call(*args, **kwargs):
+        if raise_exc:
+            raise raise_exc
+        return response
+    return call
+
+
 class FakeGeminiClient:
     def __init__(self, response: SimpleResponse, raise_exc=None):
-        self.models = SimpleNamespace(generate_content=lambda *args, **kwargs: (_ for _ in ()).throw(raise_exc) if raise_exc else response)
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=fake_async_call(response, raise_exc)))
 
 
 class FakeGroqClient:
     def __init__(self, response: SimpleResponse, raise_exc=None):
         class Chat:
             def __init__(self, resp, raise_exc):
-                self.completions = SimpleNamespace(create=lambda *a, **k: (_ for _ in ()).throw(raise_exc) if raise_exc else resp)
+                self.completions = SimpleNamespace(create=fake_async_call(resp, raise_exc))
 
         self.chat = Chat(response, raise_exc)
 
@@ -59,7 +67,7 @@ class FakeMistralClient:
                 self._resp = resp
                 self._raise = raise_exc
 
-            def complete(self, *args, **kwargs):
+            async def complete_async(self, *args, **kwargs):
                 if self._raise:
                     raise self._raise
                 return self._resp
@@ -68,7 +76,7 @@ class FakeMistralClient:
 
 
 def register_fake_mistral(fake_client, monkeypatch):
-    fake_mod = types.SimpleNamespace(Mistral=lambda api_key: fake_client)
+    fake_mod = types.SimpleNamespace(Mistral=lambda api_key, async_client=None: fake_client)
     monkeypatch.setitem(sys.modules, "mistralai", fake_mod)
 
 
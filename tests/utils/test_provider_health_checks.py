@@ -11,9 +11,17 @@ class FakeResponse:
     pass
 
 
+def fake_async_call(raise_exc=None):
+    async def call(*args, **kwargs):
+        if raise_exc:
+            raise raise_exc
+        return FakeResponse()
+    return call
+
+
 class FakeGeminiClient:
     def __init__(self, raise_exc=None):
-        self.models = SimpleNamespace(generate_content=lambda *args, **kwargs: (_ for _ in ()).throw(raise_exc) if raise_exc else FakeResponse())
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=fake_async_call(raise_exc)))
 
 
 def register_fake_genai(fake_client, monkeypatch):
@@ -37,13 +45,13 @@ class FakeGroqClient:
     def __init__(self, raise_exc=None):
         class Chat:
             def __init__(self, raise_exc):
-                self.completions = SimpleNamespace(create=lambda *a, **k: (_ for _ in ()).throw(raise_exc) if raise_exc else FakeResponse())
+                self.completions = SimpleNamespace(create=fake_async_call(raise_exc))
 
         self.chat = Chat(raise_exc)
 
 
 def register_fake_groq(fake_client, monkeypatch):
-    fake_groq_mod = types.SimpleNamespace(Groq=lambda api_key: fake_client)
+    fake_groq_mod = types.SimpleNamespace(AsyncGroq=lambda api_key, http_client=None: fake_client)
     monkeypatch.setitem(sys.modules, "groq", fake_groq_mod)
 
 
@@ -53,7 +61,7 @@ class FakeMistralClient:
             def __init__(self, raise_exc):
                 self._raise = raise_exc
 
-            def complete(self, *args, **kwargs):
+            async def complete_async(self, *args, **kwargs):
                 if self._raise:
                     raise self._raise
                 return FakeResponse()
@@ -62,7 +70,7 @@ class FakeMistralClient:
 
 
 def register_fake_mistral(fake_client, monkeypatch):
-    fake_mod = types.SimpleNamespace(Mistral=lambda api_key: fake_client)
+    fake_mod = types.SimpleNamespace(Mistral=lambda api_key, async_client=None: fake_client)
     monkeypatch.setitem(sys.modules, "mistralai", fake_mod)
 
 
@@ -25,7 +25,7 @@ class FakeModels:
         self._response = response
         self._raise = raise_exc
 
-    def generate_content(self, *args, **kwargs):
+    async def generate_content(self, *args, **kwargs):
         if self._raise:
             raise self._raise
         return self._response
@@ -33,7 +33,7 @@ class FakeModels:
 
 class FakeClient:
     def __init__(self, response: FakeResponse, raise_exc: Exception | None = None):
-        self.models = FakeModels(response, raise_exc=raise_exc)
+        self.aio = types.SimpleNamespace(models=FakeModels(response, raise_exc=raise_exc))
 
 
 def register_fake_genai(fake_client, monkeypatch):
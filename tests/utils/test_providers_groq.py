@@ -3,8 +3,10 @@ import types
 import pytest
 from types import SimpleNamespace
 
-from src.utils.providers import GroqProvider
-from src.utils.llm_client import LLMResponse
+import httpx
+
+from src.utils.providers import GroqProvider, http_client_args
+from src.utils.llm_client import LLMResponse, ProviderConfig
 
 
 class FakeUsage:
@@ -31,7 +33,7 @@ class FakeCompletions:
         self._response = response
         self._raise = raise_exc
 
-    def create(self, *args, **kwargs):
+    async def create(self, *args, **kwargs):
         if self._raise:
             raise self._raise
         return self._response
@@ -48,7 +50,7 @@ class FakeGroq:
 
 
 def register_fake_groq(fake_client, monkeypatch):
-    fake_groq_mod = types.SimpleNamespace(Groq=lambda api_key: fake_client)
+    fake_groq_mod = types.SimpleNamespace(AsyncGroq=lambda api_key, http_client=None: fake_client)
     monkeypatch.setitem(sys.modules, "groq", fake_groq_mod)
 
 
@@ -75,3 +77,26 @@ async def test_groq_generate_sdk_error(monkeypatch):
     provider = GroqProvider(api_key="k")
     with pytest.raises(RuntimeError):
         await provider.generate("Q")
+
+
+@pytest.mark.asyncio
+async def test_groq_uses_pooled_async_http_client(monkeypatch):
+    captured = {}
+
+    def fake_async_groq(api_key, http_client=None):
+        captured["http_client"] = http_client
+        return FakeGroq(FakeResponse("ok"))
+
+    monkeypatch.setitem(sys.modules, "groq", types.SimpleNamespace(AsyncGroq=fake_async_groq))
+
+    provider = GroqProvider(
+        api_key="k",
+        config=ProviderConfig(name="groq", pool_size=7, keepalive_expiry=12.0),
+    )
+    assert isinstance(captured["http_client"], httpx.AsyncClient)
+    limits = http_client_args(provider.config)["limits"]
+    assert limits.max_connections == 7
+    assert limits.keepalive_expiry == 12.0
+
+    await provider.aclose()
+    assert captured["http_client"].is_closed
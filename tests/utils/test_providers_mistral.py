@@ -32,7 +32,7 @@ class FakeChat:
         self._response = response
         self._raise = raise_exc
 
-    def complete(self, *args, **kwargs):
+    async def complete_async(self, *args, **kwargs):
         if self._raise:
             raise self._raise
         return self._response
@@ -43,7 +43,7 @@ class FakeMistral:
 
 
 def register_fake_mistral(fake_client, monkeypatch):
-    fake_mod = types.SimpleNamespace(Mistral=lambda api_key: fake_client)
+    fake_mod = types.SimpleNamespace(Mistral=lambda api_key, async_client=None: fake_client)
     monkeypatch.setitem(sys.modules, "mistralai", fake_mod)
 
 